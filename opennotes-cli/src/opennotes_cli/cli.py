@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib
 import json as json_mod
 import os
 import shutil
@@ -15,17 +16,55 @@ from baalbek import tui
 from opennotes_cli.auth import AuthProvider, JwtAuthProvider, get_auth_provider
 from opennotes_cli.http import ENV_URLS
 
-from opennotes_cli.commands.analyze import analyze
-from opennotes_cli.commands.batch import batch
-from opennotes_cli.commands.candidates import fact_check
-from opennotes_cli.commands.health import health
-from opennotes_cli.commands.orchestrator import orchestrator
-from opennotes_cli.commands.playground import playground
-from opennotes_cli.commands.rechunk import rechunk
-from opennotes_cli.commands.score import score
-from opennotes_cli.commands.search import hybrid_search
-from opennotes_cli.commands.sim_agent import sim_agent
-from opennotes_cli.commands.simulation import simulation
+# Subcommand name -> ("module:attribute", short help). Modules are imported
+# only when their command is resolved, so `opennotes <cmd>` pays for one
+# command's dependencies and `opennotes --help` for none of them.
+LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "analyze": (
+        "opennotes_cli.commands.analyze:analyze",
+        "Analysis tools for community server data.",
+    ),
+    "batch": (
+        "opennotes_cli.commands.batch:batch",
+        "Manage batch jobs (long-running operations).",
+    ),
+    "fact-check": (
+        "opennotes_cli.commands.candidates:fact_check",
+        "Fact-check related operations.",
+    ),
+    "health": (
+        "opennotes_cli.commands.health:health",
+        "Check server connectivity and authentication.",
+    ),
+    "hybrid-search": (
+        "opennotes_cli.commands.search:hybrid_search",
+        "Search fact-checks using hybrid search (FTS + semantic).",
+    ),
+    "orchestrator": (
+        "opennotes_cli.commands.orchestrator:orchestrator",
+        "Manage simulation orchestrators.",
+    ),
+    "playground": (
+        "opennotes_cli.commands.playground:playground",
+        "Manage playground community servers.",
+    ),
+    "rechunk": (
+        "opennotes_cli.commands.rechunk:rechunk",
+        "Rechunk and re-embed content.",
+    ),
+    "score": (
+        "opennotes_cli.commands.score:score",
+        "Trigger manual scoring for a community server.",
+    ),
+    "sim-agent": (
+        "opennotes_cli.commands.sim_agent:sim_agent",
+        "Manage simulation agent personalities.",
+    ),
+    "simulation": (
+        "opennotes_cli.commands.simulation:simulation",
+        "Manage simulation runs.",
+    ),
+}
 
 
 @dataclass
@@ -73,8 +112,53 @@ class HoistingGroup(click.Group):
         return super().parse_args(ctx, hoisted + rest)
 
 
+class LazyGroup(HoistingGroup):
+    """HoistingGroup whose subcommands are imported on first lookup."""
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: dict[str, tuple[str, str]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.commands[cmd_name] = self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        import_path, _ = self.lazy_commands[cmd_name]
+        module_name, attr = import_path.split(":", 1)
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{import_path} is not a click command")
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        # Listing commands must not import them: use the registered short
+        # help for commands that have not been loaded yet.
+        rows: list[tuple[str, str]] = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(formatter.width)))
+            else:
+                rows.append((name, self.lazy_commands[name][1]))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
 @tui()
-@click.group(cls=HoistingGroup)
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.option(
     "-e",
     "--env",
@@ -149,15 +233,3 @@ def cli(
 
     ctx.call_on_close(client.close)
 
-
-cli.add_command(analyze)
-cli.add_command(health)
-cli.add_command(hybrid_search)
-cli.add_command(rechunk)
-cli.add_command(fact_check)
-cli.add_command(batch)
-cli.add_command(score)
-cli.add_command(simulation)
-cli.add_command(sim_agent)
-cli.add_command(orchestrator)
-cli.add_command(playground)
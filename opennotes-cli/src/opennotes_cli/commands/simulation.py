@@ -1,18 +1,34 @@
 from __future__ import annotations
 
+import csv
 import json
+import os
 import sys
 import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import click
+import httpx
 from rich.console import Console
 from rich.panel import Panel
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeRemainingColumn,
+)
 from rich.table import Table
 
 from opennotes_cli.display import get_cli_prefix, get_status_style, handle_jsonapi_error
-from opennotes_cli.formatting import format_id, resolve_id
+from opennotes_cli.formatting import ZWS, format_id, resolve_id
 from opennotes_cli.http import add_csrf, get_csrf_token
 from opennotes_cli.polling import poll_batch_job_until_complete, poll_simulation_until_complete
 
@@ -22,6 +38,9 @@ if TYPE_CHECKING:
 console = Console()
 error_console = Console(stderr=True)
 
+_EXPORT_FORMATS = ("csv", "ndjson", "xlsx")
+_RESUMABLE_EXPORT_FORMATS = ("csv", "ndjson")
+
 
 @click.group()
 def simulation() -> None:
@@ -814,15 +833,38 @@ def simulation_launch(
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["terminal", "markdown", "xlsx"]),
+    type=click.Choice(["terminal", "markdown", *_EXPORT_FORMATS]),
     default="terminal",
     help="Output format.",
 )
 @click.option("--detailed", is_flag=True, help="Fetch detailed per-note/rating/request data.")
-@click.option("--output", "output_path", default=None, help="Output file path (for xlsx format).")
+@click.option(
+    "--output",
+    "output_path",
+    default=None,
+    help="Output path (file for xlsx/ndjson, directory for csv).",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(1, 16),
+    default=4,
+    show_default=True,
+    help="Detailed pages fetched in parallel.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Continue a partial csv/ndjson export at --output instead of starting over.",
+)
 @click.pass_context
 def simulation_analysis(
-    ctx: click.Context, simulation_id: str, output_format: str, detailed: bool, output_path: str | None
+    ctx: click.Context,
+    simulation_id: str,
+    output_format: str,
+    detailed: bool,
+    output_path: str | None,
+    concurrency: int,
+    resume: bool,
 ) -> None:
     """Show analysis results for a simulation run."""
     try:
@@ -836,15 +878,26 @@ def simulation_analysis(
     client = cli_ctx.client
     use_huuid = cli_ctx.use_huuid
 
-    if output_format == "xlsx" and not detailed:
-        error_console.print("[red]Error:[/red] --format xlsx requires --detailed flag.")
+    if output_format in _EXPORT_FORMATS and not detailed:
+        error_console.print(f"[red]Error:[/red] --format {output_format} requires --detailed flag.")
+        sys.exit(1)
+
+    if resume and output_format not in _RESUMABLE_EXPORT_FORMATS:
+        error_console.print("[red]Error:[/red] --resume is only supported for csv and ndjson exports.")
         sys.exit(1)
 
     csrf_token = get_csrf_token(client, base_url, cli_ctx.auth)
     headers = add_csrf(cli_ctx.auth.get_jsonapi_headers(), csrf_token)
 
     if detailed:
-        accumulated = _fetch_detailed_pages(client, base_url, headers, simulation_id)
+        if output_format in _EXPORT_FORMATS and not cli_ctx.json_output:
+            _export_detailed(
+                client, base_url, headers, simulation_id, output_format, output_path,
+                use_huuid, concurrency, resume,
+            )
+            return
+
+        accumulated = _fetch_detailed_pages(client, base_url, headers, simulation_id, concurrency)
 
         if cli_ctx.json_output:
             console.print(json.dumps(accumulated, indent=2, default=str))
@@ -852,8 +905,6 @@ def simulation_analysis(
 
         if output_format == "markdown":
             _render_detailed_markdown(simulation_id, accumulated, use_huuid)
-        elif output_format == "xlsx":
-            _render_detailed_xlsx(simulation_id, accumulated, output_path, use_huuid)
         else:
             _render_detailed_terminal(simulation_id, accumulated, use_huuid)
         return
@@ -1148,64 +1199,155 @@ def _render_analysis_markdown(simulation_id: str, attrs: dict[str, Any], use_huu
     click.echo("\n".join(lines))
 
 
+_DETAILED_PAGE_SIZE = 50
+
+
+def _get_detailed_page(
+    client: Any,
+    base_url: str,
+    headers: dict[str, str],
+    simulation_id: str,
+    page_number: int,
+) -> dict[str, Any]:
+    response = client.get(
+        f"{base_url}/api/v2/simulations/{simulation_id}/analysis/detailed",
+        headers=headers,
+        params={"page[number]": page_number, "page[size]": _DETAILED_PAGE_SIZE},
+    )
+    handle_jsonapi_error(response)
+    return response.json()
+
+
+def _last_page_number(body: dict[str, Any]) -> int | None:
+    last = body.get("links", {}).get("last")
+    if not last:
+        return None
+    value = httpx.URL(last).params.get("page[number]")
+    return int(value) if value and value.isdigit() else None
+
+
+def _iter_detailed_pages(
+    client: Any,
+    base_url: str,
+    headers: dict[str, str],
+    simulation_id: str,
+    concurrency: int = 1,
+    start_page: int = 1,
+) -> Iterator[tuple[int, int | None, dict[str, Any]]]:
+    """Yield ``(page_number, last_page, body)`` for each detailed-analysis page, in order.
+
+    The first page's ``last`` link gives the page count; the remaining pages
+    are then requested on the shared client with up to ``concurrency``
+    requests in flight. Pages are still yielded in order, so callers can
+    write each one as it arrives and checkpoint by page number. Without a
+    ``last`` link, pages are followed one at a time through ``next``.
+    """
+    page_number = start_page
+    body = _get_detailed_page(client, base_url, headers, simulation_id, page_number)
+    last_page = _last_page_number(body)
+
+    if last_page is None:
+        while True:
+            has_next = bool(body.get("links", {}).get("next"))
+            yield page_number, None, body
+            if not has_next:
+                return
+            page_number += 1
+            body = _get_detailed_page(client, base_url, headers, simulation_id, page_number)
+
+    yield page_number, last_page, body
+
+    remaining = iter(range(start_page + 1, last_page + 1))
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="detailed-page") as pool:
+        def submit(page: int) -> tuple[int, Future[dict[str, Any]]]:
+            return page, pool.submit(
+                _get_detailed_page, client, base_url, headers, simulation_id, page
+            )
+
+        in_flight = deque(submit(page) for page in islice(remaining, concurrency))
+        while in_flight:
+            page_number, future = in_flight.popleft()
+            in_flight.extend(submit(page) for page in islice(remaining, 1))
+            yield page_number, last_page, future.result()
+
+
+def _detailed_page_rows(
+    body: dict[str, Any],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    notes: list[dict[str, Any]] = []
+    ratings: list[dict[str, Any]] = []
+    for resource in body.get("data", []):
+        attrs = resource.get("attributes", {})
+        notes.append({
+            "note_id": attrs.get("note_id", ""),
+            "summary": attrs.get("summary", ""),
+            "classification": attrs.get("classification", ""),
+            "status": attrs.get("status", ""),
+            "helpfulness_score": attrs.get("helpfulness_score"),
+            "author_agent": attrs.get("author_agent_name", ""),
+            "request_id": attrs.get("request_id") or "",
+            "created_at": attrs.get("created_at"),
+        })
+        for r in attrs.get("ratings", []):
+            ratings.append({
+                "note_id": attrs.get("note_id", ""),
+                "note_summary": attrs.get("summary", ""),
+                "rater_agent": r.get("rater_agent_name", ""),
+                "helpfulness_level": r.get("helpfulness_level", ""),
+                "created_at": r.get("created_at"),
+            })
+    return notes, ratings
+
+
+def _detailed_page_meta(
+    body: dict[str, Any],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    meta = body.get("meta", {})
+    requests = meta.get("request_variance", {}).get("requests", [])
+    return list(requests), list(meta.get("agents", []))
+
+
+def _export_progress() -> Progress:
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeRemainingColumn(),
+        console=error_console,
+        transient=True,
+    )
+
+
 def _fetch_detailed_pages(
     client: Any,
     base_url: str,
     headers: dict[str, str],
     simulation_id: str,
+    concurrency: int = 1,
 ) -> dict[str, list[dict[str, Any]]]:
     all_notes: list[dict[str, Any]] = []
     all_ratings: list[dict[str, Any]] = []
     all_requests: list[dict[str, Any]] = []
     all_agents: list[dict[str, Any]] = []
-    page_number = 1
-
-    with error_console.status("Fetching detailed analysis...") as status:
-        while True:
-            status.update(f"Fetching page {page_number} ({len(all_notes)} notes so far)")
-            params = {"page[number]": page_number, "page[size]": 50}
-            response = client.get(
-                f"{base_url}/api/v2/simulations/{simulation_id}/analysis/detailed",
-                headers=headers,
-                params=params,
-            )
-            handle_jsonapi_error(response)
-            result = response.json()
-
-            for resource in result.get("data", []):
-                attrs = resource.get("attributes", {})
-                note = {
-                    "note_id": attrs.get("note_id", ""),
-                    "summary": attrs.get("summary", ""),
-                    "classification": attrs.get("classification", ""),
-                    "status": attrs.get("status", ""),
-                    "helpfulness_score": attrs.get("helpfulness_score"),
-                    "author_agent": attrs.get("author_agent_name", ""),
-                    "request_id": attrs.get("request_id") or "",
-                    "created_at": attrs.get("created_at"),
-                }
-                all_notes.append(note)
-                for r in attrs.get("ratings", []):
-                    all_ratings.append({
-                        "note_id": attrs.get("note_id", ""),
-                        "note_summary": attrs.get("summary", ""),
-                        "rater_agent": r.get("rater_agent_name", ""),
-                        "helpfulness_level": r.get("helpfulness_level", ""),
-                        "created_at": r.get("created_at"),
-                    })
-
+    pages = 0
+
+    with _export_progress() as progress:
+        task = progress.add_task("Fetching detailed analysis...", total=None)
+        for page_number, last_page, body in _iter_detailed_pages(
+            client, base_url, headers, simulation_id, concurrency
+        ):
+            notes, ratings = _detailed_page_rows(body)
+            all_notes.extend(notes)
+            all_ratings.extend(ratings)
             if page_number == 1:
-                meta = result.get("meta", {})
-                variance = meta.get("request_variance", {})
-                all_requests.extend(variance.get("requests", []))
-                all_agents.extend(meta.get("agents", []))
-
-            links = result.get("links", {})
-            if not links.get("next"):
-                break
-            page_number += 1
+                requests, agents = _detailed_page_meta(body)
+                all_requests.extend(requests)
+                all_agents.extend(agents)
+            pages += 1
+            progress.update(task, completed=pages, total=last_page)
 
-    error_console.print(f"Fetched {len(all_notes)} notes across {page_number} page(s)")
+    error_console.print(f"Fetched {len(all_notes)} notes across {pages} page(s)")
     return {"notes": all_notes, "ratings": all_ratings, "requests": all_requests, "agents": all_agents}
 
 
@@ -1513,122 +1655,307 @@ def _format_pydantic_ai_messages(msgs: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def _render_detailed_xlsx(
-    simulation_id: str,
-    data: dict[str, list[dict[str, Any]]],
-    output_path: str | None,
-    use_huuid: bool = False,
+# Table key -> (sheet title, [(column header, xlsx column width)]). Export
+# files are written row by row, so xlsx widths are fixed per column rather
+# than fitted to the data.
+_EXPORT_TABLES: dict[str, tuple[str, list[tuple[str, int]]]] = {
+    "notes": ("Notes", [
+        ("Note ID", 40), ("Summary", 60), ("Classification", 18), ("Status", 14),
+        ("Helpfulness Score", 18), ("Author Agent", 20), ("Request ID", 40), ("Created At", 28),
+    ]),
+    "ratings": ("Ratings", [
+        ("Note ID", 40), ("Note Summary", 60), ("Rater Agent", 20),
+        ("Helpfulness Level", 20), ("Created At", 28),
+    ]),
+    "requests": ("Requests", [
+        ("Request ID", 40), ("Content", 60), ("Content Type", 14),
+        ("Note Count", 12), ("Variance Score", 16),
+    ]),
+    "agents": ("Agents", [
+        ("Agent Name", 20), ("Personality Prompt", 60), ("Model", 24),
+        ("Memory Compaction Strategy", 28), ("Turn Count", 12), ("State", 12),
+        ("Token Count", 12), ("Recent Actions", 40), ("Last 30 Messages", 60),
+    ]),
+}
+
+_NDJSON_RECORD_TYPES = {"notes": "note", "ratings": "rating", "requests": "request", "agents": "agent"}
+
+
+def _export_row(table: str, record: dict[str, Any], use_huuid: bool) -> list[Any]:
+    if table == "notes":
+        return [
+            format_id(record.get("note_id"), use_huuid),
+            record.get("summary", ""),
+            record.get("classification", ""),
+            record.get("status", ""),
+            record.get("helpfulness_score"),
+            record.get("author_agent", ""),
+            format_id(record.get("request_id"), use_huuid),
+            record.get("created_at", ""),
+        ]
+    if table == "ratings":
+        return [
+            format_id(record.get("note_id"), use_huuid),
+            record.get("note_summary", "") or "",
+            record.get("rater_agent", ""),
+            record.get("helpfulness_level", ""),
+            record.get("created_at", ""),
+        ]
+    if table == "requests":
+        return [
+            format_id(record.get("request_id"), use_huuid),
+            record.get("content", ""),
+            record.get("content_type", ""),
+            record.get("note_count", 0),
+            record.get("variance_score"),
+        ]
+    recent = ", ".join(str(x) for x in (record.get("recent_actions", []) or []))
+    msgs = record.get("last_messages", []) or []
+    return [
+        record.get("agent_name", ""),
+        record.get("personality", ""),
+        record.get("model_name", ""),
+        record.get("memory_compaction_strategy", ""),
+        record.get("turn_count", 0),
+        record.get("state", ""),
+        record.get("token_count", 0),
+        recent,
+        _format_pydantic_ai_messages(msgs) if msgs else "",
+    ]
+
+
+class _DetailedExportWriter(ABC):
+    """Writes detailed-analysis tables to an export as pages arrive.
+
+    Resumable writers keep one append-only file per table; ``offsets()``
+    reports their sizes after the last complete page so a resumed export can
+    truncate any partially written page before appending again.
+    """
+
+    resumable = False
+
+    @abstractmethod
+    def write_rows(self, table: str, records: list[dict[str, Any]]) -> None: ...
+
+    def offsets(self) -> dict[str, int]:
+        return {}
+
+    def finish(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class _AppendFileWriter(_DetailedExportWriter):
+    resumable = True
+
+    def __init__(self, paths: dict[str, Path], offsets: dict[str, int] | None) -> None:
+        self._files: dict[str, Any] = {}
+        self._new: set[str] = set()
+        for key, path in paths.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if offsets is not None and path.exists():
+                os.truncate(path, offsets.get(str(path), 0))
+                self._files[key] = path.open("a", newline="", encoding="utf-8")
+            else:
+                self._files[key] = path.open("w", newline="", encoding="utf-8")
+                self._new.add(key)
+
+    def offsets(self) -> dict[str, int]:
+        sizes: dict[str, int] = {}
+        for f in self._files.values():
+            f.flush()
+            sizes[f.name] = os.fstat(f.fileno()).st_size
+        return sizes
+
+    def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+
+
+class _CsvExportWriter(_AppendFileWriter):
+    def __init__(self, directory: Path, use_huuid: bool, offsets: dict[str, int] | None) -> None:
+        super().__init__({table: directory / f"{table}.csv" for table in _EXPORT_TABLES}, offsets)
+        self._use_huuid = use_huuid
+        self._writers = {table: csv.writer(f) for table, f in self._files.items()}
+        for table in self._new:
+            self._writers[table].writerow([header for header, _ in _EXPORT_TABLES[table][1]])
+
+    def write_rows(self, table: str, records: list[dict[str, Any]]) -> None:
+        # format_id adds zero-width wrap hints for terminals; keep csv ids plain.
+        self._writers[table].writerows(
+            [v.replace(ZWS, "") if isinstance(v, str) else v for v in _export_row(table, record, self._use_huuid)]
+            for record in records
+        )
+
+
+class _NdjsonExportWriter(_AppendFileWriter):
+    def __init__(self, path: Path, offsets: dict[str, int] | None) -> None:
+        super().__init__({"all": path}, offsets)
+        self._file = self._files["all"]
+
+    def write_rows(self, table: str, records: list[dict[str, Any]]) -> None:
+        record_type = _NDJSON_RECORD_TYPES[table]
+        for record in records:
+            self._file.write(json.dumps({"type": record_type, **record}, default=str))
+            self._file.write("\n")
+
+
+class _XlsxExportWriter(_DetailedExportWriter):
+    def __init__(self, path: Path, use_huuid: bool) -> None:
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Font
+        from openpyxl.utils import get_column_letter
+
+        self._path = path
+        self._use_huuid = use_huuid
+        self._cell = WriteOnlyCell
+        self._header_font = Font(name="IBM Plex Sans Condensed", bold=True)
+        self._default_font = Font(name="IBM Plex Sans Condensed")
+        self._alignment = Alignment(vertical="top")
+        self._workbook = Workbook(write_only=True)
+        self._sheets: dict[str, Any] = {}
+        for table, (title, columns) in _EXPORT_TABLES.items():
+            ws = self._workbook.create_sheet(title)
+            for index, (_, width) in enumerate(columns, start=1):
+                ws.column_dimensions[get_column_letter(index)].width = width
+            self._sheets[table] = ws
+            self._append(table, [header for header, _ in columns], self._header_font)
+
+    def _append(self, table: str, values: list[Any], font: Any) -> None:
+        ws = self._sheets[table]
+        row = []
+        for value in values:
+            cell = self._cell(ws, value=_truncate_for_xlsx(value))
+            cell.font = font
+            cell.alignment = self._alignment
+            row.append(cell)
+        ws.append(row)
+
+    def write_rows(self, table: str, records: list[dict[str, Any]]) -> None:
+        for record in records:
+            self._append(table, _export_row(table, record, self._use_huuid), self._default_font)
+
+    def finish(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._workbook.save(self._path)
+
+
+def _default_export_path(simulation_id: str, output_format: str) -> Path:
+    stem = f"simulation-{simulation_id}-detailed"
+    return Path(stem if output_format == "csv" else f"{stem}.{output_format}")
+
+
+def _export_checkpoint_path(output_path: Path, output_format: str) -> Path:
+    if output_format == "csv":
+        return output_path / ".export-progress.json"
+    return output_path.with_name(f"{output_path.name}.progress.json")
+
+
+def _load_export_checkpoint(path: Path, simulation_id: str) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    state = json.loads(path.read_text())
+    if state.get("simulation_id") != simulation_id:
+        error_console.print(
+            f"[red]Error:[/red] {path} belongs to simulation {state.get('simulation_id')}, "
+            f"not {simulation_id}."
+        )
+        sys.exit(1)
+    return state
+
+
+def _save_export_checkpoint(
+    path: Path, simulation_id: str, next_page: int, offsets: dict[str, int]
 ) -> None:
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(json.dumps({
+        "simulation_id": simulation_id,
+        "next_page": next_page,
+        "offsets": offsets,
+    }))
+    tmp.replace(path)
+
+
+def _open_export_writer(
+    output_format: str,
+    output_path: Path,
+    use_huuid: bool,
+    offsets: dict[str, int] | None,
+) -> _DetailedExportWriter:
+    if output_format == "csv":
+        return _CsvExportWriter(output_path, use_huuid, offsets)
+    if output_format == "ndjson":
+        return _NdjsonExportWriter(output_path, offsets)
     try:
-        from openpyxl import Workbook
+        return _XlsxExportWriter(output_path, use_huuid)
     except ImportError:
         error_console.print("[red]Error:[/red] openpyxl is required for xlsx export. Install with: uv add openpyxl")
         sys.exit(1)
 
-    notes = data.get("notes", [])
-    ratings = data.get("ratings", [])
-    requests = data.get("requests", [])
 
-    wb = Workbook()
-
-    ws_notes = wb.active
-    assert ws_notes is not None
-    ws_notes.title = "Notes"
-    note_headers = ["Note ID", "Summary", "Classification", "Status", "Helpfulness Score", "Author Agent", "Request ID", "Created At"]
-    ws_notes.append(note_headers)
-    for n in notes:
-        ws_notes.append([
-            format_id(n.get("note_id"), use_huuid),
-            n.get("summary", ""),
-            n.get("classification", ""),
-            n.get("status", ""),
-            n.get("helpfulness_score"),
-            n.get("author_agent", ""),
-            format_id(n.get("request_id"), use_huuid),
-            n.get("created_at", ""),
-        ])
-
-    ws_ratings = wb.create_sheet("Ratings")
-    rating_headers = ["Note ID", "Note Summary", "Rater Agent", "Helpfulness Level", "Created At"]
-    ws_ratings.append(rating_headers)
-    for r in ratings:
-        ws_ratings.append([
-            format_id(r.get("note_id"), use_huuid),
-            r.get("note_summary", "") or "",
-            r.get("rater_agent", ""),
-            r.get("helpfulness_level", ""),
-            r.get("created_at", ""),
-        ])
-
-    ws_requests = wb.create_sheet("Requests")
-    request_headers = ["Request ID", "Content", "Content Type", "Note Count", "Variance Score"]
-    ws_requests.append(request_headers)
-    for req in requests:
-        ws_requests.append([
-            format_id(req.get("request_id"), use_huuid),
-            req.get("content", ""),
-            req.get("content_type", ""),
-            req.get("note_count", 0),
-            req.get("variance_score"),
-        ])
-
-    ws_agents = wb.create_sheet("Agents")
-    agent_headers = [
-        "Agent Name", "Personality Prompt", "Model",
-        "Memory Compaction Strategy", "Turn Count", "State",
-        "Token Count", "Recent Actions", "Last 30 Messages",
-    ]
-    ws_agents.append(agent_headers)
-    agents = data.get("agents", [])
-    for a in agents:
-        recent = ", ".join(str(x) for x in (a.get("recent_actions", []) or []))
-        msgs = a.get("last_messages", []) or []
-        msg_text = _format_pydantic_ai_messages(msgs) if msgs else ""
-        ws_agents.append([
-            a.get("agent_name", ""),
-            a.get("personality", ""),
-            a.get("model_name", ""),
-            a.get("memory_compaction_strategy", ""),
-            a.get("turn_count", 0),
-            a.get("state", ""),
-            a.get("token_count", 0),
-            recent,
-            msg_text,
-        ])
-
-    for ws in [ws_notes, ws_ratings, ws_requests, ws_agents]:
-        for row in ws.iter_rows():
-            for cell in row:
-                cell.value = _truncate_for_xlsx(cell.value)
-
-    for ws in [ws_notes, ws_ratings, ws_requests, ws_agents]:
-        for col in ws.columns:
-            max_length = 0
-            col_letter = col[0].column_letter
-            for cell in col:
-                try:
-                    cell_len = len(str(cell.value or ""))
-                    if cell_len > max_length:
-                        max_length = cell_len
-                except Exception:
-                    pass
-            adjusted_width = min(max_length + 2, 60)
-            ws.column_dimensions[col_letter].width = adjusted_width
-
-    from openpyxl.styles import Alignment, Font
-
-    header_font = Font(name="IBM Plex Sans Condensed", bold=True)
-    default_font = Font(name="IBM Plex Sans Condensed")
-    default_alignment = Alignment(vertical="top")
-    for ws in [ws_notes, ws_ratings, ws_requests, ws_agents]:
-        for row in ws.iter_rows():
-            for cell in row:
-                cell.font = header_font if cell.row == 1 else default_font
-                cell.alignment = default_alignment
-
-    if not output_path:
-        output_path = f"simulation-{simulation_id}-detailed.xlsx"
-
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    wb.save(output_path)
-    console.print(f"[green]\u2713[/green] Saved detailed analysis to [bold]{output_path}[/bold]")
+def _export_detailed(
+    client: Any,
+    base_url: str,
+    headers: dict[str, str],
+    simulation_id: str,
+    output_format: str,
+    output_path: str | None,
+    use_huuid: bool = False,
+    concurrency: int = 1,
+    resume: bool = False,
+) -> None:
+    """Stream detailed analysis pages into a csv, ndjson or xlsx export.
+
+    Rows are written as each page arrives instead of after the whole run is
+    fetched. csv and ndjson exports record a checkpoint after every page and
+    can be continued with ``resume``; the checkpoint is removed on success.
+    """
+    path = Path(output_path) if output_path else _default_export_path(simulation_id, output_format)
+    checkpoint_path = _export_checkpoint_path(path, output_format)
+    start_page = 1
+    offsets: dict[str, int] | None = None
+
+    if resume:
+        state = _load_export_checkpoint(checkpoint_path, simulation_id)
+        if state is None:
+            error_console.print(
+                f"[yellow]No partial export found at {path}; starting from the first page.[/yellow]"
+            )
+        else:
+            start_page = state["next_page"]
+            offsets = state["offsets"]
+            error_console.print(f"Resuming export at page {start_page}")
+
+    writer = _open_export_writer(output_format, path, use_huuid, offsets)
+    notes_written = 0
+    try:
+        with _export_progress() as progress:
+            task = progress.add_task(
+                f"Exporting to {path}...", total=None, completed=start_page - 1
+            )
+            for page_number, last_page, body in _iter_detailed_pages(
+                client, base_url, headers, simulation_id, concurrency, start_page
+            ):
+                if page_number == 1:
+                    requests, agents = _detailed_page_meta(body)
+                    writer.write_rows("requests", requests)
+                    writer.write_rows("agents", agents)
+                notes, ratings = _detailed_page_rows(body)
+                writer.write_rows("notes", notes)
+                writer.write_rows("ratings", ratings)
+                notes_written += len(notes)
+                if writer.resumable:
+                    _save_export_checkpoint(
+                        checkpoint_path, simulation_id, page_number + 1, writer.offsets()
+                    )
+                progress.update(task, completed=page_number, total=last_page)
+        writer.finish()
+    finally:
+        writer.close()
+
+    checkpoint_path.unlink(missing_ok=True)
+    error_console.print(f"Exported {notes_written} notes")
+    console.print(f"[green]\u2713[/green] Saved detailed analysis to [bold]{path}[/bold]")
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
+import click
 import httpx
 import pytest
 from click.testing import CliRunner
 
-from opennotes_cli.cli import CliContext, cli
+from opennotes_cli.cli import LAZY_COMMANDS, CliContext, cli
 
 
 @pytest.fixture()
@@ -153,6 +156,45 @@ class TestAllCommandsRegistered:
         assert result.exit_code == 0, f"Command '{cmd}' failed: {result.output}"
 
 
+def _run_in_fresh_interpreter(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=60
+    )
+
+
+class TestLazyCommandLoading:
+    @pytest.mark.parametrize("name", sorted(LAZY_COMMANDS))
+    def test_lazy_entry_matches_command(self, name: str) -> None:
+        command = cli.get_command(click.Context(cli), name)
+        assert command is not None
+        assert command.name == name
+        assert command.get_short_help_str(limit=200) == LAZY_COMMANDS[name][1]
+
+    def test_help_lists_commands_without_importing_them(self) -> None:
+        result = _run_in_fresh_interpreter(
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from opennotes_cli.cli import cli\n"
+            "result = CliRunner().invoke(cli, ['--help'])\n"
+            "assert result.exit_code == 0, result.output\n"
+            "assert 'sim-agent' in result.output\n"
+            "print(','.join(sorted(m for m in sys.modules if m.startswith("
+            "('opennotes_cli.commands.', 'numpy', 'scipy', 'openpyxl')))))"
+        )
+        assert result.stdout.strip() == ""
+
+    def test_invoking_command_imports_only_its_module(self) -> None:
+        result = _run_in_fresh_interpreter(
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from opennotes_cli.cli import cli\n"
+            "CliRunner().invoke(cli, ['score', '--help'])\n"
+            "print(','.join(sorted(m for m in sys.modules "
+            "if m.startswith('opennotes_cli.commands.'))))"
+        )
+        assert result.stdout.strip() == "opennotes_cli.commands.score"
+
+
 class TestRechunkSubcommands:
     @pytest.mark.parametrize(
         "subcmd",
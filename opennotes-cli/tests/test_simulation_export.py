@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import csv
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from opennotes_cli.cli import cli
+from opennotes_cli.commands.simulation import _iter_detailed_pages
+
+SIM_ID = "019536b8-bdb2-7c81-8975-77f5c3dbdff8"
+DETAILED_URL = f"/api/v2/simulations/{SIM_ID}/analysis/detailed"
+
+
+@pytest.fixture()
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+def _note_resource(n: int) -> dict[str, Any]:
+    return {
+        "type": "simulation-detailed-notes",
+        "id": f"note-{n:03d}",
+        "attributes": {
+            "note_id": f"note-{n:03d}",
+            "summary": f"Summary {n}",
+            "classification": "MISINFORMATION",
+            "status": "scored",
+            "helpfulness_score": 0.5,
+            "author_agent_name": "Skeptic",
+            "request_id": f"req-{n:03d}",
+            "created_at": "2026-03-01T10:00:00Z",
+            "ratings": [
+                {
+                    "rater_agent_name": "Optimist",
+                    "helpfulness_level": "HELPFUL",
+                    "created_at": "2026-03-01T10:10:00Z",
+                }
+            ],
+        },
+    }
+
+
+def _page_body(page_number: int, total_pages: int) -> dict[str, Any]:
+    return {
+        "data": [_note_resource(page_number)],
+        "links": {
+            "self": f"{DETAILED_URL}?page[number]={page_number}&page[size]=1",
+            "last": f"{DETAILED_URL}?page[number]={total_pages}&page[size]=1",
+            "next": (
+                f"{DETAILED_URL}?page[number]={page_number + 1}&page[size]=1"
+                if page_number < total_pages
+                else None
+            ),
+        },
+        "meta": {
+            "count": total_pages,
+            "request_variance": {
+                "requests": (
+                    [{"request_id": "req-001", "content": "Claim", "content_type": "text",
+                      "note_count": 1, "variance_score": 0.1}]
+                    if page_number == 1
+                    else []
+                ),
+            },
+            "agents": (
+                [{"agent_name": "Skeptic", "personality": "Doubts", "last_messages": []}]
+                if page_number == 1
+                else []
+            ),
+        },
+    }
+
+
+def _make_paged_client(total_pages: int, fail_on_page: int | None = None) -> MagicMock:
+    """Client whose detailed-analysis responses depend on the requested page."""
+
+    def get(url: str, headers: Any = None, params: dict[str, Any] | None = None) -> MagicMock:
+        resp = MagicMock()
+        resp.status_code = 200
+        if params is None:
+            return resp
+        page_number = params["page[number]"]
+        if page_number == fail_on_page:
+            raise RuntimeError("connection reset")
+        resp.json.return_value = _page_body(page_number, total_pages)
+        return resp
+
+    mock_client = MagicMock()
+    mock_client.get.side_effect = get
+    mock_client.cookies = MagicMock()
+    mock_client.cookies.get.return_value = "test-csrf"
+    return mock_client
+
+
+def _requested_pages(mock_client: MagicMock) -> list[int]:
+    return [
+        c.kwargs["params"]["page[number]"]
+        for c in mock_client.get.call_args_list
+        if c.kwargs.get("params")
+    ]
+
+
+def _export(runner: CliRunner, mock_client: MagicMock, *args: str) -> Any:
+    with patch("opennotes_cli.cli.httpx.Client", return_value=mock_client):
+        return runner.invoke(
+            cli,
+            ["--local", "--uuid", "simulation", "analysis", "--detailed", *args, SIM_ID],
+        )
+
+
+class TestIterDetailedPages:
+    def test_yields_pages_in_order_when_responses_arrive_out_of_order(self) -> None:
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def get(url: str, headers: Any = None, params: dict[str, Any] | None = None) -> MagicMock:
+            nonlocal active, peak
+            page_number = params["page[number]"]
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05 if page_number % 2 == 0 else 0.01)
+            with lock:
+                active -= 1
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.json.return_value = _page_body(page_number, 6)
+            return resp
+
+        client = MagicMock()
+        client.get.side_effect = get
+
+        pages = [
+            (page_number, last_page)
+            for page_number, last_page, _ in _iter_detailed_pages(
+                client, "http://test", {}, SIM_ID, concurrency=3
+            )
+        ]
+
+        assert pages == [(n, 6) for n in range(1, 7)]
+        assert 1 < peak <= 3
+
+    def test_follows_next_links_without_last_link(self) -> None:
+        bodies = [_page_body(1, 2), _page_body(2, 2)]
+        for body in bodies:
+            del body["links"]["last"]
+        client = MagicMock()
+        client.get.side_effect = [MagicMock(status_code=200, json=MagicMock(return_value=b)) for b in bodies]
+
+        pages = [p for p, last, _ in _iter_detailed_pages(client, "http://test", {}, SIM_ID, concurrency=4)]
+
+        assert pages == [1, 2]
+
+
+class TestCsvExport:
+    def test_writes_one_file_per_table(self, runner: CliRunner, tmp_path: Path) -> None:
+        out_dir = tmp_path / "export"
+        result = _export(runner, _make_paged_client(3), "--format", "csv", "--output", str(out_dir))
+
+        assert result.exit_code == 0, result.output
+        with (out_dir / "notes.csv").open(newline="") as f:
+            notes = list(csv.reader(f))
+        assert notes[0][:2] == ["Note ID", "Summary"]
+        assert [row[0] for row in notes[1:]] == ["note-001", "note-002", "note-003"]
+        assert len((out_dir / "ratings.csv").read_text().splitlines()) == 4
+        assert len((out_dir / "requests.csv").read_text().splitlines()) == 2
+        assert len((out_dir / "agents.csv").read_text().splitlines()) == 2
+        assert not (out_dir / ".export-progress.json").exists()
+
+    def test_requires_detailed(self, runner: CliRunner) -> None:
+        with patch("opennotes_cli.cli.httpx.Client", return_value=_make_paged_client(1)):
+            result = runner.invoke(cli, ["--local", "simulation", "analysis", "--format", "csv", SIM_ID])
+        assert result.exit_code != 0
+        assert "requires --detailed" in result.output
+
+
+class TestNdjsonExport:
+    def test_streams_typed_records(self, runner: CliRunner, tmp_path: Path) -> None:
+        out = tmp_path / "export.ndjson"
+        result = _export(runner, _make_paged_client(2), "--format", "ndjson", "--output", str(out))
+
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in out.read_text().splitlines()]
+        assert [r["type"] for r in records] == [
+            "request", "agent", "note", "rating", "note", "rating",
+        ]
+        assert records[2]["note_id"] == "note-001"
+        assert records[4]["note_id"] == "note-002"
+
+
+class TestResumeExport:
+    def test_resume_continues_after_last_complete_page(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        out = tmp_path / "export.ndjson"
+        failed = _export(
+            runner,
+            _make_paged_client(4, fail_on_page=3),
+            "--format", "ndjson", "--output", str(out), "--concurrency", "1",
+        )
+        assert failed.exit_code != 0
+        checkpoint = json.loads((tmp_path / "export.ndjson.progress.json").read_text())
+        assert checkpoint["next_page"] == 3
+
+        with out.open("a") as f:
+            f.write('{"type": "note", "note_id": "partial')
+
+        mock_client = _make_paged_client(4)
+        result = _export(runner, mock_client, "--format", "ndjson", "--output", str(out), "--resume")
+
+        assert result.exit_code == 0, result.output
+        assert _requested_pages(mock_client) == [3, 4]
+        notes = [
+            json.loads(line)["note_id"]
+            for line in out.read_text().splitlines()
+            if json.loads(line)["type"] == "note"
+        ]
+        assert notes == ["note-001", "note-002", "note-003", "note-004"]
+        assert not (tmp_path / "export.ndjson.progress.json").exists()
+
+    def test_resume_rejected_for_xlsx(self, runner: CliRunner, tmp_path: Path) -> None:
+        result = _export(
+            runner, _make_paged_client(1),
+            "--format", "xlsx", "--output", str(tmp_path / "out.xlsx"), "--resume",
+        )
+        assert result.exit_code != 0
+        assert "--resume is only supported" in result.output
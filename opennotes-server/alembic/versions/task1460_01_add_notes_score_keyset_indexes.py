@@ -0,0 +1,53 @@
+"""Add partial score indexes for top-k note queries.
+
+Revision ID: task1460_01
+Revises: task1444_10
+Create Date: 2026-10-18
+
+GET /scoring/notes/top previously loaded every non-deleted note (with all
+ratings) in OFFSET batches and sorted in Python. It now reads notes in
+``helpfulness_score DESC, id DESC`` order with ``LIMIT`` and keyset
+pagination, so it needs matching indexes:
+
+- ``idx_notes_score_desc`` serves the unscoped (service account) query.
+- ``idx_notes_community_score_desc`` serves per-community queries.
+
+Both are partial on ``deleted_at IS NULL`` to match the endpoint's filter.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "task1460_01"
+down_revision: str | Sequence[str] | None = "task1444_10"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create partial score indexes on notes."""
+    op.create_index(
+        "idx_notes_score_desc",
+        "notes",
+        [sa.text("helpfulness_score DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_notes_community_score_desc",
+        "notes",
+        ["community_server_id", sa.text("helpfulness_score DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop partial score indexes on notes."""
+    op.drop_index("idx_notes_community_score_desc", table_name="notes", if_exists=True)
+    op.drop_index("idx_notes_score_desc", table_name="notes", if_exists=True)
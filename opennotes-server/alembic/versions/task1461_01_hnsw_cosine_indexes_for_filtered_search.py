@@ -0,0 +1,90 @@
+"""Replace IVFFlat embedding indexes with HNSW cosine indexes.
+
+Revision ID: task1461_01
+Revises: task1460_01
+Create Date: 2026-10-18
+
+previously_seen_messages and fact_check_items had IVFFlat indexes built with
+the default ``vector_l2_ops`` operator class. Every search on these tables
+orders by cosine distance (``<=>``), which that index cannot serve, so the
+per-message previously-seen lookup sequentially scanned the table.
+
+Both indexes are replaced with HNSW ``vector_cosine_ops`` indexes, matching
+``idx_chunk_embeddings_embedding_hnsw``. Searches filter by community or
+dataset tags with pgvector iterative index scans (hnsw.iterative_scan), so
+selective filters still return ``limit`` rows. For tenants whose rows are few
+the planner can instead use the community_server_id B-tree and sort exactly.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "task1461_01"
+down_revision: str | Sequence[str] | None = "task1460_01"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Swap the L2 IVFFlat indexes for cosine HNSW indexes."""
+    op.drop_index(
+        "idx_previously_seen_messages_embedding_ivfflat",
+        table_name="previously_seen_messages",
+        if_exists=True,
+    )
+    op.create_index(
+        "idx_previously_seen_messages_embedding_hnsw",
+        "previously_seen_messages",
+        ["embedding"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+        if_not_exists=True,
+    )
+
+    op.drop_index(
+        "idx_fact_check_items_embedding_ivfflat",
+        table_name="fact_check_items",
+        if_exists=True,
+    )
+    op.create_index(
+        "idx_fact_check_items_embedding_hnsw",
+        "fact_check_items",
+        ["embedding"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Restore the original IVFFlat indexes."""
+    op.drop_index(
+        "idx_fact_check_items_embedding_hnsw", table_name="fact_check_items", if_exists=True
+    )
+    op.create_index(
+        "idx_fact_check_items_embedding_ivfflat",
+        "fact_check_items",
+        ["embedding"],
+        unique=False,
+        postgresql_using="ivfflat",
+        postgresql_with={"lists": 100},
+    )
+
+    op.drop_index(
+        "idx_previously_seen_messages_embedding_hnsw",
+        table_name="previously_seen_messages",
+        if_exists=True,
+    )
+    op.create_index(
+        "idx_previously_seen_messages_embedding_ivfflat",
+        "previously_seen_messages",
+        ["embedding"],
+        unique=False,
+        postgresql_using="ivfflat",
+        postgresql_with={"lists": 100},
+    )
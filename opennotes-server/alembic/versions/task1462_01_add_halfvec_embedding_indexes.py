@@ -0,0 +1,47 @@
+"""Add half-precision HNSW expression indexes on embedding columns.
+
+Revision ID: task1462_01
+Revises: task1461_01
+Create Date: 2026-10-18
+
+Full-precision vector(1536) HNSW indexes take 6 KB per row and no longer fit
+in shared buffers. These indexes cast the existing column to halfvec(1536)
+in the index expression. That halves their size without a second column or
+a backfill, because the index build populates them from current rows.
+
+They are only used when VECTOR_SEARCH_QUANTIZATION=halfvec. In that mode,
+queries generate candidates from these indexes and re-rank them against the
+full-precision column. Once the mode is rolled out, the float32 HNSW indexes
+can be dropped to reclaim their memory.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "task1462_01"
+down_revision: str | Sequence[str] | None = "task1461_01"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+HALFVEC_INDEXES = (
+    ("idx_chunk_embeddings_embedding_halfvec_hnsw", "chunk_embeddings"),
+    ("idx_fact_check_items_embedding_halfvec_hnsw", "fact_check_items"),
+    ("idx_previously_seen_messages_embedding_halfvec_hnsw", "previously_seen_messages"),
+)
+
+
+def upgrade() -> None:
+    """Create halfvec HNSW expression indexes."""
+    for index_name, table_name in HALFVEC_INDEXES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} "
+            "USING hnsw ((embedding::halfvec(1536)) halfvec_cosine_ops) "
+            "WITH (m = 16, ef_construction = 64)"
+        )
+
+
+def downgrade() -> None:
+    """Drop halfvec HNSW expression indexes."""
+    for index_name, table_name in reversed(HALFVEC_INDEXES):
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
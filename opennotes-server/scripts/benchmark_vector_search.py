@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Benchmark vector search recall and latency for each quantization mode.
+
+Samples stored embeddings as queries and runs top-k nearest-neighbour
+searches against one embedding table, once per VECTOR_SEARCH_QUANTIZATION
+mode:
+
+- none: HNSW over the full-precision vector(1536) column
+- halfvec: HNSW over the halfvec(1536) expression index, then exact
+  re-ranking of k * rerank-factor candidates
+
+Recall@k is measured against an exact sequential scan of the same table.
+Each query runs with the same hnsw.* settings that
+configure_filtered_vector_scan applies in the application.
+
+Usage:
+    uv run python scripts/benchmark_vector_search.py
+    uv run python scripts/benchmark_vector_search.py --table previously_seen_messages -k 5
+    uv run python scripts/benchmark_vector_search.py --queries 200 --rerank-factor 8
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from scripts.benchmark_db_latency import percentile
+from src.database import SUPAVISOR_CONNECT_ARGS
+
+TABLES = ("chunk_embeddings", "fact_check_items", "previously_seen_messages")
+DIMENSIONS = 1536
+
+
+def ann_query(table: str, mode: str, k: int, rerank_factor: int) -> str:
+    if mode == "none":
+        return f"""
+            SELECT id FROM {table}
+            WHERE embedding IS NOT NULL
+            ORDER BY embedding <=> CAST(:embedding AS vector)
+            LIMIT {k}
+        """
+    return f"""
+        WITH candidates AS MATERIALIZED (
+            SELECT id, embedding <=> CAST(:embedding AS vector) AS distance
+            FROM {table}
+            WHERE embedding IS NOT NULL
+            ORDER BY (embedding::halfvec({DIMENSIONS})) <=> CAST(:embedding AS halfvec({DIMENSIONS}))
+            LIMIT {k * rerank_factor}
+        )
+        SELECT id FROM candidates ORDER BY distance LIMIT {k}
+    """
+
+
+async def _configure(conn: AsyncConnection, ef_search: int, exact: bool) -> None:
+    if exact:
+        await conn.execute(text("SET LOCAL enable_indexscan = off"))
+        return
+    await conn.execute(
+        text(
+            "SELECT set_config('hnsw.ef_search', :ef_search, true), "
+            "set_config('hnsw.iterative_scan', 'relaxed_order', true)"
+        ),
+        {"ef_search": str(ef_search)},
+    )
+
+
+async def _search(
+    conn: AsyncConnection, sql: str, embedding: str, ef_search: int, exact: bool = False
+) -> tuple[list, float]:
+    async with conn.begin():
+        await _configure(conn, ef_search, exact)
+        start = time.perf_counter()
+        result = await conn.execute(text(sql), {"embedding": embedding})
+        ids = [row[0] for row in result]
+        return ids, (time.perf_counter() - start) * 1000.0
+
+
+async def run_benchmark(
+    database_url: str, table: str, num_queries: int, k: int, rerank_factor: int, ef_search: int
+) -> dict[str, tuple[list[float], list[float]]]:
+    engine = create_async_engine(
+        database_url, poolclass=NullPool, connect_args=SUPAVISOR_CONNECT_ARGS
+    )
+    results: dict[str, tuple[list[float], list[float]]] = {
+        "none": ([], []),
+        "halfvec": ([], []),
+    }
+
+    try:
+        async with engine.connect() as conn:
+            sample = await conn.execute(
+                text(
+                    f"SELECT embedding::text FROM {table} "
+                    "WHERE embedding IS NOT NULL ORDER BY random() LIMIT :n"
+                ),
+                {"n": num_queries},
+            )
+            embeddings = [row[0] for row in sample]
+            await conn.commit()
+
+            for i, embedding in enumerate(embeddings):
+                exact_ids, _ = await _search(
+                    conn, ann_query(table, "none", k, 1), embedding, ef_search, exact=True
+                )
+                expected = set(exact_ids)
+                for mode, (recalls, latencies) in results.items():
+                    ids, elapsed_ms = await _search(
+                        conn, ann_query(table, mode, k, rerank_factor), embedding, ef_search
+                    )
+                    recalls.append(len(expected.intersection(ids)) / max(len(expected), 1))
+                    latencies.append(elapsed_ms)
+
+                if (i + 1) % 25 == 0:
+                    print(f"  Completed {i + 1}/{len(embeddings)} queries...")
+    finally:
+        await engine.dispose()
+
+    return results
+
+
+def print_results(results: dict[str, tuple[list[float], list[float]]], k: int) -> None:
+    print()
+    print("=" * 60)
+    print("  Vector Search Benchmark Results")
+    print("=" * 60)
+    print(f"  {'mode':<10}{'recall@' + str(k):>12}{'p50 ms':>12}{'p95 ms':>12}{'p99 ms':>12}")
+    print("-" * 60)
+    for mode, (recalls, latencies) in results.items():
+        if not latencies:
+            print(f"  {mode:<10}{'no data':>12}")
+            continue
+        print(
+            f"  {mode:<10}{statistics.mean(recalls):>12.3f}"
+            f"{percentile(latencies, 50):>12.2f}"
+            f"{percentile(latencies, 95):>12.2f}"
+            f"{percentile(latencies, 99):>12.2f}"
+        )
+    print("=" * 60)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark vector search quantization modes")
+    parser.add_argument("--table", choices=TABLES, default="chunk_embeddings")
+    parser.add_argument(
+        "--queries", "-n", type=int, default=100, help="Number of sampled queries (default: 100)"
+    )
+    parser.add_argument("-k", type=int, default=20, help="Neighbours per query (default: 20)")
+    parser.add_argument(
+        "--rerank-factor", type=int, default=4, help="halfvec candidates per result (default: 4)"
+    )
+    parser.add_argument("--ef-search", type=int, default=100, help="hnsw.ef_search (default: 100)")
+    parser.add_argument(
+        "--url",
+        type=str,
+        default=None,
+        help="Database URL (default: read from settings/DATABASE_URL)",
+    )
+    args = parser.parse_args()
+
+    database_url = args.url
+    if database_url is None:
+        from src.config import get_settings
+
+        database_url = get_settings().DATABASE_URL
+
+    print(f"Running {args.queries} top-{args.k} searches on {args.table}...")
+    results = asyncio.run(
+        run_benchmark(
+            database_url, args.table, args.queries, args.k, args.rerank_factor, args.ef_search
+        )
+    )
+    print_results(results, args.k)
+
+
+if __name__ == "__main__":
+    main()
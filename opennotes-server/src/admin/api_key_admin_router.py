@@ -10,6 +10,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.admin.schemas import AdminAPIKeyCreate, AdminAPIKeyListItem, AdminAPIKeyResponse
+from src.auth.api_key_cache import api_key_cache
 from src.auth.dependencies import get_current_user_or_api_key, require_scope_or_admin
 from src.auth.models import ALLOWED_API_KEY_SCOPES, PRIVILEGED_SCOPE_REQUIREMENTS, RESTRICTED_SCOPES
 from src.auth.password import get_password_hash
@@ -229,6 +230,7 @@ async def revoke_admin_api_key(
         )
 
     api_key.is_active = False
+    api_key_cache.invalidate_api_key(api_key.id)
 
     ip_address, user_agent = extract_request_context(request)
     await create_audit_log(
@@ -0,0 +1,94 @@
+"""In-process cache of verified API key credentials.
+
+Verifying a raw API key requires an Argon2id or bcrypt hash check, which is
+deliberately slow. Platform adapters present the same key on every request, so
+once a key has been verified we remember the result for a short TTL.
+
+Entries are keyed by an HMAC of the raw key under a per-process random secret,
+so raw keys are never held in memory and the cache key is useless outside this
+process. A cache hit only skips the hash check: callers still load the key and
+its user from the database, so revocation and deactivation take effect
+immediately on every instance. Local invalidation on revocation just frees the
+entry early.
+"""
+
+import hashlib
+import hmac
+import secrets
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+import pendulum
+from cachetools import TTLCache
+
+from src.config import settings
+from src.users.models import APIKey
+
+
+@dataclass(frozen=True, slots=True)
+class VerifiedAPIKey:
+    """A raw API key that has passed hash verification."""
+
+    api_key_id: UUID
+    user_id: UUID
+    scopes: tuple[str, ...]
+    expires_at: datetime | None
+
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at < pendulum.now("UTC")
+
+
+class VerifiedAPIKeyCache:
+    """Short-TTL map from HMAC(raw key) to the verified credential."""
+
+    def __init__(self, ttl_seconds: int, max_size: int) -> None:
+        self._secret = secrets.token_bytes(32)
+        self._entries: TTLCache[str, VerifiedAPIKey] = TTLCache(maxsize=max_size, ttl=ttl_seconds)
+        self._lock = threading.Lock()
+
+    def _fingerprint(self, raw_key: str) -> str:
+        return hmac.new(self._secret, raw_key.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def get(self, raw_key: str) -> VerifiedAPIKey | None:
+        """Return the cached credential for raw_key, dropping it if the key has expired."""
+        fingerprint = self._fingerprint(raw_key)
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is not None and entry.is_expired():
+                del self._entries[fingerprint]
+                return None
+            return entry
+
+    def put(self, raw_key: str, api_key: APIKey) -> None:
+        """Remember that raw_key verified against api_key."""
+        entry = VerifiedAPIKey(
+            api_key_id=api_key.id,
+            user_id=api_key.user_id,
+            scopes=tuple(api_key.scopes or ()),
+            expires_at=api_key.expires_at,
+        )
+        with self._lock:
+            self._entries[self._fingerprint(raw_key)] = entry
+
+    def invalidate_api_key(self, api_key_id: UUID) -> None:
+        """Drop entries for a revoked or rotated key."""
+        with self._lock:
+            stale = [fp for fp, e in self._entries.items() if e.api_key_id == api_key_id]
+            for fingerprint in stale:
+                del self._entries[fingerprint]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+api_key_cache = VerifiedAPIKeyCache(
+    ttl_seconds=settings.API_KEY_CACHE_TTL_SECONDS,
+    max_size=settings.API_KEY_CACHE_MAX_SIZE,
+)
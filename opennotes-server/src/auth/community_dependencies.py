@@ -30,6 +30,7 @@ from src.auth.permissions import (
     is_service_account,
 )
 from src.auth.platform_claims import get_platform_admin_status, get_request_platform
+from src.auth.principal_cache import principal_cache
 from src.database import get_db
 from src.llm_config.models import (
     COMMUNITY_SERVER_PLATFORM_ID_UNIQUE_CONSTRAINT,
@@ -86,6 +87,10 @@ async def get_profile_id_from_user(db: AsyncSession, user: User) -> UUID | None:
     Returns:
         UUID of the user's profile, or None if profile cannot be determined
     """
+    cached_profile_id = await principal_cache.get_profile_id(user.id)
+    if cached_profile_id is not None:
+        return cached_profile_id
+
     if user.discord_id:
         provider = AuthProvider.DISCORD
         provider_user_id = user.discord_id
@@ -97,6 +102,7 @@ async def get_profile_id_from_user(db: AsyncSession, user: User) -> UUID | None:
 
     identity = await get_identity_by_provider(db, provider, provider_user_id)
     if identity:
+        principal_cache.put_profile_id(user.id, identity.profile_id)
         return identity.profile_id
 
     # If no identity exists and this is a service account, auto-create profile + identity
@@ -607,6 +613,10 @@ async def get_user_community_ids(
     if not profile_id:
         return []
 
+    cached = await principal_cache.get_community_ids(profile_id)
+    if cached is not None:
+        return cached
+
     result = await db.execute(
         select(CommunityMember.community_id).where(
             CommunityMember.profile_id == profile_id,
@@ -614,4 +624,6 @@ async def get_user_community_ids(
             CommunityMember.banned_at.is_(None),
         )
     )
-    return list(result.scalars().all())
+    community_ids = list(result.scalars().all())
+    principal_cache.put_community_ids(profile_id, community_ids)
+    return community_ids
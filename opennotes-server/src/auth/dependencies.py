@@ -1,4 +1,5 @@
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer, OAuth2PasswordBearer
@@ -6,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.auth import verify_token
 from src.auth.permissions import is_account_active, is_platform_admin, is_service_account
+from src.auth.principal_cache import principal_cache
 from src.database import get_db
 from src.users.crud import get_user_by_id, verify_api_key
 from src.users.models import APIKey, User
@@ -14,6 +16,16 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 http_bearer = HTTPBearer(auto_error=False)
 
 
+async def _load_principal_user(db: AsyncSession, user_id: UUID) -> User | None:
+    """Load the authenticated user, served from principal_cache when fresh."""
+    user = await principal_cache.get_user(db, user_id)
+    if user is None:
+        user = await get_user_by_id(db, user_id)
+        if user is not None:
+            principal_cache.put_user(user)
+    return user
+
+
 def get_x_api_key(x_api_key: str | None = Header(None, alias="X-API-Key")) -> str | None:
     return x_api_key
 
@@ -34,7 +46,7 @@ async def get_current_user(
         raise credentials_exception
 
     # Fetch user from database
-    user = await get_user_by_id(db, token_data.user_id)
+    user = await _load_principal_user(db, token_data.user_id)
     if not user:
         raise credentials_exception
 
@@ -88,7 +100,7 @@ async def get_current_user_or_api_key(
     # Try JWT token first
     token_data = await verify_token(token)
     if token_data:
-        user = await get_user_by_id(db, token_data.user_id)
+        user = await _load_principal_user(db, token_data.user_id)
         if user and is_account_active(user):
             if user.tokens_valid_after is not None:
                 if token_data.iat is None:
@@ -1,17 +1,27 @@
+import asyncio
 import base64
 import hashlib
 import hmac
+from concurrent.futures import ThreadPoolExecutor
 
 import bcrypt
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 
+from src.config import settings
+
 _argon2_hasher = PasswordHasher(
     memory_cost=19456,
     time_cost=2,
     parallelism=1,
 )
 
+# Argon2 and bcrypt release the GIL, so a small pool keeps hash checks off the
+# event loop without letting a burst of logins use unbounded memory/CPU.
+_verify_executor = ThreadPoolExecutor(
+    max_workers=settings.API_KEY_VERIFY_WORKERS, thread_name_prefix="password-verify"
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> tuple[bool, bool]:
     """Verify a plain password against a hashed password
@@ -30,6 +40,14 @@ def verify_password(plain_password: str, hashed_password: str) -> tuple[bool, bo
     return _verify_bcrypt(plain_password, hashed_password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> tuple[bool, bool]:
+    """Run verify_password() on the bounded verification thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _verify_executor, verify_password, plain_password, hashed_password
+    )
+
+
 def _verify_argon2(plain_password: str, hashed_password: str) -> tuple[bool, bool]:
     """Verify password against Argon2id hash."""
     try:
@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.principal_cache import principal_cache
 from src.users.models import User
 from src.users.profile_models import CommunityMember, UserProfile
 
@@ -44,6 +45,7 @@ async def set_platform_admin(db: AsyncSession, user: User, is_admin: bool) -> No
     else:
         user.platform_roles = [r for r in (user.platform_roles or []) if r != "platform_admin"]
     await db.flush()
+    await principal_cache.invalidate_user(user.id)
 
 
 def is_service_account(user: User) -> bool:
@@ -0,0 +1,201 @@
+"""Short-TTL cache of resolved authentication principals.
+
+Without it, every JWT-authenticated request loads the User row, and community
+dependencies then resolve the user's profile through their identity and list
+their memberships. Entries live in process memory. They are keyed by user_id
+(user row, profile id) or profile_id (active community ids).
+
+Invalidation is shared across instances through Redis markers holding the
+time before which cached entries are stale. The markers are written by the
+revocation path (revoke_all_user_tokens), user updates and membership changes.
+A marker is dated slightly into the future, so an entry re-cached before the
+invalidating transaction commits is not trusted either.
+
+User hits are attached to the request's session with merge(load=False). The
+endpoint gets a normal persistent User without a SELECT.
+
+Caching is bypassed when no Redis client is configured, because invalidations
+from other instances could not be seen. Marker reads fail closed: if Redis
+errors while a marker is read, the entry is treated as stale and the request
+falls back to the database. If publishing a marker fails, the invalidating
+instance still evicts its own entries, but other instances may keep serving
+theirs until the TTL expires.
+"""
+
+import copy
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from cachetools import TTLCache
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.cache.redis_client import redis_client
+from src.config import settings
+from src.users.models import User
+
+logger = logging.getLogger(__name__)
+
+USER_MARKER_KEY = "principal_invalidated:user:{}"
+PROFILE_MARKER_KEY = "principal_invalidated:profile:{}"
+
+# Entries cached within this window after an invalidation are also treated as
+# stale, covering the gap until the invalidating transaction commits.
+INVALIDATION_GRACE_SECONDS = 5
+
+
+@dataclass(frozen=True, slots=True)
+class _UserEntry:
+    columns: dict[str, Any]
+    cached_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class _ProfileEntry:
+    profile_id: UUID
+    cached_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class _CommunityEntry:
+    community_ids: tuple[UUID, ...]
+    cached_at: float
+
+
+class PrincipalCache:
+    """In-process principal cache with Redis-coordinated invalidation."""
+
+    def __init__(self, ttl_seconds: int, max_size: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._users: TTLCache[UUID, _UserEntry] = TTLCache(maxsize=max_size, ttl=ttl_seconds)
+        self._profile_ids: TTLCache[UUID, _ProfileEntry] = TTLCache(
+            maxsize=max_size, ttl=ttl_seconds
+        )
+        self._communities: TTLCache[UUID, _CommunityEntry] = TTLCache(
+            maxsize=max_size, ttl=ttl_seconds
+        )
+
+    @staticmethod
+    def _enabled() -> bool:
+        return redis_client.client is not None
+
+    @staticmethod
+    async def _is_fresh(marker_key: str, cached_at: float) -> bool:
+        """Check the invalidation marker, treating any read failure as stale.
+
+        The client is called directly because redis_client.get() reports errors
+        as a missing key, which would read as "never invalidated".
+        """
+        client = redis_client.client
+        if client is None:
+            return False
+        try:
+            marker = await client.get(marker_key)
+            return marker is None or float(marker) < cached_at
+        except Exception as e:
+            logger.warning(f"Principal cache marker read failed for {marker_key}: {e}")
+            return False
+
+    async def _mark_invalidated(self, marker_key: str) -> None:
+        """Publish an invalidation marker for other instances.
+
+        Callers evict their local entries before publishing. When publishing
+        fails, other instances cannot see the invalidation and may serve their
+        entries for up to ttl_seconds.
+        """
+        if not self._enabled():
+            return
+        try:
+            published = await redis_client.set(
+                marker_key,
+                str(time.time() + INVALIDATION_GRACE_SECONDS),
+                ttl=self.ttl_seconds + INVALIDATION_GRACE_SECONDS,
+            )
+        except Exception as e:
+            logger.error(f"Failed to publish principal cache invalidation {marker_key}: {e}")
+            return
+        if not published:
+            logger.error(f"Failed to publish principal cache invalidation {marker_key}")
+
+    async def get_user(self, db: AsyncSession, user_id: UUID) -> User | None:
+        """Return the cached user attached to db, or None on a miss."""
+        if not self._enabled():
+            return None
+        entry = self._users.get(user_id)
+        if entry is None:
+            return None
+        if not await self._is_fresh(USER_MARKER_KEY.format(user_id), entry.cached_at):
+            self._users.pop(user_id, None)
+            self._profile_ids.pop(user_id, None)
+            return None
+
+        user = User(**copy.deepcopy(entry.columns))
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+
+    def put_user(self, user: User) -> None:
+        if not self._enabled():
+            return
+        columns = {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+        self._users[user.id] = _UserEntry(columns=copy.deepcopy(columns), cached_at=time.time())
+
+    async def get_profile_id(self, user_id: UUID) -> UUID | None:
+        """Return the cached profile id for a user, or None on a miss."""
+        if not self._enabled():
+            return None
+        entry = self._profile_ids.get(user_id)
+        if entry is None:
+            return None
+        if not await self._is_fresh(USER_MARKER_KEY.format(user_id), entry.cached_at):
+            self._users.pop(user_id, None)
+            self._profile_ids.pop(user_id, None)
+            return None
+        return entry.profile_id
+
+    def put_profile_id(self, user_id: UUID, profile_id: UUID) -> None:
+        if self._enabled():
+            self._profile_ids[user_id] = _ProfileEntry(profile_id=profile_id, cached_at=time.time())
+
+    async def get_community_ids(self, profile_id: UUID) -> list[UUID] | None:
+        """Return the cached active community ids for a profile, or None on a miss."""
+        if not self._enabled():
+            return None
+        entry = self._communities.get(profile_id)
+        if entry is None:
+            return None
+        if not await self._is_fresh(PROFILE_MARKER_KEY.format(profile_id), entry.cached_at):
+            self._communities.pop(profile_id, None)
+            return None
+        return list(entry.community_ids)
+
+    def put_community_ids(self, profile_id: UUID, community_ids: list[UUID]) -> None:
+        if self._enabled():
+            self._communities[profile_id] = _CommunityEntry(
+                community_ids=tuple(community_ids), cached_at=time.time()
+            )
+
+    async def invalidate_user(self, user_id: UUID) -> None:
+        """Drop a user's cached row and profile id on every instance."""
+        self._users.pop(user_id, None)
+        self._profile_ids.pop(user_id, None)
+        await self._mark_invalidated(USER_MARKER_KEY.format(user_id))
+
+    async def invalidate_profile(self, profile_id: UUID) -> None:
+        """Drop a profile's cached community memberships on every instance."""
+        self._communities.pop(profile_id, None)
+        await self._mark_invalidated(PROFILE_MARKER_KEY.format(profile_id))
+
+    def clear(self) -> None:
+        self._users.clear()
+        self._profile_ids.clear()
+        self._communities.clear()
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+)
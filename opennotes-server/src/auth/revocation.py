@@ -6,6 +6,7 @@ from uuid import UUID
 import pendulum
 from jose import JWTError, jwt
 
+from src.auth.principal_cache import principal_cache
 from src.cache.redis_client import redis_client
 from src.circuit_breaker import CircuitBreakerError, circuit_breaker_registry
 from src.config import settings
@@ -157,8 +158,9 @@ async def revoke_all_user_tokens(user_id: UUID) -> bool:
     """
     Revoke all tokens for a user by updating their tokens_valid_after timestamp.
 
-    This doesn't use Redis - instead it relies on the tokens_valid_after field
-    in the User model which is checked during token verification.
+    Token rejection relies on the tokens_valid_after field in the User model,
+    which is checked during token verification. The cached principal for the
+    user is invalidated so the new value is seen immediately.
 
     Args:
         user_id: The user ID whose tokens should be revoked
@@ -167,5 +169,7 @@ async def revoke_all_user_tokens(user_id: UUID) -> bool:
         True (this is handled by updating the User model directly)
     """
     logger.info(f"Revoking all tokens for user_id={user_id} via tokens_valid_after")
-    # This is handled by the caller updating the User.tokens_valid_after field
+    # The caller updates User.tokens_valid_after; drop cached principals so every
+    # instance re-reads it on the next request
+    await principal_cache.invalidate_user(user_id)
     return True
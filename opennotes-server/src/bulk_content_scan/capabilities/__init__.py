@@ -5,11 +5,15 @@ They are independently importable without BulkContentScanService.
 """
 
 from src.bulk_content_scan.capabilities.flashpoint import detect_flashpoint
-from src.bulk_content_scan.capabilities.moderation import check_content_moderation
+from src.bulk_content_scan.capabilities.moderation import (
+    check_content_moderation,
+    check_content_moderation_batch,
+)
 from src.bulk_content_scan.capabilities.similarity import search_similar_claims
 
 __all__ = [
     "check_content_moderation",
+    "check_content_moderation_batch",
     "detect_flashpoint",
     "search_similar_claims",
 ]
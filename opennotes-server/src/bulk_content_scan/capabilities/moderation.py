@@ -1,5 +1,6 @@
 """OpenAI content moderation capability for bulk content scanning."""
 
+from collections.abc import Sequence
 from typing import Any
 
 from src.bulk_content_scan.schemas import ContentItem, OpenAIModerationMatch
@@ -37,13 +38,7 @@ async def check_content_moderation(
         else:
             moderation_result = await moderation_service.moderate_text(content_item.content_text)
 
-        if moderation_result.flagged:
-            return OpenAIModerationMatch(
-                max_score=moderation_result.max_score,
-                categories=moderation_result.categories,
-                scores=moderation_result.scores,
-                flagged_categories=moderation_result.flagged_categories,
-            )
+        return moderation_match_from_result(moderation_result)
 
     except Exception as e:
         logger.warning(
@@ -55,3 +50,58 @@ async def check_content_moderation(
         )
 
     return None
+
+
+def moderation_match_from_result(moderation_result: Any) -> OpenAIModerationMatch | None:
+    """Convert a ModerationResult into an OpenAIModerationMatch when it is flagged."""
+    if not moderation_result.flagged:
+        return None
+    return OpenAIModerationMatch(
+        max_score=moderation_result.max_score,
+        categories=moderation_result.categories,
+        scores=moderation_result.scores,
+        flagged_categories=moderation_result.flagged_categories,
+    )
+
+
+async def check_content_moderation_batch(
+    content_items: Sequence[ContentItem],
+    moderation_service: Any,
+) -> dict[str, OpenAIModerationMatch | None] | None:
+    """Run OpenAI content moderation on many content items in shared requests.
+
+    Uses OpenAIModerationService.moderate_batch, which groups texts into
+    multi-input requests and dedupes identical texts and image URLs by
+    content hash.
+
+    Args:
+        content_items: The platform-agnostic content items to moderate.
+        moderation_service: OpenAIModerationService instance, or None if not configured.
+
+    Returns:
+        Mapping of content_id to OpenAIModerationMatch (None when not flagged),
+        or None if the batch could not be moderated and callers should fall
+        back to check_content_moderation per item.
+    """
+    if moderation_service is None or not content_items:
+        return None
+
+    try:
+        results = await moderation_service.moderate_batch(
+            [(item.content_text, item.attachment_urls or []) for item in content_items]
+        )
+        return {
+            item.content_id: moderation_match_from_result(result)
+            for item, result in zip(content_items, results, strict=True)
+        }
+
+    except Exception as e:
+        logger.warning(
+            "Error in batch content moderation capability",
+            extra={
+                "batch_size": len(content_items),
+                "error": str(e),
+            },
+        )
+
+    return None
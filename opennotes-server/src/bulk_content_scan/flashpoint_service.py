@@ -6,6 +6,8 @@ import asyncio
 import os
 import threading
 import warnings
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -42,6 +44,7 @@ class FlashpointDetectionService:
 
     DEFAULT_MAX_CONTEXT = 5
     DEFAULT_SCORE_THRESHOLD = 50
+    DEFAULT_BATCH_THREADS = 8
 
     def __init__(
         self,
@@ -132,6 +135,35 @@ class FlashpointDetectionService:
         with _dspy.context(lm=self._lm):
             return detector(context=context_str, message=current_msg)
 
+    def _run_detector_batch(
+        self,
+        detector: RubricDetector,
+        inputs: list[tuple[str, str]],
+    ) -> list[Any]:
+        """Run the detector over many (context, message) inputs in one worker thread hop.
+
+        Inputs are fanned out over a small thread pool so the LLM calls overlap.
+        Each slot holds either the prediction or the exception raised for that
+        input, so one failure does not discard the rest of the batch.
+        """
+
+        def _run_one(item: tuple[str, str]) -> Any:
+            try:
+                return self._run_detector(detector, item[0], item[1])
+            except Exception as e:
+                return e
+
+        if len(inputs) <= 1:
+            return [_run_one(item) for item in inputs]
+
+        max_workers = min(self.DEFAULT_BATCH_THREADS, len(inputs))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_run_one, inputs))
+
+    @staticmethod
+    def _format_message(message: BulkScanMessage) -> str:
+        return f"{message.author_username or message.author_id}: {message.content}"
+
     async def detect_flashpoint(
         self,
         message: BulkScanMessage,
@@ -169,11 +201,9 @@ class FlashpointDetectionService:
 
         try:
             recent_context = context_messages[-max_context:] if context_messages else []
-            context_str = "\n".join(
-                f"{m.author_username or m.author_id}: {m.content}" for m in recent_context
-            )
+            context_str = "\n".join(self._format_message(m) for m in recent_context)
 
-            current_msg = f"{message.author_username or message.author_id}: {message.content}"
+            current_msg = self._format_message(message)
 
             detector = self._get_detector()
             result = await asyncio.to_thread(self._run_detector, detector, context_str, current_msg)
@@ -213,6 +243,116 @@ class FlashpointDetectionService:
             )
             raise
 
+    async def detect_flashpoints_batch(
+        self,
+        items: Sequence[tuple[BulkScanMessage, list[BulkScanMessage]]],
+        max_context: int | None = None,
+        score_threshold: int | None = None,
+    ) -> list[ConversationFlashpointMatch | Exception | None]:
+        """Detect flashpoints for many messages in a single detector pass.
+
+        Messages from the same channel share most of their context window, so
+        each message is formatted once and reused across every context string
+        it appears in, and identical (context, message) inputs are sent to the
+        detector only once. All detector calls share one thread hop.
+
+        Args:
+            items: (message, context_messages) pairs, with context time-ordered
+                as for detect_flashpoint
+            max_context: Maximum number of context messages to include
+                (defaults to DEFAULT_MAX_CONTEXT)
+            score_threshold: Minimum derailment_score to flag (defaults to
+                DEFAULT_SCORE_THRESHOLD)
+
+        Returns:
+            One entry per input pair, in order: a ConversationFlashpointMatch if
+            derailment_score >= threshold, None otherwise (including when that
+            message hit a transient error). A message that hit a critical
+            (non-transient) error gets the logged exception in its slot instead
+            of failing the whole batch, so callers can retry just that message.
+        """
+        from src.bulk_content_scan.flashpoint_utils import parse_derailment_score, parse_risk_level
+        from src.bulk_content_scan.schemas import ConversationFlashpointMatch
+
+        if not items:
+            return []
+        if max_context is None:
+            max_context = self.DEFAULT_MAX_CONTEXT
+        if score_threshold is None:
+            score_threshold = self.DEFAULT_SCORE_THRESHOLD
+
+        formatted: dict[str, str] = {}
+
+        def _line(m: BulkScanMessage) -> str:
+            line = formatted.get(m.message_id)
+            if line is None:
+                line = formatted[m.message_id] = self._format_message(m)
+            return line
+
+        input_index: dict[tuple[str, str], int] = {}
+        unique_inputs: list[tuple[str, str]] = []
+        item_slots: list[tuple[int, int]] = []
+        for message, context_messages in items:
+            recent_context = context_messages[-max_context:] if context_messages else []
+            key = ("\n".join(_line(m) for m in recent_context), _line(message))
+            slot = input_index.get(key)
+            if slot is None:
+                slot = input_index[key] = len(unique_inputs)
+                unique_inputs.append(key)
+            item_slots.append((slot, len(recent_context)))
+
+        try:
+            detector = self._get_detector()
+            outputs = await asyncio.to_thread(self._run_detector_batch, detector, unique_inputs)
+        except _TRANSIENT_ERRORS as e:
+            logger.warning(
+                "Flashpoint batch detection failed (transient)",
+                extra={"error": str(e), "error_type": type(e).__name__, "batch_size": len(items)},
+            )
+            return [None] * len(items)
+
+        results: list[ConversationFlashpointMatch | Exception | None] = []
+        for (message, _), (slot, context_count) in zip(items, item_slots, strict=True):
+            output = outputs[slot]
+            if isinstance(output, _TRANSIENT_ERRORS):
+                logger.warning(
+                    "Flashpoint detection failed (transient)",
+                    extra={
+                        "error": str(output),
+                        "error_type": type(output).__name__,
+                        "message_id": message.message_id,
+                    },
+                )
+                results.append(None)
+                continue
+            if isinstance(output, Exception):
+                logger.error(
+                    "Flashpoint detection failed (critical)",
+                    extra={
+                        "error": str(output),
+                        "error_type": type(output).__name__,
+                        "message_id": message.message_id,
+                    },
+                )
+                results.append(output)
+                continue
+
+            derailment_score = parse_derailment_score(output.derailment_score)
+            if derailment_score < score_threshold:
+                results.append(None)
+                continue
+
+            results.append(
+                ConversationFlashpointMatch(
+                    derailment_score=derailment_score,
+                    risk_level=parse_risk_level(output.risk_level, derailment_score),
+                    reasoning=output.reasoning,
+                    context_messages=context_count,
+                )
+            )
+
+        return results
+
 
 _flashpoint_service: FlashpointDetectionService | None = None
 _singleton_lock = threading.Lock()
@@ -1,15 +1,30 @@
 """OpenAI moderation service for content scanning."""
 
+import asyncio
+import hashlib
 import logging
+from collections.abc import Sequence
 from typing import Any
 
+from cachetools import LRUCache
 from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
+from redis.asyncio import Redis
+
+from src.config import settings
 
 logger = logging.getLogger(__name__)
 
 MODERATION_MODEL = "omni-moderation-latest"
 
+# Maximum number of text inputs sent in one moderations.create() request.
+MODERATION_BATCH_SIZE = 32
+# Image inputs are sent one per request; this bounds how many are in flight.
+MODERATION_IMAGE_CONCURRENCY = 4
+# Content-hash results kept per service instance, shared across batches.
+MODERATION_CACHE_SIZE = 10_000
+MODERATION_CACHE_KEY_PREFIX = "moderation_result"
+
 MODERATION_CATEGORY_NAMES = [
     "violence",
     "violence/graphic",
@@ -40,13 +55,73 @@ class ModerationResult(BaseModel):
 class OpenAIModerationService:
     """Service for moderating content using OpenAI's moderation API."""
 
-    def __init__(self, client: AsyncOpenAI):
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        cache_size: int = MODERATION_CACHE_SIZE,
+        redis_client: Redis | None = None,
+    ):
         """Initialize the service with an OpenAI client.
 
         Args:
             client: AsyncOpenAI client instance
+            cache_size: Maximum number of content-hash results kept in memory;
+                reusing one instance across scan batches lets repeated texts
+                and images skip the API entirely
+            redis_client: Optional Redis client backing a second cache tier
+                shared across instances and workers, expiring after
+                MODERATION_CACHE_TTL
         """
         self.client = client
+        self.redis_client = redis_client
+        self._cache: LRUCache[str, ModerationResult] = LRUCache(maxsize=cache_size)
+
+    @staticmethod
+    def _cache_key(kind: str, value: str) -> str:
+        digest = hashlib.sha256(value.encode("utf-8")).hexdigest()
+        return f"{MODERATION_MODEL}:{kind}:{digest}"
+
+    @staticmethod
+    def _redis_cache_key(key: str) -> str:
+        return f"{settings.ENVIRONMENT}:{MODERATION_CACHE_KEY_PREFIX}:{key}"
+
+    async def _get_shared_results(self, keys: Sequence[str]) -> dict[str, ModerationResult]:
+        """Read results for cache keys from Redis, promoting hits into the LRU."""
+        if not keys or self.redis_client is None or not settings.MODERATION_CACHE_TTL:
+            return {}
+
+        cached: dict[str, ModerationResult] = {}
+        try:
+            raw_values = await self.redis_client.mget(  # type: ignore[misc]
+                [self._redis_cache_key(key) for key in keys]
+            )
+            if not isinstance(raw_values, list):
+                return {}
+            for key, raw in zip(keys, raw_values, strict=True):
+                if raw is None:
+                    continue
+                cached[key] = self._cache[key] = ModerationResult.model_validate_json(raw)
+        except Exception:
+            logger.warning("Failed to read shared moderation results", exc_info=True)
+
+        return cached
+
+    async def _store_shared_results(self, results: dict[str, ModerationResult]) -> None:
+        ttl = settings.MODERATION_CACHE_TTL
+        if not results or self.redis_client is None or not ttl:
+            return
+
+        try:
+            await asyncio.gather(
+                *(
+                    self.redis_client.set(
+                        self._redis_cache_key(key), result.model_dump_json(), ex=ttl
+                    )
+                    for key, result in results.items()
+                )
+            )
+        except Exception:
+            logger.warning("Failed to store shared moderation results", exc_info=True)
 
     async def moderate_text(self, text: str) -> ModerationResult:
         """Moderate text content.
@@ -57,12 +132,7 @@ class OpenAIModerationService:
         Returns:
             ModerationResult with flagged status and category scores
         """
-        response = await self.client.moderations.create(
-            model=MODERATION_MODEL,
-            input=[{"type": "text", "text": text}],
-        )
-
-        return self._parse_response(response)
+        return (await self.moderate_texts([text]))[0]
 
     async def moderate_image(self, image_url: str) -> ModerationResult:
         """Moderate an image by URL.
@@ -73,12 +143,23 @@ class OpenAIModerationService:
         Returns:
             ModerationResult with flagged status and category scores
         """
+        key = self._cache_key("image", image_url)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        shared = await self._get_shared_results([key])
+        if key in shared:
+            return shared[key]
+
         response = await self.client.moderations.create(
             model=MODERATION_MODEL,
             input=[{"type": "image_url", "image_url": {"url": image_url}}],
         )
 
-        return self._parse_response(response)
+        result = self._parse_response(response)
+        self._cache[key] = result
+        await self._store_shared_results({key: result})
+        return result
 
     async def moderate_multimodal(self, text: str, image_urls: list[str]) -> ModerationResult:
         """Moderate text and images together.
@@ -101,6 +182,114 @@ class OpenAIModerationService:
 
         return self._parse_response(response)
 
+    async def moderate_texts(self, texts: Sequence[str]) -> list[ModerationResult]:
+        """Moderate many texts, sending up to MODERATION_BATCH_SIZE per request.
+
+        Identical texts are moderated once and results are cached by content
+        hash, in memory and (when a Redis client is configured) in Redis, so
+        repeats within this call, a later one, or another worker's batch do
+        not hit the API.
+
+        Args:
+            texts: Text contents to moderate
+
+        Returns:
+            One ModerationResult per input text, in input order
+        """
+        keys = [self._cache_key("text", text) for text in texts]
+        resolved: dict[str, ModerationResult] = {}
+        pending: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key in resolved or key in pending:
+                continue
+            cached = self._cache.get(key)
+            if cached is not None:
+                resolved[key] = cached
+            else:
+                pending[key] = text
+
+        shared = await self._get_shared_results(list(pending))
+        resolved.update(shared)
+        pending_items = [(key, text) for key, text in pending.items() if key not in shared]
+        fresh: dict[str, ModerationResult] = {}
+        for start in range(0, len(pending_items), MODERATION_BATCH_SIZE):
+            chunk = pending_items[start : start + MODERATION_BATCH_SIZE]
+            response = await self.client.moderations.create(
+                model=MODERATION_MODEL,
+                input=[text for _, text in chunk],
+            )
+            if len(response.results) != len(chunk):
+                raise ValueError(
+                    f"Moderation API returned {len(response.results)} results "
+                    f"for {len(chunk)} inputs"
+                )
+            for (key, _), result in zip(chunk, response.results, strict=True):
+                resolved[key] = fresh[key] = self._cache[key] = self._parse_result(result)
+
+        await self._store_shared_results(fresh)
+        return [resolved[key] for key in keys]
+
+    async def moderate_batch(
+        self, items: Sequence[tuple[str, Sequence[str]]]
+    ) -> list[ModerationResult]:
+        """Moderate many (text, image_urls) items with as few requests as possible.
+
+        All texts go through moderate_texts in shared requests. Each distinct
+        image URL is moderated once (the API scores one multimodal input per
+        request) and cached by URL hash. An item's result merges its text and
+        image results: it is flagged if any part is, and each category score
+        is the highest across its parts.
+
+        Args:
+            items: (text, image_urls) pairs to moderate
+
+        Returns:
+            One ModerationResult per item, in input order
+        """
+        text_results = await self.moderate_texts([text for text, _ in items])
+
+        image_urls = list(dict.fromkeys(url for _, urls in items for url in urls))
+        semaphore = asyncio.Semaphore(MODERATION_IMAGE_CONCURRENCY)
+
+        async def _moderate_one(url: str) -> ModerationResult:
+            async with semaphore:
+                return await self.moderate_image(url)
+
+        image_results = dict(
+            zip(
+                image_urls,
+                await asyncio.gather(*(_moderate_one(url) for url in image_urls)),
+                strict=True,
+            )
+        )
+
+        return [
+            self._merge_results([text_result, *(image_results[url] for url in urls)])
+            for text_result, (_, urls) in zip(text_results, items, strict=True)
+        ]
+
+    @staticmethod
+    def _merge_results(results: Sequence[ModerationResult]) -> ModerationResult:
+        """Combine per-part results into one conservative result for a message."""
+        if len(results) == 1:
+            return results[0]
+
+        categories: dict[str, bool] = {}
+        scores: dict[str, float] = {}
+        for result in results:
+            for name, flagged in result.categories.items():
+                categories[name] = categories.get(name, False) or flagged
+            for name, score in result.scores.items():
+                scores[name] = max(scores.get(name, 0.0), score)
+
+        return ModerationResult(
+            flagged=any(result.flagged for result in results),
+            categories=categories,
+            scores=scores,
+            max_score=max(scores.values()) if scores else 0.0,
+            flagged_categories=[name for name, flagged in categories.items() if flagged],
+        )
+
     def _parse_response(self, response) -> ModerationResult:
         """Parse the OpenAI moderation response into ModerationResult.
 
@@ -110,8 +299,17 @@ class OpenAIModerationService:
         Returns:
             ModerationResult with parsed categories and scores
         """
-        result = response.results[0]
+        return self._parse_result(response.results[0])
 
+    def _parse_result(self, result) -> ModerationResult:
+        """Parse a single entry of a moderation response's results list.
+
+        Args:
+            result: One element of response.results
+
+        Returns:
+            ModerationResult with parsed categories and scores
+        """
         categories = {}
         scores = {}
 
@@ -1,8 +1,9 @@
 """Service layer for Bulk Content Scan operations."""
 
 import asyncio
+import hashlib
 import uuid as uuid_module
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, Literal, overload
 from uuid import UUID
 
@@ -14,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.bulk_content_scan.capabilities import (
     check_content_moderation,
+    check_content_moderation_batch,
     detect_flashpoint,
     search_similar_claims,
 )
@@ -31,7 +33,7 @@ from src.bulk_content_scan.schemas import (
     ScanCandidate,
     SimilarityMatch,
 )
-from src.claim_relevance_check.service import ClaimRelevanceService
+from src.claim_relevance_check.service import ClaimRelevanceService, RelevancePair
 from src.config import settings
 from src.fact_checking.embedding_schemas import FactCheckMatch
 from src.fact_checking.embedding_service import EmbeddingService
@@ -44,6 +46,53 @@ logger = get_logger(__name__)
 REDIS_KEY_PREFIX = "bulk_scan"
 REDIS_TTL_SECONDS = 86400  # 24 hours
 FLASHPOINT_CONTEXT_KEY_PREFIX = "flashpoint_ctx"
+RELEVANCE_CACHE_KEY_PREFIX = "relevance_verdict"
+
+# Only verdicts the LLM actually reached are memoized; INDETERMINATE covers
+# timeouts and transient failures that should be retried on the next scan.
+CACHEABLE_RELEVANCE_OUTCOMES = frozenset(
+    {
+        RelevanceOutcome.RELEVANT,
+        RelevanceOutcome.NOT_RELEVANT,
+        RelevanceOutcome.CONTENT_FILTERED,
+    }
+)
+
+# Cross-batch flashpoint context: per channel, KEYS[2i-1] is a sorted set of
+# message ids scored by timestamp and KEYS[2i] the hash of id -> message JSON.
+# ARGV is max_messages, ttl, then per channel a message count followed by that
+# many (id, score, json) triples. Evicted ids are dropped from the hash too, so
+# both structures stay in step in a single round trip.
+_FLASHPOINT_CONTEXT_WRITE_SCRIPT = """
+local max_messages = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+local pos = 3
+
+for i = 1, #KEYS, 2 do
+    local key = KEYS[i]
+    local data_key = KEYS[i + 1]
+    local count = tonumber(ARGV[pos])
+    pos = pos + 1
+
+    for _ = 1, count do
+        redis.call('zadd', key, ARGV[pos + 1], ARGV[pos])
+        redis.call('hset', data_key, ARGV[pos], ARGV[pos + 2])
+        pos = pos + 3
+    end
+
+    local excess = redis.call('zcard', key) - max_messages
+    if excess > 0 then
+        local evicted = redis.call('zrange', key, 0, excess - 1)
+        redis.call('zremrangebyrank', key, 0, excess - 1)
+        redis.call('hdel', data_key, unpack(evicted))
+    end
+
+    redis.call('expire', key, ttl)
+    redis.call('expire', data_key, ttl)
+end
+
+return 0
+"""
 
 
 def calculate_indeterminate_threshold(base_threshold: float) -> float:
@@ -260,6 +309,9 @@ class BulkContentScanService:
         The filtering logic is IDENTICAL regardless of collect_scores setting.
         Debug mode only affects whether score information is collected and returned.
 
+        When OPENAI_MODERATION is enabled, the whole batch is moderated up front in
+        shared multi-input requests; the per-message loop then reads those results.
+
         Flashpoint detection runs independently of other scan types. Content scan types
         (similarity, moderation) use first-match-wins with break. Flashpoint always runs
         when enabled, so both a content match and a flashpoint match can be produced for
@@ -317,6 +369,17 @@ class BulkContentScanService:
             st for st in active_scan_types if st != ScanType.CONVERSATION_FLASHPOINT
         ]
 
+        moderation_matches: dict[str, OpenAIModerationMatch | None] | None = None
+        if ScanType.OPENAI_MODERATION in content_scan_types and self.moderation_service:
+            moderation_matches = await check_content_moderation_batch(
+                [
+                    _bulk_scan_message_to_content_item(msg, community_server_platform_id)
+                    for msg in messages
+                    if msg.content and len(msg.content.strip()) >= 10
+                ],
+                self.moderation_service,
+            )
+
         for msg in messages:
             if not msg.content or len(msg.content.strip()) < 10:
                 if collect_scores:
@@ -338,6 +401,7 @@ class BulkContentScanService:
                     community_server_platform_id,
                     scan_type,
                     context_messages=context_messages,
+                    moderation_matches=moderation_matches,
                 )
                 if candidate:
                     candidates.append(candidate)
@@ -409,6 +473,7 @@ class BulkContentScanService:
         community_server_platform_id: str,
         scan_type: ScanType,
         context_messages: list[BulkScanMessage] | None = None,
+        moderation_matches: Mapping[str, OpenAIModerationMatch | None] | None = None,
     ) -> ScanCandidate | None:
         """Generate a ScanCandidate using the appropriate scanner.
 
@@ -422,6 +487,9 @@ class BulkContentScanService:
             community_server_platform_id: CommunityServer.platform_community_server_id
             scan_type: Type of scan to run
             context_messages: Previous messages in the channel for flashpoint detection
+            moderation_matches: Moderation results precomputed for the batch by
+                check_content_moderation_batch, keyed by message_id; messages
+                missing from it are moderated individually
 
         Returns:
             ScanCandidate if match found, None otherwise
@@ -446,10 +514,13 @@ class BulkContentScanService:
                     )
 
             case ScanType.OPENAI_MODERATION:
-                moderation_match = await check_content_moderation(
-                    content_item=content_item,
-                    moderation_service=self.moderation_service,
-                )
+                if moderation_matches is not None and message.message_id in moderation_matches:
+                    moderation_match = moderation_matches[message.message_id]
+                else:
+                    moderation_match = await check_content_moderation(
+                        content_item=content_item,
+                        moderation_service=self.moderation_service,
+                    )
                 if moderation_match is not None:
                     matched_content = ", ".join(moderation_match.flagged_categories)
                     return ScanCandidate(
@@ -562,39 +633,38 @@ class BulkContentScanService:
         messages: Sequence[BulkScanMessage],
         community_server_id: str,
     ) -> None:
+        """Write this batch's messages to the cross-batch context cache in one round trip.
+
+        Each channel keeps a sorted set of message ids scored by timestamp plus
+        a hash of id -> serialized message. One EVAL adds every channel's
+        messages, trims each channel to the newest
+        FLASHPOINT_CONTEXT_CACHE_MAX_MESSAGES (deleting evicted ids from the
+        hash) and refreshes both TTLs. Only each channel's newest messages are
+        sent, since older ones would be trimmed straight away.
+        """
         try:
             channels: dict[str, list[BulkScanMessage]] = {}
             for msg in messages:
                 channels.setdefault(msg.channel_id, []).append(msg)
+            if not channels:
+                return
 
+            max_messages = settings.FLASHPOINT_CONTEXT_CACHE_MAX_MESSAGES
+            keys: list[str] = []
+            args = [str(max_messages), str(settings.FLASHPOINT_CONTEXT_CACHE_TTL)]
             for channel_id, channel_msgs in channels.items():
                 key = self._get_flashpoint_context_key(community_server_id, channel_id)
-                data_key = f"{key}:data"
-                score_mapping: dict[str, float] = {}
-                data_mapping: dict[str, str] = {}
-                for msg in channel_msgs:
-                    score_mapping[msg.message_id] = msg.timestamp.timestamp()
-                    data_mapping[msg.message_id] = msg.model_dump_json()
-
-                await self.redis_client.zadd(key, score_mapping)  # type: ignore[arg-type]
-                await self.redis_client.hset(data_key, mapping=data_mapping)  # type: ignore[arg-type]
-                await self.redis_client.expire(key, settings.FLASHPOINT_CONTEXT_CACHE_TTL)  # type: ignore[misc]
-                await self.redis_client.expire(data_key, settings.FLASHPOINT_CONTEXT_CACHE_TTL)  # type: ignore[misc]
-
-                card = await self.redis_client.zcard(key)  # type: ignore[misc]
-                if card > settings.FLASHPOINT_CONTEXT_CACHE_MAX_MESSAGES:
-                    trim_count = card - settings.FLASHPOINT_CONTEXT_CACHE_MAX_MESSAGES
-                    trimmed_members = await self.redis_client.zrange(key, 0, trim_count - 1)  # type: ignore[misc]
-                    await self.redis_client.zremrangebyrank(  # type: ignore[misc]
-                        key, 0, trim_count - 1
+                newest = sorted(channel_msgs, key=lambda m: m.timestamp)[-max_messages:]
+                keys.extend((key, f"{key}:data"))
+                args.append(str(len(newest)))
+                for msg in newest:
+                    args.extend(
+                        (msg.message_id, str(msg.timestamp.timestamp()), msg.model_dump_json())
                     )
-                    if trimmed_members:
-                        trimmed_ids = [
-                            m.decode("utf-8") if isinstance(m, bytes) else m
-                            for m in trimmed_members
-                        ]
-                        for mid in trimmed_ids:
-                            await self.redis_client.hdel(data_key, mid)  # type: ignore[misc]
+
+            await self.redis_client.eval(  # pyright: ignore[reportGeneralTypeIssues]
+                _FLASHPOINT_CONTEXT_WRITE_SCRIPT, len(keys), *keys, *args
+            )
         except Exception:
             logger.warning(
                 "Failed to populate cross-batch flashpoint context cache",
@@ -606,35 +676,45 @@ class BulkContentScanService:
         channel_context_map: dict[str, list[BulkScanMessage]],
         community_server_id: str,
     ) -> dict[str, list[BulkScanMessage]]:
-        try:
-            for channel_id, batch_msgs in channel_context_map.items():
-                if not batch_msgs:
-                    continue
-
-                key = self._get_flashpoint_context_key(community_server_id, channel_id)
-                data_key = f"{key}:data"
-
-                cached_ids_raw = await self.redis_client.zrange(key, 0, -1)  # type: ignore[misc]
-                if not cached_ids_raw:
-                    continue
-
-                batch_msg_ids = {m.message_id for m in batch_msgs}
-                needed_ids = []
-                for raw_id in cached_ids_raw:
-                    mid = raw_id.decode("utf-8") if isinstance(raw_id, bytes) else raw_id
-                    if mid not in batch_msg_ids:
-                        needed_ids.append(mid)
+        """Merge cached messages from earlier batches into each channel's context.
 
-                if not needed_ids:
+        All channels are read with one pipelined round trip: the id sorted set
+        and the data hash (capped at FLASHPOINT_CONTEXT_CACHE_MAX_MESSAGES
+        entries) for each. Cached messages that are also in the current batch
+        are dropped in favour of the batch copy, and ids whose data is missing
+        or fails to parse are skipped.
+        """
+        try:
+            channel_ids = [ch for ch, batch_msgs in channel_context_map.items() if batch_msgs]
+            if not channel_ids:
+                return channel_context_map
+
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for channel_id in channel_ids:
+                    key = self._get_flashpoint_context_key(community_server_id, channel_id)
+                    pipe.zrange(key, 0, -1)
+                    pipe.hgetall(f"{key}:data")
+                replies = await pipe.execute()
+
+            for index, channel_id in enumerate(channel_ids):
+                cached_ids, cached_data = replies[2 * index], replies[2 * index + 1]
+                if not cached_ids or not cached_data:
                     continue
 
-                cached_jsons = await self.redis_client.hmget(data_key, *needed_ids)  # type: ignore[misc]
+                batch_msgs = channel_context_map[channel_id]
+                batch_ids = {m.message_id for m in batch_msgs}
                 cached_msgs: list[BulkScanMessage] = []
-                for raw_json in cached_jsons:
-                    if raw_json is None:
+                for raw_id in cached_ids:
+                    message_id = raw_id.decode("utf-8") if isinstance(raw_id, bytes) else raw_id
+                    if message_id in batch_ids:
+                        continue
+                    raw = cached_data.get(raw_id)
+                    if raw is None:
+                        continue
+                    try:
+                        cached_msgs.append(BulkScanMessage.model_validate_json(raw))
+                    except ValueError:
                         continue
-                    raw_str = raw_json.decode("utf-8") if isinstance(raw_json, bytes) else raw_json
-                    cached_msgs.append(BulkScanMessage.model_validate_json(raw_str))
 
                 if cached_msgs:
                     merged = cached_msgs + batch_msgs
@@ -1259,6 +1339,75 @@ class BulkContentScanService:
 
         return None
 
+    async def _flashpoint_scan_candidates_batch(
+        self,
+        scan_id: UUID,
+        messages: Sequence[BulkScanMessage],
+        channel_context_map: dict[str, list[BulkScanMessage]],
+        message_id_index: dict[str, dict[str, int]] | None = None,
+    ) -> list[ScanCandidate]:
+        """Run flashpoint detection for a batch of messages in one detector pass.
+
+        Batch counterpart of _flashpoint_scan_candidate: every message's context
+        is sliced from the shared channel window and the whole batch is handed
+        to FlashpointDetectionService.detect_flashpoints_batch at once. Messages
+        whose slot came back as a critical error are retried on their own, so a
+        single bad message cannot drop the rest of the batch; if the batch call
+        itself raises, every message falls back to per-message detection.
+
+        Args:
+            scan_id: UUID of the scan
+            messages: Messages to analyze (already filtered for minimum length)
+            channel_context_map: Map of channel_id -> sorted messages
+            message_id_index: Optional pre-built index from _build_message_id_index
+
+        Returns:
+            ScanCandidates for the messages where a flashpoint was detected,
+            in input order
+        """
+        if not self.flashpoint_service:
+            logger.debug(
+                "Flashpoint service not configured",
+                extra={"scan_id": str(scan_id)},
+            )
+            return []
+        if not messages:
+            return []
+
+        items = [
+            (msg, self._get_context_for_message(msg, channel_context_map, message_id_index))
+            for msg in messages
+        ]
+
+        matches: list[ConversationFlashpointMatch | Exception | None]
+        try:
+            matches = await self.flashpoint_service.detect_flashpoints_batch(items)
+        except Exception as e:
+            logger.warning(
+                "Error in flashpoint batch scan, falling back to per-message detection",
+                extra={"scan_id": str(scan_id), "batch_size": len(items), "error": str(e)},
+            )
+            matches = [e] * len(items)
+
+        candidates: list[ScanCandidate] = []
+        for (msg, context_messages), match in zip(items, matches, strict=True):
+            if isinstance(match, Exception):
+                candidate = await self._flashpoint_scan_candidate(scan_id, msg, context_messages)
+                if candidate:
+                    candidates.append(candidate)
+            elif match is not None:
+                candidates.append(
+                    ScanCandidate(
+                        message=msg,
+                        scan_type=ScanType.CONVERSATION_FLASHPOINT.value,
+                        match_data=match,
+                        score=match.derailment_score / 100.0,
+                        matched_content=match.reasoning,
+                        matched_source=None,
+                    )
+                )
+        return candidates
+
     async def _filter_candidates_with_relevance(
         self,
         candidates: list[ScanCandidate],
@@ -1281,6 +1430,10 @@ class BulkContentScanService:
         This allows high-confidence matches to still be flagged even when the LLM
         cannot definitively determine relevance.
 
+        Verdicts are resolved up front by _resolve_relevance_verdicts, which
+        deduplicates identical pairs, reuses memoized verdicts and runs the
+        remaining LLM checks concurrently.
+
         Args:
             candidates: List of ScanCandidate from all scan types
             scan_id: UUID of the scan for logging
@@ -1292,6 +1445,14 @@ class BulkContentScanService:
         base_threshold = settings.SIMILARITY_SEARCH_DEFAULT_THRESHOLD
         indeterminate_threshold = calculate_indeterminate_threshold(base_threshold)
 
+        verdicts = await self._resolve_relevance_verdicts(
+            [
+                candidate
+                for candidate in candidates
+                if candidate.scan_type != ScanType.CONVERSATION_FLASHPOINT.value
+            ]
+        )
+
         for candidate in candidates:
             logger.info(
                 "Scan produced candidate",
@@ -1308,11 +1469,7 @@ class BulkContentScanService:
                 reasoning = "Flashpoint candidates bypass relevance filter"
                 outcome = RelevanceOutcome.RELEVANT
             else:
-                outcome, reasoning = await self._check_relevance_with_llm(
-                    original_message=candidate.message.content,
-                    matched_content=candidate.matched_content,
-                    matched_source=candidate.matched_source,
-                )
+                outcome, reasoning = verdicts[self._relevance_pair(candidate)]
 
                 should_flag = self._evaluate_relevance_outcome(
                     outcome=outcome,
@@ -1361,6 +1518,126 @@ class BulkContentScanService:
 
         return flagged
 
+    @staticmethod
+    def _relevance_pair(candidate: ScanCandidate) -> RelevancePair:
+        return (candidate.message.content, candidate.matched_content, candidate.matched_source)
+
+    @staticmethod
+    def _get_relevance_cache_key(pair: RelevancePair) -> str:
+        original_message, matched_content, matched_source = pair
+        digest = hashlib.sha256(
+            "\x00".join(
+                (
+                    str(settings.RELEVANCE_CHECK_MODEL),
+                    str(settings.RELEVANCE_CHECK_USE_OPTIMIZED_PROMPT),
+                    original_message,
+                    matched_content,
+                    matched_source or "",
+                )
+            ).encode("utf-8")
+        ).hexdigest()
+        return f"{settings.ENVIRONMENT}:{RELEVANCE_CACHE_KEY_PREFIX}:{digest}"
+
+    async def _get_cached_relevance_verdicts(
+        self, pairs: list[RelevancePair]
+    ) -> dict[RelevancePair, tuple[RelevanceOutcome, str]]:
+        if not pairs or not settings.RELEVANCE_CHECK_CACHE_TTL:
+            return {}
+
+        cached: dict[RelevancePair, tuple[RelevanceOutcome, str]] = {}
+        try:
+            raw_values = await self.redis_client.mget(  # type: ignore[misc]
+                [self._get_relevance_cache_key(pair) for pair in pairs]
+            )
+            if not isinstance(raw_values, list):
+                return {}
+            for pair, raw in zip(pairs, raw_values, strict=True):
+                if raw is None:
+                    continue
+                data = orjson.loads(raw)
+                cached[pair] = (RelevanceOutcome(data["outcome"]), data["reasoning"])
+        except Exception:
+            logger.warning("Failed to read memoized relevance verdicts", exc_info=True)
+
+        return cached
+
+    async def _store_relevance_verdicts(
+        self, verdicts: dict[RelevancePair, tuple[RelevanceOutcome, str]]
+    ) -> None:
+        ttl = settings.RELEVANCE_CHECK_CACHE_TTL
+        cacheable = {
+            pair: verdict
+            for pair, verdict in verdicts.items()
+            if verdict[0] in CACHEABLE_RELEVANCE_OUTCOMES
+        }
+        if not ttl or not cacheable:
+            return
+
+        try:
+            await asyncio.gather(
+                *(
+                    self.redis_client.set(
+                        self._get_relevance_cache_key(pair),
+                        orjson.dumps({"outcome": outcome.value, "reasoning": reasoning}),
+                        ex=ttl,
+                    )
+                    for pair, (outcome, reasoning) in cacheable.items()
+                )
+            )
+        except Exception:
+            logger.warning("Failed to memoize relevance verdicts", exc_info=True)
+
+    async def _resolve_relevance_verdicts(
+        self, candidates: list[ScanCandidate]
+    ) -> dict[RelevancePair, tuple[RelevanceOutcome, str]]:
+        """Resolve one relevance verdict per distinct (message, matched content) pair.
+
+        Identical pairs are checked once. Verdicts memoized in Redis by an
+        earlier scan are reused; the rest are grouped into LLM calls of
+        RELEVANCE_CHECK_BATCH_SIZE pairs that run with at most
+        RELEVANCE_CHECK_MAX_CONCURRENCY calls in flight. Only LLM-reached
+        outcomes are memoized, so INDETERMINATE results are retried later.
+        """
+        if not candidates:
+            return {}
+
+        pairs = list(dict.fromkeys(self._relevance_pair(c) for c in candidates))
+        relevance_enabled = settings.RELEVANCE_CHECK_ENABLED is True
+        verdicts = await self._get_cached_relevance_verdicts(pairs) if relevance_enabled else {}
+
+        pending = [pair for pair in pairs if pair not in verdicts]
+        batch_size = settings.RELEVANCE_CHECK_BATCH_SIZE
+        groups = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+        semaphore = asyncio.Semaphore(settings.RELEVANCE_CHECK_MAX_CONCURRENCY)
+
+        async def _check_group(group: list[RelevancePair]) -> list[tuple[RelevanceOutcome, str]]:
+            async with semaphore:
+                if len(group) == 1:
+                    return [await self._check_relevance_with_llm(*group[0])]
+                return await ClaimRelevanceService(settings=settings).check_relevance_batch(group)
+
+        group_results = await asyncio.gather(*(_check_group(group) for group in groups))
+        checked = {
+            pair: verdict
+            for group, results in zip(groups, group_results, strict=True)
+            for pair, verdict in zip(group, results, strict=True)
+        }
+        if relevance_enabled:
+            await self._store_relevance_verdicts(checked)
+        verdicts.update(checked)
+
+        logger.info(
+            "Resolved relevance verdicts",
+            extra={
+                "candidates_count": len(candidates),
+                "distinct_pairs": len(pairs),
+                "memoized_count": len(pairs) - len(pending),
+                "llm_calls": len(groups),
+            },
+        )
+
+        return verdicts
+
     async def _check_relevance_with_llm(
         self,
         original_message: str,
@@ -1681,7 +1958,7 @@ async def create_note_requests_from_flagged_messages(  # noqa: PLR0912
         List of created request IDs (string request_id values)
     """
     from src.dbos_workflows.content_monitoring_workflows import (  # noqa: PLC0415
-        start_ai_note_workflow,
+        start_ai_note_batch_workflow,
     )
     from src.llm_config.models import CommunityServer  # noqa: PLC0415
     from src.notes.request_service import RequestService  # noqa: PLC0415
@@ -1732,6 +2009,7 @@ async def create_note_requests_from_flagged_messages(  # noqa: PLR0912
     message_ids = deduplicated_ids
 
     created_ids: list[str] = []
+    ai_note_items: list[dict[str, Any]] = []
     for msg_id in message_ids:
         flagged_msg = flagged_by_message_id.get(msg_id)
         if not flagged_msg:
@@ -1803,36 +2081,29 @@ async def create_note_requests_from_flagged_messages(  # noqa: PLR0912
             )
 
             if generate_ai_notes and first_match and platform_id:
-                try:
-                    moderation_metadata = None
-                    if isinstance(first_match, SimilarityMatch) and first_match.fact_check_item_id:
-                        await asyncio.to_thread(
-                            start_ai_note_workflow,
-                            community_server_id=platform_id,
-                            request_id=str(request.id),
-                            content=flagged_msg.content,
-                            scan_type="similarity",
-                            fact_check_item_id=str(first_match.fact_check_item_id)
-                            if first_match.fact_check_item_id
-                            else None,
-                            similarity_score=first_match.score,
-                        )
-                    elif isinstance(first_match, OpenAIModerationMatch):
-                        moderation_metadata = {
+                ai_note_item: dict[str, Any] = {
+                    "request_id": str(request.id),
+                    "content": flagged_msg.content,
+                }
+                if isinstance(first_match, SimilarityMatch) and first_match.fact_check_item_id:
+                    ai_note_item.update(
+                        scan_type="similarity",
+                        fact_check_item_id=str(first_match.fact_check_item_id),
+                        similarity_score=first_match.score,
+                    )
+                elif isinstance(first_match, OpenAIModerationMatch):
+                    ai_note_item.update(
+                        scan_type="openai_moderation",
+                        moderation_metadata={
                             "categories": first_match.categories,
                             "scores": first_match.scores,
                             "flagged_categories": first_match.flagged_categories,
-                        }
-                        await asyncio.to_thread(
-                            start_ai_note_workflow,
-                            community_server_id=platform_id,
-                            request_id=str(request.id),
-                            content=flagged_msg.content,
-                            scan_type="openai_moderation",
-                            moderation_metadata=moderation_metadata,
-                        )
-                    elif isinstance(first_match, ConversationFlashpointMatch):
-                        flashpoint_metadata = {
+                        },
+                    )
+                elif isinstance(first_match, ConversationFlashpointMatch):
+                    ai_note_item.update(
+                        scan_type="conversation_flashpoint",
+                        moderation_metadata={
                             "derailment_score": first_match.derailment_score,
                             "risk_level": "high"
                             if first_match.derailment_score >= 70
@@ -1841,30 +2112,10 @@ async def create_note_requests_from_flagged_messages(  # noqa: PLR0912
                             else "low",
                             "reasoning": first_match.reasoning,
                             "context_messages": first_match.context_messages,
-                        }
-                        await asyncio.to_thread(
-                            start_ai_note_workflow,
-                            community_server_id=platform_id,
-                            request_id=str(request.id),
-                            content=flagged_msg.content,
-                            scan_type="conversation_flashpoint",
-                            moderation_metadata=flashpoint_metadata,
-                        )
-                    logger.info(
-                        "Enqueued AI note generation workflow",
-                        extra={
-                            "request_id": request.request_id,
-                            "scan_type": first_match.scan_type,
-                        },
-                    )
-                except Exception as pub_error:
-                    logger.error(
-                        "Failed to enqueue AI note generation workflow",
-                        extra={
-                            "request_id": request.request_id,
-                            "error": str(pub_error),
                         },
                     )
+                if "scan_type" in ai_note_item:
+                    ai_note_items.append(ai_note_item)
 
         except Exception as e:
             logger.error(
@@ -1879,6 +2130,23 @@ async def create_note_requests_from_flagged_messages(  # noqa: PLR0912
 
     await session.commit()
 
+    if ai_note_items and platform_id:
+        try:
+            await asyncio.to_thread(
+                start_ai_note_batch_workflow,
+                community_server_id=platform_id,
+                items=ai_note_items,
+            )
+        except Exception as pub_error:
+            logger.error(
+                "Failed to enqueue AI note batch generation workflow",
+                extra={
+                    "scan_id": str(scan_id),
+                    "batch_size": len(ai_note_items),
+                    "error": str(pub_error),
+                },
+            )
+
     logger.info(
         "Note requests created from bulk scan",
         extra={
@@ -34,6 +34,20 @@ class RelevanceCheckResult(StrictInputSchema):
     )
 
 
+class RelevanceBatchItemResult(RelevanceCheckResult):
+    """One verdict inside a batched relevance check response."""
+
+    case: int = Field(..., ge=1, description="1-based number of the case this verdict answers")
+
+
+class RelevanceBatchCheckResult(StrictInputSchema):
+    """Result from a single LLM call that checks several message/match pairs."""
+
+    results: list[RelevanceBatchItemResult] = Field(
+        ..., description="One verdict per numbered case, in any order"
+    )
+
+
 class ClaimRelevanceCheckAttributes(StrictInputSchema):
     """Attributes for performing a claim relevance check via JSON:API."""
 
@@ -6,6 +6,7 @@ reuse across bulk scan and real-time monitor paths.
 
 import asyncio
 import time
+from collections.abc import Sequence
 from typing import Any
 
 from pydantic import ValidationError
@@ -18,6 +19,7 @@ from pydantic_ai.settings import ModelSettings
 
 from src.claim_relevance_check.prompt_optimization.prompts import get_optimized_prompts
 from src.claim_relevance_check.schemas import (
+    RelevanceBatchCheckResult,
     RelevanceCheckResult,
     RelevanceOutcome,
 )
@@ -33,6 +35,20 @@ relevance_agent: Agent[None, RelevanceCheckResult] = Agent(
     capabilities=[Instrumentation()],
 )
 
+relevance_batch_agent: Agent[None, RelevanceBatchCheckResult] = Agent(
+    name="claim-relevance-batch-checker",
+    output_type=RelevanceBatchCheckResult,
+    capabilities=[Instrumentation()],
+)
+
+RelevancePair = tuple[str, str, str | None]
+"""(original_message, matched_content, matched_source) for a relevance check."""
+
+BATCH_INSTRUCTIONS = """
+
+You will receive several numbered cases. Evaluate each case independently, as if it were the only one.
+Return exactly one result per case, with "case" set to the case number."""
+
 
 class ClaimRelevanceService:
     """Checks whether a matched fact-check is relevant to a user message using LLM.
@@ -88,39 +104,9 @@ class ClaimRelevanceService:
         start_time = time.monotonic()
 
         try:
-            if cfg.RELEVANCE_CHECK_USE_OPTIMIZED_PROMPT:
-                system_prompt, user_prompt = get_optimized_prompts(
-                    message=original_message,
-                    fact_check_title=matched_content[:100],
-                    fact_check_content=matched_content,
-                    source_url=matched_source,
-                )
-            else:
-                source_info = f"\nSource: {matched_source}" if matched_source else ""
-
-                system_prompt = """You are a relevance checker. Determine if a reference can meaningfully fact-check or provide context for a SPECIFIC CLAIM in the user's message.
-
-IMPORTANT: The message must contain a verifiable claim or assertion. Simple mentions of people, topics, or questions are NOT claims.
-
-Examples:
-- "how about biden" → No claim, just a name mention → NOT RELEVANT (confidence: 0.99)
-- "or donald trump" → No claim, just a name → NOT RELEVANT (confidence: 0.99)
-- "Biden was a Confederate soldier" → Specific false claim → RELEVANT (confidence: 0.95)
-- "Trump's sons shot endangered animals" → Verifiable claim → RELEVANT (confidence: 0.90)
-- "What about the vaccine?" → Question, not a claim → NOT RELEVANT (confidence: 0.98)
-- "The vaccine causes autism" → Specific claim that can be fact-checked → RELEVANT (confidence: 0.92)
-
-Respond with JSON: {"is_relevant": true/false, "reasoning": "brief explanation", "confidence": 0.0-1.0}"""
-
-                user_prompt = f"""User message: {original_message}
-
-Reference: {matched_content}{source_info}
-
-Step 1: Does the user message contain a specific claim or assertion (not just a topic mention or question)?
-Step 2: If YES to step 1, can this reference fact-check or verify that specific claim?
-Step 3: How confident are you in this assessment? (0.0 = uncertain, 1.0 = certain)
-
-Only answer RELEVANT if BOTH steps are YES. Include your confidence score in the response."""
+            system_prompt, user_prompt = self._build_prompts(
+                original_message, matched_content, matched_source
+            )
 
             agent_result = await asyncio.wait_for(
                 relevance_agent.run(
@@ -182,6 +168,141 @@ Only answer RELEVANT if BOTH steps are YES. Include your confidence score in the
         except Exception as e:
             return self._handle_check_error(e, start_time, cfg)
 
+    def _build_prompts(
+        self,
+        original_message: str,
+        matched_content: str,
+        matched_source: str | None,
+    ) -> tuple[str, str]:
+        """Build (system_prompt, user_prompt) for one message/match pair."""
+        cfg = self._settings
+
+        if cfg.RELEVANCE_CHECK_USE_OPTIMIZED_PROMPT:
+            system_prompt, user_prompt = get_optimized_prompts(
+                message=original_message,
+                fact_check_title=matched_content[:100],
+                fact_check_content=matched_content,
+                source_url=matched_source,
+            )
+        else:
+            source_info = f"\nSource: {matched_source}" if matched_source else ""
+
+            system_prompt = """You are a relevance checker. Determine if a reference can meaningfully fact-check or provide context for a SPECIFIC CLAIM in the user's message.
+
+IMPORTANT: The message must contain a verifiable claim or assertion. Simple mentions of people, topics, or questions are NOT claims.
+
+Examples:
+- "how about biden" → No claim, just a name mention → NOT RELEVANT (confidence: 0.99)
+- "or donald trump" → No claim, just a name → NOT RELEVANT (confidence: 0.99)
+- "Biden was a Confederate soldier" → Specific false claim → RELEVANT (confidence: 0.95)
+- "Trump's sons shot endangered animals" → Verifiable claim → RELEVANT (confidence: 0.90)
+- "What about the vaccine?" → Question, not a claim → NOT RELEVANT (confidence: 0.98)
+- "The vaccine causes autism" → Specific claim that can be fact-checked → RELEVANT (confidence: 0.92)
+
+Respond with JSON: {"is_relevant": true/false, "reasoning": "brief explanation", "confidence": 0.0-1.0}"""
+
+            user_prompt = f"""User message: {original_message}
+
+Reference: {matched_content}{source_info}
+
+Step 1: Does the user message contain a specific claim or assertion (not just a topic mention or question)?
+Step 2: If YES to step 1, can this reference fact-check or verify that specific claim?
+Step 3: How confident are you in this assessment? (0.0 = uncertain, 1.0 = certain)
+
+Only answer RELEVANT if BOTH steps are YES. Include your confidence score in the response."""
+
+        return system_prompt, user_prompt
+
+    async def check_relevance_batch(
+        self,
+        pairs: Sequence[RelevancePair],
+    ) -> list[tuple[RelevanceOutcome, str]]:
+        """Check several message/match pairs with one LLM call.
+
+        The pairs share one system prompt and are sent as numbered cases.
+        Any pair the batched response does not answer, or every pair if the
+        batched call fails, falls back to check_relevance so content filter
+        retries and fail-open semantics stay per pair.
+
+        Args:
+            pairs: (original_message, matched_content, matched_source) tuples
+
+        Returns:
+            (RelevanceOutcome, reasoning) per pair, in input order
+        """
+        cfg = self._settings
+
+        if len(pairs) <= 1 or not cfg.RELEVANCE_CHECK_ENABLED or not cfg.RELEVANCE_CHECK_MODEL:
+            return [await self.check_relevance(*pair) for pair in pairs]
+
+        start_time = time.monotonic()
+        answered: dict[int, RelevanceCheckResult] = {}
+
+        try:
+            system_prompt = ""
+            cases: list[str] = []
+            for number, pair in enumerate(pairs, start=1):
+                system_prompt, user_prompt = self._build_prompts(*pair)
+                cases.append(f"### Case {number}\n{user_prompt}")
+
+            agent_result = await asyncio.wait_for(
+                relevance_batch_agent.run(
+                    "\n\n".join(cases),
+                    model=cfg.RELEVANCE_CHECK_MODEL.to_pydantic_ai_model(),
+                    instructions=system_prompt + BATCH_INSTRUCTIONS,
+                    model_settings=ModelSettings(
+                        max_tokens=cfg.RELEVANCE_CHECK_MAX_TOKENS * len(pairs),
+                        temperature=0.0,
+                    ),
+                ),
+                timeout=cfg.RELEVANCE_CHECK_TIMEOUT,
+            )
+            answered = {
+                item.case: item
+                for item in agent_result.output.results
+                if 1 <= item.case <= len(pairs)
+            }
+        except Exception as e:
+            logger.warning(
+                "Batched relevance check failed, checking pairs individually",
+                extra={
+                    "pair_count": len(pairs),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
+            )
+
+        logger.info(
+            "Batched relevance check completed",
+            extra={
+                "pair_count": len(pairs),
+                "answered_count": len(answered),
+                "latency_ms": round((time.monotonic() - start_time) * 1000, 2),
+            },
+        )
+
+        fallback_numbers = [n for n in range(1, len(pairs) + 1) if n not in answered]
+        fallback_results = await asyncio.gather(
+            *(self.check_relevance(*pairs[n - 1]) for n in fallback_numbers)
+        )
+        fallbacks = dict(zip(fallback_numbers, fallback_results, strict=True))
+
+        outcomes: list[tuple[RelevanceOutcome, str]] = []
+        for number in range(1, len(pairs) + 1):
+            result = answered.get(number)
+            if result is None:
+                outcomes.append(fallbacks[number])
+                continue
+
+            decision = "flagged" if result.is_relevant else "filtered"
+            relevance_check_total.add(1, {"outcome": "success", "decision": decision})
+            outcome = (
+                RelevanceOutcome.RELEVANT if result.is_relevant else RelevanceOutcome.NOT_RELEVANT
+            )
+            outcomes.append((outcome, result.reasoning))
+
+        return outcomes
+
     def _handle_check_error(
         self,
         error: Exception,
@@ -22,16 +22,26 @@ Usage:
 
     query = select(Note).where(and_(*filters))
 
+Keyset pagination:
+    order = [SortKey(Note.created_at), SortKey(Note.id)]
+    query = query.where(FilterBuilder.build_keyset_condition(order, cursor))
+    query = query.order_by(*(key.order_clause() for key in order))
+
 See ADR-008 for design rationale.
 """
 
-from collections.abc import Awaitable, Callable, Iterator
+from collections.abc import Awaitable, Callable, Iterator, Sequence
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 from typing import Any, overload
+from uuid import UUID
 
+from sqlalchemy import and_, or_, tuple_
 from sqlalchemy.orm import InstrumentedAttribute
 
+from src.common.jsonapi import decode_cursor, encode_cursor
+
 
 class FilterOperator(str, Enum):
     """Standard filter operators for JSON:API."""
@@ -124,6 +134,45 @@ class FilterField:
     joins: list[JoinSpec] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class SortKey:
+    """A column in a keyset (cursor) pagination ordering.
+
+    The last key should be unique (typically the primary key) so that the
+    ordering is total and cursors never skip or repeat rows. Sort columns
+    must be non-nullable.
+
+    Attributes:
+        column: SQLAlchemy column attribute to order by.
+        descending: Whether the column is ordered descending. Defaults to True.
+    """
+
+    column: InstrumentedAttribute
+    descending: bool = True
+
+    def order_clause(self) -> Any:
+        """Return the ORDER BY clause for this key."""
+        return self.column.desc() if self.descending else self.column.asc()
+
+    def value_of(self, item: Any) -> Any:
+        """Read this key's value from an ORM instance."""
+        return getattr(item, self.column.key)
+
+    def coerce(self, value: Any) -> Any:
+        """Convert a decoded cursor value back to the column's Python type."""
+        try:
+            python_type = self.column.type.python_type
+        except NotImplementedError:
+            return value
+        if value is None or isinstance(value, python_type):
+            return value
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is UUID:
+            return UUID(value)
+        return python_type(value)
+
+
 class FilterBuilder:
     """Build SQLAlchemy filter conditions from JSON:API query parameters.
 
@@ -285,6 +334,58 @@ class FilterBuilder:
 
         return FilterResult(conditions=conditions, joins=joins)
 
+    @staticmethod
+    def build_keyset_condition(sort_keys: Sequence[SortKey], cursor: str) -> Any:
+        """Build the WHERE condition selecting rows after a pagination cursor.
+
+        When all keys share a direction this is a single row-value comparison,
+        which PostgreSQL can satisfy with a composite index range scan. Mixed
+        directions expand to the equivalent OR-of-prefixes form.
+
+        Args:
+            sort_keys: Ordering the cursor was produced with.
+            cursor: Opaque cursor from encode_keyset_cursor().
+
+        Returns:
+            SQLAlchemy condition.
+
+        Raises:
+            ValueError: If the cursor is malformed or doesn't match sort_keys.
+        """
+        values = decode_cursor(cursor)
+        if len(values) != len(sort_keys):
+            raise ValueError("Invalid pagination cursor")
+        try:
+            coerced = [key.coerce(v) for key, v in zip(sort_keys, values, strict=True)]
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+
+        directions = {key.descending for key in sort_keys}
+        if len(directions) == 1:
+            columns = tuple_(*(key.column for key in sort_keys))
+            after = tuple_(*coerced)
+            return columns < after if sort_keys[0].descending else columns > after
+
+        clauses = []
+        for i, key in enumerate(sort_keys):
+            prefix = [k.column == v for k, v in zip(sort_keys[:i], coerced[:i], strict=True)]
+            step = key.column < coerced[i] if key.descending else key.column > coerced[i]
+            clauses.append(and_(*prefix, step))
+        return or_(*clauses)
+
+    @staticmethod
+    def encode_keyset_cursor(sort_keys: Sequence[SortKey], item: Any) -> str:
+        """Encode the cursor that resumes pagination after ``item``.
+
+        Args:
+            sort_keys: Ordering used for the query.
+            item: Last ORM instance on the current page.
+
+        Returns:
+            Opaque cursor string.
+        """
+        return encode_cursor([key.value_of(item) for key in sort_keys])
+
     def _parse_param(self, param: str) -> tuple[str, FilterOperator]:
         """Parse a parameter name into field name and operator.
 
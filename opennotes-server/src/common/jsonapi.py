@@ -9,6 +9,7 @@ Components:
 - Meta schemas: JSONAPIMeta, JSONAPILinks
 - Error schemas: JSONAPIError, JSONAPIErrorResponse, JSONAPIErrorSource
 - Helper functions: create_pagination_links, create_error_response, model_to_resource
+- Cursor helpers: encode_cursor, decode_cursor
 - Content type constant: JSONAPI_CONTENT_TYPE
 
 Usage:
@@ -25,7 +26,13 @@ Usage:
     links = create_pagination_links(base_url, page=1, size=20, total=100)
 """
 
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Any, Generic, TypeVar
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -46,6 +53,7 @@ class JSONAPIMeta(BaseModel):
     """JSON:API meta object for pagination and collection metadata."""
 
     count: int | None = None
+    count_capped: bool | None = None
     page: int | None = None
     pages: int | None = None
     limit: int | None = None
@@ -146,24 +154,82 @@ class JSONAPISingleResponse(ResponseSchema, Generic[T]):
     links: dict[str, str] | None = None
 
 
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode keyset values as an opaque, URL-safe pagination cursor.
+
+    UUIDs and datetimes are serialized as strings; decode_cursor returns them
+    as strings and callers coerce them back using the column types.
+
+    Args:
+        values: Sort-key values of the last item on the current page
+
+    Returns:
+        Base64url-encoded cursor without padding
+    """
+
+    def _serialize(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, UUID):
+            return str(value)
+        return value
+
+    payload = json.dumps([_serialize(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string from a page[after] query parameter
+
+    Returns:
+        List of raw JSON values in sort-key order
+
+    Raises:
+        ValueError: If the cursor is not valid base64url-encoded JSON array
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, binascii.Error) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    if not isinstance(values, list) or not values:
+        raise ValueError("Invalid pagination cursor")
+    return values
+
+
 def create_pagination_links(
     base_url: str,
-    page: int,
+    page: int | None,
     size: int,
-    total: int,
+    total: int | None,
     query_params: dict[str, str] | None = None,
+    *,
+    cursor: str | None = None,
+    next_cursor: str | None = None,
+    has_next: bool | None = None,
 ) -> JSONAPILinks:
     """Generate JSON:API pagination links.
 
     Creates links for navigating paginated collections following the JSON:API
     specification. Includes self, first, last, prev, and next links as appropriate.
 
+    Two strategies are supported:
+    - Page-number pagination (``page`` is set): page[number]/page[size] links.
+    - Cursor pagination (``page`` is None): page[after]/page[size] links, where
+      ``next`` carries ``next_cursor``. There is no ``last`` or ``prev`` link.
+
     Args:
         base_url: The base URL for the endpoint (without query parameters)
-        page: Current page number (1-indexed)
+        page: Current page number (1-indexed), or None for cursor pagination
         size: Number of items per page
-        total: Total number of items in the collection
+        total: Total number of items in the collection, or None if not counted
         query_params: Additional query parameters to preserve in links
+        cursor: Cursor the current page was fetched with (cursor pagination)
+        next_cursor: Cursor for the following page, if there is one
+        has_next: Whether another page exists; used when ``total`` is None
 
     Returns:
         JSONAPILinks with populated pagination URLs
@@ -180,7 +246,20 @@ def create_pagination_links(
     if query_params is None:
         query_params = {}
 
-    total_pages = (total + size - 1) // size if size > 0 and total > 0 else 0
+    if page is None:
+
+        def build_cursor_url(after: str) -> str:
+            params = dict(query_params)
+            params["page[after]"] = after
+            params["page[size]"] = str(size)
+            query = "&".join(f"{k}={v}" for k, v in params.items())
+            return f"{base_url}?{query}"
+
+        return JSONAPILinks(
+            self_=build_cursor_url(cursor or ""),
+            first=build_cursor_url(""),
+            next_=build_cursor_url(next_cursor) if next_cursor else None,
+        )
 
     def build_url(page_num: int) -> str:
         params = dict(query_params)
@@ -189,6 +268,16 @@ def create_pagination_links(
         query = "&".join(f"{k}={v}" for k, v in params.items())
         return f"{base_url}?{query}"
 
+    if total is None:
+        return JSONAPILinks(
+            self_=build_url(page),
+            first=build_url(1),
+            prev=build_url(page - 1) if page > 1 else None,
+            next_=build_url(page + 1) if has_next else None,
+        )
+
+    total_pages = (total + size - 1) // size if size > 0 and total > 0 else 0
+
     return JSONAPILinks(
         self_=build_url(page),
         first=build_url(1) if total > 0 else None,
@@ -0,0 +1,267 @@
+"""Query-level pagination for JSON:API list endpoints.
+
+Ties together the cursor helpers in ``src.common.jsonapi`` and the keyset
+condition builder on ``FilterBuilder`` so list routes can run one of two
+strategies against the same query:
+
+- Page-number pagination (``page[number]``/``page[size]``) using OFFSET.
+  This remains the default for backward compatibility.
+- Cursor pagination (``page[after]``/``page[size]``) using a keyset
+  condition on an ordered, unique sort key. Cost is independent of depth.
+
+``page[count]`` controls how ``meta.count`` is computed:
+
+- ``exact`` (default): ``count(*)`` over the filtered query.
+- ``capped``: counts at most ``COUNT_CAP`` rows; ``meta.count_capped`` is
+  true when the cap was hit.
+- ``none``: skips counting; ``meta.count`` is null and ``next`` links are
+  derived from a one-row lookahead.
+
+Route handlers use ``paginate_jsonapi_query``, which turns an undecodable
+``page[after]`` cursor into a 400 response instead of raising.
+
+Usage:
+    from src.common.filters import SortKey
+    from src.common.pagination import CountMode, paginate_jsonapi_query
+
+    page = await paginate_jsonapi_query(
+        db,
+        select(Note).where(Note.deleted_at.is_(None)),
+        sort_keys=[SortKey(Note.created_at), SortKey(Note.id)],
+        page_number=page_number,
+        page_size=page_size,
+        after=page_after,
+        count_mode=page_count,
+    )
+    if isinstance(page, JSONResponse):
+        return page
+    notes = page.items
+    links = page.links(request)
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Generic, TypeVar
+
+from fastapi import Request as HTTPRequest
+from fastapi import status
+from fastapi.responses import JSONResponse
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.filters import FilterBuilder, SortKey
+from src.common.jsonapi import (
+    JSONAPI_CONTENT_TYPE,
+    JSONAPILinks,
+    JSONAPIMeta,
+    create_error_response,
+    create_pagination_links,
+)
+
+T = TypeVar("T")
+
+COUNT_CAP = 10_000
+
+PAGE_AFTER_DESCRIPTION = (
+    "Opaque cursor from links.next for cursor pagination. Pass an empty value to "
+    "start cursor pagination from the first page. Takes precedence over page[number]."
+)
+INVALID_CURSOR_DETAIL = "page[after] is not a valid pagination cursor"
+
+PAGE_COUNT_DESCRIPTION = (
+    "How meta.count is computed: exact (default), capped (at most 10000), or none"
+)
+
+
+class CountMode(str, Enum):
+    """Strategy for computing ``meta.count`` on list endpoints."""
+
+    EXACT = "exact"
+    CAPPED = "capped"
+    NONE = "none"
+
+
+@dataclass
+class PageResult(Generic[T]):
+    """One page of a paginated query plus the state needed to render links/meta."""
+
+    items: list[T]
+    page_size: int
+    page_number: int | None
+    cursor: str | None
+    next_cursor: str | None
+    has_next: bool
+    total: int | None
+    count_capped: bool = False
+
+    def links(
+        self,
+        request: HTTPRequest,
+        describedby: str | None = None,
+    ) -> JSONAPILinks:
+        """Build JSON:API pagination links, preserving non-page query params."""
+        base_url = str(request.url).split("?")[0]
+        query_params = {k: v for k, v in request.query_params.items() if not k.startswith("page[")}
+        count_param = request.query_params.get("page[count]")
+        if count_param:
+            query_params["page[count]"] = count_param
+        links = create_pagination_links(
+            base_url=base_url,
+            page=self.page_number,
+            size=self.page_size,
+            total=None if self.count_capped else self.total,
+            query_params=query_params,
+            cursor=self.cursor,
+            next_cursor=self.next_cursor,
+            has_next=self.has_next,
+        )
+        if describedby:
+            links.describedby = describedby
+        return links
+
+    def meta(self) -> JSONAPIMeta:
+        """Build the JSON:API meta object for this page."""
+        return JSONAPIMeta(
+            count=self.total,
+            count_capped=True if self.count_capped else None,
+        )
+
+
+async def count_query_rows(
+    db: AsyncSession,
+    query: Select[Any],
+    count_mode: CountMode,
+    cap: int = COUNT_CAP,
+) -> tuple[int | None, bool]:
+    """Count the rows a filtered query would return.
+
+    Args:
+        db: Database session.
+        query: The filtered (unpaginated) select.
+        count_mode: Counting strategy.
+        cap: Maximum rows counted in CAPPED mode.
+
+    Returns:
+        Tuple of (count or None, whether the count was capped).
+    """
+    if count_mode == CountMode.NONE:
+        return None, False
+
+    inner = query.order_by(None)
+    if count_mode == CountMode.CAPPED:
+        inner = inner.limit(cap + 1)
+
+    result = await db.execute(select(func.count()).select_from(inner.subquery()))
+    total = result.scalar() or 0
+
+    if count_mode == CountMode.CAPPED and total > cap:
+        return cap, True
+    return total, False
+
+
+async def paginate_query(
+    db: AsyncSession,
+    query: Select[Any],
+    sort_keys: list[SortKey],
+    page_number: int,
+    page_size: int,
+    after: str | None = None,
+    count_mode: CountMode = CountMode.EXACT,
+) -> PageResult[Any]:
+    """Fetch one page of ``query`` using page-number or cursor pagination.
+
+    Cursor pagination is used whenever ``after`` is not None (an empty string
+    starts from the first page). The query must select a single ORM entity.
+
+    Args:
+        db: Database session.
+        query: Filtered select without ORDER BY/LIMIT/OFFSET.
+        sort_keys: Total ordering; the last key must be unique.
+        page_number: 1-indexed page number (ignored in cursor mode).
+        page_size: Maximum items per page.
+        after: Cursor from a previous page's links.next.
+        count_mode: How to compute the total count.
+
+    Returns:
+        PageResult with the page items and pagination state.
+
+    Raises:
+        ValueError: If ``after`` is not a valid cursor for ``sort_keys``.
+    """
+    use_cursor = after is not None
+    keyset_condition = (
+        FilterBuilder.build_keyset_condition(sort_keys, after) if use_cursor and after else None
+    )
+
+    total, count_capped = await count_query_rows(db, query, count_mode)
+
+    page_query = query.order_by(*(key.order_clause() for key in sort_keys))
+    if keyset_condition is not None:
+        page_query = page_query.where(keyset_condition)
+    if not use_cursor:
+        page_query = page_query.offset((page_number - 1) * page_size)
+    page_query = page_query.limit(page_size + 1)
+
+    result = await db.execute(page_query)
+    rows = list(result.scalars().all())
+    has_next = len(rows) > page_size
+    items = rows[:page_size]
+
+    next_cursor = None
+    if use_cursor and has_next and items:
+        next_cursor = FilterBuilder.encode_keyset_cursor(sort_keys, items[-1])
+
+    return PageResult(
+        items=items,
+        page_size=page_size,
+        page_number=None if use_cursor else page_number,
+        cursor=after if use_cursor else None,
+        next_cursor=next_cursor,
+        has_next=has_next,
+        total=total,
+        count_capped=count_capped,
+    )
+
+
+def invalid_cursor_response() -> JSONResponse:
+    """Build the JSON:API 400 response for an undecodable ``page[after]`` cursor."""
+    error_response = create_error_response(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        title="Bad Request",
+        detail=INVALID_CURSOR_DETAIL,
+        source_parameter="page[after]",
+    )
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content=error_response.model_dump(by_alias=True),
+        media_type=JSONAPI_CONTENT_TYPE,
+    )
+
+
+async def paginate_jsonapi_query(
+    db: AsyncSession,
+    query: Select[Any],
+    sort_keys: list[SortKey],
+    page_number: int,
+    page_size: int,
+    after: str | None = None,
+    count_mode: CountMode = CountMode.EXACT,
+) -> PageResult[Any] | JSONResponse:
+    """Run ``paginate_query`` for a route handler.
+
+    Takes the same arguments as paginate_query, but returns
+    invalid_cursor_response() instead of raising when ``after`` is not a
+    valid cursor, so the handler can return it directly.
+    """
+    try:
+        return await paginate_query(
+            db,
+            query,
+            sort_keys=sort_keys,
+            page_number=page_number,
+            page_size=page_size,
+            after=after,
+            count_mode=count_mode,
+        )
+    except ValueError:
+        return invalid_cursor_response()
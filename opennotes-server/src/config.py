@@ -365,6 +365,41 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(
         default=7, description="Refresh token expiration time in days"
     )
+    API_KEY_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        description="How long a verified API key skips hash verification (in-process cache)",
+        gt=0,
+    )
+    API_KEY_CACHE_MAX_SIZE: int = Field(
+        default=10000, description="Maximum verified API keys cached per process", gt=0
+    )
+    API_KEY_VERIFY_WORKERS: int = Field(
+        default=4,
+        description="Threads for off-event-loop API key hash verification",
+        gt=0,
+    )
+    PRINCIPAL_CACHE_TTL_SECONDS: int = Field(
+        default=30,
+        description="How long a resolved user, profile id and community ids are cached in-process",
+        gt=0,
+    )
+    PRINCIPAL_CACHE_MAX_SIZE: int = Field(
+        default=10000, description="Maximum principals cached per process", gt=0
+    )
+    AUDIT_LOG_BUFFER_SIZE: int = Field(
+        default=10000,
+        description="Capacity of the in-process audit log ring buffer; the oldest entries "
+        "are dropped when it is full",
+        gt=0,
+    )
+    AUDIT_LOG_BATCH_SIZE: int = Field(
+        default=200, description="Maximum audit log entries persisted per DBOS workflow", gt=0
+    )
+    AUDIT_LOG_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=1.0,
+        description="Maximum time a buffered audit log entry waits before being flushed",
+        gt=0,
+    )
     MAX_TOKEN_AGE_SECONDS: int | None = Field(
         default=None,
         description="Maximum allowed age for tokens in seconds. "
@@ -790,6 +825,31 @@ class Settings(BaseSettings):
         ge=0.0,
         le=1.0,
     )
+    VECTOR_SEARCH_HNSW_EF_SEARCH: int = Field(
+        default=100,
+        description="hnsw.ef_search for filtered vector searches (candidate list size per scan)",
+        ge=1,
+        le=1000,
+    )
+    VECTOR_SEARCH_MAX_SCAN_TUPLES: int = Field(
+        default=20000,
+        description="hnsw.max_scan_tuples for iterative vector scans; bounds how far a "
+        "filtered search walks the index looking for rows that pass its filter",
+        gt=0,
+    )
+    VECTOR_SEARCH_QUANTIZATION: Literal["none", "halfvec"] = Field(
+        default="none",
+        description="Index used for vector candidate generation. 'halfvec' searches the "
+        "half-precision HNSW expression indexes and re-ranks candidates against the "
+        "full-precision embeddings",
+    )
+    VECTOR_SEARCH_RERANK_FACTOR: int = Field(
+        default=4,
+        description="Candidates fetched per requested row from a quantized index before "
+        "exact re-ranking (only used when VECTOR_SEARCH_QUANTIZATION is not 'none')",
+        ge=1,
+        le=20,
+    )
     PREVIOUSLY_SEEN_AUTOPUBLISH_THRESHOLD: float = Field(
         default=0.9,
         description="Default similarity threshold (0.0-1.0) for auto-publishing previously seen notes. "
@@ -829,6 +889,15 @@ class Settings(BaseSettings):
         default="auto",
         description="Default vision detail level: 'low', 'high', or 'auto'",
     )
+    VISION_LOCK_TIMEOUT_SECONDS: float = Field(
+        default=180.0,
+        description=(
+            "How long one process holds the shared lock while describing an image, and how "
+            "long others wait for it. Covers describe_image's retries (5 attempts of a 30s "
+            "provider call plus backoff)"
+        ),
+        gt=0,
+    )
 
     # Relevance Check Settings (for vibe check hybrid search)
     RELEVANCE_CHECK_ENABLED: bool = Field(
@@ -853,6 +922,30 @@ class Settings(BaseSettings):
         default=True,
         description="Use DSPy-optimized prompts for relevance checking (task-966)",
     )
+    RELEVANCE_CHECK_MAX_CONCURRENCY: int = Field(
+        default=8,
+        description="Maximum concurrent relevance check LLM calls per bulk scan batch",
+        ge=1,
+    )
+    RELEVANCE_CHECK_BATCH_SIZE: int = Field(
+        default=1,
+        description="Candidate/match pairs evaluated per relevance check LLM call in bulk scans. "
+        "1 sends one pair per call; larger values share the system prompt across pairs.",
+        ge=1,
+        le=20,
+    )
+    RELEVANCE_CHECK_CACHE_TTL: int = Field(
+        default=604800,
+        description="TTL in seconds for memoized relevance verdicts keyed by (message, matched "
+        "content) (7 days default). 0 disables the cache.",
+        ge=0,
+    )
+    MODERATION_CACHE_TTL: int = Field(
+        default=604800,
+        description="TTL in seconds for OpenAI moderation results shared in Redis, keyed by "
+        "moderation model and content hash (7 days default). 0 disables the shared cache.",
+        ge=0,
+    )
 
     # AI Note Writing Settings
     AI_NOTE_WRITING_ENABLED: bool = Field(
@@ -869,6 +962,11 @@ class Settings(BaseSettings):
         "Keep notes clear, accurate, and easy to understand.",
         description="System prompt for AI note generation",
     )
+    AI_NOTE_WRITER_MAX_CONCURRENCY: int = Field(
+        default=4,
+        description="Maximum concurrent LLM calls per community server when generating AI notes in a batch",
+        ge=1,
+    )
 
     CONTENT_REVIEWER_MODEL: PydanticAIModelId = Field(
         default_factory=lambda: ModelId.from_pydantic_ai("openai:gpt-5-mini"),
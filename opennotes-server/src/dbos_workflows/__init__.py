@@ -45,7 +45,9 @@ Workflows:
     ai_note_generation_workflow: Generate AI note for fact-check match or moderation flag
     vision_description_workflow: Generate image description via LLM vision API
     call_persist_audit_log: Persist audit log entry to database
+    call_persist_audit_log_batch: Persist a batch of audit log entries to database
     start_ai_note_workflow: Enqueue AI note generation workflow
+    start_ai_note_batch_workflow: Enqueue AI note generation for a batch of flagged messages
 """
 
 from __future__ import annotations
@@ -53,6 +55,10 @@ from __future__ import annotations
 import importlib
 
 _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "AI_NOTE_BATCH_GENERATION_WORKFLOW_NAME": (
+        "src.dbos_workflows.content_monitoring_workflows",
+        "AI_NOTE_BATCH_GENERATION_WORKFLOW_NAME",
+    ),
     "AI_NOTE_GENERATION_WORKFLOW_NAME": (
         "src.dbos_workflows.content_monitoring_workflows",
         "AI_NOTE_GENERATION_WORKFLOW_NAME",
@@ -130,6 +136,10 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
         "src.dbos_workflows.content_monitoring_workflows",
         "call_persist_audit_log",
     ),
+    "call_persist_audit_log_batch": (
+        "src.dbos_workflows.content_monitoring_workflows",
+        "call_persist_audit_log_batch",
+    ),
     "cleanup_stale_batch_jobs_workflow": (
         "src.dbos_workflows.scheduler_workflows",
         "cleanup_stale_batch_jobs_workflow",
@@ -233,6 +243,10 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
         "src.dbos_workflows.content_scan_workflow",
         "similarity_scan_step",
     ),
+    "start_ai_note_batch_workflow": (
+        "src.dbos_workflows.content_monitoring_workflows",
+        "start_ai_note_batch_workflow",
+    ),
     "start_ai_note_workflow": (
         "src.dbos_workflows.content_monitoring_workflows",
         "start_ai_note_workflow",
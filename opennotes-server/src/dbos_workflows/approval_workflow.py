@@ -134,14 +134,21 @@ async def _process_single_batch(
     """Process a single batch of candidates for approval.
 
     Uses bulk UPDATE for efficiency and tracks actual rows affected.
-    Each promotion runs inside a SAVEPOINT so that a single failure does
-    not roll back the rating update or other successful promotions.
+    Promotion is set-based via promote_candidates_batch: one INSERT and one
+    status UPDATE for the whole batch, falling back to per-candidate
+    SAVEPOINTs only when the batch write fails, so a single bad row does not
+    roll back other successful promotions. Ratings are committed before
+    promoting, so a promotion error never discards them.
+
+    failed_count counts rating-update failures and promotion write failures.
+    Candidates rejected by promotion validation (no content or no approved
+    rating) are skipped, not failed.
 
     Returns:
         Tuple of (updated_count, promoted_count, failed_count, processed_count)
         where processed_count is the number of candidates that met the threshold.
     """
-    from src.fact_checking.import_pipeline.promotion import promote_candidate
+    from src.fact_checking.import_pipeline.promotion import promote_candidates_batch
 
     updated_count = 0
     promoted_count = 0
@@ -178,19 +185,26 @@ async def _process_single_batch(
                 errors.append(f"Bulk update failed for {len(batch_updates)} candidates: {e!s}")
             return updated_count, promoted_count, failed_count, processed_count
 
+    await db.commit()
+
     if auto_promote and candidates_to_promote:
-        for candidate_id in candidates_to_promote:
-            try:
-                async with db.begin_nested():
-                    promoted = await promote_candidate(db, candidate_id)
-                    if promoted:
-                        promoted_count += 1
-            except Exception as e:
-                failed_count += 1
-                if len(errors) < MAX_STORED_ERRORS:
-                    errors.append(f"Failed to promote {candidate_id}: {e!s}")
+        try:
+            outcome = await promote_candidates_batch(db, candidates_to_promote)
+        except Exception as e:
+            await db.rollback()
+            failed_count += len(candidates_to_promote)
+            if len(errors) < MAX_STORED_ERRORS:
+                errors.append(
+                    f"Bulk promotion failed for {len(candidates_to_promote)} candidates: {e!s}"
+                )
+            return updated_count, promoted_count, failed_count, processed_count
 
-    await db.commit()
+        promoted_count = len(outcome.promoted_ids)
+        failed_count += len(outcome.failures)
+        for candidate_id, reason in outcome.failures.items():
+            if len(errors) >= MAX_STORED_ERRORS:
+                break
+            errors.append(f"Failed to promote {candidate_id}: {reason}")
 
     return updated_count, promoted_count, failed_count, processed_count
 
@@ -5,10 +5,13 @@ Architecture: intra-server calls -> DBOS workflows/steps (no NATS event layer).
 
 Workflows:
     ai_note_generation_workflow: Generate AI note for fact-check match or moderation flag
+    ai_note_batch_generation_workflow: Generate AI notes for a batch of flagged messages
     vision_description_workflow: Generate image description via LLM vision API
 
 Steps:
     persist_audit_log_step: Persist audit log entry to database (wrapped by _audit_log_wrapper_workflow)
+    persist_audit_log_batch_step: Persist a batch of audit log entries in one multi-row INSERT
+        (wrapped by _audit_log_batch_workflow)
 """
 
 from __future__ import annotations
@@ -38,8 +41,10 @@ logger = logging.getLogger(__name__)
 _tracer = trace.get_tracer(__name__)
 
 AI_NOTE_GENERATION_WORKFLOW_NAME = "ai_note_generation_workflow"
+AI_NOTE_BATCH_GENERATION_WORKFLOW_NAME = "ai_note_batch_generation_workflow"
 VISION_DESCRIPTION_WORKFLOW_NAME = "vision_description_workflow"
 AUDIT_LOG_WORKFLOW_NAME = "_audit_log_wrapper_workflow"
+AUDIT_LOG_BATCH_WORKFLOW_NAME = "_audit_log_batch_workflow"
 
 if TYPE_CHECKING:
     from src.fact_checking.models import FactCheckItem
@@ -385,6 +390,136 @@ def ai_note_generation_workflow(
         gate.release()
 
 
+def _build_scan_note_prompt(
+    item: dict[str, Any], fact_check_items: dict[str, FactCheckItem]
+) -> str:
+    """Build the user prompt generate_ai_note_step would send for one batch item."""
+    content = item["content"]
+    moderation_metadata = item.get("moderation_metadata")
+    if item["scan_type"] == "similarity" and item.get("fact_check_item_id"):
+        fact_check_item_id = str(UUID(item["fact_check_item_id"]))
+        fact_check_item = fact_check_items.get(fact_check_item_id)
+        if not fact_check_item:
+            raise ValueError(f"Fact-check item not found: {fact_check_item_id}")
+        return _build_fact_check_prompt(
+            content, fact_check_item, item.get("similarity_score") or 0.0
+        )
+    if item["scan_type"] == "conversation_flashpoint" and moderation_metadata:
+        return _build_flashpoint_prompt(content, moderation_metadata)
+    return _build_general_explanation_prompt(content, moderation_metadata)
+
+
+@DBOS.step()
+def generate_ai_notes_batch_step(
+    community_server_id: str,
+    items: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Generate AI notes for many flagged-message requests in one pass.
+
+    Each item carries the keyword arguments of start_ai_note_workflow. Prompts
+    are built per scan type as in generate_ai_note_step, then handed to
+    AINoteWriter.generate_notes_for_requests, which checks enablement and the
+    rate limit once per community server, runs the LLM calls concurrently and
+    inserts every note with one commit.
+    """
+
+    async def _generate() -> dict[str, Any]:
+        from sqlalchemy import select
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        from src.database import get_engine
+        from src.fact_checking.models import FactCheckItem
+        from src.services.ai_note_writer import AINoteWriter
+
+        with _tracer.start_as_current_span("content.ai_note_batch") as span:
+            span.set_attribute("task.community_server_id", community_server_id)
+            span.set_attribute("task.batch_size", len(items))
+            span.set_attribute("task.component", "content_monitoring")
+
+            engine = get_engine()
+            async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+            try:
+                async with async_session() as session:
+                    fact_check_ids = {
+                        UUID(item["fact_check_item_id"])
+                        for item in items
+                        if item["scan_type"] == "similarity" and item.get("fact_check_item_id")
+                    }
+                    fact_check_items: dict[str, FactCheckItem] = {}
+                    if fact_check_ids:
+                        result = await session.execute(
+                            select(FactCheckItem).where(FactCheckItem.id.in_(fact_check_ids))
+                        )
+                        fact_check_items = {str(fc.id): fc for fc in result.scalars().all()}
+
+                    prompts: dict[UUID, str] = {}
+                    failures: dict[str, str] = {}
+                    for item in items:
+                        try:
+                            prompts[UUID(item["request_id"])] = _build_scan_note_prompt(
+                                item, fact_check_items
+                            )
+                        except ValueError as e:
+                            failures[item["request_id"]] = str(e)
+
+                    writer = AINoteWriter(llm_service=_get_llm_service())
+                    batch = await writer.generate_notes_for_requests(
+                        session, list(prompts), prompts=prompts
+                    )
+
+                failures.update(
+                    {str(request_id): error for request_id, error in batch.failures.items()}
+                )
+                span.set_attribute("task.generated", len(batch.notes))
+                span.set_attribute("task.failed", len(failures))
+                logger.info(
+                    "Generated AI notes for flagged messages",
+                    extra={
+                        "community_server_id": community_server_id,
+                        "requested": len(items),
+                        "generated": len(batch.notes),
+                        "failed": len(failures),
+                    },
+                )
+                return {
+                    "status": "completed",
+                    "generated": len(batch.notes),
+                    "failed": len(failures),
+                    "failures": failures,
+                }
+
+            except Exception as e:
+                error_msg = str(e)
+                span.record_exception(e)
+                span.set_status(StatusCode.ERROR, error_msg)
+                logger.error(
+                    "Failed to generate AI notes for flagged messages",
+                    extra={
+                        "community_server_id": community_server_id,
+                        "batch_size": len(items),
+                        "error": error_msg,
+                    },
+                    exc_info=True,
+                )
+                raise
+
+    return run_sync(_generate())
+
+
+@DBOS.workflow()
+def ai_note_batch_generation_workflow(
+    community_server_id: str,
+    items: list[dict[str, Any]],
+) -> dict[str, Any]:
+    gate = TokenGate(pool="default", weight=WorkflowWeight.CONTENT_MONITORING)
+    gate.acquire()
+    try:
+        return generate_ai_notes_batch_step(community_server_id=community_server_id, items=items)
+    finally:
+        gate.release()
+
+
 @DBOS.step()
 def generate_vision_description_step(
     message_archive_id: str,
@@ -394,6 +529,7 @@ def generate_vision_description_step(
     async def _generate() -> dict[str, Any]:
         from sqlalchemy.ext.asyncio import async_sessionmaker
 
+        from src.cache.cache import cache_manager
         from src.database import get_engine
         from src.notes.message_archive_models import MessageArchive
         from src.services.vision_service import VisionService
@@ -429,7 +565,9 @@ def generate_vision_description_step(
                         return {"status": "already_processed"}
 
                     llm_service = _get_llm_service()
-                    vision_service = VisionService(llm_service=llm_service)
+                    vision_service = VisionService(
+                        llm_service=llm_service, shared_cache=cache_manager
+                    )
 
                     @_retry_llm_call
                     async def _call_vision():
@@ -583,6 +721,73 @@ def _audit_log_wrapper_workflow(
     )
 
 
+def _audit_log_row(entry: dict[str, Any]) -> dict[str, Any]:
+    user_id = entry.get("user_id")
+    created_at_iso = entry.get("created_at_iso")
+    return {
+        "user_id": UUID(user_id) if user_id else None,
+        "action": entry["action"],
+        "resource": entry["resource"],
+        "resource_id": entry.get("resource_id"),
+        "details": entry.get("details"),
+        "ip_address": entry.get("ip_address"),
+        "user_agent": entry.get("user_agent"),
+        "created_at": pendulum.parse(created_at_iso) if created_at_iso else pendulum.now("UTC"),
+    }
+
+
+@DBOS.step()
+def persist_audit_log_batch_step(entries: list[dict[str, Any]]) -> dict[str, Any]:
+    """Insert a batch of audit log entries with a single multi-row INSERT.
+
+    Each entry carries the keyword arguments of call_persist_audit_log.
+    """
+
+    async def _persist() -> dict[str, Any]:
+        from sqlalchemy import insert
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        from src.database import get_engine
+        from src.users.models import AuditLog
+
+        with _tracer.start_as_current_span("content.audit_log_batch") as span:
+            span.set_attribute("task.batch_size", len(entries))
+            span.set_attribute("task.component", "content_monitoring")
+            if not entries:
+                return {"status": "completed", "persisted": 0}
+
+            engine = get_engine()
+            async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+            try:
+                async with async_session() as session:
+                    await session.execute(
+                        insert(AuditLog).values([_audit_log_row(entry) for entry in entries])
+                    )
+                    await session.commit()
+
+                logger.debug("Persisted audit log batch", extra={"batch_size": len(entries)})
+                return {"status": "completed", "persisted": len(entries)}
+
+            except Exception as e:
+                error_msg = str(e)
+                span.record_exception(e)
+                span.set_status(StatusCode.ERROR, error_msg)
+                logger.error(
+                    "Failed to persist audit log batch",
+                    extra={"batch_size": len(entries), "error": error_msg},
+                    exc_info=True,
+                )
+                raise
+
+    return run_sync(_persist())
+
+
+@DBOS.workflow()
+def _audit_log_batch_workflow(entries: list[dict[str, Any]]) -> dict[str, Any]:
+    return persist_audit_log_batch_step(entries)
+
+
 def start_ai_note_workflow(
     community_server_id: str,
     request_id: str,
@@ -619,6 +824,32 @@ def start_ai_note_workflow(
     )
 
 
+def start_ai_note_batch_workflow(
+    community_server_id: str,
+    items: list[dict[str, Any]],
+) -> None:
+    """Enqueue one workflow that generates AI notes for a batch of flagged messages.
+
+    Each item holds the keyword arguments of start_ai_note_workflow except
+    community_server_id.
+    """
+    safe_enqueue_sync(
+        lambda: content_monitoring_queue.enqueue(
+            ai_note_batch_generation_workflow,
+            community_server_id,
+            items,
+        )
+    )
+
+    logger.info(
+        "Enqueued AI note batch generation workflow",
+        extra={
+            "batch_size": len(items),
+            "community_server_id": community_server_id,
+        },
+    )
+
+
 def call_persist_audit_log(
     user_id: str | None,
     action: str,
@@ -642,3 +873,8 @@ def call_persist_audit_log(
             created_at_iso,
         )
     )
+
+
+def call_persist_audit_log_batch(entries: list[dict[str, Any]]) -> None:
+    """Enqueue one workflow that persists a whole batch of audit log entries."""
+    safe_enqueue_sync(lambda: content_monitoring_queue.enqueue(_audit_log_batch_workflow, entries))
@@ -1258,7 +1258,8 @@ def flashpoint_scan_step(
     """Run flashpoint detection on filtered messages and produce candidates.
 
     Reads filtered messages and context maps from Redis, runs flashpoint
-    detection on each message, and stores candidates back in Redis.
+    detection over the whole batch in one detector pass, and stores
+    candidates back in Redis.
 
     Args:
         scan_id: UUID string of the scan
@@ -1330,18 +1331,12 @@ def flashpoint_scan_step(
 
             message_id_index = service._build_message_id_index(channel_context_map)
 
-            candidates = []
-            for msg in typed_messages:
-                if not msg.content or len(msg.content.strip()) < 10:
-                    continue
-                context_messages = service._get_context_for_message(
-                    msg, channel_context_map, message_id_index
-                )
-                candidate = await service._flashpoint_scan_candidate(
-                    scan_uuid, msg, context_messages
-                )
-                if candidate:
-                    candidates.append(candidate)
+            scannable = [
+                msg for msg in typed_messages if msg.content and len(msg.content.strip()) >= 10
+            ]
+            candidates = await service._flashpoint_scan_candidates_batch(
+                scan_uuid, scannable, channel_context_map, message_id_index
+            )
             if await _skip_step_persist_if_scan_terminal(
                 session,
                 redis_conn,
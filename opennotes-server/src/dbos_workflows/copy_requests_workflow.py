@@ -207,26 +207,30 @@ def copy_requests_step(
     from src.database import get_session_maker
     from src.notes.copy_request_service import CopyRequestService
 
-    async def _on_progress(current: int, total: int) -> None:
-        if current % COPY_BATCH_SIZE == 0 or current == total:
-            try:
-                async with get_session_maker()() as progress_db:
-                    service = BatchJobService(progress_db)
-                    await service.update_progress(
-                        UUID(batch_job_id),
-                        completed_tasks=current,
-                        failed_tasks=0,
-                    )
-                    await progress_db.commit()
-            except Exception as e:
-                logger.error(
-                    "Failed to update batch job progress",
-                    extra={"batch_job_id": batch_job_id, "error": str(e)},
-                    exc_info=True,
-                )
-
     async def _run() -> dict[str, Any]:
-        async with get_session_maker()() as db:
+        session_maker = get_session_maker()
+        # Progress is written through its own long-lived session so updates are
+        # visible while the copy transaction is still open.
+        async with session_maker() as db, session_maker() as progress_db:
+            progress_service = BatchJobService(progress_db)
+
+            async def _on_progress(current: int, total: int) -> None:
+                if current % COPY_BATCH_SIZE == 0 or current == total:
+                    try:
+                        await progress_service.update_progress(
+                            UUID(batch_job_id),
+                            completed_tasks=current,
+                            failed_tasks=0,
+                        )
+                        await progress_db.commit()
+                    except Exception as e:
+                        await progress_db.rollback()
+                        logger.error(
+                            "Failed to update batch job progress",
+                            extra={"batch_job_id": batch_job_id, "error": str(e)},
+                            exc_info=True,
+                        )
+
             result = await CopyRequestService.copy_requests(
                 db=db,
                 source_community_server_id=UUID(source_community_server_id),
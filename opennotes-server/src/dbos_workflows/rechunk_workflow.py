@@ -579,6 +579,59 @@ def chunk_and_embed_previously_seen_sync(
     return run_sync(_embed_and_persist())
 
 
+def chunk_and_embed_previously_seen_batch_sync(
+    previously_seen_ids: list[UUID],
+    community_server_id: UUID,
+) -> dict[UUID, int]:
+    """Synchronous wrapper for chunk_and_embed_previously_seen_batch.
+
+    Loads the content of every PreviouslySeenMessage in one query, chunks
+    all of it under a single use_chunking_service_sync() hold, then embeds
+    and persists the whole group in one session and commit.
+
+    Returns:
+        chunks_created count per found message. IDs with no matching
+        PreviouslySeenMessage are absent from the result.
+    """
+    from src.database import get_session_maker
+
+    service = get_chunk_embedding_service()
+
+    async def _fetch_contents() -> dict[UUID, str]:
+        async with get_session_maker()() as db:
+            result = await db.execute(
+                select(PreviouslySeenMessage.id, PreviouslySeenMessage.extra_metadata).where(
+                    PreviouslySeenMessage.id.in_(previously_seen_ids)
+                )
+            )
+            return {row.id: (row.extra_metadata or {}).get("content", "") for row in result}
+
+    contents = run_sync(_fetch_contents())
+
+    chunk_texts_by_message: dict[UUID, list[str]] = {}
+    with use_chunking_service_sync() as chunking_service:
+        for message_id, text in contents.items():
+            if text:
+                chunk_texts_by_message[message_id] = chunking_service.chunk_text(text)
+
+    chunks_created = dict.fromkeys(contents, 0)
+    if not chunk_texts_by_message:
+        return chunks_created
+
+    async def _embed_and_persist() -> dict[UUID, int]:
+        async with get_session_maker()() as db:
+            chunks_by_message = await service.chunk_and_embed_previously_seen_batch(
+                db=db,
+                chunk_texts_by_message=chunk_texts_by_message,
+                community_server_id=community_server_id,
+            )
+            await db.commit()
+            return {message_id: len(chunks) for message_id, chunks in chunks_by_message.items()}
+
+    chunks_created.update(run_sync(_embed_and_persist()))
+    return chunks_created
+
+
 @DBOS.step(
     retries_allowed=EMBEDDING_RETRIES_ALLOWED,
     max_attempts=EMBEDDING_MAX_ATTEMPTS,
@@ -623,6 +676,47 @@ def process_previously_seen_item(
         raise
 
 
+@DBOS.step(
+    retries_allowed=EMBEDDING_RETRIES_ALLOWED,
+    max_attempts=EMBEDDING_MAX_ATTEMPTS,
+    interval_seconds=EMBEDDING_INTERVAL_SECONDS,
+    backoff_rate=EMBEDDING_BACKOFF_RATE,
+)
+def process_previously_seen_batch(
+    item_ids: list[str],
+    community_server_id: str,
+) -> dict[str, Any]:
+    """Process a group of previously-seen messages in one pass (DBOS step with retry).
+
+    Retry schedule: 1s, 2s, 4s, 8s, 16s (5 attempts total)
+
+    Args:
+        item_ids: PreviouslySeenMessage UUIDs as strings
+        community_server_id: Community server UUID as string
+
+    Returns:
+        dict with chunks_created per processed item ID and the IDs that
+        were not found
+    """
+    try:
+        result = chunk_and_embed_previously_seen_batch_sync(
+            previously_seen_ids=[UUID(item_id) for item_id in item_ids],
+            community_server_id=UUID(community_server_id),
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to process previously-seen message batch",
+            extra={"item_count": len(item_ids), "error": str(e)},
+        )
+        raise
+
+    chunks_created = {str(message_id): count for message_id, count in result.items()}
+    return {
+        "chunks_created": chunks_created,
+        "missing": [item_id for item_id in item_ids if item_id not in chunks_created],
+    }
+
+
 @DBOS.workflow()
 def rechunk_previously_seen_workflow(
     batch_job_id: str,
@@ -636,7 +730,7 @@ def rechunk_previously_seen_workflow(
         batch_job_id: UUID of the BatchJob record (as string)
         community_server_id: Community server UUID (as string)
         item_ids: List of PreviouslySeenMessage UUIDs to process
-        batch_size: Items per batch (for progress reporting)
+        batch_size: Items embedded together per step (and per progress update)
 
     Returns:
         dict with completed_count, failed_count, and any errors
@@ -668,54 +762,90 @@ def rechunk_previously_seen_workflow(
         failed_count = 0
         errors: list[dict[str, Any]] = []
 
-        for i, item_id in enumerate(item_ids):
+        def _abort_on_open_circuit() -> None:
+            logger.error(
+                "Circuit breaker open - aborting previously-seen rechunk workflow",
+                extra={
+                    "workflow_id": workflow_id,
+                    "consecutive_failures": circuit_breaker.failures,
+                },
+            )
+            _finalize_job(
+                UUID(batch_job_id),
+                success=False,
+                completed_tasks=completed_count,
+                failed_tasks=failed_count,
+                error_summary={
+                    "error": "Circuit breaker open",
+                    "consecutive_failures": circuit_breaker.failures,
+                    "errors": errors,
+                },
+            )
+
+        for start in range(0, total_items, batch_size):
+            group = item_ids[start : start + batch_size]
+
             try:
                 circuit_breaker.check()
+            except CircuitOpenError:
+                _abort_on_open_circuit()
+                raise
 
-                result = process_previously_seen_item(
-                    item_id=item_id,
+            try:
+                batch_result = process_previously_seen_batch(
+                    item_ids=group,
                     community_server_id=community_server_id,
                 )
-
-                if result["success"]:
-                    completed_count += 1
-                    circuit_breaker.record_success()
-                else:
-                    failed_count += 1
-                    errors.append({"item_id": item_id, "error": result.get("error")})
-
-            except CircuitOpenError:
-                logger.error(
-                    "Circuit breaker open - aborting previously-seen rechunk workflow",
+            except Exception as e:
+                # Fall back to one step per item so a single bad message
+                # only fails itself rather than its whole group.
+                logger.warning(
+                    "Previously-seen batch failed; retrying items individually",
                     extra={
                         "workflow_id": workflow_id,
-                        "consecutive_failures": circuit_breaker.failures,
+                        "item_count": len(group),
+                        "error": str(e),
                     },
                 )
-                _finalize_job(
-                    UUID(batch_job_id),
-                    success=False,
-                    completed_tasks=completed_count,
-                    failed_tasks=failed_count,
-                    error_summary={
-                        "error": "Circuit breaker open",
-                        "consecutive_failures": circuit_breaker.failures,
-                        "errors": errors,
-                    },
-                )
-                raise
+                batch_result = None
 
-            except Exception as e:
-                failed_count += 1
-                errors.append({"item_id": item_id, "error": str(e)})
-                circuit_breaker.record_failure()
-
-            if (i + 1) % batch_size == 0 or (i + 1) == total_items:
-                update_batch_job_progress_sync(
-                    UUID(batch_job_id),
-                    completed_tasks=completed_count,
-                    failed_tasks=failed_count,
-                )
+            if batch_result is not None:
+                completed_count += len(batch_result["chunks_created"])
+                for item_id in batch_result["missing"]:
+                    failed_count += 1
+                    errors.append({"item_id": item_id, "error": "PreviouslySeenMessage not found"})
+                circuit_breaker.record_success()
+            else:
+                for item_id in group:
+                    try:
+                        circuit_breaker.check()
+
+                        result = process_previously_seen_item(
+                            item_id=item_id,
+                            community_server_id=community_server_id,
+                        )
+
+                        if result["success"]:
+                            completed_count += 1
+                            circuit_breaker.record_success()
+                        else:
+                            failed_count += 1
+                            errors.append({"item_id": item_id, "error": result.get("error")})
+
+                    except CircuitOpenError:
+                        _abort_on_open_circuit()
+                        raise
+
+                    except Exception as e:
+                        failed_count += 1
+                        errors.append({"item_id": item_id, "error": str(e)})
+                        circuit_breaker.record_failure()
+
+            update_batch_job_progress_sync(
+                UUID(batch_job_id),
+                completed_tasks=completed_count,
+                failed_tasks=failed_count,
+            )
 
         success = _compute_batch_success(completed_count, failed_count)
         error_summary = {"errors": errors} if errors else None
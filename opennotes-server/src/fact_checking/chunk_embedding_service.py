@@ -9,11 +9,12 @@ This module provides the ChunkEmbeddingService which handles:
 - Tracking common chunks that appear across multiple documents
 """
 
+from collections.abc import Mapping
 from typing import Any, cast
 from uuid import UUID
 
 import pendulum
-from sqlalchemy import delete, func, select, union_all, update
+from sqlalchemy import delete, func, select, tuple_, union_all, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -45,6 +46,10 @@ logger = get_logger(__name__)
 # Adjust based on corpus characteristics and search quality observations.
 IS_COMMON_THRESHOLD = 2
 
+# Rows per multi-row INSERT. Keeps each statement well under asyncpg's
+# 32767 bind-parameter limit (chunk rows carry 7 parameters).
+INSERT_BATCH_ROWS = 1000
+
 
 class ChunkEmbeddingService:
     """
@@ -91,7 +96,7 @@ class ChunkEmbeddingService:
         Optimizes for performance by:
         1. Batch querying all existing chunks in a single DB query
         2. Batch generating embeddings for missing chunks in a single API call
-        3. Batch inserting new chunks with ON CONFLICT DO NOTHING
+        3. Inserting new chunks with multi-row INSERT ... ON CONFLICT DO NOTHING
 
         This reduces API calls from O(N) to O(1) and DB round trips significantly.
 
@@ -126,20 +131,24 @@ class ChunkEmbeddingService:
             )
 
             now = pendulum.now("UTC")
-
-            for text, (embedding, provider, model) in zip(missing_texts, embeddings, strict=True):
-                chunk_hash = text_to_hash[text]
+            rows = [
+                {
+                    "chunk_text": text,
+                    "chunk_text_hash": text_to_hash[text],
+                    "embedding": embedding,
+                    "embedding_provider": provider,
+                    "embedding_model": model,
+                    "is_common": False,
+                    "created_at": now,
+                }
+                for text, (embedding, provider, model) in zip(
+                    missing_texts, embeddings, strict=True
+                )
+            ]
+            for start in range(0, len(rows), INSERT_BATCH_ROWS):
                 stmt = (
                     pg_insert(ChunkEmbedding)
-                    .values(
-                        chunk_text=text,
-                        chunk_text_hash=chunk_hash,
-                        embedding=embedding,
-                        embedding_provider=provider,
-                        embedding_model=model,
-                        is_common=False,
-                        created_at=now,
-                    )
+                    .values(rows[start : start + INSERT_BATCH_ROWS])
                     .on_conflict_do_nothing(index_elements=["chunk_text_hash"])
                 )
                 await db.execute(stmt)
@@ -562,67 +571,148 @@ class ChunkEmbeddingService:
             with access_lock:
                 chunk_texts = self.chunking_service.chunk_text(text)
 
-        chunk_results = await self.get_or_create_chunks_batch(
+        chunks_by_message = await self.chunk_and_embed_previously_seen_batch(
             db=db,
-            chunk_texts=chunk_texts,
+            chunk_texts_by_message={previously_seen_id: chunk_texts},
             community_server_id=community_server_id,
         )
+        chunks = chunks_by_message[previously_seen_id]
 
-        chunks: list[ChunkEmbedding] = []
-        chunk_ids: list[UUID] = []
-        join_entries: list[dict[str, Any]] = []
-        seen_chunk_ids: set[UUID] = set()
+        logger.info(
+            "Chunked and embedded previously seen message",
+            extra={
+                "previously_seen_id": str(previously_seen_id),
+                "text_length": len(text),
+                "chunk_count": len(chunks),
+            },
+        )
 
-        for idx, (chunk, _) in enumerate(chunk_results):
-            chunks.append(chunk)
-            chunk_ids.append(chunk.id)
-            if chunk.id not in seen_chunk_ids:
+        return chunks
+
+    async def chunk_and_embed_previously_seen_batch(
+        self,
+        db: AsyncSession,
+        chunk_texts_by_message: Mapping[UUID, list[str]],
+        community_server_id: UUID | None = None,
+    ) -> dict[UUID, list[ChunkEmbedding]]:
+        """
+        Create/reuse embeddings for many PreviouslySeenMessages at once.
+
+        Same idempotent upsert-then-prune semantics as
+        chunk_and_embed_previously_seen, but set-based across messages:
+        chunk texts from every message are deduplicated and embedded in one
+        generate_embeddings_batch call, join rows for all messages are
+        upserted together, stale join rows are pruned in a few bounded DELETEs, and
+        is_common flags are recomputed once for the union of chunks.
+
+        Args:
+            db: Database session
+            chunk_texts_by_message: Pre-computed chunk texts keyed by
+                PreviouslySeenMessage UUID
+            community_server_id: Community server UUID for LLM credentials,
+                or None for global fallback
+
+        Returns:
+            ChunkEmbedding records (new or existing) per message, in chunk order
+        """
+        if not chunk_texts_by_message:
+            return {}
+
+        all_texts = [text for texts in chunk_texts_by_message.values() for text in texts]
+        chunk_results = iter(
+            await self.get_or_create_chunks_batch(
+                db=db,
+                chunk_texts=all_texts,
+                community_server_id=community_server_id,
+            )
+        )
+
+        now = pendulum.now("UTC")
+        chunks_by_message: dict[UUID, list[ChunkEmbedding]] = {}
+        join_entries: list[dict[str, Any]] = []
+        keep_pairs_by_message: dict[UUID, list[tuple[UUID, UUID]]] = {}
+
+        for previously_seen_id, texts in chunk_texts_by_message.items():
+            chunks = [chunk for chunk, _ in (next(chunk_results) for _ in texts)]
+            chunks_by_message[previously_seen_id] = chunks
+            keep_pairs = keep_pairs_by_message.setdefault(previously_seen_id, [])
+            seen_chunk_ids: set[UUID] = set()
+            for idx, chunk in enumerate(chunks):
+                if chunk.id in seen_chunk_ids:
+                    continue
                 seen_chunk_ids.add(chunk.id)
+                keep_pairs.append((previously_seen_id, chunk.id))
                 join_entries.append(
                     {
                         "chunk_id": chunk.id,
                         "previously_seen_id": previously_seen_id,
                         "chunk_index": idx,
-                        "created_at": pendulum.now("UTC"),
+                        "created_at": now,
                     }
                 )
 
         # Use upsert to handle race conditions and ensure idempotency
         # If a duplicate (chunk_id, previously_seen_id) exists, update the chunk_index
-        if join_entries:
-            stmt = pg_insert(PreviouslySeenChunk).values(join_entries)
+        for start in range(0, len(join_entries), INSERT_BATCH_ROWS):
+            stmt = pg_insert(PreviouslySeenChunk).values(
+                join_entries[start : start + INSERT_BATCH_ROWS]
+            )
             stmt = stmt.on_conflict_do_update(
                 constraint="uq_previously_seen_chunks_chunk_previously_seen",
                 set_={"chunk_index": stmt.excluded.chunk_index},
             )
             await db.execute(stmt)
 
-        # Delete stale chunk references that are no longer part of this message
-        # (e.g., if a message went from chunks A,B,C to A,B, we clean up C)
-        if chunk_ids:
-            await db.execute(
-                delete(PreviouslySeenChunk).where(
-                    PreviouslySeenChunk.previously_seen_id == previously_seen_id,
-                    PreviouslySeenChunk.chunk_id.notin_(chunk_ids),
-                )
-            )
-        else:
-            # No chunks means delete all references for this message
-            await db.execute(
-                delete(PreviouslySeenChunk).where(
-                    PreviouslySeenChunk.previously_seen_id == previously_seen_id
-                )
-            )
-
-        await self.batch_update_is_common_flags(db, chunk_ids)
+        # Delete stale chunk references that are no longer part of each message
+        # (e.g., if a message went from chunks A,B,C to A,B, we clean up C).
+        # Messages are pruned in groups of at most INSERT_BATCH_ROWS kept pairs
+        # so the NOT IN list stays under the bind-parameter limit.
+        group_ids: list[UUID] = []
+        group_pairs: list[tuple[UUID, UUID]] = []
+        for previously_seen_id, keep_pairs in keep_pairs_by_message.items():
+            if group_ids and len(group_pairs) + len(keep_pairs) > INSERT_BATCH_ROWS:
+                await self._delete_stale_previously_seen_chunks(db, group_ids, group_pairs)
+                group_ids, group_pairs = [], []
+            group_ids.append(previously_seen_id)
+            group_pairs.extend(keep_pairs)
+        await self._delete_stale_previously_seen_chunks(db, group_ids, group_pairs)
+
+        await self.batch_update_is_common_flags(
+            db,
+            [
+                chunk_id
+                for keep_pairs in keep_pairs_by_message.values()
+                for _, chunk_id in keep_pairs
+            ],
+        )
 
         logger.info(
-            "Chunked and embedded previously seen message",
+            "Chunked and embedded previously seen messages",
             extra={
-                "previously_seen_id": str(previously_seen_id),
-                "text_length": len(text),
-                "chunk_count": len(chunks),
+                "message_count": len(chunks_by_message),
+                "chunk_count": len(all_texts),
+                "join_row_count": len(join_entries),
             },
         )
 
-        return chunks
+        return chunks_by_message
+
+    @staticmethod
+    async def _delete_stale_previously_seen_chunks(
+        db: AsyncSession,
+        previously_seen_ids: list[UUID],
+        keep_pairs: list[tuple[UUID, UUID]],
+    ) -> None:
+        """Delete join rows of these messages that are not in keep_pairs."""
+        if not previously_seen_ids:
+            return
+        stale = delete(PreviouslySeenChunk).where(
+            PreviouslySeenChunk.previously_seen_id.in_(previously_seen_ids)
+        )
+        if keep_pairs:
+            stale = stale.where(
+                tuple_(PreviouslySeenChunk.previously_seen_id, PreviouslySeenChunk.chunk_id).notin_(
+                    keep_pairs
+                )
+            )
+        await db.execute(stale)
@@ -170,6 +170,13 @@ class ChunkEmbedding(Base):
             postgresql_with={"m": 16, "ef_construction": 64},
             postgresql_ops={"embedding": "vector_cosine_ops"},
         ),
+        # Half-precision HNSW index for VECTOR_SEARCH_QUANTIZATION=halfvec
+        Index(
+            "idx_chunk_embeddings_embedding_halfvec_hnsw",
+            text("(embedding::halfvec(1536)) halfvec_cosine_ops"),
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+        ),
         Index("idx_chunk_embeddings_is_common", "is_common"),
         Index("idx_chunk_embeddings_embedding_version", "embedding_provider", "embedding_model"),
         Index("idx_chunk_embeddings_search_vector", "search_vector", postgresql_using="gin"),
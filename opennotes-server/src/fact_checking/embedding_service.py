@@ -13,7 +13,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.config import settings
 from src.fact_checking.embedding_schemas import FactCheckMatch, SimilaritySearchResponse
 from src.fact_checking.previously_seen_schemas import PreviouslySeenMessageMatch
-from src.fact_checking.repository import DEFAULT_ALPHA, FUSION_K_CONSTANT, hybrid_search_with_chunks
+from src.fact_checking.repository import (
+    DEFAULT_ALPHA,
+    FUSION_K_CONSTANT,
+    ann_candidate_limit,
+    ann_distance_expression,
+    configure_filtered_vector_scan,
+    hybrid_search_with_chunks,
+)
 from src.llm_config.models import CommunityServer
 from src.llm_config.service import LLMService
 from src.monitoring import get_logger
@@ -391,7 +398,30 @@ class EmbeddingService:
 
         query_embedding_str = f"[{','.join(str(x) for x in embedding)}]"
 
-        query = text("""
+        # The community filter runs inside an iterative HNSW scan, so small tenants
+        # still get up to `limit` nearest rows; the distance cutoff is applied
+        # afterwards so the scan does not keep walking for rows that cannot match.
+        # With a quantized index the CTE over-fetches and the outer query re-ranks
+        # by exact distance.
+        query = text(f"""
+            WITH nearest AS MATERIALIZED (
+                SELECT
+                    id,
+                    community_server_id,
+                    original_message_id,
+                    published_note_id,
+                    embedding_provider,
+                    embedding_model,
+                    metadata,
+                    created_at,
+                    embedding <=> CAST(:embedding AS vector) AS distance
+                FROM previously_seen_messages
+                WHERE
+                    community_server_id = :community_server_id
+                    AND embedding IS NOT NULL
+                ORDER BY {ann_distance_expression("embedding")}
+                LIMIT :candidate_limit
+            )
             SELECT
                 id,
                 community_server_id,
@@ -401,18 +431,16 @@ class EmbeddingService:
                 embedding_model,
                 metadata,
                 created_at,
-                1 - (embedding <=> CAST(:embedding AS vector)) AS similarity_score
-            FROM previously_seen_messages
-            WHERE
-                community_server_id = :community_server_id
-                AND embedding IS NOT NULL
-                AND (embedding <=> CAST(:embedding AS vector)) <= :max_dist
-            ORDER BY embedding <=> CAST(:embedding AS vector)
+                1 - distance AS similarity_score
+            FROM nearest
+            WHERE distance <= :max_dist
+            ORDER BY distance
             LIMIT :result_limit
         """)
 
         if statement_timeout_ms is not None:
             await db.execute(text(f"SET LOCAL statement_timeout = {int(statement_timeout_ms)}"))
+        await configure_filtered_vector_scan(db)
 
         result = await db.execute(
             query,
@@ -421,6 +449,7 @@ class EmbeddingService:
                 "community_server_id": community_server_id,
                 "max_dist": max_distance,
                 "result_limit": limit,
+                "candidate_limit": ann_candidate_limit(limit),
             },
         )
 
@@ -15,7 +15,12 @@ from src.fact_checking.import_pipeline.importer import (
     upsert_candidates,
     validate_and_normalize_batch,
 )
-from src.fact_checking.import_pipeline.promotion import bulk_promote_scraped, promote_candidate
+from src.fact_checking.import_pipeline.promotion import (
+    BatchPromotionResult,
+    bulk_promote_scraped,
+    promote_candidate,
+    promote_candidates_batch,
+)
 from src.fact_checking.import_pipeline.rating_normalizer import normalize_rating
 from src.fact_checking.import_pipeline.router import (
     ImportFactCheckBureauRequest,
@@ -26,6 +31,7 @@ from src.fact_checking.import_pipeline.router import (
 from src.fact_checking.import_pipeline.schemas import ClaimReviewRow, NormalizedCandidate
 
 __all__ = [
+    "BatchPromotionResult",
     "ClaimReviewRow",
     "ImportFactCheckBureauRequest",
     "ImportStats",
@@ -36,6 +42,7 @@ __all__ = [
     "import_router",
     "normalize_rating",
     "promote_candidate",
+    "promote_candidates_batch",
     "upsert_candidates",
     "validate_and_normalize_batch",
 ]
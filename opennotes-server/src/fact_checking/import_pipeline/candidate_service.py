@@ -10,10 +10,11 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import Select, and_, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.common.filters import FilterBuilder, FilterField, FilterOperator
+from src.common.filters import FilterBuilder, FilterField, FilterOperator, SortKey
+from src.common.pagination import CountMode, PageResult, paginate_query
 from src.fact_checking.candidate_models import FactCheckedItemCandidate
 from src.fact_checking.import_pipeline.promotion import promote_candidate
 from src.fact_checking.import_pipeline.rating_normalizer import CANONICAL_RATINGS
@@ -124,7 +125,7 @@ async def list_candidates(
     Returns:
         Tuple of (candidates, total_count).
     """
-    filters = _build_filters(
+    query = _filtered_query(
         status=status,
         dataset_name=dataset_name,
         dataset_tags=dataset_tags,
@@ -134,14 +135,9 @@ async def list_candidates(
         published_date_to=published_date_to,
     )
 
-    query = select(FactCheckedItemCandidate)
-    count_query = select(func.count(FactCheckedItemCandidate.id))
-
-    if filters:
-        query = query.where(and_(*filters))
-        count_query = count_query.where(and_(*filters))
-
-    count_result = await session.execute(count_query)
+    count_result = await session.execute(
+        query.with_only_columns(func.count(FactCheckedItemCandidate.id))
+    )
     total = count_result.scalar() or 0
 
     query = query.order_by(FactCheckedItemCandidate.created_at.desc())
@@ -153,6 +149,98 @@ async def list_candidates(
     return candidates, total
 
 
+candidate_sort_keys = [
+    SortKey(FactCheckedItemCandidate.created_at),
+    SortKey(FactCheckedItemCandidate.id),
+]
+
+
+async def paginate_candidates(
+    session: AsyncSession,
+    page: int = 1,
+    page_size: int = 20,
+    after: str | None = None,
+    count_mode: CountMode = CountMode.EXACT,
+    status: str | None = None,
+    dataset_name: str | None = None,
+    dataset_tags: list[str] | None = None,
+    rating_filter: str | None = None,
+    has_content: bool | None = None,
+    published_date_from: datetime | None = None,
+    published_date_to: datetime | None = None,
+) -> PageResult[FactCheckedItemCandidate]:
+    """List candidates with filters using page-number or cursor pagination.
+
+    Same filters as list_candidates. Passing ``after`` (even an empty string)
+    switches to keyset pagination over (created_at, id).
+
+    Args:
+        session: Database session.
+        page: Page number (1-indexed), ignored in cursor mode.
+        page_size: Number of items per page.
+        after: Cursor from a previous page's links.next.
+        count_mode: How to compute the total count.
+        status: Filter by candidate status (exact match).
+        dataset_name: Filter by dataset name (exact match).
+        dataset_tags: Filter by dataset tags (array overlap).
+        rating_filter: Filter by rating: "null", "not_null", or exact value.
+        has_content: Filter by whether content exists.
+        published_date_from: Filter by published_date >= this value.
+        published_date_to: Filter by published_date <= this value.
+
+    Returns:
+        PageResult with the candidates and pagination state.
+
+    Raises:
+        ValueError: If ``after`` is not a valid cursor.
+    """
+    query = _filtered_query(
+        status=status,
+        dataset_name=dataset_name,
+        dataset_tags=dataset_tags,
+        rating_filter=rating_filter,
+        has_content=has_content,
+        published_date_from=published_date_from,
+        published_date_to=published_date_to,
+    )
+
+    return await paginate_query(
+        session,
+        query,
+        sort_keys=candidate_sort_keys,
+        page_number=page,
+        page_size=page_size,
+        after=after,
+        count_mode=count_mode,
+    )
+
+
+def _filtered_query(
+    status: str | None = None,
+    dataset_name: str | None = None,
+    dataset_tags: list[str] | None = None,
+    rating_filter: str | None = None,
+    has_content: bool | None = None,
+    published_date_from: datetime | None = None,
+    published_date_to: datetime | None = None,
+) -> Select[tuple[FactCheckedItemCandidate]]:
+    """Select candidates matching the list filters, without ordering or paging."""
+    filters = _build_filters(
+        status=status,
+        dataset_name=dataset_name,
+        dataset_tags=dataset_tags,
+        rating_filter=rating_filter,
+        has_content=has_content,
+        published_date_from=published_date_from,
+        published_date_to=published_date_to,
+    )
+
+    query = select(FactCheckedItemCandidate)
+    if filters:
+        query = query.where(and_(*filters))
+    return query
+
+
 def _build_filters(
     status: str | None = None,
     dataset_name: str | None = None,
@@ -23,12 +23,16 @@ from src.batch_jobs.schemas import BatchJobResponse
 from src.common.jsonapi import (
     JSONAPI_CONTENT_TYPE,
     JSONAPILinks,
-    JSONAPIMeta,
-    create_pagination_links,
 )
 from src.common.jsonapi import (
     create_error_response as create_error_response_model,
 )
+from src.common.pagination import (
+    PAGE_AFTER_DESCRIPTION,
+    PAGE_COUNT_DESCRIPTION,
+    CountMode,
+    invalid_cursor_response,
+)
 from src.common.responses import AUTHENTICATED_RESPONSES
 from src.database import get_db
 from src.fact_checking.candidate_models import CandidateStatus, FactCheckedItemCandidate
@@ -41,7 +45,7 @@ from src.fact_checking.import_pipeline.candidate_schemas import (
     SetRatingRequest,
 )
 from src.fact_checking.import_pipeline.candidate_service import (
-    list_candidates,
+    paginate_candidates,
     set_candidate_rating,
 )
 from src.monitoring import get_logger
@@ -81,24 +85,6 @@ def candidate_to_resource(candidate: FactCheckedItemCandidate) -> CandidateResou
     )
 
 
-def create_pagination_links_from_request(
-    request: HTTPRequest,
-    page: int,
-    size: int,
-    total: int,
-) -> JSONAPILinks:
-    """Create JSON:API pagination links from a FastAPI request."""
-    base_url = str(request.url).split("?")[0]
-    query_params = {k: v for k, v in request.query_params.items() if not k.startswith("page[")}
-    return create_pagination_links(
-        base_url=base_url,
-        page=page,
-        size=size,
-        total=total,
-        query_params=query_params,
-    )
-
-
 def validate_status_filter(filter_status: str | None) -> str | None:
     """Validate status filter against CandidateStatus enum values.
 
@@ -147,6 +133,10 @@ async def list_candidates_jsonapi(
     current_user: Annotated[User, Depends(get_current_user_or_api_key)],
     page_number: int = Query(1, ge=1, alias="page[number]"),
     page_size: int = Query(20, ge=1, le=100, alias="page[size]"),
+    page_after: str | None = Query(None, alias="page[after]", description=PAGE_AFTER_DESCRIPTION),
+    page_count: CountMode = Query(
+        CountMode.EXACT, alias="page[count]", description=PAGE_COUNT_DESCRIPTION
+    ),
     filter_status: str | None = Query(None, alias="filter[status]"),
     filter_dataset_name: str | None = Query(None, alias="filter[dataset_name]"),
     filter_dataset_tags: list[str] | None = Query(None, alias="filter[dataset_tags]"),
@@ -166,6 +156,8 @@ async def list_candidates_jsonapi(
     Query Parameters:
     - page[number]: Page number (default: 1)
     - page[size]: Page size (default: 20, max: 100)
+    - page[after]: Cursor from links.next (cursor pagination)
+    - page[count]: exact (default), capped, or none
 
     Filter Parameters:
     - filter[status]: Filter by candidate status (exact match)
@@ -186,10 +178,12 @@ async def list_candidates_jsonapi(
         )
 
     try:
-        candidates, total = await list_candidates(
+        page = await paginate_candidates(
             session=db,
             page=page_number,
             page_size=page_size,
+            after=page_after,
+            count_mode=page_count,
             status=validated_status,
             dataset_name=filter_dataset_name,
             dataset_tags=filter_dataset_tags,
@@ -199,12 +193,12 @@ async def list_candidates_jsonapi(
             published_date_to=filter_published_date_to,
         )
 
-        candidate_resources = [candidate_to_resource(c) for c in candidates]
+        candidate_resources = [candidate_to_resource(c) for c in page.items]
 
         response = CandidateListResponse(
             data=candidate_resources,
-            links=create_pagination_links_from_request(request, page_number, page_size, total),
-            meta=JSONAPIMeta(count=total),
+            links=page.links(request),
+            meta=page.meta(),
         )
 
         return JSONResponse(
@@ -212,6 +206,8 @@ async def list_candidates_jsonapi(
             media_type=JSONAPI_CONTENT_TYPE,
         )
 
+    except ValueError:
+        return invalid_cursor_response()
     except Exception:
         logger.exception("Failed to list candidates (JSON:API)")
         return create_error_response(
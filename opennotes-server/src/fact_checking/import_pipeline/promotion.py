@@ -5,9 +5,12 @@ to the main fact_check_items table.
 """
 
 import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.fact_checking.candidate_models import CandidateStatus, FactCheckedItemCandidate
@@ -16,6 +19,22 @@ from src.fact_checking.models import FactCheckItem
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class BatchPromotionResult:
+    """Outcome of promote_candidates_batch.
+
+    promoted_ids includes candidates that were already promoted before the
+    call, so retries count them as successes just like promote_candidate.
+    rejected holds candidates that failed validation (promote_candidate
+    returns False for these); failures holds candidates whose write failed.
+    """
+
+    promoted_ids: list[UUID] = field(default_factory=list)
+    fact_check_item_ids: list[UUID] = field(default_factory=list)
+    rejected: dict[UUID, str] = field(default_factory=dict)
+    failures: dict[UUID, str] = field(default_factory=dict)
+
+
 def _validate_candidate_for_promotion(
     candidate: FactCheckedItemCandidate | None, candidate_id: UUID
 ) -> str | None:
@@ -46,6 +65,50 @@ def _validate_candidate_for_promotion(
     return None
 
 
+def _fact_check_item_values(candidate: FactCheckedItemCandidate) -> dict[str, Any]:
+    """Column values for the FactCheckItem created from a promoted candidate."""
+    return {
+        "dataset_name": candidate.dataset_name,
+        "dataset_tags": candidate.dataset_tags
+        if candidate.dataset_tags
+        else [candidate.dataset_name],
+        "title": candidate.title,
+        "content": candidate.content,
+        "summary": candidate.summary,
+        "source_url": candidate.source_url,
+        "original_id": candidate.original_id,
+        "published_date": candidate.published_date,
+        "rating": candidate.rating,
+        "rating_details": candidate.rating_details,
+        "extra_metadata": candidate.extracted_data,
+    }
+
+
+async def _enqueue_chunking(fact_check_item_id: UUID) -> None:
+    """Enqueue chunking for a promoted item; failures are logged, not raised."""
+    try:
+        from src.batch_jobs.rechunk_service import (  # noqa: PLC0415
+            enqueue_single_fact_check_chunk,
+        )
+
+        success = await enqueue_single_fact_check_chunk(
+            fact_check_id=fact_check_item_id,
+            community_server_id=None,
+        )
+        if success:
+            logger.info(f"Enqueued chunking task for promoted fact_check_item {fact_check_item_id}")
+        else:
+            logger.warning(
+                f"Failed to enqueue chunking task for fact_check_item {fact_check_item_id}. "
+                f"Item was promoted but will need manual rechunking."
+            )
+    except Exception as chunk_error:
+        logger.warning(
+            f"Failed to enqueue chunking task for fact_check_item {fact_check_item_id}: "
+            f"{chunk_error}. Item was promoted but will need manual rechunking."
+        )
+
+
 async def promote_candidate(session: AsyncSession, candidate_id: UUID) -> bool:
     """Promote a candidate to the fact_check_items table.
 
@@ -87,21 +150,7 @@ async def promote_candidate(session: AsyncSession, candidate_id: UUID) -> bool:
         raise RuntimeError(f"Candidate {candidate_id} unexpectedly None after validation")
 
     try:
-        fact_check_item = FactCheckItem(
-            dataset_name=candidate.dataset_name,
-            dataset_tags=candidate.dataset_tags
-            if candidate.dataset_tags
-            else [candidate.dataset_name],
-            title=candidate.title,
-            content=candidate.content,
-            summary=candidate.summary,
-            source_url=candidate.source_url,
-            original_id=candidate.original_id,
-            published_date=candidate.published_date,
-            rating=candidate.rating,
-            rating_details=candidate.rating_details,
-            extra_metadata=candidate.extracted_data,
-        )
+        fact_check_item = FactCheckItem(**_fact_check_item_values(candidate))
 
         session.add(fact_check_item)
 
@@ -115,29 +164,7 @@ async def promote_candidate(session: AsyncSession, candidate_id: UUID) -> bool:
 
         logger.info(f"Promoted candidate {candidate_id} to fact_check_item {fact_check_item.id}")
 
-        try:
-            from src.batch_jobs.rechunk_service import (  # noqa: PLC0415
-                enqueue_single_fact_check_chunk,
-            )
-
-            success = await enqueue_single_fact_check_chunk(
-                fact_check_id=fact_check_item.id,
-                community_server_id=None,
-            )
-            if success:
-                logger.info(
-                    f"Enqueued chunking task for promoted fact_check_item {fact_check_item.id}"
-                )
-            else:
-                logger.warning(
-                    f"Failed to enqueue chunking task for fact_check_item {fact_check_item.id}. "
-                    f"Item was promoted but will need manual rechunking."
-                )
-        except Exception as chunk_error:
-            logger.warning(
-                f"Failed to enqueue chunking task for fact_check_item {fact_check_item.id}: "
-                f"{chunk_error}. Item was promoted but will need manual rechunking."
-            )
+        await _enqueue_chunking(fact_check_item.id)
 
         return True
 
@@ -147,13 +174,123 @@ async def promote_candidate(session: AsyncSession, candidate_id: UUID) -> bool:
         return False
 
 
+async def _insert_promotions(
+    session: AsyncSession, candidates: Sequence[FactCheckedItemCandidate]
+) -> list[UUID]:
+    """Insert FactCheckItems for candidates and mark them promoted.
+
+    One multi-row INSERT ... RETURNING plus one UPDATE, regardless of how
+    many candidates are given. Returns the new item ids in candidate order.
+    """
+    result = await session.execute(
+        insert(FactCheckItem).returning(FactCheckItem.id, sort_by_parameter_order=True),
+        [_fact_check_item_values(candidate) for candidate in candidates],
+    )
+    item_ids = list(result.scalars().all())
+
+    await session.execute(
+        update(FactCheckedItemCandidate)
+        .where(FactCheckedItemCandidate.id.in_([candidate.id for candidate in candidates]))
+        .values(status=CandidateStatus.PROMOTED.value, updated_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+
+    return item_ids
+
+
+async def promote_candidates_batch(
+    session: AsyncSession, candidate_ids: Sequence[UUID]
+) -> BatchPromotionResult:
+    """Promote many candidates to fact_check_items with set-based writes.
+
+    Set-based counterpart of promote_candidate: candidates are loaded in one
+    SELECT, validated in memory, and every valid candidate is promoted by a
+    single INSERT and a single status UPDATE inside one SAVEPOINT. If that
+    savepoint fails, the batch falls back to one SAVEPOINT per candidate so
+    the offending rows are isolated and reported individually while the rest
+    still get promoted. The session is committed before chunking is enqueued.
+
+    Args:
+        session: Database session.
+        candidate_ids: UUIDs of the candidates to promote.
+
+    Returns:
+        BatchPromotionResult with promoted ids, created item ids and
+        per-candidate rejection and failure reasons.
+    """
+    outcome = BatchPromotionResult()
+    if not candidate_ids:
+        return outcome
+
+    # populate_existing: callers may have just set ratings with a bulk UPDATE
+    # that bypassed the identity map.
+    result = await session.execute(
+        select(FactCheckedItemCandidate)
+        .where(FactCheckedItemCandidate.id.in_(list(candidate_ids)))
+        .execution_options(populate_existing=True)
+    )
+    candidates_by_id = {candidate.id: candidate for candidate in result.scalars().all()}
+
+    to_promote: list[FactCheckedItemCandidate] = []
+    for candidate_id in dict.fromkeys(candidate_ids):
+        candidate = candidates_by_id.get(candidate_id)
+        if candidate and candidate.status == CandidateStatus.PROMOTED.value:
+            outcome.promoted_ids.append(candidate_id)
+            continue
+
+        error = _validate_candidate_for_promotion(candidate, candidate_id)
+        if error:
+            logger.warning(error)
+            outcome.rejected[candidate_id] = error
+            continue
+
+        if candidate is None:
+            raise RuntimeError(f"Candidate {candidate_id} unexpectedly None after validation")
+
+        to_promote.append(candidate)
+
+    if to_promote:
+        try:
+            async with session.begin_nested():
+                item_ids = await _insert_promotions(session, to_promote)
+            outcome.promoted_ids.extend(candidate.id for candidate in to_promote)
+            outcome.fact_check_item_ids.extend(item_ids)
+        except Exception as e:
+            logger.warning(
+                f"Batch promotion of {len(to_promote)} candidates failed, "
+                f"retrying individually: {e}"
+            )
+            for candidate in to_promote:
+                try:
+                    async with session.begin_nested():
+                        item_ids = await _insert_promotions(session, [candidate])
+                    outcome.promoted_ids.append(candidate.id)
+                    outcome.fact_check_item_ids.extend(item_ids)
+                except Exception as row_error:
+                    logger.exception(f"Failed to promote candidate {candidate.id}: {row_error}")
+                    outcome.failures[candidate.id] = str(row_error)
+
+    await session.commit()
+
+    if outcome.fact_check_item_ids:
+        logger.info(
+            f"Promoted {len(outcome.fact_check_item_ids)} candidates to fact_check_items "
+            f"({len(outcome.failures)} failed)"
+        )
+
+    for item_id in outcome.fact_check_item_ids:
+        await _enqueue_chunking(item_id)
+
+    return outcome
+
+
 async def bulk_promote_scraped(session: AsyncSession, batch_size: int = 100) -> int:
     """Promote all scraped candidates with approved ratings to fact_check_items.
 
     Finds candidates with status='scraped' or 'promoting', content, and human-approved
-    rating, then promotes each to the main table. Including 'promoting' status enables
-    retry/idempotency: if a batch job crashes mid-promotion, the next run can
-    immediately retry without waiting for a recovery timeout.
+    rating, then promotes them to the main table in one set-based batch. Including
+    'promoting' status enables retry/idempotency: if a batch job crashes mid-promotion,
+    the next run can immediately retry without waiting for a recovery timeout.
 
     Args:
         session: Database session.
@@ -180,10 +317,8 @@ async def bulk_promote_scraped(session: AsyncSession, batch_size: int = 100) ->
         logger.info("No scraped candidates to promote")
         return 0
 
-    promoted_count = 0
-    for cid in candidate_ids:
-        if await promote_candidate(session, cid):
-            promoted_count += 1
+    outcome = await promote_candidates_batch(session, candidate_ids)
+    promoted_count = len(outcome.promoted_ids)
 
     logger.info(f"Promoted {promoted_count}/{len(candidate_ids)} candidates")
     return promoted_count
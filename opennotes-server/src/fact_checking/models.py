@@ -137,12 +137,20 @@ class FactCheckItem(Base):
         Index("idx_fact_check_items_dataset_name_tags", "dataset_name", "dataset_tags"),
         # Index for filtering by embedding version
         Index("idx_fact_check_items_embedding_version", "embedding_provider", "embedding_model"),
-        # IVFFlat vector index for embedding similarity searches
+        # HNSW cosine index for embedding similarity searches
         Index(
-            "idx_fact_check_items_embedding_ivfflat",
+            "idx_fact_check_items_embedding_hnsw",
             "embedding",
-            postgresql_using="ivfflat",
-            postgresql_with={"lists": 100},
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+        # Half-precision HNSW index for VECTOR_SEARCH_QUANTIZATION=halfvec
+        Index(
+            "idx_fact_check_items_embedding_halfvec_hnsw",
+            text("(embedding::halfvec(1536)) halfvec_cosine_ops"),
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
         ),
         # GIN index for full-text search on search_vector
         Index("ix_fact_check_items_search_vector", "search_vector", postgresql_using="gin"),
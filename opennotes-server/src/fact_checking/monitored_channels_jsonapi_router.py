@@ -22,7 +22,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi import Request as HTTPRequest
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -33,6 +33,7 @@ from src.auth.community_dependencies import (
 from src.auth.dependencies import get_current_user_or_api_key
 from src.auth.platform_claims import get_request_platform
 from src.common.base_schemas import SQLAlchemySchema, StrictInputSchema
+from src.common.filters import SortKey
 from src.common.jsonapi import (
     JSONAPI_CONTENT_TYPE,
     JSONAPILinks,
@@ -44,6 +45,12 @@ from src.common.jsonapi import (
 from src.common.jsonapi import (
     create_pagination_links as create_pagination_links_base,
 )
+from src.common.pagination import (
+    PAGE_AFTER_DESCRIPTION,
+    PAGE_COUNT_DESCRIPTION,
+    CountMode,
+    paginate_jsonapi_query,
+)
 from src.common.responses import AUTHENTICATED_RESPONSES
 from src.config import settings
 from src.database import get_db
@@ -283,6 +290,9 @@ async def _handle_dataset_tag_integrity_error(
     )
 
 
+_monitored_channel_sort_keys = [SortKey(MonitoredChannel.id, descending=False)]
+
+
 @router.get(
     "/monitored-channels",
     response_class=JSONResponse,
@@ -294,6 +304,10 @@ async def list_monitored_channels_jsonapi(
     current_user: Annotated[User, Depends(get_current_user_or_api_key)],
     page_number: int = Query(1, ge=1, alias="page[number]"),
     page_size: int = Query(20, ge=1, le=100, alias="page[size]"),
+    page_after: str | None = Query(None, alias="page[after]", description=PAGE_AFTER_DESCRIPTION),
+    page_count: CountMode = Query(
+        CountMode.EXACT, alias="page[count]", description=PAGE_COUNT_DESCRIPTION
+    ),
     filter_community_server_id: str | None = Query(None, alias="filter[community_server_id]"),
     filter_enabled: bool | None = Query(None, alias="filter[enabled]"),
 ) -> JSONResponse:
@@ -304,6 +318,8 @@ async def list_monitored_channels_jsonapi(
     Query Parameters:
     - page[number]: Page number (default: 1)
     - page[size]: Page size (default: 20, max: 100)
+    - page[after]: Cursor from links.next (cursor pagination)
+    - page[count]: exact (default), capped, or none
 
     Filter Parameters:
     - filter[community_server_id]: Filter by community server platform ID (required)
@@ -344,21 +360,24 @@ async def list_monitored_channels_jsonapi(
         if filter_enabled is not None:
             query = query.where(MonitoredChannel.enabled == filter_enabled)
 
-        total_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(total_query)
-        total = total_result.scalar() or 0
-
-        query = query.offset((page_number - 1) * page_size).limit(page_size)
-
-        result = await db.execute(query)
-        channels = result.scalars().all()
+        page = await paginate_jsonapi_query(
+            db,
+            query,
+            sort_keys=_monitored_channel_sort_keys,
+            page_number=page_number,
+            page_size=page_size,
+            after=page_after,
+            count_mode=page_count,
+        )
+        if isinstance(page, JSONResponse):
+            return page
 
-        channel_resources = [channel_to_resource(ch) for ch in channels]
+        channel_resources = [channel_to_resource(ch) for ch in page.items]
 
         response = MonitoredChannelListJSONAPIResponse(
             data=channel_resources,
-            links=create_pagination_links_from_request(request, page_number, page_size, total),
-            meta=JSONAPIMeta(count=total),
+            links=page.links(request, describedby="/api/v2/openapi.json"),
+            meta=page.meta(),
         )
 
         return JSONResponse(
@@ -25,7 +25,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic_ai import Embedder
 from pydantic_ai.exceptions import ModelAPIError, ModelHTTPError
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -35,6 +35,7 @@ from src.auth.permissions import is_service_account
 from src.circuit_breaker import circuit_breaker_registry
 from src.circuit_breaker_core import CircuitOpenError
 from src.common.base_schemas import SQLAlchemySchema, StrictInputSchema
+from src.common.filters import SortKey
 from src.common.jsonapi import (
     JSONAPI_CONTENT_TYPE,
     JSONAPILinks,
@@ -46,6 +47,12 @@ from src.common.jsonapi import (
 from src.common.jsonapi import (
     create_pagination_links as create_pagination_links_base,
 )
+from src.common.pagination import (
+    PAGE_AFTER_DESCRIPTION,
+    PAGE_COUNT_DESCRIPTION,
+    CountMode,
+    paginate_jsonapi_query,
+)
 from src.common.responses import AUTHENTICATED_RESPONSES
 from src.config import settings
 from src.database import get_db
@@ -402,6 +409,9 @@ def _handle_circuit_open_fail_open(
     )
 
 
+_previously_seen_sort_keys = [SortKey(PreviouslySeenMessage.id)]
+
+
 @router.get(
     "/previously-seen-messages",
     response_class=JSONResponse,
@@ -413,6 +423,10 @@ async def list_previously_seen_messages_jsonapi(
     current_user: Annotated[User, Depends(get_current_user_or_api_key)],
     page_number: int = Query(1, ge=1, alias="page[number]"),
     page_size: int = Query(20, ge=1, le=100, alias="page[size]"),
+    page_after: str | None = Query(None, alias="page[after]", description=PAGE_AFTER_DESCRIPTION),
+    page_count: CountMode = Query(
+        CountMode.EXACT, alias="page[count]", description=PAGE_COUNT_DESCRIPTION
+    ),
     filter_community_server_id: str | None = Query(None, alias="filter[community_server_id]"),
 ) -> JSONResponse:
     """List previously seen messages with JSON:API format.
@@ -422,6 +436,8 @@ async def list_previously_seen_messages_jsonapi(
     Query Parameters:
     - page[number]: Page number (default: 1)
     - page[size]: Page size (default: 20, max: 100)
+    - page[after]: Cursor from links.next (cursor pagination)
+    - page[count]: exact (default), capped, or none
 
     Filter Parameters:
     - filter[community_server_id]: Filter by community server UUID (required)
@@ -465,21 +481,24 @@ async def list_previously_seen_messages_jsonapi(
             PreviouslySeenMessage.community_server_id == community_uuid
         )
 
-        total_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(total_query)
-        total = total_result.scalar() or 0
-
-        query = query.offset((page_number - 1) * page_size).limit(page_size)
-
-        result = await db.execute(query)
-        messages = result.scalars().all()
+        page = await paginate_jsonapi_query(
+            db,
+            query,
+            sort_keys=_previously_seen_sort_keys,
+            page_number=page_number,
+            page_size=page_size,
+            after=page_after,
+            count_mode=page_count,
+        )
+        if isinstance(page, JSONResponse):
+            return page
 
-        message_resources = [message_to_resource(msg) for msg in messages]
+        message_resources = [message_to_resource(msg) for msg in page.items]
 
         response = PreviouslySeenMessageListResponse(
             data=message_resources,
-            links=create_pagination_links_from_request(request, page_number, page_size, total),
-            meta=JSONAPIMeta(count=total),
+            links=page.links(request, describedby="/api/v2/openapi.json"),
+            meta=page.meta(),
         )
 
         return JSONResponse(
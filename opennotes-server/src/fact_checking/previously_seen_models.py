@@ -124,13 +124,21 @@ class PreviouslySeenMessage(Base):
             "embedding_provider",
             "embedding_model",
         ),
-        # IVFFlat vector index for embedding similarity searches
-        # Using same configuration as fact_check_items for consistency
+        # HNSW cosine index for embedding similarity searches; queries filter by
+        # community with pgvector iterative scans (see configure_filtered_vector_scan)
         Index(
-            "idx_previously_seen_messages_embedding_ivfflat",
+            "idx_previously_seen_messages_embedding_hnsw",
             "embedding",
-            postgresql_using="ivfflat",
-            postgresql_with={"lists": 100},
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+        # Half-precision HNSW index for VECTOR_SEARCH_QUANTIZATION=halfvec
+        Index(
+            "idx_previously_seen_messages_embedding_halfvec_hnsw",
+            text("(embedding::halfvec(1536)) halfvec_cosine_ops"),
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
         ),
     )
 
@@ -32,6 +32,17 @@ class PreviouslySeenMessageCreate(PreviouslySeenMessageBase, StrictInputSchema):
     """Schema for creating a previously seen message record."""
 
 
+class PreviouslySeenMessageBatchItem(StrictInputSchema):
+    """One (message, note) pair for PreviouslySeenService.store_messages_batch."""
+
+    original_message_id: str = Field(..., description="Platform-specific message ID", max_length=64)
+    published_note_id: UUID = Field(..., description="Note ID that was published for this message")
+    content: str = Field(..., description="Message text to chunk and embed")
+    extra_metadata: dict[str, str | int | float | bool | None] = Field(
+        default_factory=dict, description="Additional context metadata"
+    )
+
+
 class PreviouslySeenMessageUpdate(StrictInputSchema):
     """Schema for updating a previously seen message record."""
 
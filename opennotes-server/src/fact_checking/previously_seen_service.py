@@ -1,11 +1,16 @@
 """Service for managing previously seen message records."""
 
+from collections.abc import Sequence
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.fact_checking.chunk_embedding_service import ChunkEmbeddingService
+from src.fact_checking.chunking_service import access_lock
 from src.fact_checking.previously_seen_models import PreviouslySeenMessage
 from src.fact_checking.previously_seen_schemas import (
+    PreviouslySeenMessageBatchItem,
     PreviouslySeenMessageCreate,
     PreviouslySeenMessageResponse,
 )
@@ -99,3 +104,96 @@ class PreviouslySeenService:
             )
             await db.rollback()
             return None
+
+    async def store_messages_batch(
+        self,
+        db: AsyncSession,
+        community_server_id: UUID,
+        messages: Sequence[PreviouslySeenMessageBatchItem],
+        chunk_embedding_service: ChunkEmbeddingService,
+    ) -> list[PreviouslySeenMessageResponse]:
+        """
+        Store many previously seen messages and their chunk embeddings at once.
+
+        Bulk counterpart of store_message_embedding followed by
+        chunk_and_embed_previously_seen for each message. All messages are
+        chunked together, their deduplicated chunk texts are embedded in one
+        generate_embeddings_batch call, and messages, chunks and join rows
+        are written with set-based statements in a single transaction.
+        Message content is kept in extra_metadata["content"] so rechunking
+        can find it later.
+
+        Args:
+            db: Database session
+            community_server_id: Community server UUID shared by all messages
+            messages: (message, note) pairs to store
+            chunk_embedding_service: Service used to chunk and embed content
+
+        Returns:
+            Stored messages in input order; an empty list if nothing was
+            given or the batch failed (the transaction is rolled back)
+        """
+        if not messages:
+            return []
+
+        with access_lock:
+            chunk_texts = [
+                chunk_embedding_service.chunking_service.chunk_text(message.content)
+                if message.content
+                else []
+                for message in messages
+            ]
+
+        try:
+            # ORM bulk INSERT: one insertmanyvalues statement, RETURNING rows
+            # in parameter order so they line up with chunk_texts.
+            result = await db.execute(
+                insert(PreviouslySeenMessage).returning(
+                    PreviouslySeenMessage, sort_by_parameter_order=True
+                ),
+                [
+                    {
+                        "community_server_id": community_server_id,
+                        "original_message_id": message.original_message_id,
+                        "published_note_id": message.published_note_id,
+                        "extra_metadata": {**message.extra_metadata, "content": message.content},
+                    }
+                    for message in messages
+                ],
+            )
+            records = list(result.scalars().all())
+
+            await chunk_embedding_service.chunk_and_embed_previously_seen_batch(
+                db=db,
+                chunk_texts_by_message={
+                    record.id: texts for record, texts in zip(records, chunk_texts, strict=True)
+                },
+                community_server_id=community_server_id,
+            )
+
+            responses = [PreviouslySeenMessageResponse.model_validate(r) for r in records]
+            await db.commit()
+
+            logger.info(
+                "Stored previously seen messages in batch",
+                extra={
+                    "community_server_id": str(community_server_id),
+                    "message_count": len(responses),
+                    "chunk_count": sum(len(texts) for texts in chunk_texts),
+                },
+            )
+
+            return responses
+
+        except Exception as e:
+            logger.error(
+                "Failed to store previously seen messages in batch",
+                extra={
+                    "community_server_id": str(community_server_id),
+                    "message_count": len(messages),
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            await db.rollback()
+            return []
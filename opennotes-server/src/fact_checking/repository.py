@@ -73,6 +73,51 @@ HYBRID_SEARCH_CTE_PRELIMIT = 20
 CHUNK_PRELIMIT_MULTIPLIER = 3
 
 
+def ann_distance_expression(column: str) -> str:
+    """SQL expression that orders ANN candidate generation for an embedding column.
+
+    With VECTOR_SEARCH_QUANTIZATION=halfvec this matches the half-precision HNSW
+    expression indexes, so candidates come from the smaller index; callers then
+    re-rank them by exact ``column <=> CAST(:embedding AS vector)`` distance.
+    """
+    if settings.VECTOR_SEARCH_QUANTIZATION == "halfvec":
+        dims = settings.EMBEDDING_DIMENSIONS
+        return f"({column}::halfvec({dims})) <=> CAST(:embedding AS halfvec({dims}))"
+    return f"{column} <=> CAST(:embedding AS vector)"
+
+
+def ann_candidate_limit(limit: int) -> int:
+    """Number of ANN candidates to fetch so that ``limit`` rows survive re-ranking."""
+    if settings.VECTOR_SEARCH_QUANTIZATION == "none":
+        return limit
+    return limit * settings.VECTOR_SEARCH_RERANK_FACTOR
+
+
+async def configure_filtered_vector_scan(session: AsyncSession) -> None:
+    """Enable pgvector iterative HNSW scans for the current transaction.
+
+    Vector searches here filter by community or dataset tags. A plain HNSW scan
+    returns at most hnsw.ef_search candidates before the filter is applied, so a
+    selective filter leaves fewer rows than LIMIT. With iterative scans pgvector
+    keeps walking the graph until LIMIT rows pass the filter or
+    hnsw.max_scan_tuples is reached, which bounds latency.
+
+    relaxed_order may return candidates slightly out of distance order, so
+    callers select them in a MATERIALIZED CTE and re-sort outside it.
+    """
+    await session.execute(
+        text(
+            "SELECT set_config('hnsw.ef_search', :ef_search, true), "
+            "set_config('hnsw.iterative_scan', 'relaxed_order', true), "
+            "set_config('hnsw.max_scan_tuples', :max_scan_tuples, true)"
+        ),
+        {
+            "ef_search": str(settings.VECTOR_SEARCH_HNSW_EF_SEARCH),
+            "max_scan_tuples": str(settings.VECTOR_SEARCH_MAX_SCAN_TUPLES),
+        },
+    )
+
+
 @dataclass
 class HybridSearchResult:
     """Result from hybrid search including Convex Combination fusion score."""
@@ -168,22 +213,32 @@ async def hybrid_search(
     # Convex Combination query with min-max normalization for keyword scores.
     #
     # The query uses CTEs to:
-    # 1. semantic: Get semantic similarity scores (1 - cosine_distance)
+    # 1. semantic_candidates, semantic: Nearest items, then similarity (1 - cosine_distance)
     # 2. keyword_raw: Get raw ts_rank_cd scores
     # 3. keyword_stats: Calculate min/max for normalization
     # 4. keyword: Apply min-max normalization to keyword scores
     # 5. Final SELECT: Apply CC formula: alpha * semantic + (1-alpha) * keyword_norm
     cc_query = text(f"""
-        WITH semantic AS (
-            -- Get semantic similarity scores (1 - cosine_distance, range 0-1)
+        WITH semantic_candidates AS MATERIALIZED (
+            -- Nearest items via the HNSW index (iterative scan honours the tag filter).
+            -- The distance cutoff is applied outside so the scan stops at LIMIT rows.
             SELECT
                 id,
-                1.0 - (embedding <=> CAST(:embedding AS vector)) AS similarity
+                embedding <=> CAST(:embedding AS vector) AS distance
             FROM fact_check_items
             WHERE embedding IS NOT NULL
-                AND (embedding <=> CAST(:embedding AS vector)) <= :max_semantic_distance
                 {tags_filter}
-            ORDER BY embedding <=> CAST(:embedding AS vector)
+            ORDER BY {ann_distance_expression("embedding")}
+            LIMIT {ann_candidate_limit(HYBRID_SEARCH_CTE_PRELIMIT)}
+        ),
+        semantic AS (
+            -- Re-rank by exact distance and get similarity (1 - cosine_distance, range 0-1)
+            SELECT
+                id,
+                1.0 - distance AS similarity
+            FROM semantic_candidates
+            WHERE distance <= :max_semantic_distance
+            ORDER BY distance
             LIMIT {HYBRID_SEARCH_CTE_PRELIMIT}
         ),
         keyword_raw AS (
@@ -264,6 +319,7 @@ async def hybrid_search(
             await session.execute(
                 text(f"SET LOCAL statement_timeout = {int(statement_timeout_ms)}")
             )
+        await configure_filtered_vector_scan(session)
         result = await session.execute(cc_query, params)
         rows = result.fetchall()
         query_duration_ms = (time.perf_counter() - query_start) * 1000
@@ -423,7 +479,7 @@ async def hybrid_search_with_chunks(
     # Convex Combination query for chunk-based search.
     #
     # The query uses CTEs to:
-    # 1. chunk_semantic: Get semantic similarity scores from chunks
+    # 1. chunk_candidates, chunk_semantic: Nearest chunks, then the similarity cutoff
     # 2. semantic_scores: Aggregate per fact_check_item using MAX()
     # 3. chunk_keyword_raw: Get raw ts_rank_cd scores from chunks
     # 4. keyword_raw_scores: Aggregate per fact_check_item using MAX()
@@ -431,21 +487,32 @@ async def hybrid_search_with_chunks(
     # 6. keyword_scores: Apply min-max normalization
     # 7. Final SELECT: Apply CC formula: alpha * semantic + (1-alpha) * keyword_norm
     cc_query = text(f"""
-        WITH chunk_semantic AS (
-            -- Find semantically similar chunks using HNSW index
-            -- Calculate similarity score: 1 - cosine_distance
+        WITH chunk_candidates AS MATERIALIZED (
+            -- Find nearest chunks using HNSW index (iterative scan honours the tag filter).
+            -- The distance cutoff is applied outside so the scan stops at LIMIT rows.
             SELECT
                 ce.id AS chunk_id,
                 fcc.fact_check_id,
                 ce.is_common,
-                1.0 - (ce.embedding <=> CAST(:embedding AS vector)) AS similarity
+                ce.embedding <=> CAST(:embedding AS vector) AS distance
             FROM chunk_embeddings ce
             JOIN fact_check_chunks fcc ON fcc.chunk_id = ce.id
             JOIN fact_check_items fci_chunk ON fci_chunk.id = fcc.fact_check_id
             WHERE ce.embedding IS NOT NULL
-                AND (ce.embedding <=> CAST(:embedding AS vector)) <= :max_semantic_distance
                 {chunk_tags_filter}
-            ORDER BY ce.embedding <=> CAST(:embedding AS vector)
+            ORDER BY {ann_distance_expression("ce.embedding")}
+            LIMIT {ann_candidate_limit(HYBRID_SEARCH_CTE_PRELIMIT * CHUNK_PRELIMIT_MULTIPLIER)}
+        ),
+        chunk_semantic AS (
+            -- Re-rank by exact distance and calculate similarity: 1 - cosine_distance
+            SELECT
+                chunk_id,
+                fact_check_id,
+                is_common,
+                1.0 - distance AS similarity
+            FROM chunk_candidates
+            WHERE distance <= :max_semantic_distance
+            ORDER BY distance
             LIMIT {HYBRID_SEARCH_CTE_PRELIMIT * CHUNK_PRELIMIT_MULTIPLIER}
         ),
         semantic_scores AS (
@@ -591,6 +658,7 @@ async def hybrid_search_with_chunks(
             await session.execute(
                 text(f"SET LOCAL statement_timeout = {int(statement_timeout_ms)}")
             )
+        await configure_filtered_vector_scan(session)
         result = await session.execute(cc_query, params)
         rows = result.fetchall()
         query_duration_ms = (time.perf_counter() - query_start) * 1000
@@ -84,6 +84,7 @@ from src.llm_config.manager import LLMClientManager
 from src.llm_config.router import router as llm_config_router
 from src.llm_config.service import LLMService
 from src.middleware.audit import AuditMiddleware
+from src.middleware.audit_sink import audit_log_sink
 from src.middleware.csrf import CSRFMiddleware
 from src.middleware.gcp_trace_filter import wrap_app_with_gcp_trace_filter
 from src.middleware.internal_auth import InternalHeaderValidationMiddleware
@@ -191,7 +192,7 @@ async def _init_ai_services() -> tuple[
         encryption_service=EncryptionService(settings.ENCRYPTION_MASTER_KEY)
     )
     llm_service = LLMService(client_manager=llm_client_manager)
-    vision_service = VisionService(llm_service=llm_service)
+    vision_service = VisionService(llm_service=llm_service, shared_cache=cache_manager)
     logger.info("Vision service initialized")
 
     ai_note_writer = AINoteWriter(llm_service=llm_service, vision_service=vision_service)
@@ -590,6 +591,12 @@ async def _shutdown_services(app: FastAPI, is_dbos_worker: bool) -> None:
         except Exception as e:
             logger.warning(f"Error during worker deregistration: {e}")
 
+    try:
+        await audit_log_sink.stop()
+        logger.info("Audit log sink flushed")
+    except Exception as e:
+        logger.warning(f"Error flushing audit log sink: {e}")
+
     await distributed_health.stop_heartbeat()
     logger.info("Distributed health heartbeat stopped")
 
@@ -1,7 +1,5 @@
-import asyncio
 import logging
 from collections.abc import Awaitable, Callable
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -12,17 +10,11 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from src.auth.auth import verify_token
-from src.dbos_workflows.content_monitoring_workflows import call_persist_audit_log
-from src.monitoring.metrics import (
-    audit_events_published_total,
-    audit_publish_failures_total,
-    audit_publish_timeouts_total,
-)
+from src.middleware.audit_sink import audit_log_sink
+from src.monitoring.metrics import audit_events_published_total, audit_publish_failures_total
 
 logger = logging.getLogger(__name__)
 
-_audit_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="audit-persist")
-
 
 class AuditMiddleware(BaseHTTPMiddleware):
     MAX_BODY_SIZE = 10240
@@ -66,11 +58,11 @@ class AuditMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
 
         if request.method in ["POST", "PUT", "PATCH", "DELETE"] and user_id:
-            await self._publish_audit_log(request, response, request_body, start_time, user_id)
+            self._publish_audit_log(request, response, request_body, start_time, user_id)
 
         return response
 
-    async def _publish_audit_log(
+    def _publish_audit_log(
         self,
         request: Request,
         response: Response,
@@ -78,69 +70,33 @@ class AuditMiddleware(BaseHTTPMiddleware):
         start_time: datetime,
         user_id: UUID | None,
     ) -> None:
+        """Hand the audit entry to the batched sink; persistence happens off the request path."""
         try:
             details: dict[str, Any] = {"status_code": response.status_code}
             if request_body:
                 details["request_body"] = self._truncate_large_arrays(request_body)
 
-            loop = asyncio.get_running_loop()
-            await asyncio.wait_for(
-                loop.run_in_executor(
-                    _audit_executor,
-                    call_persist_audit_log,
-                    str(user_id) if user_id else None,
-                    f"{request.method} {request.url.path}",
-                    request.url.path.split("/")[-1]
-                    if "/" in request.url.path
-                    else request.url.path,
-                    None,
-                    orjson.dumps(details).decode(),
-                    request.client.host if request.client else None,
-                    request.headers.get("user-agent"),
-                    start_time.isoformat(),
-                ),
-                timeout=5.0,
-            )
-            audit_events_published_total.add(1, {"status": "success"})
-        except TimeoutError:
-            self._handle_audit_error(
-                "Audit event publish timeout after 5s",
-                "timeout",
-                user_id,
-                request.url.path,
-            )
-        except ConnectionError as e:
-            self._handle_audit_error(
-                f"Connection error publishing audit event: {e}",
-                "connection",
-                user_id,
-                request.url.path,
+            path = request.url.path
+            audit_log_sink.submit(
+                {
+                    "user_id": str(user_id) if user_id else None,
+                    "action": f"{request.method} {path}",
+                    "resource": path.split("/")[-1] if "/" in path else path,
+                    "resource_id": None,
+                    "details": orjson.dumps(details).decode(),
+                    "ip_address": request.client.host if request.client else None,
+                    "user_agent": request.headers.get("user-agent"),
+                    "created_at_iso": start_time.isoformat(),
+                }
             )
         except Exception as e:
-            self._handle_audit_error(
-                f"Unexpected error publishing audit event: {e}",
-                "unknown",
-                user_id,
-                request.url.path,
+            logger.error(
+                f"Unexpected error buffering audit event: {e}",
+                extra={"user_id": user_id, "path": request.url.path},
                 exc_info=True,
             )
-
-    def _handle_audit_error(
-        self,
-        message: str,
-        error_type: str,
-        user_id: UUID | None,
-        path: str,
-        exc_info: bool = False,
-    ) -> None:
-        if exc_info:
-            logger.error(message, extra={"user_id": user_id, "path": path}, exc_info=True)
-        else:
-            logger.error(message, extra={"user_id": user_id, "path": path})
-        if error_type == "timeout":
-            audit_publish_timeouts_total.add(1, {})
-        audit_publish_failures_total.add(1, {"error_type": error_type})
-        audit_events_published_total.add(1, {"status": "failure"})
+            audit_publish_failures_total.add(1, {"error_type": "unknown"})
+            audit_events_published_total.add(1, {"status": "failure"})
 
     def _truncate_large_arrays(self, obj: Any, max_array_len: int = 10) -> Any:
         """Truncate large arrays in the request body to keep audit log manageable."""
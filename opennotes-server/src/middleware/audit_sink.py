@@ -0,0 +1,135 @@
+"""Non-blocking, batched sink for HTTP audit log entries.
+
+AuditMiddleware submits entries to an in-process bounded ring buffer and
+returns immediately. A background task flushes the buffer whenever a full
+batch is waiting or the flush interval elapses, enqueueing one DBOS workflow
+per batch that writes the whole batch with a single multi-row INSERT.
+
+When the buffer is full the oldest entry is overwritten and counted in
+audit.events.dropped, so a slow database never backs up request handling.
+Remaining entries are flushed on application shutdown.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from src.config import settings
+from src.dbos_workflows.content_monitoring_workflows import call_persist_audit_log_batch
+from src.monitoring.metrics import (
+    audit_events_dropped_total,
+    audit_events_published_total,
+    audit_flush_batch_size,
+    audit_publish_failures_total,
+    audit_publish_timeouts_total,
+)
+
+logger = logging.getLogger(__name__)
+
+PERSIST_TIMEOUT_SECONDS = 5.0
+
+_audit_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="audit-persist")
+
+
+class AuditLogSink:
+    """Bounded ring buffer of audit log entries flushed in batches."""
+
+    def __init__(self, capacity: int, batch_size: int, flush_interval_seconds: float) -> None:
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self._buffer: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def submit(self, entry: dict[str, Any]) -> None:
+        """Buffer an entry (keyword arguments of call_persist_audit_log) without blocking."""
+        if len(self._buffer) == self._buffer.maxlen:
+            audit_events_dropped_total.add(1, {"reason": "overflow"})
+        self._buffer.append(entry)
+        self._ensure_flusher()
+        if len(self._buffer) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    def _ensure_flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = loop.create_task(self._run(self._wakeup), name="audit-log-flusher")
+
+    async def _run(self, wakeup: asyncio.Event) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), timeout=self.flush_interval_seconds)
+            wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Persist everything currently buffered, one DBOS workflow per batch."""
+        while self._buffer:
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            await self._persist_batch(batch)
+
+    async def _persist_batch(self, batch: list[dict[str, Any]]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(
+                loop.run_in_executor(_audit_executor, call_persist_audit_log_batch, batch),
+                timeout=PERSIST_TIMEOUT_SECONDS,
+            )
+            audit_events_published_total.add(len(batch), {"status": "success"})
+            audit_flush_batch_size.record(len(batch))
+        except TimeoutError:
+            self._handle_batch_error(
+                f"Audit batch enqueue timeout after {PERSIST_TIMEOUT_SECONDS:g}s",
+                "timeout",
+                len(batch),
+            )
+        except ConnectionError as e:
+            self._handle_batch_error(
+                f"Connection error enqueueing audit batch: {e}", "connection", len(batch)
+            )
+        except Exception as e:
+            self._handle_batch_error(
+                f"Unexpected error enqueueing audit batch: {e}",
+                "unknown",
+                len(batch),
+                exc_info=True,
+            )
+
+    def _handle_batch_error(
+        self, message: str, error_type: str, batch_size: int, exc_info: bool = False
+    ) -> None:
+        logger.error(message, extra={"batch_size": batch_size}, exc_info=exc_info)
+        if error_type == "timeout":
+            audit_publish_timeouts_total.add(1, {})
+        audit_publish_failures_total.add(1, {"error_type": error_type})
+        audit_events_published_total.add(batch_size, {"status": "failure"})
+        audit_events_dropped_total.add(batch_size, {"reason": error_type})
+
+    async def stop(self) -> None:
+        """Stop the background flusher and persist whatever is still buffered."""
+        task, self._task = self._task, None
+        self._wakeup = None
+        if task is not None and not task.done():
+            task.cancel()
+            if task.get_loop() is asyncio.get_running_loop():
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        await self.flush()
+
+    def clear(self) -> None:
+        self._buffer.clear()
+
+
+audit_log_sink = AuditLogSink(
+    capacity=settings.AUDIT_LOG_BUFFER_SIZE,
+    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+    flush_interval_seconds=settings.AUDIT_LOG_FLUSH_INTERVAL_SECONDS,
+)
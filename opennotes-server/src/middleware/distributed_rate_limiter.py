@@ -1,14 +1,77 @@
 import logging
 import time
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Literal
 
 import redis.asyncio as redis
+from cachetools import LRUCache
 
 from src.cache.redis_client import create_redis_connection
 
 logger = logging.getLogger(__name__)
 
+RateLimitAlgorithm = Literal["sliding_log", "sliding_window"]
+
+LOCAL_ALLOTMENT_LIMIT_DIVISOR = 10
+"""A local allotment never exceeds limit // LOCAL_ALLOTMENT_LIMIT_DIVISOR tokens."""
+
+LOCAL_ALLOTMENT_CACHE_SIZE = 10_000
+"""Identifiers whose local allotment is kept in memory per instance."""
+
+# Sliding-window counter: one small hash per identifier holding the current fixed
+# window's index and count plus the previous window's count. The previous count is
+# weighted by how much of it still overlaps the sliding window. Claims up to ARGV[1]
+# tokens at once and returns how many were granted, so callers can hand them out
+# locally.
+_SLIDING_WINDOW_CLAIM_SCRIPT = """
+local key = KEYS[1]
+local requested = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local window_seconds = tonumber(ARGV[3])
+local window_index = tonumber(ARGV[4])
+local elapsed = tonumber(ARGV[5])
+
+local state = redis.call('hmget', key, 'window', 'current', 'previous')
+local stored_window = tonumber(state[1])
+local current_count = tonumber(state[2] or '0')
+local previous_count = tonumber(state[3] or '0')
+
+if stored_window ~= window_index then
+    if stored_window == window_index - 1 then
+        previous_count = current_count
+    else
+        previous_count = 0
+    end
+    current_count = 0
+end
+
+local weight = (window_seconds - elapsed) / window_seconds
+local estimated = math.floor(previous_count * weight) + current_count
+
+local available = limit - estimated
+if available < 0 then
+    available = 0
+end
+local granted = math.min(requested, available)
+
+redis.call(
+    'hset', key,
+    'window', window_index,
+    'current', current_count + granted,
+    'previous', previous_count
+)
+redis.call('expire', key, window_seconds * 2)
+
+return {granted, available - granted}
+"""
+
+
+@dataclass
+class _LocalAllotment:
+    window_index: int
+    tokens: int
+    remaining: int
+
 
 @dataclass
 class RateLimitInfo:
@@ -19,10 +82,36 @@ class RateLimitInfo:
 
 
 class DistributedRateLimiter:
-    def __init__(self, redis_url: str | None = None) -> None:
+    """
+    Redis-backed rate limiter shared by all API instances.
+
+    The default "sliding_log" algorithm records one sorted-set entry per request
+    and is exact. "sliding_window" keeps one small counter hash per identifier, so
+    Redis memory is constant regardless of request volume; it approximates the
+    sliding window by weighting the previous fixed window. With a local_allotment
+    above one, each instance claims that many tokens per Redis round trip and
+    serves the rest from memory until the window rolls over. Unused local tokens
+    still count against the limit, so the error is bounded and only ever rejects
+    early: at most local_allotment - 1 tokens per instance per window.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        algorithm: RateLimitAlgorithm = "sliding_log",
+        local_allotment: int = 1,
+    ) -> None:
+        if local_allotment < 1:
+            raise ValueError("local_allotment must be at least 1")
+
         self.redis_url = redis_url
         self.redis: redis.Redis | None = None
         self.key_prefix = "rate_limit:"
+        self.algorithm = algorithm
+        self.local_allotment = local_allotment
+        self._local_allotments: LRUCache[str, _LocalAllotment] = LRUCache(
+            maxsize=LOCAL_ALLOTMENT_CACHE_SIZE
+        )
 
     async def connect(self) -> None:
         if not self.redis_url:
@@ -52,6 +141,9 @@ class DistributedRateLimiter:
             return f"{self.key_prefix}{window_key}:{identifier}"
         return f"{self.key_prefix}{identifier}"
 
+    def _counter_key(self, key: str) -> str:
+        return f"{key}:counter"
+
     async def check_rate_limit(
         self,
         identifier: str,
@@ -67,6 +159,9 @@ class DistributedRateLimiter:
 
         key = self._build_key(identifier, window_key)
 
+        if self.algorithm == "sliding_window":
+            return await self._check_sliding_window(key, identifier, limit, window_seconds)
+
         try:
             current_time = int(time.time())
             window_start = current_time - window_seconds
@@ -133,6 +228,64 @@ class DistributedRateLimiter:
                 allowed=True, remaining=limit, reset_at=int(time.time()) + window_seconds
             )
 
+    async def _check_sliding_window(
+        self,
+        key: str,
+        identifier: str,
+        limit: int,
+        window_seconds: int,
+    ) -> RateLimitInfo:
+        assert self.redis is not None, "Redis client should be connected"
+
+        current_time = int(time.time())
+        window_index, elapsed = divmod(current_time, window_seconds)
+        reset_at = (window_index + 1) * window_seconds
+
+        allotment = self._local_allotments.get(key)
+        if allotment and allotment.window_index == window_index and allotment.tokens > 0:
+            allotment.tokens -= 1
+            return RateLimitInfo(
+                allowed=True,
+                remaining=allotment.remaining + allotment.tokens,
+                reset_at=reset_at,
+            )
+
+        requested = max(1, min(self.local_allotment, limit // LOCAL_ALLOTMENT_LIMIT_DIVISOR))
+
+        try:
+            result = await self.redis.eval(  # pyright: ignore[reportGeneralTypeIssues]
+                _SLIDING_WINDOW_CLAIM_SCRIPT,
+                1,
+                self._counter_key(key),
+                str(requested),
+                str(limit),
+                str(window_seconds),
+                str(window_index),
+                str(elapsed),
+            )
+        except Exception as e:
+            logger.error(f"Rate limit check failed for {identifier}: {e}")
+            return RateLimitInfo(
+                allowed=True, remaining=limit, reset_at=current_time + window_seconds
+            )
+
+        granted = int(result[0])
+        remaining = int(result[1])
+
+        if granted == 0:
+            self._local_allotments.pop(key, None)
+            return RateLimitInfo(
+                allowed=False,
+                remaining=0,
+                reset_at=reset_at,
+                retry_after=max(0, reset_at - current_time),
+            )
+
+        self._local_allotments[key] = _LocalAllotment(
+            window_index=window_index, tokens=granted - 1, remaining=remaining
+        )
+        return RateLimitInfo(allowed=True, remaining=remaining + granted - 1, reset_at=reset_at)
+
     async def reset_limit(
         self,
         identifier: str,
@@ -142,9 +295,10 @@ class DistributedRateLimiter:
             return True
 
         key = self._build_key(identifier, window_key)
+        self._local_allotments.pop(key, None)
 
         try:
-            await self.redis.delete(key)
+            await self.redis.delete(key, self._counter_key(key))
             return True
         except Exception as e:
             logger.error(f"Failed to reset rate limit for {identifier}: {e}")
@@ -167,6 +321,9 @@ class DistributedRateLimiter:
 
         key = self._build_key(identifier, window_key)
 
+        if self.algorithm == "sliding_window":
+            return await self._sliding_window_info(key, identifier, limit, window_seconds)
+
         try:
             current_time = int(time.time())
             window_start = current_time - window_seconds
@@ -222,3 +379,43 @@ class DistributedRateLimiter:
                 "reset_at": int(time.time()) + window_seconds,
                 "window_seconds": window_seconds,
             }
+
+    async def _sliding_window_info(
+        self,
+        key: str,
+        identifier: str,
+        limit: int,
+        window_seconds: int,
+    ) -> dict[str, Any]:
+        assert self.redis is not None, "Redis client should be connected"
+
+        current_time = int(time.time())
+        window_index, elapsed = divmod(current_time, window_seconds)
+        reset_at = (window_index + 1) * window_seconds
+
+        stored_window = current = previous = None
+        try:
+            stored_window, current, previous = await self.redis.hmget(  # pyright: ignore[reportGeneralTypeIssues]
+                self._counter_key(key), ["window", "current", "previous"]
+            )
+        except Exception as e:
+            logger.error(f"Failed to get rate limit info for {identifier}: {e}")
+
+        if stored_window is None:
+            current_count = previous_count = 0
+        elif int(stored_window) == window_index:
+            current_count, previous_count = int(current or 0), int(previous or 0)
+        elif int(stored_window) == window_index - 1:
+            current_count, previous_count = 0, int(current or 0)
+        else:
+            current_count = previous_count = 0
+
+        weight = (window_seconds - elapsed) / window_seconds
+        estimated = int(previous_count * weight) + current_count
+
+        return {
+            "limit": limit,
+            "remaining": max(0, limit - estimated),
+            "reset_at": reset_at,
+            "window_seconds": window_seconds,
+        }
@@ -460,6 +460,18 @@ audit_publish_timeouts_total = meter.create_counter(
     unit="1",
 )
 
+audit_events_dropped_total = meter.create_counter(
+    "audit.events.dropped",
+    description="Total number of audit events dropped before being persisted",
+    unit="1",
+)
+
+audit_flush_batch_size = meter.create_histogram(
+    "audit.flush.batch_size",
+    description="Number of audit events persisted per flushed batch",
+    unit="1",
+)
+
 dbos_pickle_fallback_total = meter.create_counter(
     "dbos.pickle_fallback",
     description="Number of times DBOS deserialization fell back to pickle from JSON",
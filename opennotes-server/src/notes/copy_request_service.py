@@ -5,8 +5,10 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from fastuuid import uuid7
-from sqlalchemy import select
+from sqlalchemy import String, Text, cast, exists, func, insert, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import aliased
 
 from src.monitoring import get_logger
 from src.notes.models import Request
@@ -15,9 +17,13 @@ if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql.elements import ColumnElement
 
 logger = get_logger(__name__)
 
+COPY_WINDOW_SIZE = 1000
+"""Source rows copied per INSERT ... SELECT; progress is reported once per window."""
+
 
 @dataclass
 class CopyResult:
@@ -26,6 +32,15 @@ class CopyResult:
     total_failed: int
 
 
+def _sort_key_bound(bound: tuple[Any, UUID]) -> ColumnElement[Any]:
+    """Bind a (created_at, id) position as a row value comparable to the sort key."""
+    created_at, request_id = bound
+    return tuple_(
+        literal(created_at, Request.created_at.type),
+        literal(request_id, Request.id.type),
+    )
+
+
 class CopyRequestService:
     @staticmethod
     async def copy_requests(
@@ -33,56 +48,120 @@ class CopyRequestService:
         source_community_server_id: UUID,
         target_community_server_id: UUID,
         on_progress: Callable[[int, int], None | Awaitable[None]] | None = None,
+        window_size: int = COPY_WINDOW_SIZE,
     ) -> CopyResult:
-        stmt = (
-            select(Request)
-            .where(
-                Request.community_server_id == source_community_server_id,
-                Request.deleted_at.is_(None),
+        """Copy active requests from one community server to another.
+
+        Rows never leave the database: each window of source requests, keyed
+        by (created_at, id), is copied with one INSERT ... SELECT inside its
+        own SAVEPOINT. Source requests that already have a copy in the target
+        (matched on request_metadata["copied_from"]) are skipped, so a retried
+        copy does not duplicate rows. A window whose INSERT fails is rolled
+        back to its savepoint and counted as failed; later windows continue.
+        The caller owns the surrounding transaction and commits it.
+        """
+        source_filter: list[ColumnElement[bool]] = [
+            Request.community_server_id == source_community_server_id,
+            Request.deleted_at.is_(None),
+        ]
+
+        total = (
+            await db.execute(select(func.count()).select_from(Request).where(*source_filter))
+        ).scalar() or 0
+
+        target = aliased(Request)
+        already_copied = exists(
+            select(1).where(
+                target.community_server_id == target_community_server_id,
+                target.request_metadata["copied_from"].astext == cast(Request.id, Text),
             )
-            .order_by(Request.created_at)
         )
-        result = await db.execute(stmt)
-        source_requests = result.scalars().all()
 
-        total = len(source_requests)
+        copied_metadata = func.coalesce(Request.request_metadata, func.jsonb_build_object()).op(
+            "||", return_type=JSONB
+        )(func.jsonb_build_object("copied_from", cast(Request.id, Text)))
+
+        sort_key = tuple_(Request.created_at, Request.id)
+        cursor: tuple[Any, UUID] | None = None
+        scanned = 0
         copied = 0
         failed = 0
 
-        for i, source_req in enumerate(source_requests):
-            try:
-                new_request_id = str(uuid7())
-
-                metadata: dict[str, Any] = {
-                    **(source_req.request_metadata or {}),
-                    "copied_from": str(source_req.id),
-                }
-
-                new_request = Request(
-                    request_id=new_request_id,
-                    community_server_id=target_community_server_id,
-                    message_archive_id=source_req.message_archive_id,
-                    requested_by=source_req.requested_by,
-                    dataset_item_id=source_req.dataset_item_id,
-                    similarity_score=source_req.similarity_score,
-                    dataset_name=source_req.dataset_name,
-                    status="PENDING",
-                    note_id=None,
-                    request_metadata=metadata,
+        while scanned < total:
+            window_filter = list(source_filter)
+            if cursor is not None:
+                window_filter.append(sort_key > _sort_key_bound(cursor))
+
+            boundary_row = (
+                await db.execute(
+                    select(Request.created_at, Request.id)
+                    .where(*window_filter)
+                    .order_by(Request.created_at, Request.id)
+                    .offset(window_size - 1)
+                    .limit(1)
                 )
-                db.add(new_request)
-                copied += 1
+            ).first()
+            if boundary_row is not None:
+                boundary = (boundary_row[0], boundary_row[1])
+                window_filter.append(sort_key <= _sort_key_bound(boundary))
+                window_count = window_size
+            else:
+                boundary = None
+                window_count = total - scanned
+
+            stmt = insert(Request).from_select(
+                [
+                    "request_id",
+                    "community_server_id",
+                    "message_archive_id",
+                    "requested_by",
+                    "dataset_item_id",
+                    "similarity_score",
+                    "dataset_name",
+                    "status",
+                    "request_metadata",
+                ],
+                select(
+                    cast(func.uuidv7(), String),
+                    literal(target_community_server_id, PGUUID(as_uuid=True)),
+                    Request.message_archive_id,
+                    Request.requested_by,
+                    Request.dataset_item_id,
+                    Request.similarity_score,
+                    Request.dataset_name,
+                    cast(literal("PENDING"), Request.status.type),
+                    copied_metadata,
+                ).where(
+                    *window_filter,
+                    ~already_copied,
+                ),
+            )
 
+            try:
+                async with db.begin_nested():
+                    result = await db.execute(stmt)
+                copied += result.rowcount or 0  # pyright: ignore[reportAttributeAccessIssue]
             except Exception as e:
                 logger.warning(
-                    "Failed to copy request",
-                    extra={"source_request_id": str(source_req.id), "error": str(e)},
+                    "Failed to copy request window",
+                    extra={
+                        "source_community_server_id": str(source_community_server_id),
+                        "window_start": scanned,
+                        "window_count": window_count,
+                        "error": str(e),
+                    },
                 )
-                failed += 1
+                failed += window_count
 
+            scanned += window_count
             if on_progress:
-                _res = on_progress(i + 1, total)
+                _res = on_progress(scanned, total)
                 if inspect.isawaitable(_res):
                     await _res
 
-        return CopyResult(total_copied=copied, total_skipped=0, total_failed=failed)
+            if boundary is None:
+                break
+            cursor = boundary
+
+        skipped = max(scanned - copied - failed, 0)
+        return CopyResult(total_copied=copied, total_skipped=skipped, total_failed=failed)
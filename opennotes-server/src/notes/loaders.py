@@ -10,18 +10,23 @@ Example usage:
     from src.notes.models import Note
 
     stmt = select(Note).options(*full(), *author())
+
+Prefer resource() over full() when only the rating count is needed: it
+computes Note.ratings_count in SQL instead of loading every Rating row.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload, with_expression
 
 from src.notes.models import Note, Rating, Request
 
 if TYPE_CHECKING:
     from sqlalchemy.orm.strategy_options import _AbstractLoad  # pyright: ignore[reportPrivateUsage]
+    from sqlalchemy.sql.selectable import ScalarSelect
 
 
 def ratings() -> tuple[_AbstractLoad, ...]:
@@ -33,6 +38,30 @@ def ratings() -> tuple[_AbstractLoad, ...]:
     return (selectinload(Note.ratings),)
 
 
+def ratings_count_expression() -> ScalarSelect[int]:
+    """Correlated count of a note's ratings, served by idx_ratings_note_rater.
+
+    Returns:
+        Scalar subquery counting Rating rows for the enclosing Note.
+    """
+    return (
+        select(func.count())
+        .select_from(Rating)
+        .where(Rating.note_id == Note.id)
+        .correlate(Note)
+        .scalar_subquery()
+    )
+
+
+def ratings_count() -> tuple[_AbstractLoad, ...]:
+    """Load the note's rating count into Note.ratings_count.
+
+    Returns:
+        Tuple containing with_expression option for Note.ratings_count.
+    """
+    return (with_expression(Note.ratings_count, ratings_count_expression()),)
+
+
 def request() -> tuple[_AbstractLoad, ...]:
     """Load note request with message archive.
 
@@ -55,6 +84,18 @@ def full() -> tuple[_AbstractLoad, ...]:
     return (*ratings(), *request())
 
 
+def resource() -> tuple[_AbstractLoad, ...]:
+    """Loading for JSON:API note resources - composes ratings_count() + request().
+
+    Use this instead of full() when rendering notes that only report
+    ratings_count. Add ratings() when the client asks for include=ratings.
+
+    Returns:
+        Tuple containing all options from ratings_count() and request().
+    """
+    return (*ratings_count(), *request())
+
+
 def admin() -> tuple[_AbstractLoad, ...]:
     """Extended loading including force_published_by_profile.
 
@@ -19,7 +19,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from src.database import Base
 
@@ -105,6 +105,9 @@ class Note(Base, TimestampMixin):
     # Soft delete
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
+    # Aggregate rating count, populated only when loaded via loaders.ratings_count()
+    ratings_count: Mapped[int | None] = query_expression()
+
     # Relationships with lazy='raise' to prevent N+1 queries (explicit loading required)
     author: Mapped[UserProfile] = relationship(
         "UserProfile", foreign_keys=[author_id], lazy="raise"
@@ -126,6 +129,20 @@ class Note(Base, TimestampMixin):
         Index("idx_notes_author_id", "author_id"),
         Index("idx_notes_status", "status"),
         Index("idx_notes_deleted_at", "deleted_at"),
+        # Top-k by persisted score with keyset pagination (GET /scoring/notes/top)
+        Index(
+            "idx_notes_score_desc",
+            text("helpfulness_score DESC"),
+            text("id DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_notes_community_score_desc",
+            "community_server_id",
+            text("helpfulness_score DESC"),
+            text("id DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
 
     @hybrid_property
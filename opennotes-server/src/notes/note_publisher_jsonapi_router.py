@@ -24,7 +24,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi import Request as HTTPRequest
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import and_, delete, func, select
+from sqlalchemy import and_, delete, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -35,7 +35,7 @@ from src.auth.community_dependencies import (
 from src.auth.dependencies import get_current_user_or_api_key
 from src.auth.permissions import is_service_account
 from src.common.base_schemas import SQLAlchemySchema, StrictInputSchema
-from src.common.filters import FilterBuilder, FilterField, FilterOperator
+from src.common.filters import FilterBuilder, FilterField, FilterOperator, SortKey
 from src.common.jsonapi import (
     JSONAPI_CONTENT_TYPE,
     JSONAPILinks,
@@ -47,6 +47,12 @@ from src.common.jsonapi import (
 from src.common.jsonapi import (
     create_pagination_links as create_pagination_links_base,
 )
+from src.common.pagination import (
+    PAGE_AFTER_DESCRIPTION,
+    PAGE_COUNT_DESCRIPTION,
+    CountMode,
+    paginate_jsonapi_query,
+)
 from src.common.responses import AUTHENTICATED_RESPONSES
 from src.database import get_db
 from src.llm_config.models import CommunityServer
@@ -77,6 +83,9 @@ _publisher_post_filter_builder = FilterBuilder(
     FilterField(NotePublisherPost.success, alias="success", operators=[FilterOperator.EQ]),
 )
 
+_publisher_config_sort_keys = [SortKey(NotePublisherConfig.id, descending=False)]
+_publisher_post_sort_keys = [SortKey(NotePublisherPost.posted_at), SortKey(NotePublisherPost.id)]
+
 
 class NotePublisherConfigCreateAttributes(StrictInputSchema):
     """Attributes for creating a note publisher config via JSON:API."""
@@ -354,6 +363,10 @@ async def list_note_publisher_configs_jsonapi(
     current_user: Annotated[User, Depends(get_current_user_or_api_key)],
     page_number: int = Query(1, ge=1, alias="page[number]"),
     page_size: int = Query(20, ge=1, le=100, alias="page[size]"),
+    page_after: str | None = Query(None, alias="page[after]", description=PAGE_AFTER_DESCRIPTION),
+    page_count: CountMode = Query(
+        CountMode.EXACT, alias="page[count]", description=PAGE_COUNT_DESCRIPTION
+    ),
     filter_community_server_id: str | None = Query(None, alias="filter[community_server_id]"),
     filter_enabled: bool | None = Query(None, alias="filter[enabled]"),
 ) -> JSONResponse:
@@ -364,6 +377,8 @@ async def list_note_publisher_configs_jsonapi(
     Query Parameters:
     - page[number]: Page number (default: 1)
     - page[size]: Page size (default: 20, max: 100)
+    - page[after]: Cursor from links.next (cursor pagination)
+    - page[count]: exact (default), capped, or none
 
     Filter Parameters:
     - filter[community_server_id]: Filter by community server platform ID (required)
@@ -405,21 +420,24 @@ async def list_note_publisher_configs_jsonapi(
         if filters:
             query = query.where(and_(*filters))
 
-        total_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(total_query)
-        total = total_result.scalar() or 0
-
-        query = query.offset((page_number - 1) * page_size).limit(page_size)
-
-        result = await db.execute(query)
-        configs = result.scalars().all()
+        page = await paginate_jsonapi_query(
+            db,
+            query,
+            sort_keys=_publisher_config_sort_keys,
+            page_number=page_number,
+            page_size=page_size,
+            after=page_after,
+            count_mode=page_count,
+        )
+        if isinstance(page, JSONResponse):
+            return page
 
-        config_resources = [config_to_resource(cfg) for cfg in configs]
+        config_resources = [config_to_resource(cfg) for cfg in page.items]
 
         response = NotePublisherConfigListResponse(
             data=config_resources,
-            links=create_pagination_links_from_request(request, page_number, page_size, total),
-            meta=JSONAPIMeta(count=total),
+            links=page.links(request, describedby="/api/v2/openapi.json"),
+            meta=page.meta(),
         )
 
         return JSONResponse(
@@ -728,6 +746,10 @@ async def list_note_publisher_posts_jsonapi(
     current_user: Annotated[User, Depends(get_current_user_or_api_key)],
     page_number: int = Query(1, ge=1, alias="page[number]"),
     page_size: int = Query(20, ge=1, le=100, alias="page[size]"),
+    page_after: str | None = Query(None, alias="page[after]", description=PAGE_AFTER_DESCRIPTION),
+    page_count: CountMode = Query(
+        CountMode.EXACT, alias="page[count]", description=PAGE_COUNT_DESCRIPTION
+    ),
     filter_community_server_id: str | None = Query(None, alias="filter[community_server_id]"),
     filter_channel_id: str | None = Query(None, alias="filter[channel_id]"),
     filter_success: bool | None = Query(None, alias="filter[success]"),
@@ -739,6 +761,8 @@ async def list_note_publisher_posts_jsonapi(
     Query Parameters:
     - page[number]: Page number (default: 1)
     - page[size]: Page size (default: 20, max: 100)
+    - page[after]: Cursor from links.next (cursor pagination)
+    - page[count]: exact (default), capped, or none
 
     Filter Parameters:
     - filter[community_server_id]: Filter by community server platform ID (required)
@@ -782,23 +806,24 @@ async def list_note_publisher_posts_jsonapi(
         if filters:
             query = query.where(and_(*filters))
 
-        query = query.order_by(NotePublisherPost.posted_at.desc())
-
-        total_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(total_query)
-        total = total_result.scalar() or 0
-
-        query = query.offset((page_number - 1) * page_size).limit(page_size)
-
-        result = await db.execute(query)
-        posts = result.scalars().all()
+        page = await paginate_jsonapi_query(
+            db,
+            query,
+            sort_keys=_publisher_post_sort_keys,
+            page_number=page_number,
+            page_size=page_size,
+            after=page_after,
+            count_mode=page_count,
+        )
+        if isinstance(page, JSONResponse):
+            return page
 
-        post_resources = [post_to_resource(p) for p in posts]
+        post_resources = [post_to_resource(p) for p in page.items]
 
         response = NotePublisherPostListResponse(
             data=post_resources,
-            links=create_pagination_links_from_request(request, page_number, page_size, total),
-            meta=JSONAPIMeta(count=total),
+            links=page.links(request, describedby="/api/v2/openapi.json"),
+            meta=page.meta(),
         )
 
         return JSONResponse(
@@ -5,6 +5,8 @@ It provides:
 - Standard JSON:API response envelope structure
 - Advanced filtering with operators (neq, gte, lte, not_in)
 - Pagination support
+- Sparse fieldsets (fields[notes]) applied to the SQL projection
+- Compound documents for ratings (include=ratings)
 - Write operations (POST, PATCH, DELETE)
 - Proper content-type headers (application/vnd.api+json)
 
@@ -19,8 +21,9 @@ Filter operators supported (via fastapi-filter style syntax):
 - filter[rater_id]: Include only notes rated by this user
 """
 
+from collections.abc import Callable, Iterable
 from datetime import datetime
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
 import pendulum
@@ -28,8 +31,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi import Request as HTTPRequest
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import and_, desc, exists, func, not_, select
+from sqlalchemy import and_, exists, not_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from src.auth.community_dependencies import (
     get_profile_id_from_user,
@@ -41,7 +45,7 @@ from src.auth.dependencies import get_current_user_or_api_key
 from src.auth.ownership_dependencies import verify_note_ownership
 from src.auth.permissions import is_service_account
 from src.common.base_schemas import StrictInputSchema
-from src.common.filters import FilterBuilder, FilterField, FilterOperator, JoinSpec
+from src.common.filters import FilterBuilder, FilterField, FilterOperator, JoinSpec, SortKey
 from src.common.jsonapi import (
     JSONAPI_CONTENT_TYPE,
     JSONAPILinks,
@@ -53,6 +57,12 @@ from src.common.jsonapi import (
 from src.common.jsonapi import (
     create_pagination_links as create_pagination_links_base,
 )
+from src.common.pagination import (
+    PAGE_AFTER_DESCRIPTION,
+    PAGE_COUNT_DESCRIPTION,
+    CountMode,
+    paginate_jsonapi_query,
+)
 from src.common.responses import AUTHENTICATED_RESPONSES
 from src.database import get_db
 from src.events.publisher import event_publisher
@@ -60,6 +70,7 @@ from src.monitoring import get_logger
 from src.notes import loaders
 from src.notes.message_archive_models import MessageArchive
 from src.notes.models import Note, Rating, Request
+from src.notes.ratings_jsonapi_router import rating_to_resource
 from src.notes.schemas import (
     NoteClassification,
     NoteJSONAPIAttributes,
@@ -67,6 +78,7 @@ from src.notes.schemas import (
     NoteResource,
     NoteSingleResponse,
     NoteStatus,
+    RatingResource,
 )
 from src.notes.score_event_context import build_score_event_routing_context
 from src.users.models import User
@@ -129,37 +141,163 @@ class NoteUpdateRequest(BaseModel):
     data: NoteUpdateData
 
 
-def note_to_resource(note: Note) -> NoteResource:
-    """Convert a Note model to a JSON:API resource object."""
-    platform_message_id = None
-    platform_channel_id = None
-    if note.request and note.request.message_archive:
-        platform_message_id = note.request.message_archive.platform_message_id
-        platform_channel_id = note.request.message_archive.platform_channel_id
-
-    return NoteResource(
-        type="notes",
-        id=str(note.id),
-        attributes=NoteJSONAPIAttributes(
-            author_id=str(note.author_id),
-            channel_id=note.channel_id,
-            summary=note.summary,
-            classification=note.classification,
-            helpfulness_score=note.helpfulness_score,
-            status=note.status,
-            ai_generated=note.ai_generated,
-            ai_provider=note.ai_provider,
-            force_published=note.force_published,
-            force_published_at=note.force_published_at,
-            created_at=note.created_at,
-            updated_at=note.updated_at,
-            request_id=note.request_id,
-            platform_message_id=platform_message_id,
-            platform_channel_id=platform_channel_id,
-            ratings_count=len(note.ratings) if note.ratings else 0,
-            community_server_id=str(note.community_server_id) if note.community_server_id else None,
-        ),
-    )
+def _note_ratings_count(note: Note) -> int:
+    """Rating count from the aggregate expression, falling back to loaded ratings."""
+    if note.ratings_count is not None:
+        return note.ratings_count
+    return len(note.ratings) if note.ratings else 0
+
+
+def _note_message_archive(note: Note) -> MessageArchive | None:
+    return note.request.message_archive if note.request else None
+
+
+_NOTE_ATTRIBUTE_GETTERS: dict[str, Callable[[Note], Any]] = {
+    "author_id": lambda note: str(note.author_id),
+    "channel_id": lambda note: note.channel_id,
+    "summary": lambda note: note.summary,
+    "classification": lambda note: note.classification,
+    "helpfulness_score": lambda note: note.helpfulness_score,
+    "status": lambda note: note.status,
+    "ai_generated": lambda note: note.ai_generated,
+    "ai_provider": lambda note: note.ai_provider,
+    "force_published": lambda note: note.force_published,
+    "force_published_at": lambda note: note.force_published_at,
+    "created_at": lambda note: note.created_at,
+    "updated_at": lambda note: note.updated_at,
+    "request_id": lambda note: note.request_id,
+    "platform_message_id": lambda note: (
+        archive.platform_message_id if (archive := _note_message_archive(note)) else None
+    ),
+    "platform_channel_id": lambda note: (
+        archive.platform_channel_id if (archive := _note_message_archive(note)) else None
+    ),
+    "ratings_count": _note_ratings_count,
+    "community_server_id": lambda note: (
+        str(note.community_server_id) if note.community_server_id else None
+    ),
+}
+
+# Columns each sparse-fieldset attribute needs from the notes table. Attributes
+# mapped to an empty tuple are either derived (ratings_count) or never populated.
+_NOTE_SPARSE_COLUMNS: dict[str, tuple[Any, ...]] = {
+    "author_id": (Note.author_id,),
+    "channel_id": (Note.channel_id,),
+    "summary": (Note.summary,),
+    "classification": (Note.classification,),
+    "helpfulness_score": (Note.helpfulness_score,),
+    "status": (Note.status,),
+    "ai_generated": (Note.ai_generated,),
+    "ai_provider": (Note.ai_provider,),
+    "ai_model": (),
+    "force_published": (Note.force_published,),
+    "force_published_at": (Note.force_published_at,),
+    "created_at": (Note.created_at,),
+    "updated_at": (Note.updated_at,),
+    "request_id": (Note.request_id,),
+    "platform_message_id": (Note.request_id,),
+    "platform_channel_id": (Note.request_id,),
+    "ratings_count": (),
+    "community_server_id": (Note.community_server_id,),
+}
+
+_NOTE_PLATFORM_FIELDS = frozenset({"platform_message_id", "platform_channel_id"})
+_NOTE_INCLUDES = frozenset({"ratings"})
+
+
+def parse_note_fieldset(value: str | None) -> frozenset[str] | None:
+    """Parse a ``fields[notes]`` sparse fieldset.
+
+    Returns None when no fieldset was requested (all attributes).
+
+    Raises:
+        ValueError: If the fieldset names an unknown note attribute.
+    """
+    if value is None:
+        return None
+    fields = frozenset(f.strip() for f in value.split(",") if f.strip())
+    unknown = fields - _NOTE_SPARSE_COLUMNS.keys()
+    if unknown:
+        raise ValueError(f"Unknown note fields: {', '.join(sorted(unknown))}")
+    return fields
+
+
+def parse_note_include(value: str | None) -> bool:
+    """Parse the ``include`` parameter, returning whether ratings were requested.
+
+    Raises:
+        ValueError: If an unsupported relationship path is requested.
+    """
+    if value is None:
+        return False
+    paths = {p.strip() for p in value.split(",") if p.strip()}
+    unsupported = paths - _NOTE_INCLUDES
+    if unsupported:
+        raise ValueError(f"Unsupported include paths: {', '.join(sorted(unsupported))}")
+    return "ratings" in paths
+
+
+def note_load_options(
+    fields: frozenset[str] | None = None, include_ratings: bool = False
+) -> tuple[Any, ...]:
+    """Build loader options for a notes query honoring sparse fieldsets and includes.
+
+    Without a fieldset every column is loaded along with the rating count and
+    request archive. With a fieldset only the requested columns are selected
+    (plus those needed for authorization and keyset pagination), and the rating
+    count and request archive are loaded only when asked for. Rating rows are
+    loaded only for ``include=ratings``.
+    """
+    if fields is None:
+        options: tuple[Any, ...] = loaders.resource()
+    else:
+        columns = {col for name in fields for col in _NOTE_SPARSE_COLUMNS[name]}
+        options = (load_only(Note.community_server_id, Note.created_at, *columns, raiseload=True),)
+        if fields & _NOTE_PLATFORM_FIELDS:
+            options = (*options, *loaders.request())
+        if "ratings_count" in fields:
+            options = (*options, *loaders.ratings_count())
+    if include_ratings:
+        options = (*options, *loaders.ratings())
+    return options
+
+
+def note_to_resource(
+    note: Note, fields: frozenset[str] | None = None, include_ratings: bool = False
+) -> NoteResource:
+    """Convert a Note model to a JSON:API resource object.
+
+    Args:
+        note: Note loaded with options from note_load_options() (or equivalent)
+        fields: Sparse fieldset; only these attributes are read and serialized
+        include_ratings: Add a ratings relationship (requires loaded ratings)
+    """
+    if fields is None:
+        attributes = NoteJSONAPIAttributes(
+            **{name: getter(note) for name, getter in _NOTE_ATTRIBUTE_GETTERS.items()}
+        )
+    else:
+        attributes = NoteJSONAPIAttributes.model_construct(
+            **{
+                name: getter(note)
+                for name, getter in _NOTE_ATTRIBUTE_GETTERS.items()
+                if name in fields
+            }
+        )
+
+    resource = NoteResource(type="notes", id=str(note.id), attributes=attributes)
+    if include_ratings:
+        resource.relationships = {
+            "ratings": {"data": [{"type": "ratings", "id": str(r.id)} for r in note.ratings]}
+        }
+    if fields is not None:
+        resource.restrict_attributes(fields)
+    return resource
+
+
+def included_ratings(notes: Iterable[Note]) -> list[RatingResource]:
+    """Build the compound-document ``included`` array for include=ratings."""
+    return [rating_to_resource(rating) for note in notes for rating in note.ratings]
 
 
 def create_pagination_links_from_request(
@@ -213,6 +351,8 @@ def create_error_response(
     )
 
 
+note_sort_keys = [SortKey(Note.created_at), SortKey(Note.id)]
+
 _platform_message_id_joins = [
     JoinSpec(target=Request, onclause=Note.request_id == Request.id),
     JoinSpec(target=MessageArchive, onclause=Request.message_archive_id == MessageArchive.id),
@@ -263,6 +403,10 @@ async def list_notes_jsonapi(
     current_user: Annotated[User, Depends(get_current_user_or_api_key)],
     page_number: int = Query(1, ge=1, alias="page[number]"),
     page_size: int = Query(20, ge=1, le=100, alias="page[size]"),
+    page_after: str | None = Query(None, alias="page[after]", description=PAGE_AFTER_DESCRIPTION),
+    page_count: CountMode = Query(
+        CountMode.EXACT, alias="page[count]", description=PAGE_COUNT_DESCRIPTION
+    ),
     filter_status: NoteStatus | None = Query(None, alias="filter[status]"),
     filter_status_neq: NoteStatus | None = Query(None, alias="filter[status__neq]"),
     filter_classification: NoteClassification | None = Query(None, alias="filter[classification]"),
@@ -274,6 +418,14 @@ async def list_notes_jsonapi(
     filter_rated_by_not_in: str | None = Query(None, alias="filter[rater_id__not_in]"),
     filter_rated_by: UUID | None = Query(None, alias="filter[rater_id]"),
     filter_platform_message_id: str | None = Query(None, alias="filter[platform_message_id]"),
+    include: str | None = Query(
+        None, alias="include", description="Related resources to include (supported: ratings)"
+    ),
+    fields_notes: str | None = Query(
+        None,
+        alias="fields[notes]",
+        description="Comma-separated note attributes to return (sparse fieldset)",
+    ),
 ) -> JSONResponse:
     """List notes with JSON:API format.
 
@@ -282,6 +434,8 @@ async def list_notes_jsonapi(
     Query Parameters:
     - page[number]: Page number (default: 1)
     - page[size]: Page size (default: 20, max: 100)
+    - page[after]: Cursor from links.next (cursor pagination)
+    - page[count]: exact (default), capped, or none
 
     Filter Parameters (equality):
     - filter[status]: Filter by note status (exact match)
@@ -299,10 +453,24 @@ async def list_notes_jsonapi(
       (comma-separated list of user profile UUIDs)
     - filter[rater_id]: Include only notes rated by this user (user profile UUID)
 
+    Other Parameters:
+    - include: "ratings" adds rating relationships and an included array
+    - fields[notes]: Sparse fieldset; only these attributes are selected and returned
+
     Returns JSON:API formatted response with data, jsonapi, links, and meta.
     """
     try:
-        query = select(Note).options(*loaders.full()).where(Note.deleted_at.is_(None))
+        try:
+            fields = parse_note_fieldset(fields_notes)
+            include_ratings = parse_note_include(include)
+        except ValueError as e:
+            return create_error_response(status.HTTP_400_BAD_REQUEST, "Bad Request", str(e))
+
+        query = (
+            select(Note)
+            .options(*note_load_options(fields, include_ratings))
+            .where(Note.deleted_at.is_(None))
+        )
 
         rated_by_list: list[UUID] | None = None
         if filter_rated_by_not_in:
@@ -363,26 +531,25 @@ async def list_notes_jsonapi(
         if filters:
             query = query.where(and_(*filters))
 
-        total_query = select(func.count(Note.id)).where(Note.deleted_at.is_(None))
-        for join_spec in filters.joins:
-            total_query = total_query.join(join_spec.target, join_spec.onclause)
-        if filters:
-            total_query = total_query.where(and_(*filters))
-        total_result = await db.execute(total_query)
-        total = total_result.scalar() or 0
-
-        query = query.order_by(desc(Note.created_at))
-        query = query.limit(page_size).offset((page_number - 1) * page_size)
-
-        result = await db.execute(query)
-        notes = result.scalars().all()
+        page = await paginate_jsonapi_query(
+            db,
+            query,
+            sort_keys=note_sort_keys,
+            page_number=page_number,
+            page_size=page_size,
+            after=page_after,
+            count_mode=page_count,
+        )
+        if isinstance(page, JSONResponse):
+            return page
 
-        note_resources = [note_to_resource(note) for note in notes]
+        note_resources = [note_to_resource(note, fields, include_ratings) for note in page.items]
 
         response = NoteListResponse(
             data=note_resources,
-            links=create_pagination_links_from_request(request, page_number, page_size, total),
-            meta=JSONAPIMeta(count=total),
+            included=included_ratings(page.items) if include_ratings else None,
+            links=page.links(request, describedby="/api/v2/openapi.json"),
+            meta=page.meta(),
         )
 
         return JSONResponse(
@@ -407,16 +574,32 @@ async def get_note_jsonapi(
     request: HTTPRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user_or_api_key)],
+    include: str | None = Query(
+        None, alias="include", description="Related resources to include (supported: ratings)"
+    ),
+    fields_notes: str | None = Query(
+        None,
+        alias="fields[notes]",
+        description="Comma-separated note attributes to return (sparse fieldset)",
+    ),
 ) -> JSONResponse:
     """Get a single note by ID with JSON:API format.
 
+    Supports include=ratings and fields[notes] like the list endpoint.
+
     Returns JSON:API formatted response with data and jsonapi keys.
     Returns JSON:API error format for 404 and other errors.
     """
     try:
+        try:
+            fields = parse_note_fieldset(fields_notes)
+            include_ratings = parse_note_include(include)
+        except ValueError as e:
+            return create_error_response(status.HTTP_400_BAD_REQUEST, "Bad Request", str(e))
+
         result = await db.execute(
             select(Note)
-            .options(*loaders.full())
+            .options(*note_load_options(fields, include_ratings))
             .where(Note.id == note_id, Note.deleted_at.is_(None))
         )
         note = result.scalar_one_or_none()
@@ -433,10 +616,11 @@ async def get_note_jsonapi(
                 note.community_server_id, current_user, db, request
             )
 
-        note_resource = note_to_resource(note)
+        note_resource = note_to_resource(note, fields, include_ratings)
 
         response = NoteSingleResponse(
             data=note_resource,
+            included=included_ratings([note]) if include_ratings else None,
             links=JSONAPILinks(self_=str(request.url)),
         )
 
@@ -526,7 +710,7 @@ async def create_note_jsonapi(
 
         result = await db.execute(
             select(Note)
-            .options(*loaders.full())
+            .options(*loaders.resource())
             .where(Note.id == note.id, Note.deleted_at.is_(None))
         )
         note = result.scalar_one()
@@ -592,7 +776,7 @@ async def update_note_jsonapi(
 
         result = await db.execute(
             select(Note)
-            .options(*loaders.full())
+            .options(*loaders.resource())
             .where(Note.id == note.id, Note.deleted_at.is_(None))
         )
         note = result.scalar_one()
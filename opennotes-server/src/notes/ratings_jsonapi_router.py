@@ -3,6 +3,7 @@
 This module implements JSON:API 1.0 compliant endpoints for ratings.
 It provides:
 - POST /ratings: Create or upsert a rating
+- POST /ratings/bulk: Create or upsert many ratings with per-item results
 - GET /notes/{id}/ratings: List ratings for a note
 - Standard JSON:API response envelope structure
 - Proper content-type headers (application/vnd.api+json)
@@ -10,7 +11,7 @@ It provides:
 Reference: https://jsonapi.org/format/
 """
 
-from datetime import datetime
+from collections.abc import Sequence
 from typing import Annotated, Literal
 from uuid import UUID
 
@@ -29,6 +30,8 @@ from src.auth.permissions import is_service_account
 from src.common.base_schemas import SQLAlchemySchema, StrictInputSchema
 from src.common.jsonapi import (
     JSONAPI_CONTENT_TYPE,
+    JSONAPIError,
+    JSONAPIErrorSource,
     JSONAPILinks,
 )
 from src.common.jsonapi import (
@@ -39,9 +42,10 @@ from src.database import get_db
 from src.monitoring import get_logger
 from src.notes import loaders
 from src.notes.models import Note, Rating
-from src.notes.schemas import HelpfulnessLevel
+from src.notes.schemas import HelpfulnessLevel, RatingAttributes, RatingResource
 from src.simulation.workflows.scoring_workflow import dispatch_community_scoring
 from src.users.models import User
+from src.users.profile_models import UserProfile
 
 logger = get_logger(__name__)
 
@@ -73,22 +77,33 @@ class RatingCreateRequest(BaseModel):
     data: RatingCreateData
 
 
-class RatingAttributes(SQLAlchemySchema):
-    """Rating attributes for JSON:API resource."""
+MAX_BULK_RATINGS = 500
 
-    note_id: str
-    rater_id: str
-    helpfulness_level: str
-    created_at: datetime | None = None
-    updated_at: datetime | None = None
 
+class RatingBulkCreateRequest(BaseModel):
+    """JSON:API request body for creating or upserting many ratings at once."""
 
-class RatingResource(BaseModel):
-    """JSON:API resource object for a rating."""
+    model_config = ConfigDict(extra="forbid")
 
-    type: str = "ratings"
-    id: str
-    attributes: RatingAttributes
+    data: list[RatingCreateData] = Field(..., min_length=1, max_length=MAX_BULK_RATINGS)
+
+
+class RatingBulkItemResult(BaseModel):
+    """Outcome of one item of a bulk rating request, by position in 'data'."""
+
+    index: int
+    status: str = Field(..., description="HTTP status code for this item")
+    id: str | None = Field(default=None, description="Rating ID when the item was persisted")
+    error: JSONAPIError | None = None
+
+
+class RatingBulkMeta(BaseModel):
+    """Meta object summarising a bulk rating request."""
+
+    total_requested: int
+    total_succeeded: int
+    total_failed: int
+    results: list[RatingBulkItemResult]
 
 
 class RatingSingleResponse(SQLAlchemySchema):
@@ -107,6 +122,15 @@ class RatingListResponse(SQLAlchemySchema):
     links: JSONAPILinks | None = None
 
 
+class RatingBulkResponse(SQLAlchemySchema):
+    """JSON:API response for a bulk rating request."""
+
+    data: list[RatingResource]
+    meta: RatingBulkMeta
+    jsonapi: dict[str, str] = {"version": "1.1"}
+    links: JSONAPILinks | None = None
+
+
 class RatingUpdateAttributes(StrictInputSchema):
     """Attributes for updating a rating via JSON:API."""
 
@@ -310,6 +334,180 @@ async def create_rating_jsonapi(
         )
 
 
+def _bulk_item_error(index: int, status_code: int, title: str, detail: str) -> RatingBulkItemResult:
+    return RatingBulkItemResult(
+        index=index,
+        status=str(status_code),
+        error=JSONAPIError(
+            status=str(status_code),
+            title=title,
+            detail=detail,
+            source=JSONAPIErrorSource(pointer=f"/data/{index}"),
+        ),
+    )
+
+
+def validate_bulk_ratings(
+    items: Sequence[RatingCreateAttributes],
+    existing_note_ids: set[UUID],
+    existing_rater_ids: set[UUID],
+) -> tuple[dict[tuple[UUID, UUID], int], dict[int, RatingBulkItemResult]]:
+    """Split bulk rating items into rows to upsert and per-item errors.
+
+    Returns the index of the item to persist for each (note_id, rater_id) pair,
+    and an error result for every rejected index. When a pair repeats, the last
+    occurrence wins and earlier ones are reported as conflicts, since a single
+    upsert statement cannot touch the same row twice.
+    """
+    accepted: dict[tuple[UUID, UUID], int] = {}
+    errors: dict[int, RatingBulkItemResult] = {}
+
+    for index, attrs in enumerate(items):
+        if attrs.note_id not in existing_note_ids:
+            errors[index] = _bulk_item_error(
+                index, status.HTTP_404_NOT_FOUND, "Not Found", f"Note {attrs.note_id} not found"
+            )
+            continue
+        if attrs.rater_id not in existing_rater_ids:
+            errors[index] = _bulk_item_error(
+                index,
+                status.HTTP_404_NOT_FOUND,
+                "Not Found",
+                f"Rater profile {attrs.rater_id} not found",
+            )
+            continue
+
+        key = (attrs.note_id, attrs.rater_id)
+        superseded = accepted.get(key)
+        if superseded is not None:
+            errors[superseded] = _bulk_item_error(
+                superseded,
+                status.HTTP_409_CONFLICT,
+                "Conflict",
+                f"Superseded by a later rating of note {attrs.note_id} by the same rater",
+            )
+        accepted[key] = index
+
+    return accepted, errors
+
+
+@router.post("/ratings/bulk", response_class=JSONResponse, response_model=RatingBulkResponse)
+async def bulk_create_ratings_jsonapi(
+    request: HTTPRequest,
+    body: RatingBulkCreateRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user_or_api_key)],
+) -> JSONResponse:
+    """Create or upsert up to MAX_BULK_RATINGS ratings in one request.
+
+    Notes and rater profiles are validated for the whole batch with one query
+    each, and all valid ratings are upserted with a single statement. Scoring is
+    dispatched once per affected community rather than once per rating.
+
+    The response always has 200 OK status. 'data' contains the persisted
+    ratings; meta.results reports every item by index with its own status and,
+    for rejected items, a JSON:API error object pointing at the item.
+    """
+    try:
+        items = [item.attributes for item in body.data]
+        note_ids = {attrs.note_id for attrs in items}
+        rater_ids = {attrs.rater_id for attrs in items}
+
+        note_rows = await db.execute(
+            select(Note.id, Note.community_server_id).where(
+                Note.id.in_(note_ids), Note.deleted_at.is_(None)
+            )
+        )
+        note_communities = {row.id: row.community_server_id for row in note_rows}
+        rater_result = await db.execute(select(UserProfile.id).where(UserProfile.id.in_(rater_ids)))
+        existing_rater_ids = set(rater_result.scalars().all())
+
+        accepted, errors = validate_bulk_ratings(items, set(note_communities), existing_rater_ids)
+
+        ratings_by_key: dict[tuple[UUID, UUID], Rating] = {}
+        if accepted:
+            insert_stmt = insert(Rating).values(
+                [items[index].model_dump(mode="python") for index in accepted.values()]
+            )
+            stmt = insert_stmt.on_conflict_do_update(
+                index_elements=["note_id", "rater_id"],
+                set_={
+                    "helpfulness_level": insert_stmt.excluded.helpfulness_level,
+                    "updated_at": func.now(),
+                },
+            ).returning(Rating)
+            result = await db.execute(stmt)
+            ratings_by_key = {(r.note_id, r.rater_id): r for r in result.scalars().all()}
+            await db.commit()
+
+        results: list[RatingBulkItemResult] = []
+        persisted: list[Rating] = []
+        for index, attrs in enumerate(items):
+            if index in errors:
+                results.append(errors[index])
+                continue
+            rating = ratings_by_key[(attrs.note_id, attrs.rater_id)]
+            persisted.append(rating)
+            results.append(
+                RatingBulkItemResult(
+                    index=index, status=str(status.HTTP_201_CREATED), id=str(rating.id)
+                )
+            )
+
+        community_ids = {
+            note_communities[note_id]
+            for note_id, _ in accepted
+            if note_communities[note_id] is not None
+        }
+        for community_server_id in community_ids:
+            try:
+                await dispatch_community_scoring(community_server_id)
+            except Exception as e:
+                logger.warning(
+                    "Failed to dispatch DBOS rescore workflow after bulk rating",
+                    extra={"community_server_id": str(community_server_id), "error": str(e)},
+                )
+
+        logger.info(
+            "Created/updated ratings in bulk via JSON:API",
+            extra={
+                "user_id": str(current_user.id),
+                "total_requested": len(items),
+                "total_succeeded": len(persisted),
+                "total_failed": len(errors),
+                "affected_notes": len({note_id for note_id, _ in accepted}),
+                "scoring_dispatches": len(community_ids),
+            },
+        )
+
+        response = RatingBulkResponse(
+            data=[rating_to_resource(rating) for rating in persisted],
+            meta=RatingBulkMeta(
+                total_requested=len(items),
+                total_succeeded=len(persisted),
+                total_failed=len(errors),
+                results=results,
+            ),
+            links=JSONAPILinks(self_=str(request.url)),
+        )
+
+        return JSONResponse(
+            content=response.model_dump(by_alias=True, mode="json"),
+            media_type=JSONAPI_CONTENT_TYPE,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Failed to create ratings in bulk (JSON:API): {e}")
+        await db.rollback()
+        return create_error_response(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "Internal Server Error",
+            "Failed to create ratings",
+        )
+
+
 @router.get(
     "/notes/{note_id}/ratings", response_class=JSONResponse, response_model=RatingListResponse
 )
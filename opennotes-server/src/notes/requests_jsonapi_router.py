@@ -26,7 +26,7 @@ from openai import (
     RateLimitError,
 )
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.community_dependencies import (
@@ -39,7 +39,7 @@ from src.auth.ownership_dependencies import verify_request_ownership
 from src.auth.permissions import is_service_account
 from src.auth.platform_claims import get_request_platform
 from src.common.base_schemas import SQLAlchemySchema, StrictInputSchema
-from src.common.filters import FilterBuilder, FilterField, FilterOperator
+from src.common.filters import FilterBuilder, FilterField, FilterOperator, SortKey
 from src.common.jsonapi import (
     JSONAPI_CONTENT_TYPE,
     JSONAPILinks,
@@ -51,6 +51,12 @@ from src.common.jsonapi import (
 from src.common.jsonapi import (
     create_pagination_links as create_pagination_links_base,
 )
+from src.common.pagination import (
+    PAGE_AFTER_DESCRIPTION,
+    PAGE_COUNT_DESCRIPTION,
+    CountMode,
+    paginate_jsonapi_query,
+)
 from src.common.responses import AUTHENTICATED_RESPONSES
 from src.database import get_db
 from src.middleware.rate_limiting import limiter
@@ -92,6 +98,9 @@ def note_to_resource(note: Note) -> NoteResource:
     """Convert a Note model to a JSON:API resource object."""
     platform_message_id = None
     platform_channel_id = None
+    ratings_count = note.ratings_count
+    if ratings_count is None:
+        ratings_count = len(note.ratings) if note.ratings else 0
     if note.request and note.request.message_archive:
         platform_message_id = note.request.message_archive.platform_message_id
         platform_channel_id = note.request.message_archive.platform_channel_id
@@ -115,7 +124,7 @@ def note_to_resource(note: Note) -> NoteResource:
             request_id=note.request_id,
             platform_message_id=platform_message_id,
             platform_channel_id=platform_channel_id,
-            ratings_count=len(note.ratings) if note.ratings else 0,
+            ratings_count=ratings_count,
             community_server_id=str(note.community_server_id) if note.community_server_id else None,
         ),
     )
@@ -325,6 +334,8 @@ request_filter_builder = FilterBuilder(
     ),
 )
 
+request_sort_keys = [SortKey(Request.requested_at), SortKey(Request.id)]
+
 
 @router.get("/requests", response_class=JSONResponse, response_model=RequestListJSONAPIResponse)
 async def list_requests_jsonapi(
@@ -333,6 +344,10 @@ async def list_requests_jsonapi(
     current_user: Annotated[User, Depends(get_current_user_or_api_key)],
     page_number: int = Query(1, ge=1, alias="page[number]"),
     page_size: int = Query(20, ge=1, le=100, alias="page[size]"),
+    page_after: str | None = Query(None, alias="page[after]", description=PAGE_AFTER_DESCRIPTION),
+    page_count: CountMode = Query(
+        CountMode.EXACT, alias="page[count]", description=PAGE_COUNT_DESCRIPTION
+    ),
     filter_status: RequestStatus | None = Query(None, alias="filter[status]"),
     filter_community_server_id: UUID | None = Query(None, alias="filter[community_server_id]"),
     filter_requested_by: str | None = Query(None, alias="filter[requested_by]"),
@@ -346,6 +361,8 @@ async def list_requests_jsonapi(
     Query Parameters:
     - page[number]: Page number (default: 1)
     - page[size]: Page size (default: 20, max: 100)
+    - page[after]: Cursor from links.next (cursor pagination)
+    - page[count]: exact (default), capped, or none
 
     Filter Parameters:
     - filter[status]: Filter by request status (PENDING, IN_PROGRESS, COMPLETED, FAILED)
@@ -398,24 +415,24 @@ async def list_requests_jsonapi(
         if filters:
             query = query.where(and_(*filters))
 
-        total_query = select(func.count(Request.id)).where(Request.deleted_at.is_(None))
-        if filters:
-            total_query = total_query.where(and_(*filters))
-        total_result = await db.execute(total_query)
-        total = total_result.scalar() or 0
-
-        query = query.order_by(desc(Request.requested_at))
-        query = query.limit(page_size).offset((page_number - 1) * page_size)
-
-        result = await db.execute(query)
-        requests = result.scalars().all()
+        page = await paginate_jsonapi_query(
+            db,
+            query,
+            sort_keys=request_sort_keys,
+            page_number=page_number,
+            page_size=page_size,
+            after=page_after,
+            count_mode=page_count,
+        )
+        if isinstance(page, JSONResponse):
+            return page
 
-        request_resources = [request_to_resource(req) for req in requests]
+        request_resources = [request_to_resource(req) for req in page.items]
 
         response = RequestListJSONAPIResponse(
             data=request_resources,
-            links=create_pagination_links_from_request(request, page_number, page_size, total),
-            meta=JSONAPIMeta(count=total),
+            links=page.links(request, describedby="/api/v2/openapi.json"),
+            meta=page.meta(),
         )
 
         return JSONResponse(
@@ -729,7 +746,7 @@ async def generate_ai_note_jsonapi(  # noqa: PLR0911
 
         result = await db.execute(
             select(Note)
-            .options(*loaders.full())
+            .options(*loaders.resource())
             .where(Note.id == note.id, Note.deleted_at.is_(None))
         )
         note_with_relations = result.scalar_one()
@@ -4,7 +4,16 @@ from typing import Any, Literal
 from uuid import UUID
 
 import pendulum
-from pydantic import BaseModel, ConfigDict, Field, computed_field, field_serializer
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    computed_field,
+    field_serializer,
+    model_serializer,
+)
 
 from src.common.base_schemas import (
     ResponseSchema,
@@ -165,30 +174,89 @@ class NoteJSONAPIAttributes(SQLAlchemySchema):
     community_server_id: str | None = None
 
 
+class RatingAttributes(SQLAlchemySchema):
+    """Rating attributes for JSON:API resource."""
+
+    note_id: str
+    rater_id: str
+    helpfulness_level: str
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class RatingResource(BaseModel):
+    """JSON:API resource object for a rating."""
+
+    type: str = "ratings"
+    id: str
+    attributes: RatingAttributes
+
+
+def _omit_if_none(data: dict[str, Any], model: BaseModel, *fields: str) -> dict[str, Any]:
+    """Drop optional JSON:API members that were not requested from serialized output.
+
+    Used by wrap model serializers. Those serializers are left unannotated so
+    the OpenAPI schema is still generated from the model fields.
+    """
+    for name in fields:
+        if getattr(model, name) is None:
+            data.pop(name, None)
+    return data
+
+
 class NoteResource(BaseModel):
-    """JSON:API resource object for a note."""
+    """JSON:API resource object for a note.
+
+    relationships is only serialized when the request asked for include=ratings,
+    and attributes can be limited to a sparse fieldset (fields[notes]).
+    """
 
     type: str = "notes"
     id: str
     attributes: NoteJSONAPIAttributes
+    relationships: dict[str, Any] | None = None
+
+    _fields: frozenset[str] | None = PrivateAttr(default=None)
+
+    def restrict_attributes(self, fields: frozenset[str]) -> "NoteResource":
+        """Limit serialized attributes to a JSON:API sparse fieldset."""
+        self._fields = fields
+        return self
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler):
+        data = _omit_if_none(handler(self), self, "relationships")
+        if self._fields is not None:
+            data["attributes"] = {k: v for k, v in data["attributes"].items() if k in self._fields}
+        return data
 
 
 class NoteListResponse(SQLAlchemySchema):
     """JSON:API response for a list of note resources."""
 
     data: list[NoteResource]
+    included: list[RatingResource] | None = None
     jsonapi: dict[str, str] = {"version": "1.1"}
     links: JSONAPILinks | None = None
     meta: JSONAPIMeta | None = None
 
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler):
+        return _omit_if_none(handler(self), self, "included")
+
 
 class NoteSingleResponse(SQLAlchemySchema):
     """JSON:API response for a single note resource."""
 
     data: NoteResource
+    included: list[RatingResource] | None = None
     jsonapi: dict[str, str] = {"version": "1.1"}
     links: JSONAPILinks | None = None
 
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler):
+        return _omit_if_none(handler(self), self, "included")
+
 
 # Rating schemas
 class RatingBase(BaseModel):
@@ -31,7 +31,7 @@ from src.auth.community_dependencies import (
 from src.auth.dependencies import get_current_user_or_api_key, require_scope_or_admin
 from src.auth.permissions import is_service_account
 from src.common.base_schemas import SQLAlchemySchema, StrictInputSchema
-from src.common.filters import FilterBuilder, FilterField, FilterOperator
+from src.common.filters import FilterBuilder, FilterField, FilterOperator, SortKey
 from src.common.jsonapi import (
     JSONAPI_CONTENT_TYPE,
     JSONAPILinks,
@@ -44,7 +44,7 @@ from src.config import settings
 from src.database import get_db
 from src.middleware.rate_limiting import limiter
 from src.monitoring import get_logger
-from src.notes.loaders import full
+from src.notes import loaders
 from src.notes.models import Note
 from src.notes.scoring import (
     get_tier_config,
@@ -97,6 +97,12 @@ logger = get_logger(__name__)
 router = APIRouter(responses=AUTHENTICATED_RESPONSES)
 _ISO8601_UTC_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
 
+MIN_RATINGS_FOR_CONFIDENCE: dict[ScoreConfidence, int] = {
+    ScoreConfidence.NO_DATA: 0,
+    ScoreConfidence.PROVISIONAL: 1,
+    ScoreConfidence.STANDARD: 5,
+}
+
 top_notes_filter_builder = FilterBuilder().add_auth_gated_filter(
     FilterField(
         Note.community_server_id,
@@ -313,15 +319,26 @@ def note_score_to_resource(note_id: UUID, score_response: Any) -> NoteScoreResou
     )
 
 
-def _build_persisted_score_response(note: Any, note_count: int) -> NoteScoreResponse:
+def _build_persisted_score_response(
+    note: Any, note_count: int, rating_count: int | None = None
+) -> NoteScoreResponse:
+    """Build a score response from the persisted helpfulness_score.
+
+    ``rating_count`` can be supplied when it was computed in SQL; otherwise it
+    comes from ``note.ratings_count`` (loaders.ratings_count()) or, failing
+    that, the loaded ``note.ratings`` collection.
+    """
     active_tier_enum = get_tier_for_note_count(note_count)
     active_tier_level = get_tier_level(active_tier_enum)
-    rating_count = len(note.ratings) if note.ratings else 0
+    if rating_count is None:
+        rating_count = getattr(note, "ratings_count", None)
+    if rating_count is None:
+        rating_count = len(note.ratings) if note.ratings else 0
     score = (note.helpfulness_score or 0) / 100.0
 
-    if rating_count == 0:
+    if rating_count < MIN_RATINGS_FOR_CONFIDENCE[ScoreConfidence.PROVISIONAL]:
         confidence = ScoreConfidence.NO_DATA
-    elif rating_count < 5:
+    elif rating_count < MIN_RATINGS_FOR_CONFIDENCE[ScoreConfidence.STANDARD]:
         confidence = ScoreConfidence.PROVISIONAL
     else:
         confidence = ScoreConfidence.STANDARD
@@ -490,7 +507,9 @@ async def get_note_score_jsonapi(
     """
     try:
         result = await db.execute(
-            select(Note).options(*full()).where(Note.id == note_id, Note.deleted_at.is_(None))
+            select(Note)
+            .options(*loaders.ratings_count(), *loaders.request())
+            .where(Note.id == note_id, Note.deleted_at.is_(None))
         )
         note = result.scalar_one_or_none()
 
@@ -599,7 +618,9 @@ async def get_batch_scores_jsonapi(
             user_communities = await get_user_community_ids(current_user, db)
 
         result = await db.execute(
-            select(Note).options(*full()).where(Note.id.in_(note_ids), Note.deleted_at.is_(None))
+            select(Note)
+            .options(*loaders.ratings_count(), *loaders.request())
+            .where(Note.id.in_(note_ids), Note.deleted_at.is_(None))
         )
         notes = result.scalars().all()
 
@@ -659,6 +680,14 @@ async def get_batch_scores_jsonapi(
         )
 
 
+top_notes_sort_keys = [SortKey(Note.helpfulness_score), SortKey(Note.id)]
+
+
+def _rating_count_expression() -> Any:
+    """Correlated rating count for a note, served by idx_ratings_note_rater."""
+    return loaders.ratings_count_expression().label("rating_count")
+
+
 @router.get("/scoring/notes/top", response_class=JSONResponse, response_model=NoteScoreListResponse)
 async def get_top_notes_jsonapi(  # noqa: PLR0912
     request: HTTPRequest,
@@ -669,8 +698,20 @@ async def get_top_notes_jsonapi(  # noqa: PLR0912
         None, description="Minimum confidence level filter"
     ),
     tier: int | None = Query(None, ge=0, le=5, description="Filter by scoring tier"),
-    batch_size: int = Query(1000, ge=100, le=5000, description="Batch size for processing"),
+    _batch_size: int = Query(
+        1000,
+        alias="batch_size",
+        ge=100,
+        le=5000,
+        description="Deprecated: ignored. Top notes are read from an index in a single query.",
+        deprecated=True,
+    ),
     community_server_id: UUID | None = Query(None, description="Filter by community server"),
+    cursor: str | None = Query(
+        None,
+        alias="page[after]",
+        description="Opaque cursor from links.next to fetch the following page",
+    ),
 ) -> JSONResponse:
     """Get top-scored notes in JSON:API format.
 
@@ -683,14 +724,28 @@ async def get_top_notes_jsonapi(  # noqa: PLR0912
     - Rating counts
     - Optional filtering by confidence level and tier
 
+    Notes are ordered by persisted score (ties broken by note ID). Follow
+    links.next to fetch the next page.
+
     Query Parameters:
     - limit: Number of results (1-100, default 10)
     - min_confidence: Filter by confidence level (no_data, provisional, standard)
     - tier: Filter by scoring tier (0-5)
-    - batch_size: Processing batch size (100-5000, default 1000)
     - community_server_id: Filter by community server UUID
+    - page[after]: Cursor from a previous response's links.next
     """
     try:
+        after_condition: Any = None
+        if cursor:
+            try:
+                after_condition = FilterBuilder.build_keyset_condition(top_notes_sort_keys, cursor)
+            except ValueError as e:
+                return create_error_response(
+                    status.HTTP_400_BAD_REQUEST,
+                    "Bad Request",
+                    str(e),
+                )
+
         community_server_id_value = community_server_id
         community_server_id_in_value = None
         if not is_service_account(current_user) and not community_server_id:
@@ -731,31 +786,15 @@ async def get_top_notes_jsonapi(  # noqa: PLR0912
                 e.detail,
             )
 
-        base_query = select(Note).options(*full()).where(Note.deleted_at.is_(None))
-        if filters:
-            base_query = base_query.where(and_(*filters))
+        conditions: list[Any] = [Note.deleted_at.is_(None), *filters]
 
-        count_query = select(func.count(Note.id)).where(Note.deleted_at.is_(None))
-        if filters:
-            count_query = count_query.where(and_(*filters))
-        count_result = await db.execute(count_query)
+        count_result = await db.execute(select(func.count(Note.id)).where(and_(*conditions)))
         note_count = count_result.scalar() or 0
 
         active_tier_enum = get_tier_for_note_count(note_count)
         active_tier_level = get_tier_level(active_tier_enum)
 
-        confidence_order = {
-            ScoreConfidence.NO_DATA: 0,
-            ScoreConfidence.PROVISIONAL: 1,
-            ScoreConfidence.STANDARD: 2,
-        }
-        min_confidence_level = confidence_order.get(min_confidence, 0) if min_confidence else 0
-
-        top_scored_notes: list[tuple[Note, Any]] = []
-        offset = 0
-        processed_count = 0
         filters_applied: dict[str, Any] = {}
-
         if min_confidence:
             filters_applied["min_confidence"] = min_confidence.value
         if tier is not None:
@@ -763,65 +802,69 @@ async def get_top_notes_jsonapi(  # noqa: PLR0912
         if community_server_id:
             filters_applied["community_server_id"] = str(community_server_id)
 
-        logger.info(
-            "Starting batch processing for top notes (JSON:API)",
-            extra={
-                "total_notes": note_count,
-                "batch_size": batch_size,
-                "requested_limit": limit,
-            },
-        )
-
-        while offset < note_count:
-            batch_result = await db.execute(base_query.offset(offset).limit(batch_size))
-            batch_notes = batch_result.scalars().all()
-
-            if not batch_notes:
-                break
-
-            for note in batch_notes:
-                score_response = _build_persisted_score_response(note, note_count)
-
-                if (
-                    min_confidence
-                    and confidence_order[score_response.confidence] < min_confidence_level
-                ):
-                    continue
-                if tier is not None and score_response.tier != tier:
-                    continue
-
-                top_scored_notes.append((note, score_response))
-
-                if len(top_scored_notes) > limit * 5:
-                    top_scored_notes.sort(key=lambda x: x[1].score, reverse=True)
-                    top_scored_notes = top_scored_notes[: limit * 3]
-
-            processed_count += len(batch_notes)
-            offset += batch_size
+        rating_count = _rating_count_expression()
+        min_ratings = MIN_RATINGS_FOR_CONFIDENCE[min_confidence] if min_confidence else 0
+        if min_ratings > 0:
+            conditions.append(rating_count >= min_ratings)
+
+        # Every note shares the active tier, so a tier filter either matches all
+        # notes or none of them.
+        tier_matches = tier is None or tier == active_tier_level
+
+        rows: list[Any] = []
+        total_count = 0
+        if tier_matches and note_count > 0:
+            if min_ratings > 0:
+                total_result = await db.execute(
+                    select(func.count(Note.id)).where(and_(*conditions))
+                )
+                total_count = total_result.scalar() or 0
+            else:
+                total_count = note_count
+
+            page_conditions = list(conditions)
+            if after_condition is not None:
+                page_conditions.append(after_condition)
+
+            page_result = await db.execute(
+                select(Note, rating_count)
+                .options(*loaders.request())
+                .where(and_(*page_conditions))
+                .order_by(*(key.order_clause() for key in top_notes_sort_keys))
+                .limit(limit + 1)
+            )
+            rows = list(page_result.all())
 
-        top_scored_notes.sort(key=lambda x: x[1].score, reverse=True)
-        total_count = len(top_scored_notes)
-        paginated_notes = top_scored_notes[:limit]
+        has_more = len(rows) > limit
+        rows = rows[:limit]
 
         score_resources = [
-            note_score_to_resource(note.id, score) for note, score in paginated_notes
+            note_score_to_resource(
+                note.id, _build_persisted_score_response(note, note_count, note_rating_count)
+            )
+            for note, note_rating_count in rows
         ]
 
+        next_link = None
+        if has_more:
+            next_cursor = FilterBuilder.encode_keyset_cursor(top_notes_sort_keys, rows[-1][0])
+            next_link = str(request.url.include_query_params(**{"page[after]": next_cursor}))
+
         logger.info(
             "Top notes retrieved (JSON:API)",
             extra={
                 "total_notes": note_count,
-                "processed_count": processed_count,
                 "filtered_count": total_count,
                 "returned_count": len(score_resources),
                 "filters": filters_applied,
                 "current_tier": active_tier_level,
+                "has_more": has_more,
             },
         )
 
         response = NoteScoreListResponse(
             data=score_resources,
-            links=JSONAPILinks(self_=str(request.url)),
+            links=JSONAPILinks(self_=str(request.url), next_=next_link),
             meta={
                 "total_count": total_count,
                 "current_tier": active_tier_level,
@@ -1,6 +1,9 @@
 """Service for automatically generating community notes using AI for fact-check matches."""
 
+import asyncio
 import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 from uuid import UUID
 
@@ -37,11 +40,20 @@ class NoteGenerationStrategy(str, Enum):
     )
 
 
+@dataclass
+class BatchNoteGenerationResult:
+    """Outcome of AINoteWriter.generate_notes_for_requests."""
+
+    notes: dict[UUID, Note] = field(default_factory=dict)
+    failures: dict[UUID, str] = field(default_factory=dict)
+
+
 class AINoteWriter:
     """
     Service for automatically generating community notes using AI.
 
-    On-demand note generation is available via generate_note_for_request().
+    On-demand note generation is available via generate_note_for_request(),
+    or generate_notes_for_requests() for many requests at once.
     Background AI note generation is handled by DBOS workflows
     (see src/dbos_workflows/content_monitoring_workflows.py).
     """
@@ -207,6 +219,286 @@ class AINoteWriter:
             )
             raise
 
+    async def generate_notes_for_requests(
+        self,
+        db: AsyncSession,
+        request_ids: Sequence[UUID],
+        prompts: Mapping[UUID, str] | None = None,
+    ) -> BatchNoteGenerationResult:
+        """
+        Generate AI notes for many requests at once.
+
+        Requests and their fact-check items are loaded with one query each, the
+        enabled check and rate limit are applied once per community server, LLM
+        calls run concurrently (at most AI_NOTE_WRITER_MAX_CONCURRENCY per
+        community server), and all notes are inserted with a single commit.
+        A request that cannot be processed is recorded in ``failures`` and
+        does not affect the rest of the batch.
+
+        Args:
+            db: Database session
+            request_ids: Request IDs
+            prompts: Optional prebuilt user prompts keyed by request ID (e.g. with
+                scan context the request row does not carry). Those requests are
+                sent as-is, skipping strategy selection, fact-check lookup and
+                image description.
+
+        Returns:
+            BatchNoteGenerationResult with notes and failures keyed by request ID
+        """
+        batch = BatchNoteGenerationResult()
+        prompts = prompts or {}
+        unique_ids = list(dict.fromkeys(request_ids))
+        if not unique_ids:
+            return batch
+
+        result = await db.execute(
+            select(Request)
+            .options(*note_loaders.request_with_archive())
+            .where(Request.id.in_(unique_ids), Request.deleted_at.is_(None))
+        )
+        requests_by_id = {request.id: request for request in result.scalars().all()}
+
+        by_community = self._group_batch_requests(batch, unique_ids, requests_by_id)
+        admitted = await self._admit_batch_requests(db, batch, by_community)
+        fact_check_items = await self._load_batch_fact_check_items(db, batch, admitted, prompts)
+
+        # Image descriptions share the session, so they are resolved sequentially
+        # before the LLM calls fan out.
+        image_descriptions = {
+            request.id: None
+            if request.id in prompts
+            else await self._get_image_description(db, request, request.id)
+            for request in admitted
+        }
+
+        semaphores = {
+            community_server_uuid: asyncio.Semaphore(settings.AI_NOTE_WRITER_MAX_CONCURRENCY)
+            for community_server_uuid in by_community
+        }
+        outcomes = await asyncio.gather(
+            *(
+                self._generate_batch_note(
+                    db,
+                    request,
+                    semaphores,
+                    fact_check_items,
+                    image_descriptions[request.id],
+                    prompts.get(request.id),
+                )
+                for request in admitted
+            ),
+            return_exceptions=True,
+        )
+
+        await self._persist_batch_notes(db, batch, admitted, outcomes)
+
+        logger.info(
+            f"Generated {len(batch.notes)} AI notes in batch",
+            extra={
+                "requested": len(unique_ids),
+                "generated": len(batch.notes),
+                "failed": len(batch.failures),
+            },
+        )
+
+        return batch
+
+    @staticmethod
+    def _record_batch_failure(
+        batch: BatchNoteGenerationResult,
+        request_id: UUID,
+        request: Request | None,
+        error: Exception,
+    ) -> None:
+        batch.failures[request_id] = str(error)
+        if request and request.community_server_id:
+            ai_notes_failed_total.add(
+                1,
+                {
+                    "community_server_id": str(request.community_server_id),
+                    "error_type": type(error).__name__,
+                },
+            )
+        logger.warning(
+            f"Failed to generate AI note for request {request_id}: {error}",
+            extra={"request_id": request_id, "error_type": type(error).__name__},
+        )
+
+    def _group_batch_requests(
+        self,
+        batch: BatchNoteGenerationResult,
+        request_ids: Sequence[UUID],
+        requests_by_id: dict[UUID, Request],
+    ) -> dict[UUID, list[Request]]:
+        """Group processable requests by community server, failing the rest."""
+        by_community: dict[UUID, list[Request]] = {}
+        for request_id in request_ids:
+            request = requests_by_id.get(request_id)
+            if request is None:
+                error = ValueError(f"Request not found: {request_id}")
+            elif not request.community_server_id:
+                error = ValueError(f"Request {request_id} is missing community_server_id")
+            elif not request.content:
+                error = ValueError(f"Request {request_id} is missing original message content")
+            else:
+                by_community.setdefault(request.community_server_id, []).append(request)
+                continue
+            self._record_batch_failure(batch, request_id, request, error)
+        return by_community
+
+    async def _admit_batch_requests(
+        self,
+        db: AsyncSession,
+        batch: BatchNoteGenerationResult,
+        by_community: dict[UUID, list[Request]],
+    ) -> list[Request]:
+        """Apply the enabled check and rate limit once per community server."""
+        admitted: list[Request] = []
+        for community_server_uuid, community_requests in by_community.items():
+            community_server_id_str = str(community_server_uuid)
+            if not await self._is_ai_note_writing_enabled(db, community_server_id_str):
+                error = ValueError(
+                    f"AI note writing is disabled for community server {community_server_id_str}"
+                )
+                for request in community_requests:
+                    self._record_batch_failure(batch, request.id, request, error)
+                continue
+
+            granted, _ = await rate_limiter.check_rate_limit_batch(
+                community_server_id=f"ai_note_writer:{community_server_id_str}",
+                count=len(community_requests),
+            )
+            admitted.extend(community_requests[:granted])
+            error = ValueError(
+                f"Rate limit exceeded for AI note writing: {community_server_id_str}"
+            )
+            for request in community_requests[granted:]:
+                self._record_batch_failure(batch, request.id, request, error)
+        return admitted
+
+    async def _load_batch_fact_check_items(
+        self,
+        db: AsyncSession,
+        batch: BatchNoteGenerationResult,
+        admitted: list[Request],
+        prompts: Mapping[UUID, str],
+    ) -> dict[str, FactCheckItem]:
+        """Load fact-check items for admitted requests in one query.
+
+        Requests with a malformed dataset_item_id are failed and removed from
+        admitted. Requests with a prebuilt prompt are skipped.
+        """
+        fact_check_ids: set[UUID] = set()
+        for request in list(admitted):
+            if (
+                request.id in prompts
+                or self._select_strategy(request) != NoteGenerationStrategy.FACT_CHECK
+                or request.dataset_item_id is None
+            ):
+                continue
+            try:
+                fact_check_ids.add(UUID(request.dataset_item_id))
+            except ValueError as e:
+                admitted.remove(request)
+                self._record_batch_failure(batch, request.id, request, e)
+
+        if not fact_check_ids:
+            return {}
+        result = await db.execute(select(FactCheckItem).where(FactCheckItem.id.in_(fact_check_ids)))
+        return {str(item.id): item for item in result.scalars().all()}
+
+    async def _generate_batch_note(
+        self,
+        db: AsyncSession,
+        request: Request,
+        semaphores: dict[UUID, asyncio.Semaphore],
+        fact_check_items: dict[str, FactCheckItem],
+        image_description: str | None,
+        prompt: str | None = None,
+    ) -> Note:
+        # Type narrowing: requests without community_server_id or content were
+        # rejected by _group_batch_requests.
+        assert request.community_server_id is not None
+        assert request.content is not None
+
+        async with semaphores[request.community_server_id]:
+            start_time = time.time()
+            if prompt is not None:
+                note_content = await self._generate_prompted_note(prompt)
+            elif self._select_strategy(request) == NoteGenerationStrategy.FACT_CHECK:
+                assert request.dataset_item_id is not None
+                assert request.similarity_score is not None
+                fact_check_item = fact_check_items.get(str(UUID(request.dataset_item_id)))
+                if not fact_check_item:
+                    raise ValueError(f"Fact-check item not found: {request.dataset_item_id}")
+
+                note_content = await self._generate_fact_check_note(
+                    db,
+                    request.community_server_id,
+                    request.content,
+                    fact_check_item,
+                    request.similarity_score,
+                    image_description=image_description,
+                )
+            else:
+                note_content = await self._generate_general_explanation_note(
+                    db,
+                    request.community_server_id,
+                    request.content,
+                    image_description=image_description,
+                )
+
+            ai_note_generation_duration_seconds.record(
+                time.time() - start_time,
+                {"community_server_id": str(request.community_server_id)},
+            )
+
+        return Note(
+            request_id=request.id,
+            author_id=PLACEHOLDER_USER_ID,
+            summary=note_content,
+            classification="NOT_MISLEADING",
+            status="NEEDS_MORE_RATINGS",
+            community_server_id=request.community_server_id,
+            ai_generated=True,
+            ai_provider=settings.AI_NOTE_WRITER_MODEL.provider,
+            ai_model=settings.AI_NOTE_WRITER_MODEL.model,
+        )
+
+    async def _persist_batch_notes(
+        self,
+        db: AsyncSession,
+        batch: BatchNoteGenerationResult,
+        admitted: list[Request],
+        outcomes: Sequence[Note | BaseException],
+    ) -> None:
+        """Insert generated notes with one commit and record per-request failures."""
+        generated: list[tuple[Request, Note]] = []
+        for request, outcome in zip(admitted, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                self._record_batch_failure(batch, request.id, request, outcome)
+            else:
+                generated.append((request, outcome))
+
+        if not generated:
+            return
+
+        db.add_all([note for _, note in generated])
+        await db.commit()
+
+        for request, note in generated:
+            batch.notes[request.id] = note
+            ai_notes_generated_total.add(
+                1,
+                {
+                    "community_server_id": str(request.community_server_id),
+                    "dataset_name": request.dataset_name or "",
+                },
+            )
+
     def _select_strategy(self, request: Request) -> NoteGenerationStrategy:
         """
         Select note generation strategy based on available request data.
@@ -455,6 +747,42 @@ class AINoteWriter:
 
         return response.content
 
+    async def _generate_prompted_note(self, prompt: str) -> str:
+        """
+        Generate note content from a caller-built user prompt.
+
+        Args:
+            prompt: User prompt to send after the AI note writer system prompt
+
+        Returns:
+            Generated note content
+
+        Raises:
+            Exception: If LLM call fails
+        """
+        messages = [
+            LLMMessage(role="system", content=settings.AI_NOTE_WRITER_SYSTEM_PROMPT),
+            LLMMessage(role="user", content=prompt),
+        ]
+
+        response = await self.llm_service.complete(
+            messages=messages,
+            model=settings.AI_NOTE_WRITER_MODEL,
+            max_tokens=500,
+            temperature=0.7,
+        )
+
+        logger.info(
+            "Generated AI note content (prebuilt prompt)",
+            extra={
+                "content_length": len(response.content),
+                "model": response.model,
+                "tokens_used": response.tokens_used,
+            },
+        )
+
+        return response.content
+
     def _build_fact_check_prompt(
         self,
         original_message: str,
@@ -1,12 +1,17 @@
 """Service for generating image descriptions using LLM vision capabilities."""
 
+import asyncio
+import base64
+import binascii
 import hashlib
 from typing import Literal, cast
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from cachetools import TTLCache
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache.cache import CacheManager, lock_manager
 from src.config import settings
 from src.llm_config.models import CommunityServer
 from src.llm_config.service import LLMService
@@ -14,19 +19,69 @@ from src.monitoring import get_logger
 
 logger = get_logger(__name__)
 
+SHARED_CACHE_PREFIX = "vision:description"
+
+# Discord signs attachment URLs with expiring query parameters (ex, is, hm), so the
+# same attachment is served under many URLs; the path alone identifies the file.
+_SIGNED_URL_HOSTS = frozenset({"cdn.discordapp.com", "media.discordapp.net"})
+
+
+def normalize_image_url(image_url: str) -> str:
+    """
+    Reduce an image URL to a stable content address.
+
+    data: URLs are addressed by a hash of their decoded bytes. HTTP(S) URLs have
+    their scheme and host lowercased, default ports, fragments and (for Discord's
+    CDN) signing parameters dropped, and remaining query parameters sorted.
+
+    Args:
+        image_url: Image URL as received
+
+    Returns:
+        Normalized identifier for the image
+    """
+    if image_url.startswith("data:"):
+        _, _, payload = image_url.partition(",")
+        try:
+            data = base64.b64decode(payload, validate=False)
+        except (binascii.Error, ValueError):
+            data = payload.encode("utf-8")
+        return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+    parts = urlsplit(image_url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    netloc = host
+    if port and not (scheme == "http" and port == 80) and not (scheme == "https" and port == 443):
+        netloc = f"{host}:{port}"
+
+    query = ""
+    if host not in _SIGNED_URL_HOSTS:
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+
+    return urlunsplit((scheme, netloc, parts.path, query, ""))
+
 
 class VisionService:
     """
     Service for generating image descriptions using LLM vision capabilities.
 
     Uses LLMService for credential management and provider abstraction.
+
+    Descriptions are keyed by the normalized image URL (see normalize_image_url)
+    and cached per process. When a shared cache is supplied they are also stored
+    in Redis so every API replica and worker reuses them, and concurrent requests
+    for the same image (in this process or another) share one vision call.
     """
 
-    def __init__(self, llm_service: LLMService) -> None:
+    def __init__(self, llm_service: LLMService, shared_cache: CacheManager | None = None) -> None:
         self.llm_service = llm_service
+        self.shared_cache = shared_cache
         self.description_cache: TTLCache[str, str] = TTLCache[str, str](
             maxsize=1000, ttl=settings.VISION_CACHE_TTL_SECONDS
         )
+        self._in_flight: dict[str, asyncio.Future[str]] = {}
 
     async def describe_image(
         self,
@@ -64,6 +119,15 @@ class VisionService:
             )
             return cast(str, self.description_cache[cache_key])
 
+        shared_description = await self._get_shared(cache_key)
+        if shared_description is not None:
+            logger.debug(
+                "Vision shared cache hit",
+                extra={"image_url": image_url[:100], "cache_key": cache_key[:16]},
+            )
+            self.description_cache[cache_key] = shared_description
+            return shared_description
+
         # Convert guild ID string to UUID for LLMService
         # Get CommunityServer UUID from platform_community_server_id (Discord guild ID)
         result = await db.execute(
@@ -78,18 +142,70 @@ class VisionService:
                 f"Community server not found for platform_community_server_id: {community_server_id}"
             )
 
-        # Generate description via LLMService (handles retries internally)
-        description = await self.llm_service.describe_image(
-            image_url, detail=detail, max_tokens=max_tokens
-        )
+        in_flight = self._in_flight.get(cache_key)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(
+                self._generate_description(cache_key, image_url, detail, max_tokens)
+            )
+            self._in_flight[cache_key] = in_flight
+            in_flight.add_done_callback(lambda _: self._in_flight.pop(cache_key, None))
+        else:
+            logger.debug(
+                "Joining in-flight vision request",
+                extra={"image_url": image_url[:100], "cache_key": cache_key[:16]},
+            )
 
-        self.description_cache[cache_key] = description
+        return await asyncio.shield(in_flight)
+
+    async def _generate_description(
+        self,
+        cache_key: str,
+        image_url: str,
+        detail: Literal["low", "high", "auto"],
+        max_tokens: int,
+    ) -> str:
+        """
+        Describe an image once across processes and populate both cache tiers.
 
+        Mirrors the single-flight pattern of src.cache.cached: the process holding
+        the Redis lock calls the vision model, others wait for its result and only
+        fall back to their own call if the lock times out.
+        """
+        shared_key = f"{SHARED_CACHE_PREFIX}:{cache_key}"
+        lock_acquired = False
+        if self.shared_cache is not None:
+            lock_timeout = settings.VISION_LOCK_TIMEOUT_SECONDS
+            lock_acquired = await lock_manager.acquire_lock(shared_key, timeout=lock_timeout)
+            if not lock_acquired:
+                await lock_manager.wait_for_lock(shared_key, timeout=lock_timeout)
+
+        try:
+            description = await self._get_shared(cache_key)
+            if description is None:
+                # Generate description via LLMService (handles retries internally)
+                description = await self.llm_service.describe_image(
+                    image_url, detail=detail, max_tokens=max_tokens
+                )
+                if self.shared_cache is not None:
+                    await self.shared_cache.set(
+                        shared_key, description, ttl=settings.VISION_CACHE_TTL_SECONDS
+                    )
+        finally:
+            if lock_acquired:
+                await lock_manager.release_lock(shared_key)
+
+        self.description_cache[cache_key] = description
         return description
 
+    async def _get_shared(self, cache_key: str) -> str | None:
+        if self.shared_cache is None:
+            return None
+        cached = await self.shared_cache.get(f"{SHARED_CACHE_PREFIX}:{cache_key}")
+        return cached if isinstance(cached, str) else None
+
     def _get_cache_key(self, image_url: str, detail: str, max_tokens: int) -> str:
         """
-        Generate cache key from image URL and parameters.
+        Generate cache key from the normalized image URL, model and parameters.
 
         Args:
             image_url: Image URL
@@ -99,10 +215,19 @@ class VisionService:
         Returns:
             SHA256 hash of parameters
         """
-        key_data = f"{image_url}|{detail}|{max_tokens}"
+        key_data = f"{normalize_image_url(image_url)}|{settings.VISION_MODEL}|{detail}|{max_tokens}"
         return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
 
     def invalidate_cache(self, community_server_id: str | None = None) -> None:
+        """
+        Clear this process's description cache.
+
+        Shared entries are content-addressed rather than scoped to a community
+        server, so they are left to expire with VISION_CACHE_TTL_SECONDS.
+
+        Args:
+            community_server_id: Community server ID (for logging only)
+        """
         self.description_cache.clear()
         logger.info(
             "Vision description cache invalidated",
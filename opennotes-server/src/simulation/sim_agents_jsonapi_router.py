@@ -6,21 +6,27 @@ from fastapi import APIRouter, Depends, Query, Response, status
 from fastapi import Request as HTTPRequest
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field, field_validator
-from sqlalchemy import desc, func, select
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_current_user_or_api_key, require_admin
 from src.common.base_schemas import SQLAlchemySchema, StrictInputSchema
+from src.common.filters import SortKey
 from src.common.jsonapi import (
     JSONAPI_CONTENT_TYPE,
     JSONAPILinks,
     JSONAPIMeta,
-    create_pagination_links,
 )
 from src.common.jsonapi import (
     create_error_response as create_error_response_model,
 )
+from src.common.pagination import (
+    PAGE_AFTER_DESCRIPTION,
+    PAGE_COUNT_DESCRIPTION,
+    CountMode,
+    paginate_jsonapi_query,
+)
 from src.database import get_db
 from src.llm_config.model_id import ModelId
 from src.monitoring import get_logger
@@ -245,6 +251,9 @@ async def create_sim_agent_jsonapi(
         )
 
 
+_sim_agent_sort_keys = [SortKey(SimAgent.created_at), SortKey(SimAgent.id)]
+
+
 @router.get(
     "/sim-agents",
     response_class=JSONResponse,
@@ -256,39 +265,32 @@ async def list_sim_agents_jsonapi(
     current_user: Annotated[User, Depends(get_current_user_or_api_key)],
     page_number: int = Query(1, ge=1, alias="page[number]"),
     page_size: int = Query(20, ge=1, le=100, alias="page[size]"),
+    page_after: str | None = Query(None, alias="page[after]", description=PAGE_AFTER_DESCRIPTION),
+    page_count: CountMode = Query(
+        CountMode.EXACT, alias="page[count]", description=PAGE_COUNT_DESCRIPTION
+    ),
 ) -> JSONResponse:
     require_admin(current_user)
 
     try:
-        count_query = select(func.count(SimAgent.id)).where(SimAgent.deleted_at.is_(None))
-        count_result = await db.execute(count_query)
-        total = count_result.scalar() or 0
-
-        offset = (page_number - 1) * page_size
-        query = (
-            select(SimAgent)
-            .where(SimAgent.deleted_at.is_(None))
-            .order_by(desc(SimAgent.created_at))
-            .limit(page_size)
-            .offset(offset)
+        page = await paginate_jsonapi_query(
+            db,
+            select(SimAgent).where(SimAgent.deleted_at.is_(None)),
+            sort_keys=_sim_agent_sort_keys,
+            page_number=page_number,
+            page_size=page_size,
+            after=page_after,
+            count_mode=page_count,
         )
-        result = await db.execute(query)
-        agents = result.scalars().all()
+        if isinstance(page, JSONResponse):
+            return page
 
-        resources = [sim_agent_to_resource(agent) for agent in agents]
-
-        base_url = str(request.url).split("?")[0]
-        links = create_pagination_links(
-            base_url=base_url,
-            page=page_number,
-            size=page_size,
-            total=total,
-        )
+        resources = [sim_agent_to_resource(agent) for agent in page.items]
 
         response = SimAgentListResponse(
             data=resources,
-            links=links,
-            meta=JSONAPIMeta(count=total),
+            links=page.links(request),
+            meta=page.meta(),
         )
 
         return JSONResponse(
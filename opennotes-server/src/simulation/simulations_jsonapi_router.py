@@ -14,12 +14,13 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi import Request as HTTPRequest
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import ColumnElement, desc, func, select, update
+from sqlalchemy import ColumnElement, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_current_user_or_api_key, require_admin, require_scope_or_admin
 from src.cache.redis_client import redis_client
 from src.common.base_schemas import SQLAlchemySchema, StrictInputSchema
+from src.common.filters import SortKey
 from src.common.jsonapi import (
     JSONAPI_CONTENT_TYPE,
     JSONAPILinks,
@@ -29,6 +30,12 @@ from src.common.jsonapi import (
 from src.common.jsonapi import (
     create_error_response as create_error_response_model,
 )
+from src.common.pagination import (
+    PAGE_AFTER_DESCRIPTION,
+    PAGE_COUNT_DESCRIPTION,
+    CountMode,
+    paginate_jsonapi_query,
+)
 from src.database import get_db
 from src.llm_config.models import CommunityServer
 from src.monitoring import get_logger
@@ -64,6 +71,9 @@ SCORING_PERSISTENCE_FAILURE_MESSAGE = "Required scoring snapshot persistence fai
 
 router = APIRouter()
 
+_simulation_run_sort_keys = [SortKey(SimulationRun.created_at), SortKey(SimulationRun.id)]
+_result_note_sort_keys = [SortKey(Note.created_at), SortKey(Note.id)]
+
 VALID_PAUSE_FROM = {"running"}
 VALID_RESUME_FROM = {"pending", "paused", "failed", "cancelled"}
 VALID_CANCEL_FROM = {"pending", "running", "paused"}
@@ -524,6 +534,10 @@ async def list_simulations(
     current_user: Annotated[User, Depends(get_current_user_or_api_key)],
     page_number: int = Query(1, ge=1, alias="page[number]"),
     page_size: int = Query(20, ge=1, le=100, alias="page[size]"),
+    page_after: str | None = Query(None, alias="page[after]", description=PAGE_AFTER_DESCRIPTION),
+    page_count: CountMode = Query(
+        CountMode.EXACT, alias="page[count]", description=PAGE_COUNT_DESCRIPTION
+    ),
     is_public: bool | None = Query(None, alias="filter[is_public]"),
 ) -> JSONResponse:
     scoped = require_scope_or_admin(current_user, request, "simulations:read")
@@ -535,35 +549,26 @@ async def list_simulations(
         if is_public is not None:
             base_filter.append(SimulationRun.is_public == is_public)
 
-        count_query = select(func.count(SimulationRun.id)).where(*base_filter)
-        count_result = await db.execute(count_query)
-        total = count_result.scalar() or 0
-
-        offset = (page_number - 1) * page_size
-        query = (
-            select(SimulationRun)
-            .where(*base_filter)
-            .order_by(desc(SimulationRun.created_at))
-            .limit(page_size)
-            .offset(offset)
+        page = await paginate_jsonapi_query(
+            db,
+            select(SimulationRun).where(*base_filter),
+            sort_keys=_simulation_run_sort_keys,
+            page_number=page_number,
+            page_size=page_size,
+            after=page_after,
+            count_mode=page_count,
         )
-        result = await db.execute(query)
-        runs = result.scalars().all()
+        if isinstance(page, JSONResponse):
+            return page
 
-        resources = [simulation_run_to_resource(run, sanitize_error_message=scoped) for run in runs]
-
-        base_url = str(request.url).split("?")[0]
-        links = create_pagination_links(
-            base_url=base_url,
-            page=page_number,
-            size=page_size,
-            total=total,
-        )
+        resources = [
+            simulation_run_to_resource(run, sanitize_error_message=scoped) for run in page.items
+        ]
 
         response = SimulationListResponse(
             data=resources,
-            links=links,
-            meta=JSONAPIMeta(count=total),
+            links=page.links(request),
+            meta=page.meta(),
         )
 
         return JSONResponse(
@@ -1403,6 +1408,10 @@ async def get_simulation_results(
     current_user: Annotated[User, Depends(get_current_user_or_api_key)],
     page_number: int = Query(1, ge=1, alias="page[number]"),
     page_size: int = Query(20, ge=1, le=100, alias="page[size]"),
+    page_after: str | None = Query(None, alias="page[after]", description=PAGE_AFTER_DESCRIPTION),
+    page_count: CountMode = Query(
+        CountMode.EXACT, alias="page[count]", description=PAGE_COUNT_DESCRIPTION
+    ),
     agent_profile_id: UUID | None = Query(None),
 ) -> JSONResponse:
     scoped = require_scope_or_admin(current_user, request, "simulations:read")
@@ -1454,29 +1463,24 @@ async def get_simulation_results(
                 media_type=JSONAPI_CONTENT_TYPE,
             )
 
-        count_query = select(func.count(Note.id)).where(
+        notes_query = select(Note).where(
             Note.author_id.in_(user_profile_ids),
             Note.deleted_at.is_(None),
         )
-        count_result = await db.execute(count_query)
-        total = count_result.scalar() or 0
-
-        offset = (page_number - 1) * page_size
-        notes_query = (
-            select(Note)
-            .where(
-                Note.author_id.in_(user_profile_ids),
-                Note.deleted_at.is_(None),
-            )
-            .order_by(desc(Note.created_at))
-            .limit(page_size)
-            .offset(offset)
+        page = await paginate_jsonapi_query(
+            db,
+            notes_query,
+            sort_keys=_result_note_sort_keys,
+            page_number=page_number,
+            page_size=page_size,
+            after=page_after,
+            count_mode=page_count,
         )
-        notes_result = await db.execute(notes_query)
-        notes = notes_result.scalars().all()
+        if isinstance(page, JSONResponse):
+            return page
 
         resources: list[ResultNoteResource] = []
-        for note in notes:
+        for note in page.items:
             agent_prof_id = profile_to_agent_profile.get(note.author_id)
             if agent_prof_id is None:
                 logger.warning(
@@ -1502,18 +1506,10 @@ async def get_simulation_results(
                 )
             )
 
-        base_url = str(request.url).split("?")[0]
-        links = create_pagination_links(
-            base_url=base_url,
-            page=page_number,
-            size=page_size,
-            total=total,
-        )
-
         resp = ResultsListResponse(
             data=resources,
-            links=links,
-            meta=JSONAPIMeta(count=total),
+            links=page.links(request),
+            meta=page.meta(),
         )
 
         return JSONResponse(
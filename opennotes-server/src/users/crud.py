@@ -5,12 +5,14 @@ from uuid import UUID
 import orjson
 import pendulum
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.api_key_cache import api_key_cache
 from src.auth.models import APIKeyCreate, UserCreate, UserUpdate
-from src.auth.password import get_password_hash, verify_password
+from src.auth.password import get_password_hash, verify_password, verify_password_async
 from src.auth.permissions import is_account_active, is_service_account
+from src.auth.principal_cache import principal_cache
 from src.events.nats_client import nats_client
 from src.users.audit_helper import create_audit_log
 from src.users.models import APIKey, AuditLog, RefreshToken, User
@@ -183,6 +185,7 @@ async def update_user(
 
     await db.flush()
     await db.refresh(user)
+    await principal_cache.invalidate_user(user.id)
 
     return user
 
@@ -439,12 +442,36 @@ async def _publish_api_key_used_event(api_key_id: UUID) -> None:
     await nats_client.publish_fire_and_forget("events.api_key.used", event_data)
 
 
-async def verify_api_key(db: AsyncSession, raw_key: str) -> tuple[APIKey, User] | None:  # noqa: PLR0911, PLR0912
+def _is_api_key_usable(api_key: APIKey, user: User) -> bool:
+    if api_key.expires_at and api_key.expires_at < pendulum.now("UTC"):
+        return False
+    return is_account_active(user) and api_key.is_scoped()
+
+
+async def _get_active_api_key_with_user(
+    db: AsyncSession, *criteria: ColumnElement[bool]
+) -> tuple[APIKey, User] | None:
+    """Load an active API key and its owner in a single round trip."""
+    result = await db.execute(
+        select(APIKey, User)
+        .join(User, User.id == APIKey.user_id)
+        .where(APIKey.is_active == True, *criteria)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+    return row[0], row[1]
+
+
+async def verify_api_key(db: AsyncSession, raw_key: str) -> tuple[APIKey, User] | None:  # noqa: PLR0911
     """
     Verify an API key and return the associated APIKey and User.
 
-    Uses key prefix for O(1) database lookup instead of O(n) iteration.
-    Falls back to O(n) verification for legacy keys without prefix.
+    Recently verified keys are served from api_key_cache, which skips the hash
+    check but still re-reads the key and user so revocation is honoured.
+    Otherwise uses key prefix for O(1) database lookup instead of O(n)
+    iteration, falling back to O(n) verification for legacy keys without
+    prefix. Hash verification runs on a worker thread, off the event loop.
 
     Args:
         db: Database session
@@ -453,40 +480,34 @@ async def verify_api_key(db: AsyncSession, raw_key: str) -> tuple[APIKey, User]
     Returns:
         Tuple of (APIKey, User) if valid, None otherwise
     """
+    cached = api_key_cache.get(raw_key)
+    if cached is not None:
+        found = await _get_active_api_key_with_user(
+            db, APIKey.id == cached.api_key_id, APIKey.user_id == cached.user_id
+        )
+        if found is None or not _is_api_key_usable(*found):
+            api_key_cache.invalidate_api_key(cached.api_key_id)
+            return None
+        await _publish_api_key_used_event(cached.api_key_id)
+        return found
+
     if raw_key.startswith("opk_"):
         parts = raw_key.split("_", 2)
         if len(parts) == 3:
             key_prefix = parts[1]
 
-            result = await db.execute(
-                select(APIKey).where(
-                    APIKey.key_prefix == key_prefix,
-                    APIKey.is_active == True,
-                )
-            )
-            api_key = result.scalar_one_or_none()
+            found = await _get_active_api_key_with_user(db, APIKey.key_prefix == key_prefix)
 
-            if api_key is None:
-                _ = verify_password("dummy", DUMMY_PASSWORD_HASH)
+            if found is None:
+                _ = await verify_password_async("dummy", DUMMY_PASSWORD_HASH)
                 return None
 
-            is_valid, _ = verify_password(raw_key, api_key.key_hash)
-            if not is_valid:
-                return None
-
-            if api_key.expires_at and api_key.expires_at < pendulum.now("UTC"):
-                return None
-
-            user = await get_user_by_id(db, api_key.user_id)
-            if user is None:
-                return None
-
-            if not is_account_active(user):
-                return None
-
-            if not api_key.is_scoped():
+            api_key, user = found
+            is_valid, _ = await verify_password_async(raw_key, api_key.key_hash)
+            if not is_valid or not _is_api_key_usable(api_key, user):
                 return None
 
+            api_key_cache.put(raw_key, api_key)
             await _publish_api_key_used_event(api_key.id)
             return api_key, user
 
@@ -498,7 +519,7 @@ async def verify_api_key(db: AsyncSession, raw_key: str) -> tuple[APIKey, User]
     api_keys = result.scalars().all()
 
     for api_key in api_keys:
-        is_valid, _ = verify_password(raw_key, api_key.key_hash)
+        is_valid, _ = await verify_password_async(raw_key, api_key.key_hash)
         if is_valid:
             if api_key.expires_at and api_key.expires_at < pendulum.now("UTC"):
                 continue
@@ -508,6 +529,7 @@ async def verify_api_key(db: AsyncSession, raw_key: str) -> tuple[APIKey, User]
 
             user = await get_user_by_id(db, api_key.user_id)
             if user and is_account_active(user):
+                api_key_cache.put(raw_key, api_key)
                 await _publish_api_key_used_event(api_key.id)
                 return api_key, user
 
@@ -528,6 +550,7 @@ async def revoke_api_key(
 
     api_key.is_active = False
     await db.flush()
+    api_key_cache.invalidate_api_key(api_key_id)
 
     await create_audit_log(
         db=db,
@@ -35,6 +35,7 @@ from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.principal_cache import principal_cache
 from src.llm_config.models import CommunityServer
 from src.users import loaders
 from src.users.audit_helper import create_audit_log
@@ -429,6 +430,7 @@ async def create_community_member(
     db.add(member)
     await db.flush()
     await db.refresh(member)
+    await principal_cache.invalidate_profile(member.profile_id)
 
     return member
 
@@ -491,6 +493,7 @@ async def update_community_member(
 
     await db.flush()
     await db.refresh(member)
+    await principal_cache.invalidate_profile(member.profile_id)
 
     return member
 
@@ -393,6 +393,8 @@ async def logout_all(
         current_user.tokens_valid_after = pendulum.from_timestamp(current_second + 1)
         await db.flush()
 
+        await revoke_all_user_tokens(current_user.id)
+
         await create_audit_log(
             db=db,
             user_id=current_user.id,
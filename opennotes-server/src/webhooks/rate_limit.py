@@ -109,6 +109,53 @@ class RateLimiter:
 
         return allowed, remaining
 
+    async def check_rate_limit_batch(
+        self,
+        community_server_id: str,
+        count: int,
+        user_id: str | None = None,
+    ) -> tuple[int, int]:
+        """Reserve up to ``count`` slots in one round trip.
+
+        Same sliding window as check_rate_limit, but all slots are recorded
+        with one pipeline and any that exceed the limit are released again.
+
+        Returns:
+            Tuple of (granted, remaining) where granted is how many of the
+            ``count`` slots were reserved.
+        """
+        if count <= 0:
+            return 0, 0
+
+        await self._ensure_connected()
+        assert self.redis_client is not None, "Redis client should be connected"
+
+        key = f"rate_limit:community_server:{community_server_id}"
+        if user_id:
+            key = f"rate_limit:community_server:{community_server_id}:user:{user_id}"
+
+        now = pendulum.now("UTC").timestamp()
+        window_start = now - settings.WEBHOOK_RATE_LIMIT_WINDOW
+        members = [f"{now}:{i}" for i in range(count)]
+
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(key, 0, window_start)
+            pipe.zadd(key, dict.fromkeys(members, now))
+            pipe.zcard(key)
+            pipe.expire(key, settings.WEBHOOK_RATE_LIMIT_WINDOW)
+
+            results = await pipe.execute()
+
+        current_count = results[2]
+        limit = settings.WEBHOOK_RATE_LIMIT_PER_COMMUNITY_SERVER
+        granted = max(0, min(count, limit - (current_count - count)))
+
+        if granted < count:
+            await self.redis_client.zrem(key, *members[granted:])
+            logger.warning(f"Rate limit exceeded for {key}: granted {granted} of {count}")
+
+        return granted, max(0, limit - (current_count - count) - granted)
+
     async def get_rate_limit_info(
         self,
         community_server_id: str,
@@ -1255,6 +1255,19 @@ async def setup_database(request):
     settings.NATS_URL = original_settings_nats_url
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    """Reset in-process auth caches so tests don't share credentials or principals."""
+    from src.auth.api_key_cache import api_key_cache
+    from src.auth.principal_cache import principal_cache
+
+    api_key_cache.clear()
+    principal_cache.clear()
+    yield
+    api_key_cache.clear()
+    principal_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def disable_rate_limiting(monkeypatch):
     """
@@ -287,3 +287,32 @@ class TestCopyRequestsE2E:
                 src = source_metadata[copied_from]
                 assert req.dataset_name == src["dataset_name"]
                 assert req.similarity_score == src["similarity_score"]
+
+    async def test_rerun_skips_already_copied_requests(
+        self,
+        source_community_server,
+        target_community_server,
+        source_requests_with_ids,
+    ):
+        for expected_copied, expected_skipped in ((4, 0), (0, 4)):
+            async with get_session_maker()() as db:
+                result = await CopyRequestService.copy_requests(
+                    db=db,
+                    source_community_server_id=source_community_server.id,
+                    target_community_server_id=target_community_server.id,
+                    window_size=3,
+                )
+                await db.commit()
+
+            assert result.total_copied == expected_copied
+            assert result.total_skipped == expected_skipped
+            assert result.total_failed == 0
+
+        async with get_session_maker()() as db:
+            count = await db.scalar(
+                select(func.count())
+                .select_from(Request)
+                .where(Request.community_server_id == target_community_server.id)
+            )
+
+        assert count == 4
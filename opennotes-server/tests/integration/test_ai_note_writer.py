@@ -250,3 +250,155 @@ async def test_generate_note_for_request_invalid_fact_check_item_id(
 
         with pytest.raises(ValueError, match="Fact-check item not found"):
             await ai_note_writer.generate_note_for_request(db_session, request.id)
+
+
+# Tests for generate_notes_for_requests (batched AI note generation)
+
+
+async def _create_requests(db_session, community_server, fact_check_item, count):
+    requests = []
+    for i in range(count):
+        request = await RequestService.create_from_message(
+            db=db_session,
+            request_id=f"discord-batch-request-{i}",
+            content=f"Batch message {i}",
+            community_server_id=community_server.id,
+            requested_by="test_user",
+            platform_message_id=f"20000000{i}",
+            dataset_item_id=str(fact_check_item.id) if i % 2 == 0 else None,
+            similarity_score=0.85 if i % 2 == 0 else None,
+            dataset_name="snopes" if i % 2 == 0 else None,
+            status="PENDING",
+        )
+        requests.append(request)
+    await db_session.commit()
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_generate_notes_for_requests_success(
+    ai_note_writer,
+    db_session,
+    community_server,
+    fact_check_item,
+    mock_llm_service,
+    ai_note_writing_enabled,
+):
+    """Test that a batch generates one note per request with one rate-limit reservation."""
+    requests = await _create_requests(db_session, community_server, fact_check_item, 4)
+
+    with patch("src.services.ai_note_writer.rate_limiter") as mock_rate_limiter:
+        mock_rate_limiter.check_rate_limit_batch = AsyncMock(return_value=(4, 6))
+
+        result = await ai_note_writer.generate_notes_for_requests(
+            db_session, [request.id for request in requests]
+        )
+
+        mock_rate_limiter.check_rate_limit_batch.assert_awaited_once()
+        assert mock_rate_limiter.check_rate_limit_batch.call_args.kwargs["count"] == 4
+
+    assert result.failures == {}
+    assert set(result.notes) == {request.id for request in requests}
+    assert mock_llm_service.complete.await_count == 4
+    for request in requests:
+        note = result.notes[request.id]
+        assert note.id is not None
+        assert note.ai_generated is True
+        assert note.request_id == request.id
+
+
+@pytest.mark.asyncio
+async def test_generate_notes_for_requests_partial_rate_limit(
+    ai_note_writer,
+    db_session,
+    community_server,
+    fact_check_item,
+    mock_llm_service,
+    ai_note_writing_enabled,
+):
+    """Test that requests beyond the granted budget fail without blocking the rest."""
+    requests = await _create_requests(db_session, community_server, fact_check_item, 3)
+
+    with patch("src.services.ai_note_writer.rate_limiter") as mock_rate_limiter:
+        mock_rate_limiter.check_rate_limit_batch = AsyncMock(return_value=(2, 0))
+
+        result = await ai_note_writer.generate_notes_for_requests(
+            db_session, [request.id for request in requests]
+        )
+
+    assert set(result.notes) == {requests[0].id, requests[1].id}
+    assert "Rate limit exceeded" in result.failures[requests[2].id]
+    assert mock_llm_service.complete.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_notes_for_requests_isolates_failures(
+    ai_note_writer,
+    db_session,
+    community_server,
+    fact_check_item,
+    ai_note_writing_enabled,
+):
+    """Test that missing requests and fact-check items are reported per request."""
+    requests = await _create_requests(db_session, community_server, fact_check_item, 2)
+    orphan = await RequestService.create_from_message(
+        db=db_session,
+        request_id="discord-batch-orphan",
+        content="Orphan message",
+        community_server_id=community_server.id,
+        requested_by="test_user",
+        platform_message_id="3000000000",
+        dataset_item_id=str(uuid4()),
+        similarity_score=0.85,
+        dataset_name="snopes",
+        status="PENDING",
+    )
+    await db_session.commit()
+    missing_id = uuid4()
+
+    with patch("src.services.ai_note_writer.rate_limiter") as mock_rate_limiter:
+        mock_rate_limiter.check_rate_limit_batch = AsyncMock(return_value=(3, 7))
+
+        result = await ai_note_writer.generate_notes_for_requests(
+            db_session, [*(request.id for request in requests), orphan.id, missing_id]
+        )
+
+    assert set(result.notes) == {request.id for request in requests}
+    assert "Fact-check item not found" in result.failures[orphan.id]
+    assert "Request not found" in result.failures[missing_id]
+
+
+@pytest.mark.asyncio
+async def test_generate_notes_for_requests_uses_prebuilt_prompts(
+    ai_note_writer,
+    db_session,
+    community_server,
+    mock_llm_service,
+    ai_note_writing_enabled,
+):
+    """Test that a prebuilt prompt replaces the fact-check lookup for its request."""
+    orphan = await RequestService.create_from_message(
+        db=db_session,
+        request_id="discord-batch-prompted",
+        content="Prompted message",
+        community_server_id=community_server.id,
+        requested_by="test_user",
+        platform_message_id="4000000000",
+        dataset_item_id=str(uuid4()),
+        similarity_score=0.85,
+        dataset_name="snopes",
+        status="PENDING",
+    )
+    await db_session.commit()
+
+    with patch("src.services.ai_note_writer.rate_limiter") as mock_rate_limiter:
+        mock_rate_limiter.check_rate_limit_batch = AsyncMock(return_value=(1, 9))
+
+        result = await ai_note_writer.generate_notes_for_requests(
+            db_session, [orphan.id], prompts={orphan.id: "Prebuilt scan prompt"}
+        )
+
+    assert result.failures == {}
+    assert set(result.notes) == {orphan.id}
+    messages = mock_llm_service.complete.call_args.kwargs["messages"]
+    assert messages[-1].content == "Prebuilt scan prompt"
@@ -8,7 +8,7 @@ These tests verify that:
 4. Performance is independent of total API key count
 """
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from sqlalchemy import select
@@ -99,9 +99,9 @@ async def test_constant_time_dummy_verification_on_invalid_key(db_session):
     # Create invalid key with correct format but nonexistent prefix
     invalid_key = "opk_nonexistent_secretpart"
 
-    # Mock verify_password to track if it's called
-    with patch("src.users.crud.verify_password") as mock_verify:
-        mock_verify.return_value = False
+    # Mock verify_password_async to track if it's called
+    with patch("src.users.crud.verify_password_async", new_callable=AsyncMock) as mock_verify:
+        mock_verify.return_value = (False, False)
 
         result = await verify_api_key(db_session, invalid_key)
 
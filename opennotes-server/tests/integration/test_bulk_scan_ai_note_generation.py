@@ -252,11 +252,11 @@ class TestSimilarityMatchAINoteGeneration(TestBulkScanAINoteGenerationFixtures):
         completed_scan_with_similarity_matches,
     ):
         """
-        Similarity match with generate_ai_notes=True should start DBOS AI note workflows.
+        Similarity match with generate_ai_notes=True should start a DBOS AI note batch workflow.
 
         Expected behavior:
-        - For each message_id in the request, if it has a similarity match with fact_check_item_id,
-          a DBOS AI note workflow should be started via start_ai_note_workflow
+        - One start_ai_note_batch_workflow call carries an item for each message_id that
+          has a similarity match with fact_check_item_id
         """
         scan_data = completed_scan_with_similarity_matches
         scan = scan_data["scan"]
@@ -270,7 +270,7 @@ class TestSimilarityMatchAINoteGeneration(TestBulkScanAINoteGenerationFixtures):
             mock_get_flagged.return_value = flagged_messages
 
             with patch(
-                "src.dbos_workflows.content_monitoring_workflows.start_ai_note_workflow"
+                "src.dbos_workflows.content_monitoring_workflows.start_ai_note_batch_workflow"
             ) as mock_workflow:
                 transport = ASGITransport(app=app)
                 async with AsyncClient(transport=transport, base_url="http://test") as client:
@@ -296,22 +296,21 @@ class TestSimilarityMatchAINoteGeneration(TestBulkScanAINoteGenerationFixtures):
                     f"Response: {response.text}"
                 )
 
-                assert mock_workflow.call_count == 2, (
-                    f"Expected 2 calls to start_ai_note_workflow but got {mock_workflow.call_count}."
+                mock_workflow.assert_called_once()
+                call_kwargs = mock_workflow.call_args.kwargs
+                assert (
+                    call_kwargs["community_server_id"]
+                    == community_server.platform_community_server_id
+                )
+                assert len(call_kwargs["items"]) == 2, (
+                    f"Expected 2 batch items but got {len(call_kwargs['items'])}."
                 )
 
-                for call_args in mock_workflow.call_args_list:
-                    kwargs = call_args.kwargs if call_args.kwargs else {}
-
-                    if kwargs:
-                        assert "request_id" in kwargs
-                        assert kwargs["scan_type"] == "similarity"
-                        assert kwargs["fact_check_item_id"] == str(fact_check_item.id)
-                        assert (
-                            kwargs["community_server_id"]
-                            == community_server.platform_community_server_id
-                        )
-                        assert kwargs["similarity_score"] >= 0.85
+                for item in call_kwargs["items"]:
+                    assert "request_id" in item
+                    assert item["scan_type"] == "similarity"
+                    assert item["fact_check_item_id"] == str(fact_check_item.id)
+                    assert item["similarity_score"] >= 0.85
 
     @pytest.mark.asyncio
     async def test_similarity_match_workflow_contains_correct_data(
@@ -321,10 +320,9 @@ class TestSimilarityMatchAINoteGeneration(TestBulkScanAINoteGenerationFixtures):
         completed_scan_with_similarity_matches,
     ):
         """
-        Verify start_ai_note_workflow is called with all required fields.
+        Verify start_ai_note_batch_workflow is called with all required fields.
 
-        The workflow function signature requires:
-        - community_server_id: str
+        The call carries community_server_id, and each item carries:
         - request_id: str
         - content: str
         - scan_type: str
@@ -341,7 +339,7 @@ class TestSimilarityMatchAINoteGeneration(TestBulkScanAINoteGenerationFixtures):
             mock_get_flagged.return_value = flagged_messages
 
             with patch(
-                "src.dbos_workflows.content_monitoring_workflows.start_ai_note_workflow"
+                "src.dbos_workflows.content_monitoring_workflows.start_ai_note_batch_workflow"
             ) as mock_workflow:
                 transport = ASGITransport(app=app)
                 async with AsyncClient(transport=transport, base_url="http://test") as client:
@@ -366,18 +364,17 @@ class TestSimilarityMatchAINoteGeneration(TestBulkScanAINoteGenerationFixtures):
 
                 mock_workflow.assert_called_once()
                 call_kwargs = mock_workflow.call_args.kwargs
-
-                assert "request_id" in call_kwargs, "Workflow call missing request_id"
-                assert "content" in call_kwargs, "Workflow call missing content"
-                assert "scan_type" in call_kwargs, "Workflow call missing scan_type"
-                assert call_kwargs["scan_type"] == "similarity"
                 assert "community_server_id" in call_kwargs, (
                     "Workflow call missing community_server_id"
                 )
-                assert "fact_check_item_id" in call_kwargs, (
-                    "Workflow call missing fact_check_item_id"
-                )
-                assert "similarity_score" in call_kwargs, "Workflow call missing similarity_score"
+                [item] = call_kwargs["items"]
+
+                assert "request_id" in item, "Workflow item missing request_id"
+                assert "content" in item, "Workflow item missing content"
+                assert "scan_type" in item, "Workflow item missing scan_type"
+                assert item["scan_type"] == "similarity"
+                assert "fact_check_item_id" in item, "Workflow item missing fact_check_item_id"
+                assert "similarity_score" in item, "Workflow item missing similarity_score"
 
 
 class TestModerationMatchAINoteGeneration(TestBulkScanAINoteGenerationFixtures):
@@ -411,7 +408,7 @@ class TestModerationMatchAINoteGeneration(TestBulkScanAINoteGenerationFixtures):
             mock_get_flagged.return_value = flagged_messages
 
             with patch(
-                "src.dbos_workflows.content_monitoring_workflows.start_ai_note_workflow"
+                "src.dbos_workflows.content_monitoring_workflows.start_ai_note_batch_workflow"
             ) as mock_workflow:
                 transport = ASGITransport(app=app)
                 async with AsyncClient(transport=transport, base_url="http://test") as client:
@@ -435,11 +432,11 @@ class TestModerationMatchAINoteGeneration(TestBulkScanAINoteGenerationFixtures):
                 assert response.status_code == 201
                 mock_workflow.assert_called_once()
 
-                call_kwargs = mock_workflow.call_args.kwargs
-                assert call_kwargs["scan_type"] == "openai_moderation"
-                assert call_kwargs.get("fact_check_item_id") is None
-                assert "moderation_metadata" in call_kwargs
-                assert call_kwargs["moderation_metadata"]["flagged_categories"] == ["harassment"]
+                [item] = mock_workflow.call_args.kwargs["items"]
+                assert item["scan_type"] == "openai_moderation"
+                assert item.get("fact_check_item_id") is None
+                assert "moderation_metadata" in item
+                assert item["moderation_metadata"]["flagged_categories"] == ["harassment"]
 
 
 class TestGenerateAINotesDisabled(TestBulkScanAINoteGenerationFixtures):
@@ -469,7 +466,7 @@ class TestGenerateAINotesDisabled(TestBulkScanAINoteGenerationFixtures):
             mock_get_flagged.return_value = flagged_messages
 
             with patch(
-                "src.dbos_workflows.content_monitoring_workflows.start_ai_note_workflow"
+                "src.dbos_workflows.content_monitoring_workflows.start_ai_note_batch_workflow"
             ) as mock_workflow:
                 transport = ASGITransport(app=app)
                 async with AsyncClient(transport=transport, base_url="http://test") as client:
@@ -646,7 +643,7 @@ class TestPartialMatches(TestBulkScanAINoteGenerationFixtures):
             mock_get_flagged.return_value = flagged_messages
 
             with patch(
-                "src.dbos_workflows.content_monitoring_workflows.start_ai_note_workflow"
+                "src.dbos_workflows.content_monitoring_workflows.start_ai_note_batch_workflow"
             ) as mock_workflow:
                 transport = ASGITransport(app=app)
                 async with AsyncClient(transport=transport, base_url="http://test") as client:
@@ -672,12 +669,10 @@ class TestPartialMatches(TestBulkScanAINoteGenerationFixtures):
 
                 assert response.status_code == 201
 
-                assert mock_workflow.call_count == 1, (
-                    f"Expected 1 call (only message with fact_check_item_id triggers workflow) "
-                    f"but got {mock_workflow.call_count}"
-                )
-
-                call_kwargs = mock_workflow.call_args.kwargs
-                assert call_kwargs["fact_check_item_id"] == str(
-                    fact_check_item_for_partial_tests.id
+                mock_workflow.assert_called_once()
+                items = mock_workflow.call_args.kwargs["items"]
+                assert len(items) == 1, (
+                    f"Expected 1 item (only message with fact_check_item_id triggers workflow) "
+                    f"but got {len(items)}"
                 )
+                assert items[0]["fact_check_item_id"] == str(fact_check_item_for_partial_tests.id)
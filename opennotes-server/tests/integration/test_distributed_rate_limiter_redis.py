@@ -0,0 +1,74 @@
+"""Integration tests running the sliding-window claim script against real Redis."""
+
+import os
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.middleware.distributed_rate_limiter import DistributedRateLimiter
+
+WINDOW_SECONDS = 60
+LIMIT = 10
+# Start of window 100 for WINDOW_SECONDS=60.
+WINDOW_START = 6000
+
+
+@pytest.fixture
+async def sliding_window_limiter():
+    limiter = DistributedRateLimiter(
+        redis_url=os.environ.get("REDIS_URL", "redis://localhost:6379"),
+        algorithm="sliding_window",
+    )
+    await limiter.connect()
+    assert limiter.redis is not None, "Redis must be reachable for this test"
+    identifier = f"test:{uuid4()}"
+    yield limiter, identifier
+    await limiter.reset_limit(identifier)
+    await limiter.disconnect()
+
+
+async def _claim_until_denied(limiter: DistributedRateLimiter, identifier: str, at: float) -> int:
+    allowed = 0
+    with patch("src.middleware.distributed_rate_limiter.time.time", return_value=at):
+        for _ in range(LIMIT + 1):
+            info = await limiter.check_rate_limit(identifier, LIMIT, WINDOW_SECONDS)
+            if not info.allowed:
+                return allowed
+            allowed += 1
+    return allowed
+
+
+@pytest.mark.asyncio
+async def test_claims_are_capped_at_limit_within_window(sliding_window_limiter):
+    limiter, identifier = sliding_window_limiter
+
+    assert await _claim_until_denied(limiter, identifier, WINDOW_START) == LIMIT
+
+
+@pytest.mark.asyncio
+async def test_previous_window_is_weighted_after_rollover(sliding_window_limiter):
+    limiter, identifier = sliding_window_limiter
+    await _claim_until_denied(limiter, identifier, WINDOW_START)
+
+    # 15s into the next window, 45/60 of the previous window still counts:
+    # floor(10 * 0.75) = 7 used, so 3 more requests fit.
+    rollover = WINDOW_START + WINDOW_SECONDS + 15
+    with patch("src.middleware.distributed_rate_limiter.time.time", return_value=rollover):
+        info = await limiter.get_limit_info(identifier, LIMIT, WINDOW_SECONDS)
+    assert info["remaining"] == 3
+
+    assert await _claim_until_denied(limiter, identifier, rollover) == 3
+
+    state = await limiter.redis.hgetall(f"rate_limit:{identifier}:counter")
+    assert state == {"window": "101", "current": "3", "previous": "10"}
+
+
+@pytest.mark.asyncio
+async def test_stale_windows_are_forgotten(sliding_window_limiter):
+    limiter, identifier = sliding_window_limiter
+    await _claim_until_denied(limiter, identifier, WINDOW_START)
+
+    two_windows_later = WINDOW_START + 2 * WINDOW_SECONDS + 15
+
+    assert await _claim_until_denied(limiter, identifier, two_windows_later) == LIMIT
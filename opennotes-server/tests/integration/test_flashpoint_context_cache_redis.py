@@ -0,0 +1,75 @@
+"""Integration tests running the cross-batch flashpoint context script against real Redis."""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pendulum
+import pytest
+from redis.asyncio import Redis
+
+from src.bulk_content_scan.schemas import BulkScanMessage
+from src.bulk_content_scan.service import BulkContentScanService
+
+MAX_MESSAGES = 5
+TTL_SECONDS = 600
+
+
+def _message(index: int, content: str | None = None) -> BulkScanMessage:
+    return BulkScanMessage(
+        message_id=f"msg_{index}",
+        channel_id="ch_1",
+        community_server_id="guild_123",
+        content=content or f"Message {index} content for testing",
+        author_id="user_1",
+        timestamp=pendulum.datetime(2024, 1, 1, 0, index, 0, tz="UTC"),
+    )
+
+
+@pytest.fixture
+async def context_cache():
+    redis = Redis.from_url(os.environ.get("REDIS_URL", "redis://localhost:6379"))
+    service = BulkContentScanService(
+        session=AsyncMock(),
+        embedding_service=MagicMock(),
+        redis_client=redis,
+    )
+    community_server_id = f"test:{uuid4()}"
+    with patch("src.bulk_content_scan.service.settings") as mock_settings:
+        mock_settings.ENVIRONMENT = "test"
+        mock_settings.FLASHPOINT_CONTEXT_CACHE_MAX_MESSAGES = MAX_MESSAGES
+        mock_settings.FLASHPOINT_CONTEXT_CACHE_TTL = TTL_SECONDS
+        key = service._get_flashpoint_context_key(community_server_id, "ch_1")
+        yield service, redis, community_server_id, key
+    await redis.delete(key, f"{key}:data")
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+async def test_trim_evicts_ids_from_both_structures(context_cache):
+    service, redis, community_server_id, key = context_cache
+
+    await service._populate_cross_batch_cache([_message(i) for i in range(3)], community_server_id)
+    await service._populate_cross_batch_cache(
+        [_message(i) for i in range(3, 8)], community_server_id
+    )
+
+    ids = [m.decode() for m in await redis.zrange(key, 0, -1)]
+    assert ids == [f"msg_{i}" for i in range(3, 8)]
+    data = await redis.hgetall(f"{key}:data")
+    assert sorted(k.decode() for k in data) == sorted(ids)
+    assert 0 < await redis.ttl(key) <= TTL_SECONDS
+    assert 0 < await redis.ttl(f"{key}:data") <= TTL_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_rewritten_message_keeps_one_entry_with_latest_content(context_cache):
+    service, redis, community_server_id, key = context_cache
+
+    await service._populate_cross_batch_cache([_message(1)], community_server_id)
+    await service._populate_cross_batch_cache([_message(1, "Edited")], community_server_id)
+
+    assert await redis.zcard(key) == 1
+    context_map = BulkContentScanService.build_channel_context_map([_message(2)])
+    enriched = await service._enrich_context_from_cache(context_map, community_server_id)
+    assert [m.content for m in enriched["ch_1"]] == ["Edited", "Message 2 content for testing"]
@@ -394,6 +394,65 @@ class TestRatingsJSONAPI:
         data = response.json()
         assert "errors" in data, "Error response must contain 'errors' array"
 
+    @pytest.mark.asyncio
+    async def test_bulk_create_ratings_jsonapi_reports_per_item_results(
+        self,
+        ratings_jsonapi_auth_client,
+        ratings_jsonapi_sample_note_data,
+        ratings_jsonapi_community_server,
+    ):
+        """Test POST /api/v2/ratings/bulk upserts valid items and reports failures by index."""
+        from uuid import uuid4
+
+        note_data = self._get_unique_note_data(ratings_jsonapi_sample_note_data)
+        create_response = await self._create_note_v2(ratings_jsonapi_auth_client, note_data)
+        assert create_response.status_code == 201
+        note_id = create_response.json()["data"]["id"]
+
+        rater_a = await create_rater_profile(
+            ratings_jsonapi_community_server["uuid"], "Bulk Rater A", "test_rater_bulk_a"
+        )
+        rater_b = await create_rater_profile(
+            ratings_jsonapi_community_server["uuid"], "Bulk Rater B", "test_rater_bulk_b"
+        )
+
+        def item(note, rater, level):
+            return {
+                "type": "ratings",
+                "attributes": {
+                    "note_id": str(note),
+                    "rater_id": str(rater),
+                    "helpfulness_level": level,
+                },
+            }
+
+        request_body = {
+            "data": [
+                item(note_id, rater_a, "HELPFUL"),
+                item(uuid4(), rater_a, "HELPFUL"),
+                item(note_id, rater_b, "SOMEWHAT_HELPFUL"),
+                item(note_id, rater_a, "NOT_HELPFUL"),
+            ]
+        }
+
+        response = await ratings_jsonapi_auth_client.post("/api/v2/ratings/bulk", json=request_body)
+
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert data["meta"]["total_requested"] == 4
+        assert data["meta"]["total_succeeded"] == 2
+        assert data["meta"]["total_failed"] == 2
+        assert [r["status"] for r in data["meta"]["results"]] == ["409", "404", "201", "201"]
+        assert data["meta"]["results"][1]["error"]["source"]["pointer"] == "/data/1"
+
+        levels = {
+            r["attributes"]["rater_id"]: r["attributes"]["helpfulness_level"] for r in data["data"]
+        }
+        assert levels == {str(rater_b): "SOMEWHAT_HELPFUL", str(rater_a): "NOT_HELPFUL"}
+
+        list_response = await ratings_jsonapi_auth_client.get(f"/api/v2/notes/{note_id}/ratings")
+        assert len(list_response.json()["data"]) == 2
+
     @pytest.mark.asyncio
     async def test_list_note_ratings_jsonapi(
         self,
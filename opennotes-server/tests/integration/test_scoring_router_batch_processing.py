@@ -8,7 +8,6 @@ This test file verifies that task-224 fix works correctly by ensuring:
 """
 
 from datetime import UTC, datetime
-from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
 import pytest
@@ -285,91 +284,59 @@ async def test_get_top_notes_filtering_works_with_batch_processing(
 
 
 @pytest.mark.asyncio
-async def test_get_top_notes_memory_efficient_with_large_dataset(
+async def test_get_top_notes_keyset_pagination_follows_next_link(
     async_client, async_auth_headers, db_session, community_server, user_with_community_membership
 ):
-    """Test that memory usage is bounded with large datasets."""
-    large_count = 50000
-    batch_size = 1000
-    limit = 10
+    """Test that links.next walks the full ordering without gaps or duplicates."""
+    author_ids = [await create_user_profile(f"Keyset Author {i}") for i in range(25)]
 
-    max_in_memory = [0]
-
-    test_community_id = user_with_community_membership["membership"].community_id
-    mock_author_id = uuid4()
-
-    class MockNote:
-        def __init__(self, note_idx, score, community_id):
-            self.id = uuid4()
-            self.author_id = mock_author_id
-            self.summary = f"Note {note_idx}"
-            self.classification = "NOT_MISLEADING"
-            self.helpfulness_score = score
-            self.status = "NEEDS_MORE_RATINGS"
-            self.ratings = []
-            self.community_server_id = community_id
-
-    # Save original execute for delegation
-    original_execute = db_session.execute
-
-    async def mock_execute(query):
-        query_str = str(query).lower()
-
-        # Let community membership queries go through to real DB
-        # These queries are needed to verify user access
-        if "community_member" in query_str or "user_identit" in query_str:
-            return await original_execute(query)
-
-        # Count query for notes
-        if "count" in query_str and "note" in query_str:
-            result = MagicMock()
-            result.scalar.return_value = large_count
-            return result
-
-        # Batch query for notes - simulate returning batches
-        offset = 0
-        limit_val = batch_size
-
-        # Extract offset and limit from query (simplified)
-        result_notes = []
-        for i in range(offset, min(offset + limit_val, large_count)):
-            result_notes.append(MockNote(i, 50 + (i % 100), test_community_id))
-
-        class MockScalarResult:
-            def __init__(self, notes):
-                self.notes = notes
-                max_in_memory[0] = max(max_in_memory[0], len(notes))
-
-            def all(self):
-                return self.notes
-
-        class MockResult:
-            def __init__(self, notes):
-                self.notes = notes
-
-            def scalars(self):
-                return MockScalarResult(self.notes)
+    for i in range(25):
+        db_session.add(
+            Note(
+                id=uuid4(),
+                author_id=author_ids[i],
+                community_server_id=community_server,
+                summary=f"Test note {i}",
+                classification=NoteClassification.NOT_MISLEADING,
+                helpfulness_score=i % 5,
+                status=NoteStatus.NEEDS_MORE_RATINGS,
+            )
+        )
 
-        return MockResult(result_notes)
+    await db_session.commit()
 
-    db_session.execute = mock_execute
+    seen_ids: list[str] = []
+    scores: list[float] = []
+    url: str | None = "/api/v2/scoring/notes/top?limit=10"
+    pages = 0
+    while url:
+        response = await async_client.get(url, headers=async_auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        seen_ids.extend(note["id"] for note in data["data"])
+        scores.extend(note["attributes"]["score"] for note in data["data"])
+        assert data["meta"]["total_count"] == 25
+        url = data["links"].get("next")
+        pages += 1
 
-    try:
-        response = await async_client.get(
-            "/api/v2/scoring/notes/top",
-            headers=async_auth_headers,
-            params={"limit": limit, "batch_size": batch_size},
-        )
+    assert pages == 3
+    assert len(seen_ids) == 25
+    assert len(set(seen_ids)) == 25
+    assert scores == sorted(scores, reverse=True)
 
-        assert response.status_code == status.HTTP_200_OK
 
-        expected_max = batch_size + (limit * 5)
-        assert max_in_memory[0] <= expected_max, (
-            f"Peak memory {max_in_memory[0]} should not exceed {expected_max}"
-        )
+@pytest.mark.asyncio
+async def test_get_top_notes_rejects_malformed_cursor(
+    async_client, async_auth_headers, community_server, user_with_community_membership
+):
+    """Test that an undecodable page[after] cursor returns 400."""
+    response = await async_client.get(
+        "/api/v2/scoring/notes/top",
+        headers=async_auth_headers,
+        params={"page[after]": "not-a-cursor"},
+    )
 
-    finally:
-        db_session.execute = original_execute
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
 @pytest.mark.asyncio
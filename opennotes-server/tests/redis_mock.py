@@ -676,6 +676,16 @@ class RedisPipelineMock:
         self.commands.append(("zremrangebyrank", key, start, stop))
         return self
 
+    def zrange(self, key: str, start: int, stop: int, withscores: bool = False):
+        """Queue zrange command"""
+        self.commands.append(("zrange", key, start, stop, withscores))
+        return self
+
+    def hgetall(self, key: str):
+        """Queue hgetall command"""
+        self.commands.append(("hgetall", key))
+        return self
+
     def expire(self, key: str, seconds: int):
         """Queue expire command"""
         self.commands.append(("expire", key, seconds))
@@ -725,6 +735,12 @@ class RedisPipelineMock:
             elif cmd_name == "zremrangebyrank":
                 _, key, start, stop = command
                 result = await self.redis_mock._zremrangebyrank(key, start, stop)
+            elif cmd_name == "zrange":
+                _, key, start, stop, withscores = command
+                result = await self.redis_mock._zrange(key, start, stop, withscores=withscores)
+            elif cmd_name == "hgetall":
+                _, key = command
+                result = await self.redis_mock._hgetall(key)
             elif cmd_name == "expire":
                 _, key, seconds = command
                 result = await self.redis_mock._expire(key, seconds)
@@ -1,14 +1,18 @@
 """Tests for VisionService."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import base64
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 from openai import RateLimitError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.llm_config.models import CommunityServer, CommunityServerLLMConfig
 from src.llm_config.service import LLMService
-from src.services.vision_service import VisionService
+from src.services.vision_service import VisionService, normalize_image_url
 
 
 @pytest.fixture
@@ -222,3 +226,96 @@ async def test_cache_key_generation(vision_service: VisionService):
     assert key1 != key3
     assert key1 != key4
     assert len(key1) == 64
+
+
+def test_normalize_image_url_ignores_discord_signature():
+    """Test that re-signed Discord CDN URLs for one attachment share a key."""
+    first = "https://cdn.discordapp.com/attachments/1/2/meme.png?ex=aa&is=bb&hm=cc"
+    second = "HTTPS://CDN.discordapp.com:443/attachments/1/2/meme.png?ex=dd&is=ee&hm=ff#x"
+
+    assert normalize_image_url(first) == normalize_image_url(second)
+    assert normalize_image_url("https://example.com/a.png?b=2&a=1") == normalize_image_url(
+        "https://example.com/a.png?a=1&b=2"
+    )
+    assert normalize_image_url("https://example.com/a.png?v=1") != normalize_image_url(
+        "https://example.com/a.png?v=2"
+    )
+
+
+def test_normalize_image_url_hashes_data_url_bytes():
+    """Test that data: URLs are addressed by their decoded payload."""
+    payload = base64.b64encode(b"image-bytes").decode()
+
+    assert normalize_image_url(f"data:image/png;base64,{payload}") == normalize_image_url(
+        f"data:image/jpeg;base64,{payload}"
+    )
+    assert normalize_image_url(f"data:image/png;base64,{payload}").startswith("sha256:")
+
+
+def _mock_db_with_community():
+    db = AsyncMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = uuid4()
+    db.execute.return_value = result
+    return db
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_vision_call(mock_llm_service):
+    """Test that concurrent requests for the same image are coalesced."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_describe(*_args, **_kwargs):
+        started.set()
+        await release.wait()
+        return "A shared meme"
+
+    mock_llm_service.describe_image = AsyncMock(side_effect=slow_describe)
+    vision_service = VisionService(mock_llm_service)
+    db = _mock_db_with_community()
+
+    first = asyncio.create_task(
+        vision_service.describe_image(db, "https://example.com/meme.png?x=1", "guild")
+    )
+    await started.wait()
+    second = asyncio.create_task(
+        vision_service.describe_image(db, "https://EXAMPLE.com/meme.png?x=1#frag", "guild")
+    )
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(first, second) == ["A shared meme", "A shared meme"]
+    mock_llm_service.describe_image.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_reused_across_instances(mock_llm_service):
+    """Test that a description stored by one instance is served to another."""
+    store: dict[str, str] = {}
+    shared_cache = MagicMock()
+    shared_cache.get = AsyncMock(side_effect=store.get)
+    shared_cache.set = AsyncMock(
+        side_effect=lambda key, value, ttl=None: store.__setitem__(key, value) or True
+    )
+
+    with patch("src.services.vision_service.lock_manager") as mock_lock_manager:
+        mock_lock_manager.acquire_lock = AsyncMock(return_value=True)
+        mock_lock_manager.release_lock = AsyncMock()
+
+        writer = VisionService(mock_llm_service, shared_cache=shared_cache)
+        reader = VisionService(mock_llm_service, shared_cache=shared_cache)
+
+        first = await writer.describe_image(
+            _mock_db_with_community(), "https://example.com/meme.png", "guild-a"
+        )
+        reader_db = _mock_db_with_community()
+        second = await reader.describe_image(reader_db, "https://example.com/meme.png", "guild-b")
+
+    assert first == second == "A cat sitting on a table"
+    mock_llm_service.describe_image.assert_awaited_once()
+    mock_lock_manager.release_lock.assert_awaited_once()
+    assert mock_lock_manager.acquire_lock.await_args.kwargs == {
+        "timeout": settings.VISION_LOCK_TIMEOUT_SECONDS
+    }
+    reader_db.execute.assert_not_called()
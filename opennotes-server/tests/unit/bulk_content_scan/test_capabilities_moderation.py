@@ -166,3 +166,60 @@ class TestCheckContentModeration:
         )
 
         assert result is None
+
+
+class TestCheckContentModerationBatch:
+    """Tests for the check_content_moderation_batch capability function."""
+
+    @pytest.mark.asyncio
+    async def test_returns_matches_keyed_by_content_id(self):
+        from src.bulk_content_scan.capabilities.moderation import check_content_moderation_batch
+
+        mock_service = AsyncMock()
+        mock_service.moderate_batch = AsyncMock(
+            return_value=[
+                make_moderation_result(flagged=False),
+                make_moderation_result(
+                    flagged=True,
+                    max_score=0.9,
+                    categories={"violence": True},
+                    scores={"violence": 0.9},
+                    flagged_categories=["violence"],
+                ),
+            ]
+        )
+
+        items = [
+            make_content_item(content_id="msg_1", content_text="hello"),
+            make_content_item(
+                content_id="msg_2",
+                content_text="look",
+                attachment_urls=["https://example.com/img.jpg"],
+            ),
+        ]
+        result = await check_content_moderation_batch(items, mock_service)
+
+        mock_service.moderate_batch.assert_awaited_once_with(
+            [("hello", []), ("look", ["https://example.com/img.jpg"])]
+        )
+        assert result is not None
+        assert result["msg_1"] is None
+        assert isinstance(result["msg_2"], OpenAIModerationMatch)
+        assert result["msg_2"].flagged_categories == ["violence"]
+
+    @pytest.mark.asyncio
+    async def test_returns_none_on_exception(self):
+        from src.bulk_content_scan.capabilities.moderation import check_content_moderation_batch
+
+        mock_service = AsyncMock()
+        mock_service.moderate_batch = AsyncMock(side_effect=Exception("API error"))
+
+        result = await check_content_moderation_batch([make_content_item()], mock_service)
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_returns_none_without_service(self):
+        from src.bulk_content_scan.capabilities.moderation import check_content_moderation_batch
+
+        assert await check_content_moderation_batch([make_content_item()], None) is None
@@ -1336,3 +1336,144 @@ class TestRiskLevelNormalizationInService:
         assert result is not None
         assert isinstance(result, ConversationFlashpointMatch)
         assert result.risk_level == "Heated"
+
+
+def _prediction(score: int, risk_level: str = "Hostile", reasoning: str = "r") -> MagicMock:
+    prediction = MagicMock(spec=dspy.Prediction)
+    prediction.derailment_score = score
+    prediction.risk_level = risk_level
+    prediction.reasoning = reasoning
+    return prediction
+
+
+class TestDetectFlashpointsBatch:
+    """Tests for FlashpointDetectionService.detect_flashpoints_batch."""
+
+    @pytest.mark.asyncio
+    async def test_returns_results_in_input_order(self):
+        service = FlashpointDetectionService(model="openai/gpt-5-mini")
+        scores = {"alice: calm": 10, "bob: you're wrong": 80}
+
+        mock_detector = MagicMock()
+        mock_detector.side_effect = lambda context, message: _prediction(scores[message])
+
+        first = make_bulk_scan_message(message_id="m1", content="calm", author_username="alice")
+        second = make_bulk_scan_message(
+            message_id="m2", content="you're wrong", author_username="bob"
+        )
+
+        with patch.object(service, "_get_detector", return_value=mock_detector):
+            results = await service.detect_flashpoints_batch([(first, []), (second, [first])])
+
+        assert results[0] is None
+        assert results[1] is not None
+        assert results[1].derailment_score == 80
+        assert results[1].context_messages == 1
+        mock_detector.assert_any_call(context="alice: calm", message="bob: you're wrong")
+
+    @pytest.mark.asyncio
+    async def test_uses_single_thread_hop_for_batch(self):
+        service = FlashpointDetectionService(model="openai/gpt-5-mini")
+        mock_detector = MagicMock(return_value=_prediction(90))
+        messages = [make_bulk_scan_message(message_id=f"m{i}", content=f"c{i}") for i in range(4)]
+        items = [(m, messages[:i]) for i, m in enumerate(messages)]
+
+        thread_hops = 0
+
+        async def fake_to_thread(fn, *args):
+            nonlocal thread_hops
+            thread_hops += 1
+            return fn(*args)
+
+        with (
+            patch.object(service, "_get_detector", return_value=mock_detector),
+            patch(
+                "src.bulk_content_scan.flashpoint_service.asyncio.to_thread",
+                new=fake_to_thread,
+            ),
+        ):
+            results = await service.detect_flashpoints_batch(items)
+
+        assert thread_hops == 1
+        assert mock_detector.call_count == 4
+        assert all(r is not None for r in results)
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_identical_inputs(self):
+        service = FlashpointDetectionService(model="openai/gpt-5-mini")
+        mock_detector = MagicMock(return_value=_prediction(70))
+        message = make_bulk_scan_message(message_id="m1", content="same")
+
+        with patch.object(service, "_get_detector", return_value=mock_detector):
+            results = await service.detect_flashpoints_batch([(message, []), (message, [])])
+
+        assert mock_detector.call_count == 1
+        assert results[0] is not None
+        assert results[1] is not None
+
+    @pytest.mark.asyncio
+    async def test_context_limited_to_max_context(self):
+        service = FlashpointDetectionService(model="openai/gpt-5-mini")
+        mock_detector = MagicMock(return_value=_prediction(70))
+        context = [
+            make_bulk_scan_message(message_id=f"ctx_{i}", content=f"c{i}", author_username="u")
+            for i in range(10)
+        ]
+        message = make_bulk_scan_message(message_id="m1", content="now", author_username="u")
+
+        with patch.object(service, "_get_detector", return_value=mock_detector):
+            results = await service.detect_flashpoints_batch([(message, context)], max_context=2)
+
+        mock_detector.assert_called_once_with(context="u: c8\nu: c9", message="u: now")
+        assert results[0] is not None
+        assert results[0].context_messages == 2
+
+    @pytest.mark.asyncio
+    async def test_transient_error_only_drops_that_message(self):
+        service = FlashpointDetectionService(model="openai/gpt-5-mini")
+
+        def _detect(context, message):
+            if message.endswith("flaky"):
+                raise TimeoutError("timed out")
+            return _prediction(90)
+
+        mock_detector = MagicMock(side_effect=_detect)
+        ok = make_bulk_scan_message(message_id="m1", content="fine")
+        flaky = make_bulk_scan_message(message_id="m2", content="flaky")
+
+        with patch.object(service, "_get_detector", return_value=mock_detector):
+            results = await service.detect_flashpoints_batch([(ok, []), (flaky, [ok])])
+
+        assert results[0] is not None
+        assert results[1] is None
+
+    @pytest.mark.asyncio
+    async def test_critical_error_is_returned_in_that_message_slot(self):
+        service = FlashpointDetectionService(model="openai/gpt-5-mini")
+
+        def _detect(context, message):
+            if message.endswith("broken"):
+                raise ValueError("bad output")
+            return _prediction(90)
+
+        mock_detector = MagicMock(side_effect=_detect)
+        ok = make_bulk_scan_message(message_id="m1", content="fine")
+        broken = make_bulk_scan_message(message_id="m2", content="broken")
+
+        with patch.object(service, "_get_detector", return_value=mock_detector):
+            results = await service.detect_flashpoints_batch([(ok, []), (broken, [ok])])
+
+        assert results[0] is not None
+        assert not isinstance(results[0], Exception)
+        assert isinstance(results[1], ValueError)
+        assert str(results[1]) == "bad output"
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_detector(self):
+        service = FlashpointDetectionService(model="openai/gpt-5-mini")
+
+        with patch.object(service, "_get_detector") as mock_get_detector:
+            results = await service.detect_flashpoints_batch([])
+
+        assert results == []
+        mock_get_detector.assert_not_called()
@@ -250,3 +250,48 @@ class TestScannerDispatch:
         )
 
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_process_messages_moderates_batch_in_one_call(
+        self, service_with_moderation, mock_moderation_service
+    ):
+        """process_messages should moderate all messages with one moderate_batch call."""
+        from src.bulk_content_scan.openai_moderation_service import ModerationResult
+
+        clean = ModerationResult(
+            flagged=False, categories={"violence": False}, scores={"violence": 0.01}, max_score=0.01
+        )
+        flagged = ModerationResult(
+            flagged=True,
+            categories={"violence": True},
+            scores={"violence": 0.9},
+            max_score=0.9,
+            flagged_categories=["violence"],
+        )
+        mock_moderation_service.moderate_batch = AsyncMock(return_value=[clean, flagged, clean])
+        service_with_moderation.get_existing_request_message_ids = AsyncMock(return_value=set())
+        service_with_moderation._filter_candidates_with_relevance = AsyncMock(return_value=[])
+
+        messages = [
+            BulkScanMessage(
+                message_id=f"msg_{i}",
+                channel_id="456",
+                community_server_id="789",
+                content=f"message number {i} with enough text",
+                author_id="user1",
+                timestamp=pendulum.now("UTC"),
+            )
+            for i in range(3)
+        ]
+
+        await service_with_moderation.process_messages(
+            scan_id=uuid4(),
+            messages=messages,
+            community_server_platform_id="community-platform-id",
+            scan_types=[ScanType.OPENAI_MODERATION],
+        )
+
+        mock_moderation_service.moderate_batch.assert_awaited_once()
+        mock_moderation_service.moderate_text.assert_not_called()
+        candidates = service_with_moderation._filter_candidates_with_relevance.await_args.args[0]
+        assert [c.message.message_id for c in candidates] == ["msg_1"]
@@ -1,7 +1,7 @@
 """Tests for OpenAI moderation service."""
 
 from dataclasses import dataclass
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -170,6 +170,216 @@ class TestOpenAIModerationService:
         assert result.flagged is True
 
 
+class FakeModerationEndpoint:
+    """Local stand-in for moderations.create() that scores each input.
+
+    Text inputs containing "attack" and image URLs containing "gore" are
+    flagged for violence; everything else is clean. Returns one result per
+    string input and a single result for a multimodal input list.
+    """
+
+    def __init__(self):
+        self.calls: list[list] = []
+
+    async def create(self, model: str, input: list):  # noqa: A002
+        self.calls.append(list(input))
+        if all(isinstance(item, str) for item in input):
+            return MockModerationResponse(results=[self._score(item) for item in input])
+        flagged = any(
+            "gore" in item["image_url"]["url"] for item in input if item.get("type") == "image_url"
+        )
+        return MockModerationResponse(results=[self._result(flagged)])
+
+    def _score(self, text: str) -> MockModerationResult:
+        return self._result("attack" in text)
+
+    @staticmethod
+    def _result(flagged: bool) -> MockModerationResult:
+        return MockModerationResult(
+            flagged=flagged,
+            categories=MockCategories(violence=flagged),
+            category_scores=MockCategoryScores(violence=0.9 if flagged else 0.01),
+        )
+
+
+class TestOpenAIModerationServiceBatching:
+    """Tests for batched, content-hash-deduplicated moderation."""
+
+    @pytest.fixture
+    def endpoint(self):
+        return FakeModerationEndpoint()
+
+    @pytest.fixture
+    def moderation_service(self, endpoint):
+        from src.bulk_content_scan.openai_moderation_service import OpenAIModerationService
+
+        client = AsyncMock()
+        client.moderations = endpoint
+        return OpenAIModerationService(client=client)
+
+    @pytest.mark.asyncio
+    async def test_moderate_texts_sends_one_request_for_batch(self, moderation_service, endpoint):
+        results = await moderation_service.moderate_texts(["hello", "an attack", "bye"])
+
+        assert len(endpoint.calls) == 1
+        assert endpoint.calls[0] == ["hello", "an attack", "bye"]
+        assert [r.flagged for r in results] == [False, True, False]
+        assert results[1].flagged_categories == ["violence"]
+
+    @pytest.mark.asyncio
+    async def test_moderate_texts_chunks_large_batches(self, moderation_service, endpoint):
+        from src.bulk_content_scan.openai_moderation_service import MODERATION_BATCH_SIZE
+
+        texts = [f"message {i}" for i in range(MODERATION_BATCH_SIZE + 5)]
+
+        results = await moderation_service.moderate_texts(texts)
+
+        assert [len(call) for call in endpoint.calls] == [MODERATION_BATCH_SIZE, 5]
+        assert len(results) == len(texts)
+
+    @pytest.mark.asyncio
+    async def test_moderate_texts_dedupes_within_and_across_calls(
+        self, moderation_service, endpoint
+    ):
+        first = await moderation_service.moderate_texts(["same", "same", "an attack"])
+        second = await moderation_service.moderate_texts(["an attack", "same"])
+        single = await moderation_service.moderate_text("same")
+
+        assert endpoint.calls == [["same", "an attack"]]
+        assert [r.flagged for r in first] == [False, False, True]
+        assert [r.flagged for r in second] == [True, False]
+        assert single.flagged is False
+
+    @pytest.mark.asyncio
+    async def test_moderate_texts_rejects_mismatched_result_count(self, moderation_service):
+        moderation_service.client.moderations = AsyncMock()
+        moderation_service.client.moderations.create = AsyncMock(
+            return_value=MockModerationResponse(results=[FakeModerationEndpoint._result(False)])
+        )
+
+        with pytest.raises(ValueError, match="1 results for 2 inputs"):
+            await moderation_service.moderate_texts(["one", "two"])
+
+    @pytest.mark.asyncio
+    async def test_moderate_batch_dedupes_images_and_merges_results(
+        self, moderation_service, endpoint
+    ):
+        results = await moderation_service.moderate_batch(
+            [
+                ("look at this", ["https://example.com/gore.jpg"]),
+                ("and this", ["https://example.com/gore.jpg", "https://example.com/cat.jpg"]),
+                ("no images", []),
+            ]
+        )
+
+        text_calls = [call for call in endpoint.calls if all(isinstance(i, str) for i in call)]
+        image_calls = [call for call in endpoint.calls if call not in text_calls]
+        assert text_calls == [["look at this", "and this", "no images"]]
+        assert len(image_calls) == 2
+        assert [r.flagged for r in results] == [True, True, False]
+        assert results[1].scores["violence"] == 0.9
+
+        await moderation_service.moderate_batch([("again", ["https://example.com/cat.jpg"])])
+
+        assert len(endpoint.calls) == 4
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in supporting MGET and SET with expiry."""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def mget(self, keys: list[str]):
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key: str, value: str, ex: int | None = None):
+        self.store[key] = value
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+
+class TestOpenAIModerationServiceSharedCache:
+    """Tests for the Redis tier shared across service instances."""
+
+    @pytest.fixture
+    def redis_client(self):
+        return FakeRedis()
+
+    def _service(self, endpoint, redis_client):
+        from src.bulk_content_scan.openai_moderation_service import OpenAIModerationService
+
+        client = AsyncMock()
+        client.moderations = endpoint
+        return OpenAIModerationService(client=client, redis_client=redis_client)
+
+    @pytest.mark.asyncio
+    async def test_results_are_shared_across_instances(self, redis_client):
+        from src.config import settings
+
+        first_endpoint = FakeModerationEndpoint()
+        second_endpoint = FakeModerationEndpoint()
+
+        await self._service(first_endpoint, redis_client).moderate_texts(["hello", "an attack"])
+        results = await self._service(second_endpoint, redis_client).moderate_texts(
+            ["an attack", "new text"]
+        )
+
+        assert first_endpoint.calls == [["hello", "an attack"]]
+        assert second_endpoint.calls == [["new text"]]
+        assert [r.flagged for r in results] == [True, False]
+        assert len(redis_client.store) == 3
+        assert set(redis_client.ttls.values()) == {settings.MODERATION_CACHE_TTL}
+
+    @pytest.mark.asyncio
+    async def test_image_results_are_shared_across_instances(self, redis_client):
+        first_endpoint = FakeModerationEndpoint()
+        second_endpoint = FakeModerationEndpoint()
+        url = "https://example.com/gore.jpg"
+
+        await self._service(first_endpoint, redis_client).moderate_image(url)
+        result = await self._service(second_endpoint, redis_client).moderate_image(url)
+
+        assert len(first_endpoint.calls) == 1
+        assert second_endpoint.calls == []
+        assert result.flagged is True
+
+    @pytest.mark.asyncio
+    async def test_lru_hit_skips_redis(self, redis_client):
+        endpoint = FakeModerationEndpoint()
+        service = self._service(endpoint, redis_client)
+        await service.moderate_texts(["hello"])
+        redis_client.mget = AsyncMock(side_effect=AssertionError("LRU should answer first"))
+
+        result = await service.moderate_text("hello")
+
+        assert result.flagged is False
+        assert endpoint.calls == [["hello"]]
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_fall_back_to_api(self, redis_client):
+        endpoint = FakeModerationEndpoint()
+        redis_client.mget = AsyncMock(side_effect=ConnectionError("redis down"))
+        redis_client.set = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        results = await self._service(endpoint, redis_client).moderate_texts(["an attack"])
+
+        assert endpoint.calls == [["an attack"]]
+        assert results[0].flagged is True
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_shared_cache(self, redis_client):
+        endpoint = FakeModerationEndpoint()
+
+        with patch("src.bulk_content_scan.openai_moderation_service.settings") as mock_settings:
+            mock_settings.MODERATION_CACHE_TTL = 0
+            await self._service(endpoint, redis_client).moderate_texts(["hello"])
+
+        assert redis_client.store == {}
+
+
 class TestModerationResult:
     """Tests for the ModerationResult dataclass."""
 
@@ -2498,6 +2498,139 @@ class TestContentScanTypesHoisted:
         assert mock_flashpoint_service.detect_flashpoint.call_count == 3
 
 
+class TestFlashpointScanCandidatesBatch:
+    """Test batched flashpoint candidate generation over a shared channel window."""
+
+    def _make_messages(self, count: int):
+        from src.bulk_content_scan.schemas import BulkScanMessage
+
+        return [
+            BulkScanMessage(
+                message_id=f"msg_{i}",
+                channel_id="ch_1",
+                community_server_id="guild_123",
+                content=f"Message {i} content for testing",
+                author_id="user_1",
+                timestamp=pendulum.datetime(2024, 1, 1, i, 0, 0, tz="UTC"),
+            )
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_runs_one_batch_call_with_sliced_context(
+        self, mock_session, mock_embedding_service, mock_redis
+    ):
+        from src.bulk_content_scan.scan_types import ScanType
+        from src.bulk_content_scan.schemas import ConversationFlashpointMatch
+        from src.bulk_content_scan.service import BulkContentScanService
+
+        match = ConversationFlashpointMatch(
+            derailment_score=80, risk_level="Hostile", reasoning="Escalation", context_messages=2
+        )
+        mock_flashpoint_service = AsyncMock()
+        mock_flashpoint_service.detect_flashpoints_batch = AsyncMock(
+            return_value=[None, None, match]
+        )
+
+        service = BulkContentScanService(
+            session=mock_session,
+            embedding_service=mock_embedding_service,
+            redis_client=mock_redis,
+            flashpoint_service=mock_flashpoint_service,
+        )
+        messages = self._make_messages(3)
+        context_map = service.build_channel_context_map(messages)
+
+        candidates = await service._flashpoint_scan_candidates_batch(
+            uuid4(), messages, context_map, service._build_message_id_index(context_map)
+        )
+
+        mock_flashpoint_service.detect_flashpoints_batch.assert_awaited_once()
+        mock_flashpoint_service.detect_flashpoint.assert_not_called()
+        items = mock_flashpoint_service.detect_flashpoints_batch.await_args.args[0]
+        assert [len(context) for _, context in items] == [0, 1, 2]
+        assert len(candidates) == 1
+        assert candidates[0].message.message_id == "msg_2"
+        assert candidates[0].scan_type == ScanType.CONVERSATION_FLASHPOINT.value
+        assert candidates[0].score == 0.8
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_per_message_detection_on_batch_error(
+        self, mock_session, mock_embedding_service, mock_redis
+    ):
+        from src.bulk_content_scan.service import BulkContentScanService
+
+        mock_flashpoint_service = AsyncMock()
+        mock_flashpoint_service.detect_flashpoints_batch = AsyncMock(
+            side_effect=ValueError("bad output")
+        )
+        mock_flashpoint_service.detect_flashpoint = AsyncMock(return_value=None)
+
+        service = BulkContentScanService(
+            session=mock_session,
+            embedding_service=mock_embedding_service,
+            redis_client=mock_redis,
+            flashpoint_service=mock_flashpoint_service,
+        )
+        messages = self._make_messages(3)
+        context_map = service.build_channel_context_map(messages)
+
+        candidates = await service._flashpoint_scan_candidates_batch(uuid4(), messages, context_map)
+
+        assert candidates == []
+        assert mock_flashpoint_service.detect_flashpoint.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_retries_only_messages_with_failed_slots(
+        self, mock_session, mock_embedding_service, mock_redis
+    ):
+        from src.bulk_content_scan.schemas import ConversationFlashpointMatch
+        from src.bulk_content_scan.service import BulkContentScanService
+
+        messages = self._make_messages(3)
+        match = ConversationFlashpointMatch(
+            derailment_score=80, risk_level="Hostile", reasoning="Escalation", context_messages=0
+        )
+        mock_flashpoint_service = AsyncMock()
+        mock_flashpoint_service.detect_flashpoints_batch = AsyncMock(
+            return_value=[match, ValueError("bad output"), None]
+        )
+        mock_flashpoint_service.detect_flashpoint = AsyncMock(return_value=None)
+
+        service = BulkContentScanService(
+            session=mock_session,
+            embedding_service=mock_embedding_service,
+            redis_client=mock_redis,
+            flashpoint_service=mock_flashpoint_service,
+        )
+        context_map = service.build_channel_context_map(messages)
+
+        candidates = await service._flashpoint_scan_candidates_batch(uuid4(), messages, context_map)
+
+        assert [c.message.message_id for c in candidates] == [messages[0].message_id]
+        mock_flashpoint_service.detect_flashpoint.assert_awaited_once()
+        assert mock_flashpoint_service.detect_flashpoint.await_args.kwargs["message"] == messages[1]
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_without_flashpoint_service(
+        self, mock_session, mock_embedding_service, mock_redis
+    ):
+        from src.bulk_content_scan.service import BulkContentScanService
+
+        service = BulkContentScanService(
+            session=mock_session,
+            embedding_service=mock_embedding_service,
+            redis_client=mock_redis,
+        )
+        messages = self._make_messages(2)
+
+        candidates = await service._flashpoint_scan_candidates_batch(
+            uuid4(), messages, service.build_channel_context_map(messages)
+        )
+
+        assert candidates == []
+
+
 class TestUnifiedFlaggedMessageConstruction:
     """Test unified FlaggedMessage construction via _build_flagged_message_from_candidate (TASK-1067.102)."""
 
@@ -2563,7 +2696,33 @@ class TestCrossBatchContextCache:
     def stateful_redis(self):
         from tests.redis_mock import StatefulRedisMock
 
-        return StatefulRedisMock()
+        redis = StatefulRedisMock()
+
+        async def _context_write_script(script, numkeys, *keys_and_args):
+            # Mirrors _FLASHPOINT_CONTEXT_WRITE_SCRIPT; the Lua itself is
+            # exercised against real Redis in the integration suite.
+            keys, args = keys_and_args[:numkeys], list(keys_and_args[numkeys:])
+            max_messages, ttl = int(args[0]), int(args[1])
+            pos = 2
+            for key, data_key in zip(keys[::2], keys[1::2], strict=True):
+                count = int(args[pos])
+                pos += 1
+                for _ in range(count):
+                    message_id, score, data = args[pos : pos + 3]
+                    await redis._zadd(key, {message_id: float(score)})
+                    await redis._hset(data_key, message_id, data)
+                    pos += 3
+                excess = await redis._zcard(key) - max_messages
+                if excess > 0:
+                    evicted = await redis._zrange(key, 0, excess - 1)
+                    await redis._zremrangebyrank(key, 0, excess - 1)
+                    await redis._hdel(data_key, *evicted)
+                await redis._expire(key, ttl)
+                await redis._expire(data_key, ttl)
+            return 0
+
+        redis.eval = AsyncMock(side_effect=_context_write_script)
+        return redis
 
     def _make_message(self, msg_id: str, channel_id: str, minute: int):
         from src.bulk_content_scan.schemas import BulkScanMessage
@@ -2620,6 +2779,7 @@ class TestCrossBatchContextCache:
         key = service._get_flashpoint_context_key("server_abc", "ch_1")
         remaining_ttl = await stateful_redis.ttl(key)
         assert remaining_ttl > 0
+        assert await stateful_redis.ttl(f"{key}:data") > 0
 
     @pytest.mark.asyncio
     async def test_populate_trims_to_max_messages(
@@ -2651,6 +2811,11 @@ class TestCrossBatchContextCache:
         cached = await stateful_redis.zrange(key, 0, -1, withscores=True)
         scores = [s for _, s in cached]
         assert scores == sorted(scores)
+        assert [m for m, _ in cached] == [f"msg_{i}" for i in range(15, 25)]
+        data = await stateful_redis.hgetall(f"{key}:data")
+        assert sorted(data) == sorted(m for m, _ in cached)
+        _, numkeys, *keys_and_args = stateful_redis.eval.await_args.args
+        assert keys_and_args[numkeys + 2] == "10"
 
     @pytest.mark.asyncio
     async def test_enrich_merges_cached_messages_into_context(
@@ -2783,12 +2948,97 @@ class TestCrossBatchContextCache:
         timestamps = [m.timestamp for m in enriched3["ch_1"]]
         assert timestamps == sorted(timestamps)
 
+    @pytest.mark.asyncio
+    async def test_populate_and_enrich_use_one_round_trip_each(
+        self, mock_session, mock_embedding_service, stateful_redis
+    ):
+        from src.bulk_content_scan.service import BulkContentScanService
+
+        service = BulkContentScanService(
+            session=mock_session,
+            embedding_service=mock_embedding_service,
+            redis_client=stateful_redis,
+        )
+        stateful_redis.pipeline = MagicMock(side_effect=stateful_redis._pipeline)
+
+        batch1 = [self._make_message(f"msg_{i}", f"ch_{i % 3}", i) for i in range(6)]
+        await service._populate_cross_batch_cache(batch1, "server_abc")
+
+        batch2 = [self._make_message(f"msg_{i}", f"ch_{i % 3}", i) for i in range(6, 9)]
+        context_map = BulkContentScanService.build_channel_context_map(batch2)
+        enriched = await service._enrich_context_from_cache(context_map, "server_abc")
+
+        stateful_redis.eval.assert_awaited_once()
+        _, numkeys, *_ = stateful_redis.eval.await_args.args
+        assert numkeys == 6
+        assert stateful_redis.pipeline.call_count == 1
+        stateful_redis.zadd.assert_not_called()
+        stateful_redis.zrange.assert_not_called()
+        stateful_redis.hgetall.assert_not_called()
+        assert all(len(msgs) == 3 for msgs in enriched.values())
+
+    @pytest.mark.asyncio
+    async def test_populate_replaces_stale_content_for_same_message(
+        self, mock_session, mock_embedding_service, stateful_redis
+    ):
+        from src.bulk_content_scan.service import BulkContentScanService
+
+        service = BulkContentScanService(
+            session=mock_session,
+            embedding_service=mock_embedding_service,
+            redis_client=stateful_redis,
+        )
+
+        original = self._make_message("msg_1", "ch_1", 1)
+        edited = original.model_copy(update={"content": "Edited content for testing"})
+        await service._populate_cross_batch_cache([original], "server_abc")
+        await service._populate_cross_batch_cache([edited], "server_abc")
+
+        key = service._get_flashpoint_context_key("server_abc", "ch_1")
+        assert await stateful_redis.zcard(key) == 1
+
+        context_map = BulkContentScanService.build_channel_context_map(
+            [self._make_message("msg_2", "ch_1", 2)]
+        )
+        enriched = await service._enrich_context_from_cache(context_map, "server_abc")
+
+        assert [m.content for m in enriched["ch_1"]] == [
+            "Edited content for testing",
+            "Message msg_2 content for testing",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_enrich_skips_unparseable_cache_entries(
+        self, mock_session, mock_embedding_service, stateful_redis
+    ):
+        from src.bulk_content_scan.service import BulkContentScanService
+
+        service = BulkContentScanService(
+            session=mock_session,
+            embedding_service=mock_embedding_service,
+            redis_client=stateful_redis,
+        )
+
+        await service._populate_cross_batch_cache(
+            [self._make_message("msg_1", "ch_1", 1)], "server_abc"
+        )
+        key = service._get_flashpoint_context_key("server_abc", "ch_1")
+        await stateful_redis.zadd(key, {"orphan_id": 0.0, "corrupt_id": 0.5})
+        await stateful_redis.hset(f"{key}:data", "corrupt_id", "not json")
+
+        context_map = BulkContentScanService.build_channel_context_map(
+            [self._make_message("msg_2", "ch_1", 2)]
+        )
+        enriched = await service._enrich_context_from_cache(context_map, "server_abc")
+
+        assert [m.message_id for m in enriched["ch_1"]] == ["msg_1", "msg_2"]
+
     @pytest.mark.asyncio
     async def test_populate_graceful_on_redis_error(self, mock_session, mock_embedding_service):
         from src.bulk_content_scan.service import BulkContentScanService
 
         broken_redis = AsyncMock()
-        broken_redis.zadd = AsyncMock(side_effect=ConnectionError("Redis unavailable"))
+        broken_redis.eval = AsyncMock(side_effect=ConnectionError("Redis unavailable"))
 
         service = BulkContentScanService(
             session=mock_session,
@@ -2799,12 +3049,14 @@ class TestCrossBatchContextCache:
         messages = [self._make_message("msg_1", "ch_1", 1)]
         await service._populate_cross_batch_cache(messages, "server_abc")
 
+        broken_redis.eval.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_enrich_graceful_on_redis_error(self, mock_session, mock_embedding_service):
         from src.bulk_content_scan.service import BulkContentScanService
 
         broken_redis = AsyncMock()
-        broken_redis.zrange = AsyncMock(side_effect=ConnectionError("Redis unavailable"))
+        broken_redis.pipeline = MagicMock(side_effect=ConnectionError("Redis unavailable"))
 
         service = BulkContentScanService(
             session=mock_session,
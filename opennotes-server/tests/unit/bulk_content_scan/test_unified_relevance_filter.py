@@ -365,6 +365,9 @@ class TestUnifiedRelevanceFilter:
             mock_settings.RELEVANCE_CHECK_MODEL = ModelId.from_pydantic_ai("openai:gpt-5-mini")
             mock_settings.RELEVANCE_CHECK_MAX_TOKENS = 100
             mock_settings.RELEVANCE_CHECK_TIMEOUT = 10
+            mock_settings.RELEVANCE_CHECK_MAX_CONCURRENCY = 4
+            mock_settings.RELEVANCE_CHECK_BATCH_SIZE = 1
+            mock_settings.RELEVANCE_CHECK_CACHE_TTL = 0
             mock_settings.INSTANCE_ID = "test"
 
             flagged = await service._filter_candidates_with_relevance(
@@ -439,6 +442,9 @@ class TestUpdatedRelevancePrompt:
             mock_settings.RELEVANCE_CHECK_MODEL = ModelId.from_pydantic_ai("openai:gpt-5-mini")
             mock_settings.RELEVANCE_CHECK_MAX_TOKENS = 100
             mock_settings.RELEVANCE_CHECK_TIMEOUT = 10
+            mock_settings.RELEVANCE_CHECK_MAX_CONCURRENCY = 4
+            mock_settings.RELEVANCE_CHECK_BATCH_SIZE = 1
+            mock_settings.RELEVANCE_CHECK_CACHE_TTL = 0
             mock_settings.INSTANCE_ID = "test"
             mock_settings.SIMILARITY_SEARCH_DEFAULT_THRESHOLD = 0.6
 
@@ -510,6 +516,9 @@ class TestUpdatedRelevancePrompt:
             mock_settings.RELEVANCE_CHECK_MODEL = ModelId.from_pydantic_ai("openai:gpt-5-mini")
             mock_settings.RELEVANCE_CHECK_MAX_TOKENS = 100
             mock_settings.RELEVANCE_CHECK_TIMEOUT = 10
+            mock_settings.RELEVANCE_CHECK_MAX_CONCURRENCY = 4
+            mock_settings.RELEVANCE_CHECK_BATCH_SIZE = 1
+            mock_settings.RELEVANCE_CHECK_CACHE_TTL = 0
             mock_settings.INSTANCE_ID = "test"
             mock_settings.SIMILARITY_SEARCH_DEFAULT_THRESHOLD = 0.6
 
@@ -590,6 +599,9 @@ class TestDebugModeUnification:
             mock_settings.RELEVANCE_CHECK_MODEL = ModelId.from_pydantic_ai("openai:gpt-5-mini")
             mock_settings.RELEVANCE_CHECK_MAX_TOKENS = 100
             mock_settings.RELEVANCE_CHECK_TIMEOUT = 10
+            mock_settings.RELEVANCE_CHECK_MAX_CONCURRENCY = 4
+            mock_settings.RELEVANCE_CHECK_BATCH_SIZE = 1
+            mock_settings.RELEVANCE_CHECK_CACHE_TTL = 0
             mock_settings.INSTANCE_ID = "test"
             mock_settings.SIMILARITY_SEARCH_DEFAULT_THRESHOLD = 0.6
 
@@ -672,6 +684,9 @@ class TestCandidateFlaggedLogging:
             mock_settings.RELEVANCE_CHECK_MODEL = ModelId.from_pydantic_ai("openai:gpt-5-mini")
             mock_settings.RELEVANCE_CHECK_MAX_TOKENS = 100
             mock_settings.RELEVANCE_CHECK_TIMEOUT = 10
+            mock_settings.RELEVANCE_CHECK_MAX_CONCURRENCY = 4
+            mock_settings.RELEVANCE_CHECK_BATCH_SIZE = 1
+            mock_settings.RELEVANCE_CHECK_CACHE_TTL = 0
             mock_settings.INSTANCE_ID = "test"
             mock_settings.SIMILARITY_SEARCH_DEFAULT_THRESHOLD = 0.6
 
@@ -685,3 +700,177 @@ class TestCandidateFlaggedLogging:
                 "Relevance filtering complete" in call or "candidates_count" in call
                 for call in log_calls
             )
+
+
+def _similarity_candidate(message_id: str, content: str, matched_content: str):
+    from src.bulk_content_scan.schemas import BulkScanMessage, ScanCandidate, SimilarityMatch
+
+    return ScanCandidate(
+        message=BulkScanMessage(
+            message_id=message_id,
+            channel_id="ch_1",
+            community_server_id="guild_123",
+            content=content,
+            author_id="user_1",
+            timestamp=pendulum.now("UTC"),
+        ),
+        scan_type=ScanType.SIMILARITY,
+        match_data=SimilarityMatch(
+            score=0.85,
+            matched_claim=matched_content,
+            matched_source="https://factcheck.com",
+        ),
+        score=0.85,
+        matched_content=matched_content,
+        matched_source="https://factcheck.com",
+    )
+
+
+class TestRelevanceVerdictResolution:
+    """Relevance checks are deduplicated, memoized, batched and run concurrently."""
+
+    @pytest.fixture
+    def relevance_settings(self):
+        with patch("src.bulk_content_scan.service.settings") as mock_settings:
+            mock_settings.RELEVANCE_CHECK_ENABLED = True
+            mock_settings.RELEVANCE_CHECK_MODEL = ModelId.from_pydantic_ai("openai:gpt-5-mini")
+            mock_settings.RELEVANCE_CHECK_USE_OPTIMIZED_PROMPT = True
+            mock_settings.RELEVANCE_CHECK_MAX_CONCURRENCY = 4
+            mock_settings.RELEVANCE_CHECK_BATCH_SIZE = 1
+            mock_settings.RELEVANCE_CHECK_CACHE_TTL = 3600
+            mock_settings.SIMILARITY_SEARCH_DEFAULT_THRESHOLD = 0.6
+            mock_settings.ENVIRONMENT = "test"
+            yield mock_settings
+
+    @pytest.fixture
+    def service(self, mock_session, mock_embedding_service, mock_redis):
+        from src.bulk_content_scan.service import BulkContentScanService
+
+        mock_redis.mget = AsyncMock(side_effect=lambda keys: [None] * len(keys))
+        return BulkContentScanService(
+            session=mock_session,
+            embedding_service=mock_embedding_service,
+            redis_client=mock_redis,
+        )
+
+    @pytest.mark.asyncio
+    async def test_identical_pairs_are_checked_once(self, service, relevance_settings):
+        from src.bulk_content_scan.schemas import RelevanceOutcome
+
+        candidates = [
+            _similarity_candidate("msg_1", "Viral claim", "Fact-check A"),
+            _similarity_candidate("msg_2", "Viral claim", "Fact-check A"),
+            _similarity_candidate("msg_3", "Other claim", "Fact-check A"),
+        ]
+        service._check_relevance_with_llm = AsyncMock(
+            return_value=(RelevanceOutcome.RELEVANT, "Relevant")
+        )
+
+        flagged = await service._filter_candidates_with_relevance(candidates, uuid4())
+
+        assert [f.message_id for f in flagged] == ["msg_1", "msg_2", "msg_3"]
+        assert service._check_relevance_with_llm.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_memoized_verdict_skips_llm(self, service, mock_redis, relevance_settings):
+        import orjson
+
+        mock_redis.mget = AsyncMock(
+            return_value=[orjson.dumps({"outcome": "not_relevant", "reasoning": "cached"})]
+        )
+        service._check_relevance_with_llm = AsyncMock()
+
+        flagged = await service._filter_candidates_with_relevance(
+            [_similarity_candidate("msg_1", "how about biden", "Biden fact-check")], uuid4()
+        )
+
+        assert flagged == []
+        service._check_relevance_with_llm.assert_not_awaited()
+        mock_redis.set.assert_not_awaited()
+
+    def test_cache_key_distinguishes_matched_source(self, relevance_settings):
+        from src.bulk_content_scan.service import BulkContentScanService
+
+        key = BulkContentScanService._get_relevance_cache_key
+
+        assert key(("Claim", "Fact-check A", "https://a.example")) != key(
+            ("Claim", "Fact-check A", "https://b.example")
+        )
+
+    @pytest.mark.asyncio
+    async def test_only_llm_reached_verdicts_are_memoized(
+        self, service, mock_redis, relevance_settings
+    ):
+        from src.bulk_content_scan.schemas import RelevanceOutcome
+
+        verdicts = {
+            "Claim one": (RelevanceOutcome.RELEVANT, "Relevant"),
+            "Claim two": (RelevanceOutcome.INDETERMINATE, "Timed out"),
+        }
+        service._check_relevance_with_llm = AsyncMock(
+            side_effect=lambda original_message, *_: verdicts[original_message]
+        )
+
+        await service._filter_candidates_with_relevance(
+            [
+                _similarity_candidate("msg_1", "Claim one", "Fact-check A"),
+                _similarity_candidate("msg_2", "Claim two", "Fact-check A"),
+            ],
+            uuid4(),
+        )
+
+        mock_redis.set.assert_awaited_once()
+        assert mock_redis.set.await_args.kwargs["ex"] == 3600
+
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently_up_to_limit(self, service, relevance_settings):
+        import asyncio
+
+        from src.bulk_content_scan.schemas import RelevanceOutcome
+
+        relevance_settings.RELEVANCE_CHECK_MAX_CONCURRENCY = 2
+        in_flight = 0
+        peak = 0
+
+        async def slow_check(*_args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return (RelevanceOutcome.RELEVANT, "Relevant")
+
+        service._check_relevance_with_llm = AsyncMock(side_effect=slow_check)
+
+        flagged = await service._filter_candidates_with_relevance(
+            [_similarity_candidate(f"msg_{i}", f"Claim {i}", "Fact-check A") for i in range(6)],
+            uuid4(),
+        )
+
+        assert len(flagged) == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_pairs_are_grouped_into_batched_llm_calls(self, service, relevance_settings):
+        from src.bulk_content_scan.schemas import RelevanceOutcome
+
+        relevance_settings.RELEVANCE_CHECK_BATCH_SIZE = 2
+        service._check_relevance_with_llm = AsyncMock(
+            return_value=(RelevanceOutcome.RELEVANT, "Relevant")
+        )
+
+        async def batch_check(pairs):
+            return [(RelevanceOutcome.NOT_RELEVANT, "batched")] * len(pairs)
+
+        with patch(
+            "src.bulk_content_scan.service.ClaimRelevanceService.check_relevance_batch",
+            AsyncMock(side_effect=batch_check),
+        ) as mock_batch:
+            flagged = await service._filter_candidates_with_relevance(
+                [_similarity_candidate(f"msg_{i}", f"Claim {i}", "Fact-check A") for i in range(3)],
+                uuid4(),
+            )
+
+        assert [f.message_id for f in flagged] == ["msg_2"]
+        mock_batch.assert_awaited_once()
+        service._check_relevance_with_llm.assert_awaited_once()
@@ -9,8 +9,17 @@ from pydantic_ai.messages import ModelResponse, TextPart
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 from pydantic_ai.models.test import TestModel
 
-from src.claim_relevance_check.schemas import RelevanceCheckResult, RelevanceOutcome
-from src.claim_relevance_check.service import ClaimRelevanceService, relevance_agent
+from src.claim_relevance_check.schemas import (
+    RelevanceBatchCheckResult,
+    RelevanceBatchItemResult,
+    RelevanceCheckResult,
+    RelevanceOutcome,
+)
+from src.claim_relevance_check.service import (
+    ClaimRelevanceService,
+    relevance_agent,
+    relevance_batch_agent,
+)
 
 
 @pytest.fixture
@@ -309,3 +318,93 @@ class TestContentFilterRetry:
 
         assert outcome == RelevanceOutcome.INDETERMINATE
         assert "not configured" in reasoning.lower()
+
+
+class TestCheckRelevanceBatch:
+    """Tests for ClaimRelevanceService.check_relevance_batch."""
+
+    PAIRS = [
+        ("The earth is flat.", "Flat earth debunked.", "https://snopes.com/flat"),
+        ("how about biden", "Biden fact-check.", None),
+        ("Vaccines cause autism.", "No link between vaccines and autism.", None),
+    ]
+
+    @pytest.mark.asyncio
+    async def test_all_pairs_answered_in_one_call(self, mock_settings) -> None:
+        batch_model = TestModel(
+            custom_output_args=RelevanceBatchCheckResult(
+                results=[
+                    RelevanceBatchItemResult(case=3, is_relevant=True, reasoning="claim 3"),
+                    RelevanceBatchItemResult(case=1, is_relevant=True, reasoning="claim 1"),
+                    RelevanceBatchItemResult(case=2, is_relevant=False, reasoning="no claim"),
+                ]
+            )
+        )
+        single_model = TestModel(
+            custom_output_args=RelevanceCheckResult(is_relevant=False, reasoning="single")
+        )
+
+        with (
+            relevance_batch_agent.override(model=batch_model),
+            relevance_agent.override(model=single_model),
+        ):
+            service = ClaimRelevanceService(settings=mock_settings)
+            results = await service.check_relevance_batch(self.PAIRS)
+
+        assert results == [
+            (RelevanceOutcome.RELEVANT, "claim 1"),
+            (RelevanceOutcome.NOT_RELEVANT, "no claim"),
+            (RelevanceOutcome.RELEVANT, "claim 3"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unanswered_pair_falls_back_to_single_check(self, mock_settings) -> None:
+        batch_model = TestModel(
+            custom_output_args=RelevanceBatchCheckResult(
+                results=[
+                    RelevanceBatchItemResult(case=1, is_relevant=True, reasoning="claim 1"),
+                    RelevanceBatchItemResult(case=2, is_relevant=False, reasoning="no claim"),
+                ]
+            )
+        )
+        single_model = TestModel(
+            custom_output_args=RelevanceCheckResult(is_relevant=True, reasoning="single")
+        )
+
+        with (
+            relevance_batch_agent.override(model=batch_model),
+            relevance_agent.override(model=single_model),
+        ):
+            service = ClaimRelevanceService(settings=mock_settings)
+            results = await service.check_relevance_batch(self.PAIRS)
+
+        assert results[2] == (RelevanceOutcome.RELEVANT, "single")
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_checks_each_pair_individually(self, mock_settings) -> None:
+        def raise_error(messages: list, agent_info: AgentInfo) -> ModelResponse:
+            raise Exception("LLM service unavailable")
+
+        single_model = TestModel(
+            custom_output_args=RelevanceCheckResult(is_relevant=False, reasoning="single")
+        )
+
+        with (
+            relevance_batch_agent.override(model=FunctionModel(raise_error)),
+            relevance_agent.override(model=single_model),
+        ):
+            service = ClaimRelevanceService(settings=mock_settings)
+            results = await service.check_relevance_batch(self.PAIRS)
+
+        assert results == [(RelevanceOutcome.NOT_RELEVANT, "single")] * 3
+
+    @pytest.mark.asyncio
+    async def test_disabled_feature_flag_skips_batch_call(self, mock_settings) -> None:
+        mock_settings.RELEVANCE_CHECK_ENABLED = False
+
+        with patch.object(relevance_batch_agent, "run") as mock_run:
+            service = ClaimRelevanceService(settings=mock_settings)
+            results = await service.check_relevance_batch(self.PAIRS)
+
+        mock_run.assert_not_called()
+        assert [outcome for outcome, _ in results] == [RelevanceOutcome.RELEVANT] * 3
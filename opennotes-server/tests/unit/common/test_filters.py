@@ -7,6 +7,7 @@ This module tests the core filter operators in src/common/filters.py:
 - Null checking (isnull)
 - Text matching (like, ilike)
 - Array operations (contains, overlap)
+- Keyset pagination conditions (SortKey, cursors)
 """
 
 from datetime import UTC, datetime
@@ -17,7 +18,15 @@ from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
-from src.common.filters import FilterBuilder, FilterField, FilterOperator, FilterResult, JoinSpec
+from src.common.filters import (
+    FilterBuilder,
+    FilterField,
+    FilterOperator,
+    FilterResult,
+    JoinSpec,
+    SortKey,
+)
+from src.common.jsonapi import encode_cursor
 
 
 class Base(DeclarativeBase):
@@ -759,3 +768,62 @@ class TestBackwardCompatibility:
         builder = FilterBuilder(FilterField(TestModel.status, operators=[FilterOperator.EQ]))
         result = builder.build(status=None)
         assert not result
+
+
+class TestKeysetPagination:
+    """Tests for SortKey and FilterBuilder keyset (cursor) helpers."""
+
+    def test_sort_key_order_clause_defaults_to_descending(self):
+        assert compile_condition(SortKey(TestModel.id).order_clause()) == "test_models.id DESC"
+        assert (
+            compile_condition(SortKey(TestModel.id, descending=False).order_clause())
+            == "test_models.id ASC"
+        )
+
+    def test_sort_key_coerces_cursor_values(self):
+        created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+        assert SortKey(TestModel.created_at).coerce(created_at.isoformat()) == created_at
+        assert SortKey(TestModel.count).coerce("5") == 5
+
+    def test_keyset_condition_uses_row_value_comparison(self):
+        sort_keys = [SortKey(TestModel.count), SortKey(TestModel.id)]
+        cursor = FilterBuilder.encode_keyset_cursor(
+            sort_keys, TestModel(id=7, count=3, created_at=datetime.now(UTC))
+        )
+
+        condition = FilterBuilder.build_keyset_condition(sort_keys, cursor)
+
+        assert compile_condition(condition) == "(test_models.count, test_models.id) < (3, 7)"
+
+    def test_keyset_condition_ascending(self):
+        sort_keys = [SortKey(TestModel.count, descending=False), SortKey(TestModel.id, False)]
+        cursor = encode_cursor([3, 7])
+
+        condition = FilterBuilder.build_keyset_condition(sort_keys, cursor)
+
+        assert compile_condition(condition) == "(test_models.count, test_models.id) > (3, 7)"
+
+    def test_keyset_condition_mixed_directions_expands_prefixes(self):
+        sort_keys = [SortKey(TestModel.count), SortKey(TestModel.id, descending=False)]
+        cursor = encode_cursor([3, 7])
+
+        sql = compile_condition(FilterBuilder.build_keyset_condition(sort_keys, cursor))
+
+        assert "test_models.count < 3" in sql
+        assert "test_models.count = 3 AND test_models.id > 7" in sql
+        assert " OR " in sql
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor!",
+            encode_cursor([3]),
+            encode_cursor(["three", 7]),
+        ],
+    )
+    def test_keyset_condition_rejects_invalid_cursor(self, cursor):
+        sort_keys = [SortKey(TestModel.count), SortKey(TestModel.id)]
+
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            FilterBuilder.build_keyset_condition(sort_keys, cursor)
@@ -0,0 +1,205 @@
+"""Unit tests for query-level pagination in src/common/pagination.py."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.responses import JSONResponse
+from sqlalchemy import Integer, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from starlette.requests import Request
+
+from src.common.filters import SortKey
+from src.common.jsonapi import decode_cursor, encode_cursor
+from src.common.pagination import (
+    COUNT_CAP,
+    INVALID_CURSOR_DETAIL,
+    CountMode,
+    PageResult,
+    paginate_jsonapi_query,
+    paginate_query,
+)
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class PagedModel(Base):
+    __tablename__ = "paged_models"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    rank: Mapped[int] = mapped_column(Integer)
+
+
+SORT_KEYS = [SortKey(PagedModel.rank), SortKey(PagedModel.id)]
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def _mock_db(rows: list, total: int | None = None) -> AsyncMock:
+    page_result = MagicMock()
+    page_result.scalars.return_value.all.return_value = rows
+    results = [page_result]
+    if total is not None:
+        count_result = MagicMock()
+        count_result.scalar.return_value = total
+        results.insert(0, count_result)
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=results)
+    return db
+
+
+def _rows(*pairs: tuple[int, int]) -> list[SimpleNamespace]:
+    return [SimpleNamespace(id=id_, rank=rank) for rank, id_ in pairs]
+
+
+def _request(query_string: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "scheme": "http",
+            "server": ("test", 80),
+            "path": "/api/v2/items",
+            "query_string": query_string.encode(),
+            "headers": [],
+        }
+    )
+
+
+class TestPaginateQuery:
+    @pytest.mark.asyncio
+    async def test_page_number_mode_uses_offset_and_lookahead(self):
+        db = _mock_db(_rows((9, 1), (8, 2), (7, 3)), total=25)
+
+        page = await paginate_query(db, select(PagedModel), SORT_KEYS, page_number=3, page_size=2)
+
+        page_sql = _compile(db.execute.await_args_list[1].args[0])
+        assert "ORDER BY paged_models.rank DESC, paged_models.id DESC" in page_sql
+        assert "LIMIT 3 OFFSET 4" in page_sql
+        assert [item.id for item in page.items] == [1, 2]
+        assert page.has_next is True
+        assert page.next_cursor is None
+        assert page.total == 25
+        assert page.page_number == 3
+
+    @pytest.mark.asyncio
+    async def test_cursor_mode_applies_keyset_and_returns_next_cursor(self):
+        db = _mock_db(_rows((5, 10), (5, 9), (4, 20)), total=None)
+
+        page = await paginate_query(
+            db,
+            select(PagedModel),
+            SORT_KEYS,
+            page_number=1,
+            page_size=2,
+            after=encode_cursor([6, 3]),
+            count_mode=CountMode.NONE,
+        )
+
+        db.execute.assert_awaited_once()
+        page_sql = _compile(db.execute.await_args.args[0])
+        assert "(paged_models.rank, paged_models.id) < (6, 3)" in page_sql
+        assert "OFFSET" not in page_sql
+        assert page.page_number is None
+        assert page.total is None
+        assert decode_cursor(page.next_cursor) == [5, 9]
+
+    @pytest.mark.asyncio
+    async def test_empty_cursor_starts_cursor_pagination(self):
+        db = _mock_db(_rows((5, 10)), total=1)
+
+        page = await paginate_query(
+            db, select(PagedModel), SORT_KEYS, page_number=1, page_size=2, after=""
+        )
+
+        page_sql = _compile(db.execute.await_args_list[1].args[0])
+        assert "WHERE" not in page_sql
+        assert page.page_number is None
+        assert page.has_next is False
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises_before_querying(self):
+        db = _mock_db([], total=0)
+
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            await paginate_query(
+                db, select(PagedModel), SORT_KEYS, page_number=1, page_size=2, after="%%%"
+            )
+
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_jsonapi_query_returns_400_for_invalid_cursor(self):
+        db = _mock_db([], total=0)
+
+        response = await paginate_jsonapi_query(
+            db, select(PagedModel), SORT_KEYS, page_number=1, page_size=2, after="%%%"
+        )
+
+        assert isinstance(response, JSONResponse)
+        assert response.status_code == 400
+        body = json.loads(bytes(response.body))
+        assert body["errors"][0]["detail"] == INVALID_CURSOR_DETAIL
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_jsonapi_query_returns_page_for_valid_cursor(self):
+        db = _mock_db(_rows((5, 10)), total=1)
+
+        page = await paginate_jsonapi_query(
+            db, select(PagedModel), SORT_KEYS, page_number=1, page_size=2, after=""
+        )
+
+        assert isinstance(page, PageResult)
+        assert page.has_next is False
+
+    @pytest.mark.asyncio
+    async def test_capped_count_limits_counted_rows(self):
+        db = _mock_db(_rows((5, 10)), total=COUNT_CAP + 1)
+
+        page = await paginate_query(
+            db,
+            select(PagedModel),
+            SORT_KEYS,
+            page_number=1,
+            page_size=2,
+            count_mode=CountMode.CAPPED,
+        )
+
+        count_sql = _compile(db.execute.await_args_list[0].args[0])
+        assert f"LIMIT {COUNT_CAP + 1}" in count_sql
+        assert page.total == COUNT_CAP
+        assert page.count_capped is True
+        assert page.meta().count_capped is True
+
+
+class TestPageResultLinks:
+    def test_links_preserve_filters_and_count_mode(self):
+        page = PageResult(
+            items=[],
+            page_size=2,
+            page_number=None,
+            cursor="abc",
+            next_cursor="def",
+            has_next=True,
+            total=None,
+        )
+
+        links = page.links(
+            _request("filter[status]=x&page[after]=abc&page[count]=none"),
+            describedby="/api/v2/openapi.json",
+        )
+
+        assert links.next_ is not None
+        assert "filter[status]=x" in links.next_
+        assert "page[count]=none" in links.next_
+        assert "page[after]=def" in links.next_
+        assert "page[after]=abc" not in links.next_
+        assert links.describedby == "/api/v2/openapi.json"
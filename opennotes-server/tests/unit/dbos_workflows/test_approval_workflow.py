@@ -9,6 +9,7 @@ Tests cover:
 - Error aggregation respects MAX_STORED_ERRORS
 - Import service dispatches via wrapper function
 - Bulk UPDATE failure triggers db.rollback()
+- Promotion is one batch call with per-candidate failures reported
 - start_batch_job_sync failure aborts workflow
 - Progress update guard skips total_scanned==0
 """
@@ -517,7 +518,7 @@ class TestProcessSingleBatchRollback:
 
         errors: list[str] = []
 
-        mock_promote = AsyncMock(return_value=True)
+        mock_promote = AsyncMock()
 
         with (
             patch(
@@ -525,7 +526,7 @@ class TestProcessSingleBatchRollback:
                 return_value="true",
             ),
             patch(
-                "src.fact_checking.import_pipeline.promotion.promote_candidate",
+                "src.fact_checking.import_pipeline.promotion.promote_candidates_batch",
                 mock_promote,
             ),
         ):
@@ -545,6 +546,135 @@ class TestProcessSingleBatchRollback:
         mock_promote.assert_not_awaited()
 
 
+class TestProcessSingleBatchPromotion:
+    @pytest.mark.asyncio
+    async def test_batch_promoted_in_one_call_with_failures_reported_individually(
+        self,
+    ) -> None:
+        from src.dbos_workflows.approval_workflow import _process_single_batch
+        from src.fact_checking.import_pipeline.promotion import BatchPromotionResult
+
+        candidates = []
+        for _ in range(3):
+            candidate = MagicMock()
+            candidate.id = uuid4()
+            candidate.predicted_ratings = {"true": 0.95, "false": 0.05}
+            candidates.append(candidate)
+
+        mock_db = AsyncMock()
+        errors: list[str] = []
+        mock_promote = AsyncMock(
+            return_value=BatchPromotionResult(
+                promoted_ids=[candidates[0].id, candidates[1].id],
+                fact_check_item_ids=[uuid4(), uuid4()],
+                failures={candidates[2].id: "value too long"},
+            )
+        )
+
+        with (
+            patch(
+                "src.dbos_workflows.approval_workflow.extract_high_confidence_rating",
+                return_value="true",
+            ),
+            patch(
+                "src.fact_checking.import_pipeline.promotion.promote_candidates_batch",
+                mock_promote,
+            ),
+        ):
+            updated, promoted, failed, processed = await _process_single_batch(
+                db=mock_db,
+                batch=candidates,
+                threshold=0.9,
+                auto_promote=True,
+                errors=errors,
+            )
+
+        assert (updated, promoted, failed, processed) == (3, 2, 1, 3)
+        mock_promote.assert_awaited_once_with(mock_db, [c.id for c in candidates])
+        assert errors == [f"Failed to promote {candidates[2].id}: value too long"]
+        mock_db.execute.assert_awaited_once()
+        mock_db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_validation_rejects_are_skipped_not_failed(self) -> None:
+        from src.dbos_workflows.approval_workflow import _process_single_batch
+        from src.fact_checking.import_pipeline.promotion import BatchPromotionResult
+
+        candidates = []
+        for _ in range(2):
+            candidate = MagicMock()
+            candidate.id = uuid4()
+            candidate.predicted_ratings = {"true": 0.95, "false": 0.05}
+            candidates.append(candidate)
+
+        errors: list[str] = []
+        mock_promote = AsyncMock(
+            return_value=BatchPromotionResult(
+                promoted_ids=[candidates[0].id],
+                fact_check_item_ids=[uuid4()],
+                rejected={candidates[1].id: "has no content"},
+            )
+        )
+
+        with (
+            patch(
+                "src.dbos_workflows.approval_workflow.extract_high_confidence_rating",
+                return_value="true",
+            ),
+            patch(
+                "src.fact_checking.import_pipeline.promotion.promote_candidates_batch",
+                mock_promote,
+            ),
+        ):
+            result = await _process_single_batch(
+                db=AsyncMock(),
+                batch=candidates,
+                threshold=0.9,
+                auto_promote=True,
+                errors=errors,
+            )
+
+        assert result == (2, 1, 0, 2)
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_promotion_error_keeps_committed_rating_updates(self) -> None:
+        from src.dbos_workflows.approval_workflow import _process_single_batch
+
+        candidates = []
+        for _ in range(2):
+            candidate = MagicMock()
+            candidate.id = uuid4()
+            candidate.predicted_ratings = {"true": 0.95, "false": 0.05}
+            candidates.append(candidate)
+
+        mock_db = AsyncMock()
+        errors: list[str] = []
+
+        with (
+            patch(
+                "src.dbos_workflows.approval_workflow.extract_high_confidence_rating",
+                return_value="true",
+            ),
+            patch(
+                "src.fact_checking.import_pipeline.promotion.promote_candidates_batch",
+                AsyncMock(side_effect=RuntimeError("connection lost")),
+            ),
+        ):
+            result = await _process_single_batch(
+                db=mock_db,
+                batch=candidates,
+                threshold=0.9,
+                auto_promote=True,
+                errors=errors,
+            )
+
+        assert result == (2, 0, 2, 2)
+        mock_db.commit.assert_awaited_once()
+        mock_db.rollback.assert_awaited_once()
+        assert errors == ["Bulk promotion failed for 2 candidates: connection lost"]
+
+
 class TestProgressUpdateGuard:
     def test_progress_not_updated_when_total_scanned_zero(self) -> None:
         """When total_scanned==0, modulo check should not trigger progress update."""
@@ -4277,7 +4277,9 @@ class TestFlashpointScanStepInnerLogic:
         mock_service_instance = MagicMock()
         mock_service_instance._build_message_id_index.return_value = {}
         mock_service_instance._get_context_for_message.return_value = []
-        mock_service_instance._flashpoint_scan_candidate = AsyncMock(return_value=candidate)
+        mock_service_instance._flashpoint_scan_candidates_batch = AsyncMock(
+            return_value=[candidate]
+        )
 
         mock_session = AsyncMock()
         mock_redis = MagicMock()
@@ -4346,7 +4348,7 @@ class TestFlashpointScanStepInnerLogic:
             "flashpoint_candidates_key": "test:flashpoint",
             "candidate_count": 1,
         }
-        mock_service_instance._flashpoint_scan_candidate.assert_awaited_once()
+        mock_service_instance._flashpoint_scan_candidates_batch.assert_awaited_once()
         mock_store.assert_awaited_once_with(
             mock_redis,
             "test:flashpoint",
@@ -4361,7 +4363,7 @@ class TestFlashpointScanStepInnerLogic:
         mock_service_instance = MagicMock()
         mock_service_instance._build_message_id_index.return_value = {}
         mock_service_instance._get_context_for_message.return_value = []
-        mock_service_instance._flashpoint_scan_candidate = AsyncMock()
+        mock_service_instance._flashpoint_scan_candidates_batch = AsyncMock()
 
         mock_session = AsyncMock()
 
@@ -4422,7 +4424,7 @@ class TestFlashpointScanStepInnerLogic:
             )
 
         assert result == {"flashpoint_candidates_key": "", "candidate_count": 0}
-        mock_service_instance._flashpoint_scan_candidate.assert_not_awaited()
+        mock_service_instance._flashpoint_scan_candidates_batch.assert_not_awaited()
         mock_store.assert_not_awaited()
 
     def test_skips_candidate_writes_when_scan_becomes_terminal_before_persist(self) -> None:
@@ -4435,7 +4437,9 @@ class TestFlashpointScanStepInnerLogic:
         mock_service_instance = MagicMock()
         mock_service_instance._build_message_id_index.return_value = {}
         mock_service_instance._get_context_for_message.return_value = []
-        mock_service_instance._flashpoint_scan_candidate = AsyncMock(return_value=candidate)
+        mock_service_instance._flashpoint_scan_candidates_batch = AsyncMock(
+            return_value=[candidate]
+        )
 
         mock_session = AsyncMock()
 
@@ -4496,7 +4500,7 @@ class TestFlashpointScanStepInnerLogic:
             )
 
         assert result == {"flashpoint_candidates_key": "", "candidate_count": 0}
-        mock_service_instance._flashpoint_scan_candidate.assert_awaited_once()
+        mock_service_instance._flashpoint_scan_candidates_batch.assert_awaited_once()
         mock_store.assert_not_awaited()
 
 
@@ -4545,7 +4549,9 @@ class TestFlashpointScanStepTimeoutAndBatchCap:
         mock_service_instance = MagicMock()
         mock_service_instance._build_message_id_index.return_value = {}
         mock_service_instance._get_context_for_message.return_value = []
-        mock_service_instance._flashpoint_scan_candidate = AsyncMock(return_value=candidate)
+        mock_service_instance._flashpoint_scan_candidates_batch = AsyncMock(
+            return_value=[candidate]
+        )
 
         mock_session = AsyncMock()
         mock_redis = MagicMock()
@@ -4609,7 +4615,9 @@ class TestFlashpointScanStepTimeoutAndBatchCap:
                 context_maps_key="test:context",
             )
 
-        assert mock_service_instance._flashpoint_scan_candidate.await_count == 50
+        mock_service_instance._flashpoint_scan_candidates_batch.assert_awaited_once()
+        scanned = mock_service_instance._flashpoint_scan_candidates_batch.await_args.args[1]
+        assert len(scanned) == 50
 
     def test_flashpoint_batch_cap_logs_warning_when_exceeded(self) -> None:
         from src.dbos_workflows.content_scan_workflow import flashpoint_scan_step
@@ -4621,7 +4629,9 @@ class TestFlashpointScanStepTimeoutAndBatchCap:
         mock_service_instance = MagicMock()
         mock_service_instance._build_message_id_index.return_value = {}
         mock_service_instance._get_context_for_message.return_value = []
-        mock_service_instance._flashpoint_scan_candidate = AsyncMock(return_value=candidate)
+        mock_service_instance._flashpoint_scan_candidates_batch = AsyncMock(
+            return_value=[candidate]
+        )
 
         mock_session = AsyncMock()
         mock_redis = MagicMock()
@@ -4710,7 +4720,9 @@ class TestFlashpointScanStepTimeoutAndBatchCap:
         mock_service_instance = MagicMock()
         mock_service_instance._build_message_id_index.return_value = {}
         mock_service_instance._get_context_for_message.return_value = []
-        mock_service_instance._flashpoint_scan_candidate = AsyncMock(return_value=candidate)
+        mock_service_instance._flashpoint_scan_candidates_batch = AsyncMock(
+            side_effect=lambda _scan_id, msgs, *_args: [candidate] * len(msgs)
+        )
 
         mock_session = AsyncMock()
         mock_redis = MagicMock()
@@ -4774,7 +4786,9 @@ class TestFlashpointScanStepTimeoutAndBatchCap:
                 context_maps_key="test:context",
             )
 
-        assert mock_service_instance._flashpoint_scan_candidate.await_count == 30
+        mock_service_instance._flashpoint_scan_candidates_batch.assert_awaited_once()
+        scanned = mock_service_instance._flashpoint_scan_candidates_batch.await_args.args[1]
+        assert len(scanned) == 30
         assert result["candidate_count"] == 30
 
 
@@ -1,8 +1,8 @@
 """Tests for DBOS rechunk previously-seen workflow.
 
 Tests the rechunk previously-seen workflow components including
-process_previously_seen_item step, the main workflow function,
-the dispatch function, and the sync wrapper.
+the process_previously_seen_item and process_previously_seen_batch steps,
+the main workflow function, the dispatch function, and the sync wrappers.
 
 Note: Tests mock the synchronous helper functions that wrap async operations
 since DBOS steps/workflows are synchronous. The actual DBOS decorators
@@ -146,6 +146,111 @@ class TestChunkAndEmbedPreviouslySeenSync:
             assert mock_run_sync.call_count == 1
 
 
+class TestProcessPreviouslySeenBatch:
+    def test_reports_chunks_and_missing_items(self) -> None:
+        from src.dbos_workflows.rechunk_workflow import process_previously_seen_batch
+
+        found_id = uuid4()
+        missing_id = uuid4()
+        community_server_id = uuid4()
+
+        with patch(
+            "src.dbos_workflows.rechunk_workflow.chunk_and_embed_previously_seen_batch_sync"
+        ) as mock_chunk:
+            mock_chunk.return_value = {found_id: 3}
+
+            result = process_previously_seen_batch.__wrapped__(
+                item_ids=[str(found_id), str(missing_id)],
+                community_server_id=str(community_server_id),
+            )
+
+        mock_chunk.assert_called_once_with(
+            previously_seen_ids=[found_id, missing_id],
+            community_server_id=community_server_id,
+        )
+        assert result == {"chunks_created": {str(found_id): 3}, "missing": [str(missing_id)]}
+
+    def test_raises_on_processing_failure(self) -> None:
+        from src.dbos_workflows.rechunk_workflow import process_previously_seen_batch
+
+        with patch(
+            "src.dbos_workflows.rechunk_workflow.chunk_and_embed_previously_seen_batch_sync"
+        ) as mock_chunk:
+            mock_chunk.side_effect = RuntimeError("Embedding service unavailable")
+
+            with pytest.raises(RuntimeError, match="Embedding service unavailable"):
+                process_previously_seen_batch.__wrapped__(
+                    item_ids=[str(uuid4())],
+                    community_server_id=str(uuid4()),
+                )
+
+
+class TestChunkAndEmbedPreviouslySeenBatchSync:
+    def test_embeds_all_messages_in_one_service_call(self) -> None:
+        from src.dbos_workflows.rechunk_workflow import (
+            chunk_and_embed_previously_seen_batch_sync,
+        )
+
+        with_text = uuid4()
+        empty = uuid4()
+        community_server_id = uuid4()
+
+        mock_service = MagicMock()
+        mock_chunking_service = MagicMock()
+        mock_chunking_service.chunk_text.return_value = ["chunk1", "chunk2"]
+
+        @contextmanager
+        def mock_use_chunking_sync():
+            yield mock_chunking_service
+
+        with (
+            patch("src.dbos_workflows.rechunk_workflow.run_sync") as mock_run_sync,
+            patch(
+                "src.dbos_workflows.rechunk_workflow.get_chunk_embedding_service",
+                return_value=mock_service,
+            ),
+            patch(
+                "src.dbos_workflows.rechunk_workflow.use_chunking_service_sync",
+                side_effect=mock_use_chunking_sync,
+            ),
+        ):
+            mock_run_sync.side_effect = [
+                {with_text: "some text content", empty: ""},
+                {with_text: 2},
+            ]
+
+            result = chunk_and_embed_previously_seen_batch_sync(
+                previously_seen_ids=[with_text, empty, uuid4()],
+                community_server_id=community_server_id,
+            )
+
+        assert result == {with_text: 2, empty: 0}
+        assert mock_run_sync.call_count == 2
+        mock_chunking_service.chunk_text.assert_called_once_with("some text content")
+
+    def test_skips_embedding_when_no_content(self) -> None:
+        from src.dbos_workflows.rechunk_workflow import (
+            chunk_and_embed_previously_seen_batch_sync,
+        )
+
+        empty = uuid4()
+
+        with (
+            patch("src.dbos_workflows.rechunk_workflow.run_sync") as mock_run_sync,
+            patch("src.dbos_workflows.rechunk_workflow.get_chunk_embedding_service"),
+            patch("src.dbos_workflows.rechunk_workflow.use_chunking_service_sync"),
+        ):
+            mock_run_sync.return_value = {empty: ""}
+
+            result = chunk_and_embed_previously_seen_batch_sync(
+                previously_seen_ids=[empty],
+                community_server_id=uuid4(),
+            )
+
+        assert result == {empty: 0}
+        assert mock_run_sync.call_count == 1
+
+
 class TestRechunkPreviouslySeenWorkflow:
     def test_workflow_processes_all_items(self) -> None:
         from src.dbos_workflows.rechunk_workflow import rechunk_previously_seen_workflow
@@ -156,6 +261,9 @@ class TestRechunkPreviouslySeenWorkflow:
 
         with (
             patch("src.dbos_workflows.rechunk_workflow.TokenGate"),
+            patch(
+                "src.dbos_workflows.rechunk_workflow.process_previously_seen_batch"
+            ) as mock_batch,
             patch(
                 "src.dbos_workflows.rechunk_workflow.process_previously_seen_item"
             ) as mock_process,
@@ -166,7 +274,10 @@ class TestRechunkPreviouslySeenWorkflow:
             patch("src.dbos_workflows.rechunk_workflow.DBOS") as mock_dbos,
         ):
             mock_dbos.workflow_id = "test-workflow-id"
-            mock_process.return_value = {"success": True, "chunks_created": 2}
+            mock_batch.return_value = {
+                "chunks_created": dict.fromkeys(item_ids, 2),
+                "missing": [],
+            }
             mock_progress.return_value = True
             mock_finalize.return_value = True
 
@@ -176,10 +287,45 @@ class TestRechunkPreviouslySeenWorkflow:
                 item_ids=item_ids,
             )
 
-            assert mock_process.call_count == 3
+            mock_batch.assert_called_once_with(
+                item_ids=item_ids, community_server_id=community_server_id
+            )
+            mock_process.assert_not_called()
             assert result["completed_count"] == 3
             assert result["failed_count"] == 0
 
+    def test_workflow_counts_missing_items_as_failed(self) -> None:
+        from src.dbos_workflows.rechunk_workflow import rechunk_previously_seen_workflow
+
+        batch_job_id = str(uuid4())
+        community_server_id = str(uuid4())
+        item_ids = [str(uuid4()) for _ in range(3)]
+
+        with (
+            patch("src.dbos_workflows.rechunk_workflow.TokenGate"),
+            patch(
+                "src.dbos_workflows.rechunk_workflow.process_previously_seen_batch"
+            ) as mock_batch,
+            patch("src.dbos_workflows.rechunk_workflow.update_batch_job_progress_sync"),
+            patch("src.dbos_workflows.rechunk_workflow.finalize_batch_job_sync", return_value=True),
+            patch("src.dbos_workflows.rechunk_workflow.DBOS") as mock_dbos,
+        ):
+            mock_dbos.workflow_id = "test-workflow-id"
+            mock_batch.return_value = {
+                "chunks_created": dict.fromkeys(item_ids[:2], 1),
+                "missing": [item_ids[2]],
+            }
+
+            result = rechunk_previously_seen_workflow.__wrapped__(
+                batch_job_id=batch_job_id,
+                community_server_id=community_server_id,
+                item_ids=item_ids,
+            )
+
+            assert result["completed_count"] == 2
+            assert result["failed_count"] == 1
+            assert result["errors"][0]["item_id"] == item_ids[2]
+
     def test_workflow_handles_item_failure(self) -> None:
         from src.dbos_workflows.rechunk_workflow import rechunk_previously_seen_workflow
 
@@ -198,6 +344,10 @@ class TestRechunkPreviouslySeenWorkflow:
 
         with (
             patch("src.dbos_workflows.rechunk_workflow.TokenGate"),
+            patch(
+                "src.dbos_workflows.rechunk_workflow.process_previously_seen_batch",
+                side_effect=RuntimeError("Batch failed"),
+            ),
             patch(
                 "src.dbos_workflows.rechunk_workflow.process_previously_seen_item"
             ) as mock_process,
@@ -231,6 +381,10 @@ class TestRechunkPreviouslySeenWorkflow:
 
         with (
             patch("src.dbos_workflows.rechunk_workflow.TokenGate"),
+            patch(
+                "src.dbos_workflows.rechunk_workflow.process_previously_seen_batch",
+                side_effect=RuntimeError("Batch failed"),
+            ),
             patch(
                 "src.dbos_workflows.rechunk_workflow.process_previously_seen_item"
             ) as mock_process,
@@ -260,6 +414,10 @@ class TestRechunkPreviouslySeenWorkflow:
 
         with (
             patch("src.dbos_workflows.rechunk_workflow.TokenGate"),
+            patch(
+                "src.dbos_workflows.rechunk_workflow.process_previously_seen_batch",
+                side_effect=RuntimeError("Batch failed"),
+            ),
             patch(
                 "src.dbos_workflows.rechunk_workflow.process_previously_seen_item"
             ) as mock_process,
@@ -294,8 +452,8 @@ class TestRechunkPreviouslySeenWorkflow:
         with (
             patch("src.dbos_workflows.rechunk_workflow.TokenGate"),
             patch(
-                "src.dbos_workflows.rechunk_workflow.process_previously_seen_item"
-            ) as mock_process,
+                "src.dbos_workflows.rechunk_workflow.process_previously_seen_batch"
+            ) as mock_batch,
             patch(
                 "src.dbos_workflows.rechunk_workflow.update_batch_job_progress_sync"
             ) as mock_progress,
@@ -303,7 +461,10 @@ class TestRechunkPreviouslySeenWorkflow:
             patch("src.dbos_workflows.rechunk_workflow.DBOS") as mock_dbos,
         ):
             mock_dbos.workflow_id = "test-workflow-id"
-            mock_process.return_value = {"success": True, "chunks_created": 1}
+            mock_batch.side_effect = lambda item_ids, community_server_id: {
+                "chunks_created": dict.fromkeys(item_ids, 1),
+                "missing": [],
+            }
             mock_progress.return_value = True
             mock_finalize.return_value = True
 
@@ -316,6 +477,7 @@ class TestRechunkPreviouslySeenWorkflow:
 
             progress_calls = mock_progress.call_count
             assert progress_calls == 2
+            assert [len(c.kwargs["item_ids"]) for c in mock_batch.call_args_list] == [100, 50]
 
 
 class TestRechunkPreviouslySeenWorkflowName:
@@ -496,6 +658,10 @@ class TestCircuitBreakerInPreviouslySeenWorkflow:
 
         with (
             patch("src.dbos_workflows.rechunk_workflow.TokenGate"),
+            patch(
+                "src.dbos_workflows.rechunk_workflow.process_previously_seen_batch",
+                side_effect=RuntimeError("Batch failed"),
+            ),
             patch(
                 "src.dbos_workflows.rechunk_workflow.process_previously_seen_item"
             ) as mock_process,
@@ -536,6 +702,10 @@ class TestCircuitBreakerInPreviouslySeenWorkflow:
 
         with (
             patch("src.dbos_workflows.rechunk_workflow.TokenGate"),
+            patch(
+                "src.dbos_workflows.rechunk_workflow.process_previously_seen_batch",
+                side_effect=RuntimeError("Batch failed"),
+            ),
             patch(
                 "src.dbos_workflows.rechunk_workflow.process_previously_seen_item"
             ) as mock_process,
@@ -140,8 +140,8 @@ class TestRechunkPreviouslySeenTokenGated:
         with (
             patch("src.dbos_workflows.rechunk_workflow.TokenGate") as mock_gate_cls,
             patch(
-                "src.dbos_workflows.rechunk_workflow.process_previously_seen_item"
-            ) as mock_process,
+                "src.dbos_workflows.rechunk_workflow.process_previously_seen_batch"
+            ) as mock_batch,
             patch("src.dbos_workflows.rechunk_workflow.update_batch_job_progress_sync"),
             patch("src.dbos_workflows.rechunk_workflow.finalize_batch_job_sync", return_value=True),
             patch("src.dbos_workflows.rechunk_workflow.DBOS") as mock_dbos,
@@ -149,7 +149,7 @@ class TestRechunkPreviouslySeenTokenGated:
             mock_dbos.workflow_id = "wf-test"
             mock_gate = MagicMock()
             mock_gate_cls.return_value = mock_gate
-            mock_process.return_value = {"success": True}
+            mock_batch.return_value = {"chunks_created": dict.fromkeys(item_ids, 1), "missing": []}
 
             rechunk_previously_seen_workflow.__wrapped__(
                 batch_job_id=batch_job_id,
@@ -170,6 +170,10 @@ class TestRechunkPreviouslySeenTokenGated:
 
         with (
             patch("src.dbos_workflows.rechunk_workflow.TokenGate") as mock_gate_cls,
+            patch(
+                "src.dbos_workflows.rechunk_workflow.process_previously_seen_batch",
+                side_effect=RuntimeError("Batch failed"),
+            ),
             patch(
                 "src.dbos_workflows.rechunk_workflow.process_previously_seen_item"
             ) as mock_process,
@@ -339,8 +339,10 @@ class TestWorkerWorkflowRegistration:
                 "content_scan_orchestration_workflow",
                 "process_content_scan_batch",
                 "ai_note_generation_workflow",
+                "ai_note_batch_generation_workflow",
                 "vision_description_workflow",
                 "_audit_log_wrapper_workflow",
+                "_audit_log_batch_workflow",
                 "cleanup_stale_batch_jobs_workflow",
                 "monitor_stuck_batch_jobs_workflow",
                 "fact_check_import_workflow",
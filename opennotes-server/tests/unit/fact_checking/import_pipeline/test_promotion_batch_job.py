@@ -4,6 +4,7 @@ Unit tests for promotion batch job helpers.
 Remaining tests verify:
 - _validate_candidate_for_promotion helper behavior
 - promote_candidate function with chunking routing (DBOS enqueue)
+- promote_candidates_batch set-based promotion and per-candidate fallback
 """
 
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -239,3 +240,112 @@ class TestPromotionChunkingRouting:
 
             assert result is True
             mock_enqueue.assert_called_once()
+
+
+def _promotable_candidate(status: str = "scraped") -> MagicMock:
+    candidate = MagicMock()
+    candidate.id = uuid4()
+    candidate.content = "Valid content for promotion"
+    candidate.rating = "Mixed"
+    candidate.status = status
+    candidate.dataset_name = "test_dataset"
+    candidate.dataset_tags = ["tag1"]
+    candidate.title = "Test Title"
+    candidate.summary = "Test summary"
+    candidate.source_url = "https://example.com"
+    candidate.original_id = "orig123"
+    candidate.published_date = None
+    candidate.rating_details = None
+    candidate.extracted_data = {}
+    return candidate
+
+
+def _batch_session(candidates: list[MagicMock], *write_results) -> AsyncMock:
+    select_result = MagicMock()
+    select_result.scalars.return_value.all.return_value = candidates
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=[select_result, *write_results])
+    session.begin_nested = MagicMock(return_value=MagicMock())
+    return session
+
+
+def _insert_result(*item_ids) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = list(item_ids)
+    return result
+
+
+class TestPromoteCandidatesBatch:
+    """Set-based promotion via promote_candidates_batch."""
+
+    @pytest.mark.asyncio
+    async def test_valid_candidates_promoted_with_one_insert_and_one_update(self):
+        from src.fact_checking.import_pipeline.promotion import promote_candidates_batch
+
+        candidates = [_promotable_candidate() for _ in range(3)]
+        item_ids = [uuid4() for _ in candidates]
+        session = _batch_session(candidates, _insert_result(*item_ids), MagicMock())
+
+        with patch(
+            "src.batch_jobs.rechunk_service.enqueue_single_fact_check_chunk",
+            new_callable=AsyncMock,
+            return_value=True,
+        ) as mock_enqueue:
+            outcome = await promote_candidates_batch(session, [c.id for c in candidates])
+
+        assert outcome.promoted_ids == [c.id for c in candidates]
+        assert outcome.fact_check_item_ids == item_ids
+        assert outcome.failures == {}
+        assert session.execute.await_count == 3
+        insert_rows = session.execute.await_args_list[1].args[1]
+        assert [row["title"] for row in insert_rows] == ["Test Title"] * 3
+        session.begin_nested.assert_called_once()
+        session.commit.assert_awaited_once()
+        assert mock_enqueue.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_and_already_promoted_candidates_are_not_written(self):
+        from src.fact_checking.import_pipeline.promotion import promote_candidates_batch
+
+        already = _promotable_candidate(status="promoted")
+        unrated = _promotable_candidate()
+        unrated.rating = None
+        missing_id = uuid4()
+        session = _batch_session([already, unrated])
+
+        outcome = await promote_candidates_batch(session, [already.id, unrated.id, missing_id])
+
+        assert outcome.promoted_ids == [already.id]
+        assert outcome.fact_check_item_ids == []
+        assert set(outcome.rejected) == {unrated.id, missing_id}
+        assert "human-approved rating" in outcome.rejected[unrated.id]
+        assert outcome.failures == {}
+        assert session.execute.await_count == 1
+        session.begin_nested.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_to_per_candidate_savepoints(self):
+        from src.fact_checking.import_pipeline.promotion import promote_candidates_batch
+
+        good, bad = _promotable_candidate(), _promotable_candidate()
+        good_item_id = uuid4()
+        session = _batch_session(
+            [good, bad],
+            RuntimeError("batch insert failed"),
+            _insert_result(good_item_id),
+            MagicMock(),
+            RuntimeError("value too long"),
+        )
+
+        with patch(
+            "src.batch_jobs.rechunk_service.enqueue_single_fact_check_chunk",
+            new_callable=AsyncMock,
+            return_value=True,
+        ):
+            outcome = await promote_candidates_batch(session, [good.id, bad.id])
+
+        assert outcome.promoted_ids == [good.id]
+        assert outcome.fact_check_item_ids == [good_item_id]
+        assert outcome.failures == {bad.id: "value too long"}
+        assert session.begin_nested.call_count == 3
+        session.commit.assert_awaited_once()
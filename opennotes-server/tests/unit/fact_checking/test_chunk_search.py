@@ -287,6 +287,115 @@ class TestInputValidation:
         assert str(timeout_stmt) == "SET LOCAL statement_timeout = 10000"
 
 
+class TestFilteredVectorScan:
+    """Filtered semantic CTEs rely on pgvector iterative scans."""
+
+    @pytest.mark.asyncio
+    async def test_configure_filtered_vector_scan_sets_local_hnsw_options(self):
+        from unittest.mock import AsyncMock
+
+        from src.fact_checking.repository import configure_filtered_vector_scan
+
+        mock_session = AsyncMock()
+
+        await configure_filtered_vector_scan(mock_session)
+
+        stmt, params = mock_session.execute.await_args.args
+        sql = str(stmt)
+        assert "set_config('hnsw.iterative_scan', 'relaxed_order', true)" in sql
+        assert params == {
+            "ef_search": str(settings.VECTOR_SEARCH_HNSW_EF_SEARCH),
+            "max_scan_tuples": str(settings.VECTOR_SEARCH_MAX_SCAN_TUPLES),
+        }
+
+    @pytest.mark.asyncio
+    async def test_chunk_search_applies_distance_cutoff_outside_ann_scan(self):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.fact_checking.repository import hybrid_search_with_chunks
+
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = []
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = mock_result
+
+        await hybrid_search_with_chunks(
+            session=mock_session,
+            query_text="test query",
+            query_embedding=[0.1] * settings.EMBEDDING_DIMENSIONS,
+            dataset_tags=["snopes"],
+        )
+
+        scan_sql = str(mock_session.execute.call_args_list[0].args[0])
+        assert "hnsw.iterative_scan" in scan_sql
+        search_sql = str(mock_session.execute.call_args_list[1].args[0])
+        candidates = search_sql.split("chunk_semantic AS", maxsplit=1)[0]
+        assert "AS MATERIALIZED" in candidates
+        assert ":max_semantic_distance" not in candidates
+
+
+class TestQuantizedCandidateGeneration:
+    """VECTOR_SEARCH_QUANTIZATION=halfvec searches the halfvec index and re-ranks exactly."""
+
+    def test_full_precision_mode_orders_by_vector_distance(self):
+        from unittest.mock import patch
+
+        from src.fact_checking.repository import ann_candidate_limit, ann_distance_expression
+
+        with patch.object(settings, "VECTOR_SEARCH_QUANTIZATION", "none"):
+            assert ann_distance_expression("ce.embedding") == (
+                "ce.embedding <=> CAST(:embedding AS vector)"
+            )
+            assert ann_candidate_limit(20) == 20
+
+    def test_halfvec_mode_matches_expression_index_and_overfetches(self):
+        from unittest.mock import patch
+
+        from src.fact_checking.repository import ann_candidate_limit, ann_distance_expression
+
+        with (
+            patch.object(settings, "VECTOR_SEARCH_QUANTIZATION", "halfvec"),
+            patch.object(settings, "VECTOR_SEARCH_RERANK_FACTOR", 4),
+            patch.object(settings, "EMBEDDING_DIMENSIONS", 1536),
+        ):
+            assert ann_distance_expression("embedding") == (
+                "(embedding::halfvec(1536)) <=> CAST(:embedding AS halfvec(1536))"
+            )
+            assert ann_candidate_limit(20) == 80
+
+    @pytest.mark.asyncio
+    async def test_halfvec_chunk_search_reranks_by_exact_distance(self):
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from src.fact_checking.repository import (
+            CHUNK_PRELIMIT_MULTIPLIER,
+            HYBRID_SEARCH_CTE_PRELIMIT,
+            hybrid_search_with_chunks,
+        )
+
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = []
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = mock_result
+
+        with (
+            patch.object(settings, "VECTOR_SEARCH_QUANTIZATION", "halfvec"),
+            patch.object(settings, "VECTOR_SEARCH_RERANK_FACTOR", 4),
+        ):
+            await hybrid_search_with_chunks(
+                session=mock_session,
+                query_text="test query",
+                query_embedding=[0.1] * settings.EMBEDDING_DIMENSIONS,
+            )
+
+        search_sql = " ".join(str(mock_session.execute.call_args_list[1].args[0]).split())
+        candidates, reranked = search_sql.split("chunk_semantic AS", maxsplit=1)
+        chunk_limit = HYBRID_SEARCH_CTE_PRELIMIT * CHUNK_PRELIMIT_MULTIPLIER
+        assert "::halfvec(" in candidates
+        assert f"LIMIT {chunk_limit * 4}" in candidates
+        assert f"ORDER BY distance LIMIT {chunk_limit}" in reranked
+
+
 class TestWeightFactorBoundaries:
     """Test weight factor parameter boundaries."""
 
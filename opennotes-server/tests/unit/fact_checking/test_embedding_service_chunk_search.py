@@ -301,3 +301,33 @@ class TestPreviouslySeenSearchStatementTimeout:
 
         timeout_stmt = mock_db.execute.await_args_list[0].args[0]
         assert str(timeout_stmt) == "SET LOCAL statement_timeout = 10000"
+
+    async def test_search_previously_seen_uses_iterative_filtered_scan(self):
+        """The community filter runs inside an iterative HNSW scan; the cutoff is applied after."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.fact_checking.embedding_service import EmbeddingService
+
+        service = EmbeddingService(MagicMock())
+
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = []
+        mock_db = AsyncMock()
+        mock_db.execute.return_value = mock_result
+
+        await service.search_previously_seen(
+            db=mock_db,
+            embedding=[0.1] * 1536,
+            community_server_id=uuid4(),
+            similarity_threshold=0.8,
+        )
+
+        scan_stmt, scan_params = mock_db.execute.await_args_list[0].args
+        assert "hnsw.iterative_scan" in str(scan_stmt)
+        assert set(scan_params) == {"ef_search", "max_scan_tuples"}
+
+        search_sql = " ".join(str(mock_db.execute.await_args_list[1].args[0]).split())
+        assert "AS MATERIALIZED" in search_sql
+        inner, outer = search_sql.split("FROM nearest")
+        assert ":max_dist" not in inner
+        assert "WHERE distance <= :max_dist ORDER BY distance" in outer
@@ -0,0 +1,108 @@
+"""Unit tests for the batched audit log sink in src/middleware/audit_sink.py."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.middleware.audit_sink import AuditLogSink
+
+
+def _entry(n: int) -> dict:
+    return {"user_id": None, "action": f"POST /api/v1/notes/{n}", "resource": str(n)}
+
+
+@pytest.fixture
+def persist():
+    with patch("src.middleware.audit_sink.call_persist_audit_log_batch") as mock_persist:
+        yield mock_persist
+
+
+class TestAuditLogSink:
+    @pytest.mark.asyncio
+    async def test_submit_does_not_persist_inline(self, persist):
+        sink = AuditLogSink(capacity=10, batch_size=5, flush_interval_seconds=60)
+
+        sink.submit(_entry(1))
+
+        persist.assert_not_called()
+        assert len(sink) == 1
+        await sink.stop()
+
+    @pytest.mark.asyncio
+    async def test_flush_splits_buffer_into_batches(self, persist):
+        sink = AuditLogSink(capacity=10, batch_size=2, flush_interval_seconds=60)
+        for n in range(5):
+            sink.submit(_entry(n))
+
+        await sink.stop()
+
+        batches = [c.args[0] for c in persist.call_args_list]
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert [e["resource"] for b in batches for e in b] == ["0", "1", "2", "3", "4"]
+        assert len(sink) == 0
+
+    @pytest.mark.asyncio
+    async def test_full_batch_wakes_flusher(self, persist):
+        sink = AuditLogSink(capacity=10, batch_size=2, flush_interval_seconds=60)
+
+        sink.submit(_entry(1))
+        sink.submit(_entry(2))
+        for _ in range(50):
+            if persist.called:
+                break
+            await asyncio.sleep(0.01)
+
+        persist.assert_called_once()
+        await sink.stop()
+
+    @pytest.mark.asyncio
+    async def test_interval_flushes_partial_batch(self, persist):
+        sink = AuditLogSink(capacity=10, batch_size=100, flush_interval_seconds=0.01)
+
+        sink.submit(_entry(1))
+        deadline = time.monotonic() + 1
+        while not persist.called and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+
+        persist.assert_called_once()
+        await sink.stop()
+
+    @pytest.mark.asyncio
+    async def test_overflow_drops_oldest_and_counts(self, persist):
+        sink = AuditLogSink(capacity=2, batch_size=10, flush_interval_seconds=60)
+
+        with patch("src.middleware.audit_sink.audit_events_dropped_total") as dropped:
+            for n in range(3):
+                sink.submit(_entry(n))
+
+        dropped.add.assert_called_once_with(1, {"reason": "overflow"})
+        await sink.stop()
+        assert [e["resource"] for e in persist.call_args.args[0]] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_counted_as_dropped(self, persist):
+        persist.side_effect = ConnectionError("queue unavailable")
+        sink = AuditLogSink(capacity=10, batch_size=10, flush_interval_seconds=60)
+        sink.submit(_entry(1))
+        sink.submit(_entry(2))
+
+        with (
+            patch("src.middleware.audit_sink.audit_events_dropped_total") as dropped,
+            patch("src.middleware.audit_sink.audit_publish_failures_total") as failures,
+        ):
+            await sink.stop()
+
+        dropped.add.assert_called_once_with(2, {"reason": "connection"})
+        failures.add.assert_called_once_with(1, {"error_type": "connection"})
+
+    @pytest.mark.asyncio
+    async def test_stop_without_entries_is_noop(self):
+        sink = AuditLogSink(capacity=10, batch_size=10, flush_interval_seconds=60)
+        persist = MagicMock()
+
+        with patch("src.middleware.audit_sink.call_persist_audit_log_batch", persist):
+            await sink.stop()
+
+        persist.assert_not_called()
@@ -0,0 +1,150 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.middleware.distributed_rate_limiter import DistributedRateLimiter
+
+pytestmark = pytest.mark.unit
+
+
+def _limiter(**kwargs) -> DistributedRateLimiter:
+    limiter = DistributedRateLimiter(redis_url="redis://localhost", **kwargs)
+    limiter.redis = MagicMock()
+    limiter.redis.eval = AsyncMock()
+    limiter.redis.delete = AsyncMock()
+    limiter.redis.hmget = AsyncMock()
+    return limiter
+
+
+class TestSlidingLogAlgorithm:
+    @pytest.mark.asyncio
+    async def test_default_algorithm_uses_sorted_set_script_per_request(self):
+        limiter = _limiter()
+        limiter.redis.eval.return_value = [1, 9, 1060]
+
+        for _ in range(3):
+            info = await limiter.check_rate_limit("user:1", limit=10, window_seconds=60)
+            assert info.allowed is True
+
+        assert limiter.redis.eval.await_count == 3
+        assert "zremrangebyscore" in limiter.redis.eval.await_args.args[0]
+
+
+class TestSlidingWindowAlgorithm:
+    def test_rejects_non_positive_local_allotment(self):
+        with pytest.raises(ValueError, match="local_allotment"):
+            DistributedRateLimiter(algorithm="sliding_window", local_allotment=0)
+
+    @pytest.mark.asyncio
+    async def test_local_allotment_serves_requests_without_redis(self):
+        limiter = _limiter(algorithm="sliding_window", local_allotment=5)
+        limiter.redis.eval.return_value = [5, 90]
+
+        with patch("src.middleware.distributed_rate_limiter.time.time", return_value=1000.0):
+            results = [
+                await limiter.check_rate_limit("user:1", limit=100, window_seconds=60)
+                for _ in range(5)
+            ]
+
+        assert all(info.allowed for info in results)
+        assert [info.remaining for info in results] == [94, 93, 92, 91, 90]
+        limiter.redis.eval.assert_awaited_once()
+
+        args = limiter.redis.eval.await_args.args
+        assert "hmget" in args[0]
+        assert args[1] == 1
+        assert args[2] == "rate_limit:user:1:counter"
+        assert args[3] == "5"
+
+    @pytest.mark.asyncio
+    async def test_claims_again_when_local_allotment_is_spent(self):
+        limiter = _limiter(algorithm="sliding_window", local_allotment=2)
+        limiter.redis.eval.return_value = [2, 50]
+
+        with patch("src.middleware.distributed_rate_limiter.time.time", return_value=1000.0):
+            for _ in range(3):
+                await limiter.check_rate_limit("user:1", limit=100, window_seconds=60)
+
+        assert limiter.redis.eval.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_local_allotment_is_capped_by_limit(self):
+        limiter = _limiter(algorithm="sliding_window", local_allotment=50)
+        limiter.redis.eval.return_value = [2, 18]
+
+        await limiter.check_rate_limit("user:1", limit=20, window_seconds=60)
+
+        assert limiter.redis.eval.await_args.args[3] == "2"
+
+    @pytest.mark.asyncio
+    async def test_local_allotment_expires_with_window(self):
+        limiter = _limiter(algorithm="sliding_window", local_allotment=5)
+        limiter.redis.eval.return_value = [5, 90]
+
+        with patch(
+            "src.middleware.distributed_rate_limiter.time.time", side_effect=[1000.0, 1020.0]
+        ):
+            await limiter.check_rate_limit("user:1", limit=100, window_seconds=60)
+            await limiter.check_rate_limit("user:1", limit=100, window_seconds=60)
+
+        assert limiter.redis.eval.await_count == 2
+        assert limiter.redis.eval.await_args.args[6] == "17"
+
+    @pytest.mark.asyncio
+    async def test_denies_when_no_tokens_granted(self):
+        limiter = _limiter(algorithm="sliding_window", local_allotment=5)
+        limiter.redis.eval.return_value = [0, 0]
+
+        with patch("src.middleware.distributed_rate_limiter.time.time", return_value=1000.0):
+            info = await limiter.check_rate_limit("user:1", limit=100, window_seconds=60)
+
+        assert info.allowed is False
+        assert info.remaining == 0
+        assert info.reset_at == 1020
+        assert info.retry_after == 20
+
+    @pytest.mark.asyncio
+    async def test_fails_open_on_redis_error(self):
+        limiter = _limiter(algorithm="sliding_window", local_allotment=5)
+        limiter.redis.eval.side_effect = ConnectionError("Redis down")
+
+        info = await limiter.check_rate_limit("user:1", limit=100, window_seconds=60)
+
+        assert info.allowed is True
+        assert info.remaining == 100
+
+    @pytest.mark.asyncio
+    async def test_reset_limit_clears_counter_and_local_allotment(self):
+        limiter = _limiter(algorithm="sliding_window", local_allotment=5)
+        limiter.redis.eval.return_value = [5, 90]
+
+        await limiter.check_rate_limit("user:1", limit=100, window_seconds=60)
+        assert await limiter.reset_limit("user:1") is True
+        await limiter.check_rate_limit("user:1", limit=100, window_seconds=60)
+
+        limiter.redis.delete.assert_awaited_once_with(
+            "rate_limit:user:1", "rate_limit:user:1:counter"
+        )
+        assert limiter.redis.eval.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_limit_info_weights_previous_window(self):
+        limiter = _limiter(algorithm="sliding_window")
+        limiter.redis.hmget.return_value = ["16", "10", "40"]
+
+        with patch("src.middleware.distributed_rate_limiter.time.time", return_value=1005.0):
+            info = await limiter.get_limit_info("user:1", limit=100, window_seconds=60)
+
+        # 15s of the previous window still overlap: 40 * 0.25 + 10 = 20 used.
+        assert info["remaining"] == 80
+        assert info["reset_at"] == 1020
+
+    @pytest.mark.asyncio
+    async def test_get_limit_info_rolls_stale_window(self):
+        limiter = _limiter(algorithm="sliding_window")
+        limiter.redis.hmget.return_value = ["15", "40", "5"]
+
+        with patch("src.middleware.distributed_rate_limiter.time.time", return_value=1005.0):
+            info = await limiter.get_limit_info("user:1", limit=100, window_seconds=60)
+
+        assert info["remaining"] == 90
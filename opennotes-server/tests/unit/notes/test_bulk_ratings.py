@@ -0,0 +1,79 @@
+"""Tests for set-wise validation of bulk rating requests."""
+
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from src.notes.ratings_jsonapi_router import (
+    MAX_BULK_RATINGS,
+    RatingBulkCreateRequest,
+    RatingCreateAttributes,
+    validate_bulk_ratings,
+)
+
+
+def _attrs(note_id, rater_id, level: str = "HELPFUL") -> RatingCreateAttributes:
+    return RatingCreateAttributes(note_id=note_id, rater_id=rater_id, helpfulness_level=level)
+
+
+class TestValidateBulkRatings:
+    def test_accepts_items_with_existing_notes_and_raters(self):
+        note_id, rater_a, rater_b = uuid4(), uuid4(), uuid4()
+        items = [_attrs(note_id, rater_a), _attrs(note_id, rater_b)]
+
+        accepted, errors = validate_bulk_ratings(items, {note_id}, {rater_a, rater_b})
+
+        assert accepted == {(note_id, rater_a): 0, (note_id, rater_b): 1}
+        assert errors == {}
+
+    def test_reports_missing_note_and_rater_per_item(self):
+        note_id, rater_id = uuid4(), uuid4()
+        missing_note, missing_rater = uuid4(), uuid4()
+        items = [
+            _attrs(missing_note, rater_id),
+            _attrs(note_id, missing_rater),
+            _attrs(note_id, rater_id),
+        ]
+
+        accepted, errors = validate_bulk_ratings(items, {note_id}, {rater_id})
+
+        assert accepted == {(note_id, rater_id): 2}
+        assert errors[0].status == "404"
+        assert str(missing_note) in errors[0].error.detail
+        assert errors[0].error.source.pointer == "/data/0"
+        assert errors[1].status == "404"
+        assert "Rater profile" in errors[1].error.detail
+
+    def test_duplicate_pair_keeps_last_occurrence(self):
+        note_id, rater_id = uuid4(), uuid4()
+        items = [
+            _attrs(note_id, rater_id, "HELPFUL"),
+            _attrs(note_id, rater_id, "NOT_HELPFUL"),
+        ]
+
+        accepted, errors = validate_bulk_ratings(items, {note_id}, {rater_id})
+
+        assert accepted == {(note_id, rater_id): 1}
+        assert errors[0].status == "409"
+        assert errors[0].error.source.pointer == "/data/0"
+
+
+class TestRatingBulkCreateRequest:
+    def _item(self) -> dict:
+        return {
+            "type": "ratings",
+            "attributes": {
+                "note_id": str(uuid4()),
+                "rater_id": str(uuid4()),
+                "helpfulness_level": "HELPFUL",
+            },
+        }
+
+    def test_rejects_empty_batch(self):
+        with pytest.raises(ValidationError):
+            RatingBulkCreateRequest(data=[])
+
+    def test_rejects_batch_over_limit(self):
+        with pytest.raises(ValidationError):
+            RatingBulkCreateRequest(data=[self._item() for _ in range(MAX_BULK_RATINGS + 1)])
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
 import pytest
 from fastuuid import uuid7
+from sqlalchemy.dialects import postgresql
 
 from src.notes.copy_request_service import CopyRequestService
 
@@ -21,41 +21,6 @@ def _ensure_mappers():
     configure_mappers()
 
 
-@dataclass
-class FakeRequest:
-    id: UUID
-    community_server_id: UUID
-    requested_by: str
-    message_archive_id: UUID | None
-    request_metadata: dict | None
-    dataset_item_id: str | None
-    similarity_score: float | None
-    dataset_name: str | None
-    deleted_at: datetime | None = None
-    created_at: datetime | None = None
-
-
-def _make_fake_request(
-    community_server_id: UUID,
-    *,
-    request_metadata: dict | None = None,
-    dataset_item_id: str | None = None,
-    similarity_score: float | None = None,
-    dataset_name: str | None = None,
-    with_archive: bool = True,
-) -> FakeRequest:
-    return FakeRequest(
-        id=uuid7(),
-        community_server_id=community_server_id,
-        requested_by="user_abc",
-        message_archive_id=uuid7() if with_archive else None,
-        request_metadata=request_metadata,
-        dataset_item_id=dataset_item_id,
-        similarity_score=similarity_score,
-        dataset_name=dataset_name,
-    )
-
-
 @pytest.fixture
 def source_community_server_id() -> UUID:
     return uuid7()
@@ -70,37 +35,43 @@ def target_community_server_id() -> UUID:
 def mock_db() -> AsyncMock:
     db = AsyncMock()
     db.add = MagicMock()
+    db.begin_nested = MagicMock(return_value=MagicMock())
     return db
 
 
-def _setup_db_to_return(mock_db: AsyncMock, requests: list[FakeRequest]) -> None:
-    result_mock = MagicMock()
-    scalars_mock = MagicMock()
-    scalars_mock.all.return_value = requests
-    result_mock.scalars.return_value = scalars_mock
-    mock_db.execute.return_value = result_mock
+def _count_result(total: int) -> MagicMock:
+    result = MagicMock()
+    result.scalar.return_value = total
+    return result
+
+
+def _boundary_result(found: bool) -> MagicMock:
+    result = MagicMock()
+    result.first.return_value = (datetime.now(UTC), uuid7()) if found else None
+    return result
+
+
+def _insert_result(rowcount: int) -> MagicMock:
+    result = MagicMock()
+    result.rowcount = rowcount
+    return result
+
+
+def _compiled(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
 
 
 @pytest.mark.asyncio
-async def test_copy_requests_copies_all_with_correct_fields(
+async def test_copy_requests_runs_server_side_insert_select(
     mock_db: AsyncMock,
     source_community_server_id: UUID,
     target_community_server_id: UUID,
 ) -> None:
-    source_requests = [
-        _make_fake_request(
-            source_community_server_id,
-            request_metadata={"key": "value"},
-            dataset_item_id="ds_item_1",
-            similarity_score=0.95,
-            dataset_name="snopes",
-        ),
-        _make_fake_request(
-            source_community_server_id,
-            request_metadata=None,
-        ),
+    mock_db.execute.side_effect = [
+        _count_result(2),
+        _boundary_result(found=False),
+        _insert_result(2),
     ]
-    _setup_db_to_return(mock_db, source_requests)
 
     result = await CopyRequestService.copy_requests(
         db=mock_db,
@@ -111,41 +82,31 @@ async def test_copy_requests_copies_all_with_correct_fields(
     assert result.total_copied == 2
     assert result.total_skipped == 0
     assert result.total_failed == 0
-    assert mock_db.add.call_count == 2
-
-    first_req = mock_db.add.call_args_list[0][0][0]
-    assert first_req.community_server_id == target_community_server_id
-    assert first_req.message_archive_id == source_requests[0].message_archive_id
-    assert first_req.note_id is None
-    assert first_req.status == "PENDING"
-    assert first_req.requested_by == "user_abc"
-    assert first_req.dataset_item_id == "ds_item_1"
-    assert first_req.similarity_score == 0.95
-    assert first_req.dataset_name == "snopes"
-
-    metadata = first_req.request_metadata
-    assert metadata["key"] == "value"
-    assert metadata["copied_from"] == str(source_requests[0].id)
-
-    second_req = mock_db.add.call_args_list[1][0][0]
-    assert second_req.request_metadata["copied_from"] == str(source_requests[1].id)
-    assert second_req.message_archive_id == source_requests[1].message_archive_id
+    mock_db.add.assert_not_called()
 
-    assert first_req.request_id != second_req.request_id
-    assert first_req.request_id != str(source_requests[0].id)
+    insert = mock_db.execute.await_args_list[2].args[0].compile(dialect=postgresql.dialect())
+    insert_sql = str(insert)
+    assert insert_sql.startswith("INSERT INTO requests")
+    assert "SELECT" in insert_sql
+    insert_columns = insert_sql.split("(", 1)[1].split(")", 1)[0].split(", ")
+    assert "request_metadata" in insert_columns
+    assert "copied_from" in insert.params.values()
+    assert "NOT (EXISTS (SELECT 1" in insert_sql
+    assert "uuidv7()" in insert_sql
+    assert "note_id" not in insert_sql
 
 
 @pytest.mark.asyncio
-async def test_copy_requests_copies_with_null_archive(
+async def test_copy_requests_counts_already_copied_rows_as_skipped(
     mock_db: AsyncMock,
     source_community_server_id: UUID,
     target_community_server_id: UUID,
 ) -> None:
-    source_requests = [
-        _make_fake_request(source_community_server_id, with_archive=False),
-        _make_fake_request(source_community_server_id),
+    mock_db.execute.side_effect = [
+        _count_result(3),
+        _boundary_result(found=False),
+        _insert_result(1),
     ]
-    _setup_db_to_return(mock_db, source_requests)
 
     result = await CopyRequestService.copy_requests(
         db=mock_db,
@@ -153,71 +114,70 @@ async def test_copy_requests_copies_with_null_archive(
         target_community_server_id=target_community_server_id,
     )
 
-    assert result.total_copied == 2
-    assert result.total_skipped == 0
+    assert result.total_copied == 1
+    assert result.total_skipped == 2
     assert result.total_failed == 0
-    assert mock_db.add.call_count == 2
-
-    first_req = mock_db.add.call_args_list[0][0][0]
-    assert first_req.message_archive_id is None
-
-    second_req = mock_db.add.call_args_list[1][0][0]
-    assert second_req.message_archive_id == source_requests[1].message_archive_id
 
 
 @pytest.mark.asyncio
-async def test_copy_requests_counts_failures(
+async def test_copy_requests_reports_progress_per_window(
     mock_db: AsyncMock,
     source_community_server_id: UUID,
     target_community_server_id: UUID,
 ) -> None:
-    source_requests = [
-        _make_fake_request(source_community_server_id),
-        _make_fake_request(source_community_server_id),
+    mock_db.execute.side_effect = [
+        _count_result(5),
+        _boundary_result(found=True),
+        _insert_result(2),
+        _boundary_result(found=True),
+        _insert_result(2),
+        _boundary_result(found=False),
+        _insert_result(1),
     ]
-    _setup_db_to_return(mock_db, source_requests)
-    mock_db.add = MagicMock(side_effect=[Exception("DB error"), None])
+
+    progress_calls: list[tuple[int, int]] = []
+
+    def track_progress(current: int, total: int) -> None:
+        progress_calls.append((current, total))
 
     result = await CopyRequestService.copy_requests(
         db=mock_db,
         source_community_server_id=source_community_server_id,
         target_community_server_id=target_community_server_id,
+        on_progress=track_progress,
+        window_size=2,
     )
 
-    assert result.total_copied == 1
+    assert result.total_copied == 5
     assert result.total_skipped == 0
-    assert result.total_failed == 1
+    assert progress_calls == [(2, 5), (4, 5), (5, 5)]
+    assert mock_db.begin_nested.call_count == 3
 
 
 @pytest.mark.asyncio
-async def test_copy_requests_calls_on_progress(
+async def test_copy_requests_counts_failed_window_and_continues(
     mock_db: AsyncMock,
     source_community_server_id: UUID,
     target_community_server_id: UUID,
 ) -> None:
-    source_requests = [
-        _make_fake_request(source_community_server_id),
-        _make_fake_request(source_community_server_id),
-        _make_fake_request(source_community_server_id, with_archive=False),
+    mock_db.execute.side_effect = [
+        _count_result(3),
+        _boundary_result(found=True),
+        Exception("DB error"),
+        _boundary_result(found=False),
+        _insert_result(1),
     ]
-    _setup_db_to_return(mock_db, source_requests)
-
-    progress_calls: list[tuple[int, int]] = []
-
-    def track_progress(current: int, total: int) -> None:
-        progress_calls.append((current, total))
 
     result = await CopyRequestService.copy_requests(
         db=mock_db,
         source_community_server_id=source_community_server_id,
         target_community_server_id=target_community_server_id,
-        on_progress=track_progress,
+        window_size=2,
     )
 
-    assert result.total_copied == 3
+    assert result.total_copied == 1
     assert result.total_skipped == 0
-    assert len(progress_calls) == 3
-    assert progress_calls == [(1, 3), (2, 3), (3, 3)]
+    assert result.total_failed == 2
 
 
 @pytest.mark.asyncio
@@ -226,7 +186,7 @@ async def test_copy_requests_empty_source(
     source_community_server_id: UUID,
     target_community_server_id: UUID,
 ) -> None:
-    _setup_db_to_return(mock_db, [])
+    mock_db.execute.side_effect = [_count_result(0)]
 
     result = await CopyRequestService.copy_requests(
         db=mock_db,
@@ -237,4 +197,5 @@ async def test_copy_requests_empty_source(
     assert result.total_copied == 0
     assert result.total_skipped == 0
     assert result.total_failed == 0
-    assert mock_db.add.call_count == 0
+    mock_db.execute.assert_awaited_once()
+    mock_db.begin_nested.assert_not_called()
@@ -121,6 +121,29 @@ class TestFullLoader:
             assert isinstance(option, Load)
 
 
+class TestRatingsCountLoader:
+    """Test the ratings_count() and resource() loader functions."""
+
+    def test_ratings_count_is_a_correlated_aggregate(self):
+        """ratings_count() should compute the count in SQL, not load Rating rows."""
+        from sqlalchemy import select
+        from sqlalchemy.dialects import postgresql
+
+        from src.notes.loaders import ratings_count
+
+        stmt = select(Note).options(*ratings_count())
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "count(*)" in sql
+        assert "ratings.note_id = notes.id" in sql
+
+    def test_resource_composes_ratings_count_and_request(self):
+        """resource() should compose ratings_count() and request(), not ratings()."""
+        from src.notes.loaders import ratings_count, request, resource
+
+        assert len(resource()) == len(ratings_count()) + len(request())
+
+
 class TestAdminLoader:
     """Test the admin() loader function."""
 
@@ -5,12 +5,18 @@ from uuid import uuid4
 
 import pytest
 
-from src.notes.notes_jsonapi_router import note_to_resource
+from src.notes.notes_jsonapi_router import (
+    _NOTE_SPARSE_COLUMNS,
+    note_to_resource,
+    parse_note_fieldset,
+    parse_note_include,
+)
+from src.notes.schemas import NoteJSONAPIAttributes
 
 pytestmark = pytest.mark.unit
 
 
-def _make_note(*, message_archive=None, request=None, ratings=None):
+def _make_note(*, message_archive=None, request=None, ratings=None, ratings_count=None):
     """Build a SimpleNamespace that mimics a Note model for note_to_resource."""
     if request is None and message_archive is not None:
         request = SimpleNamespace(message_archive=message_archive)
@@ -30,6 +36,7 @@ def _make_note(*, message_archive=None, request=None, ratings=None):
         updated_at=None,
         request_id=uuid4(),
         ratings=ratings or [],
+        ratings_count=ratings_count,
         community_server_id=uuid4(),
         request=request,
     )
@@ -75,3 +82,65 @@ class TestNoteToResourcePlatformChannelId:
 
         assert resource.attributes.platform_channel_id is None
         assert resource.attributes.platform_message_id == "msg-789"
+
+
+class TestNoteToResourceRatingsCount:
+    def test_prefers_aggregate_ratings_count(self):
+        note = _make_note(ratings_count=7)
+
+        resource = note_to_resource(note)
+
+        assert resource.attributes.ratings_count == 7
+
+    def test_falls_back_to_loaded_ratings(self):
+        note = _make_note(ratings=[SimpleNamespace(id=uuid4()), SimpleNamespace(id=uuid4())])
+
+        resource = note_to_resource(note)
+
+        assert resource.attributes.ratings_count == 2
+
+
+class TestNoteToResourceSparseFieldsets:
+    def test_only_requested_attributes_are_serialized(self):
+        note = _make_note(ratings_count=3)
+
+        resource = note_to_resource(note, fields=frozenset({"summary", "ratings_count"}))
+        data = resource.model_dump(by_alias=True, mode="json")
+
+        assert data["attributes"] == {"summary": "Test note", "ratings_count": 3}
+        assert "relationships" not in data
+
+    def test_unrequested_attributes_are_not_read(self):
+        note = SimpleNamespace(id=uuid4(), status="NEEDS_MORE_RATINGS")
+
+        resource = note_to_resource(note, fields=frozenset({"status"}))
+
+        assert resource.model_dump()["attributes"] == {"status": "NEEDS_MORE_RATINGS"}
+
+    def test_sparse_columns_cover_every_attribute(self):
+        assert set(_NOTE_SPARSE_COLUMNS) == set(NoteJSONAPIAttributes.model_fields)
+
+    def test_parse_fieldset_rejects_unknown_fields(self):
+        assert parse_note_fieldset(None) is None
+        assert parse_note_fieldset("summary, status") == frozenset({"summary", "status"})
+        with pytest.raises(ValueError, match="Unknown note fields: bogus"):
+            parse_note_fieldset("summary,bogus")
+
+
+class TestNoteToResourceIncludeRatings:
+    def test_ratings_relationship_added_when_included(self):
+        rating_ids = [uuid4(), uuid4()]
+        note = _make_note(ratings=[SimpleNamespace(id=rid) for rid in rating_ids])
+
+        resource = note_to_resource(note, include_ratings=True)
+        data = resource.model_dump(by_alias=True, mode="json")
+
+        assert data["relationships"]["ratings"]["data"] == [
+            {"type": "ratings", "id": str(rid)} for rid in rating_ids
+        ]
+
+    def test_parse_include(self):
+        assert parse_note_include(None) is False
+        assert parse_note_include("ratings") is True
+        with pytest.raises(ValueError, match="Unsupported include paths: author"):
+            parse_note_include("ratings,author")
@@ -0,0 +1,67 @@
+"""Tests for index-backed top-k helpers in the scoring router."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pendulum
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.common.filters import FilterBuilder
+from src.notes.scoring_jsonapi_router import (
+    _build_persisted_score_response,
+    _rating_count_expression,
+    top_notes_sort_keys,
+)
+from src.notes.scoring_schemas import ScoreConfidence
+
+
+class TestTopNotesCursor:
+    def test_round_trip(self):
+        note_id = uuid4()
+        cursor = FilterBuilder.encode_keyset_cursor(
+            top_notes_sort_keys, SimpleNamespace(helpfulness_score=87, id=note_id)
+        )
+
+        condition = FilterBuilder.build_keyset_condition(top_notes_sort_keys, cursor)
+        compiled = condition.compile(dialect=postgresql.dialect())
+
+        assert "(notes.helpfulness_score, notes.id) <" in str(compiled)
+        assert list(compiled.params.values()) == [87, note_id]
+
+    def test_cursor_is_url_safe(self):
+        cursor = FilterBuilder.encode_keyset_cursor(
+            top_notes_sort_keys, SimpleNamespace(helpfulness_score=100, id=uuid4())
+        )
+
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "W10", "WyJ4IiwieSJd"])
+    def test_malformed_cursor_raises_value_error(self, cursor):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            FilterBuilder.build_keyset_condition(top_notes_sort_keys, cursor)
+
+
+class TestRatingCountPushdown:
+    def test_rating_count_is_correlated_subquery(self):
+        sql = str(_rating_count_expression())
+
+        assert "count(*)" in sql
+        assert "ratings.note_id = notes.id" in sql
+
+    def test_explicit_rating_count_skips_ratings_relationship(self):
+        now = pendulum.now("UTC")
+        note = SimpleNamespace(
+            id=uuid4(),
+            helpfulness_score=90,
+            updated_at=now,
+            created_at=now,
+            request=None,
+        )
+
+        resp = _build_persisted_score_response(note, note_count=10, rating_count=5)
+
+        assert resp.rating_count == 5
+        assert resp.confidence == ScoreConfidence.STANDARD
@@ -0,0 +1,132 @@
+"""Unit tests for the verified API key cache and cached verify_api_key path."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.auth.api_key_cache import VerifiedAPIKeyCache, api_key_cache
+from src.auth.password import get_password_hash, verify_password_async
+from src.users import crud
+from src.users.models import APIKey, User
+
+pytestmark = pytest.mark.unit
+
+RAW_KEY = "opk_abc123_secretpart"
+
+
+def _make_api_key(**overrides) -> APIKey:
+    fields = {
+        "id": uuid4(),
+        "user_id": uuid4(),
+        "name": "Adapter Key",
+        "key_prefix": "abc123",
+        "key_hash": get_password_hash(RAW_KEY),
+        "is_active": True,
+        "scopes": ["platform:adapter"],
+        "expires_at": datetime.now(UTC) + timedelta(days=30),
+    }
+    fields.update(overrides)
+    return APIKey(**fields)
+
+
+def _make_user(user_id) -> User:
+    return User(
+        id=user_id,
+        username="adapter",
+        email="adapter@example.com",
+        hashed_password="hash",
+        is_active=True,
+    )
+
+
+def _mock_db(*rows) -> AsyncMock:
+    results = []
+    for row in rows:
+        result = MagicMock()
+        result.one_or_none.return_value = row
+        results.append(result)
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=results)
+    return db
+
+
+class TestVerifiedAPIKeyCache:
+    def test_put_and_get_round_trip(self):
+        cache = VerifiedAPIKeyCache(ttl_seconds=60, max_size=10)
+        api_key = _make_api_key()
+
+        cache.put(RAW_KEY, api_key)
+        entry = cache.get(RAW_KEY)
+
+        assert entry is not None
+        assert entry.api_key_id == api_key.id
+        assert entry.user_id == api_key.user_id
+        assert entry.scopes == ("platform:adapter",)
+        assert cache.get("opk_abc123_other") is None
+
+    def test_raw_key_is_not_stored(self):
+        cache = VerifiedAPIKeyCache(ttl_seconds=60, max_size=10)
+        cache.put(RAW_KEY, _make_api_key())
+
+        assert RAW_KEY not in cache._entries
+        assert all(RAW_KEY not in fp for fp in cache._entries)
+
+    def test_expired_key_is_dropped(self):
+        cache = VerifiedAPIKeyCache(ttl_seconds=60, max_size=10)
+        cache.put(RAW_KEY, _make_api_key(expires_at=datetime.now(UTC) - timedelta(seconds=1)))
+
+        assert cache.get(RAW_KEY) is None
+        assert len(cache) == 0
+
+    def test_invalidate_api_key(self):
+        cache = VerifiedAPIKeyCache(ttl_seconds=60, max_size=10)
+        api_key = _make_api_key()
+        cache.put(RAW_KEY, api_key)
+        cache.put("opk_other_key", _make_api_key())
+
+        cache.invalidate_api_key(api_key.id)
+
+        assert cache.get(RAW_KEY) is None
+        assert len(cache) == 1
+
+
+class TestVerifyAPIKeyCaching:
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_hash_verification(self):
+        api_key = _make_api_key()
+        user = _make_user(api_key.user_id)
+        db = _mock_db((api_key, user), (api_key, user))
+
+        with patch.object(crud, "_publish_api_key_used_event", AsyncMock()):
+            assert await crud.verify_api_key(db, RAW_KEY) == (api_key, user)
+            with patch.object(crud, "verify_password_async", AsyncMock(side_effect=AssertionError)):
+                assert await crud.verify_api_key(db, RAW_KEY) == (api_key, user)
+
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_revoked_key_is_rejected_and_evicted(self):
+        api_key = _make_api_key()
+        api_key_cache.put(RAW_KEY, api_key)
+        db = _mock_db(None)
+
+        assert await crud.verify_api_key(db, RAW_KEY) is None
+        assert api_key_cache.get(RAW_KEY) is None
+
+    @pytest.mark.asyncio
+    async def test_failed_verification_is_not_cached(self):
+        api_key = _make_api_key(key_hash=get_password_hash("opk_abc123_different"))
+        db = _mock_db((api_key, _make_user(api_key.user_id)))
+
+        assert await crud.verify_api_key(db, RAW_KEY) is None
+        assert api_key_cache.get(RAW_KEY) is None
+
+
+@pytest.mark.asyncio
+async def test_verify_password_async_matches_sync_result():
+    hashed = get_password_hash(RAW_KEY)
+
+    assert await verify_password_async(RAW_KEY, hashed) == (True, False)
+    assert (await verify_password_async("wrong", hashed))[0] is False
@@ -384,3 +384,146 @@ class TestChunkEmbeddingServiceLLMCalls:
         mock_llm.generate_embedding.assert_awaited_once_with(
             "test chunk text", input_type="document"
         )
+
+
+@pytest.mark.asyncio
+class TestPreviouslySeenBatchChunking:
+    """Set-based chunk/embed path for many previously seen messages."""
+
+    async def test_missing_chunks_are_inserted_in_one_statement(self):
+        from src.fact_checking.chunk_embedding_service import ChunkEmbeddingService
+
+        mock_llm = MagicMock()
+        mock_llm.generate_embeddings_batch = AsyncMock(
+            return_value=[
+                ([0.1] * 1536, "openai", "text-embedding-3-small"),
+                ([0.2] * 1536, "openai", "text-embedding-3-small"),
+            ]
+        )
+        service = ChunkEmbeddingService(MagicMock(), mock_llm)
+
+        chunks = []
+        for text_hash in ("hash1", "hash2"):
+            chunk = MagicMock()
+            chunk.chunk_text_hash = text_hash
+            chunks.append(chunk)
+        empty_result = MagicMock()
+        empty_result.scalars.return_value.all.return_value = []
+        inserted_result = MagicMock()
+        inserted_result.scalars.return_value.all.return_value = chunks
+        mock_db = AsyncMock()
+        mock_db.execute = AsyncMock(side_effect=[empty_result, MagicMock(), inserted_result])
+
+        with (
+            patch("src.fact_checking.chunk_embedding_service.pg_insert") as mock_pg_insert,
+            patch(
+                "src.fact_checking.chunk_embedding_service.compute_chunk_text_hash",
+                side_effect=lambda t: f"hash{['text1', 'text2'].index(t) + 1}",
+            ),
+        ):
+            mock_stmt = MagicMock()
+            mock_stmt.on_conflict_do_nothing.return_value = mock_stmt
+            mock_pg_insert.return_value.values.return_value = mock_stmt
+
+            results = await service.get_or_create_chunks_batch(
+                db=mock_db, chunk_texts=["text1", "text2", "text1"]
+            )
+
+        mock_pg_insert.return_value.values.assert_called_once()
+        rows = mock_pg_insert.return_value.values.call_args.args[0]
+        assert [row["chunk_text"] for row in rows] == ["text1", "text2"]
+        assert [chunk for chunk, _ in results] == [chunks[0], chunks[1], chunks[0]]
+
+    async def test_batch_embeds_all_messages_with_one_chunk_lookup(self):
+        from src.fact_checking.chunk_embedding_service import ChunkEmbeddingService
+
+        service = ChunkEmbeddingService(MagicMock(), MagicMock())
+        shared, only_a, only_b = MagicMock(id=uuid4()), MagicMock(id=uuid4()), MagicMock(id=uuid4())
+        message_a, message_b = uuid4(), uuid4()
+        mock_db = AsyncMock()
+
+        with (
+            patch.object(
+                service,
+                "get_or_create_chunks_batch",
+                AsyncMock(
+                    return_value=[(shared, False), (only_a, True), (shared, False), (only_b, True)]
+                ),
+            ) as get_or_create,
+            patch.object(service, "batch_update_is_common_flags", AsyncMock()) as update_flags,
+        ):
+            result = await service.chunk_and_embed_previously_seen_batch(
+                db=mock_db,
+                chunk_texts_by_message={
+                    message_a: ["shared", "only a"],
+                    message_b: ["shared", "only b"],
+                },
+            )
+
+        get_or_create.assert_awaited_once()
+        assert get_or_create.call_args.kwargs["chunk_texts"] == [
+            "shared",
+            "only a",
+            "shared",
+            "only b",
+        ]
+        assert result == {message_a: [shared, only_a], message_b: [shared, only_b]}
+        # One join-row upsert and one stale-row delete for the whole batch.
+        assert mock_db.execute.await_count == 2
+        update_flags.assert_awaited_once_with(mock_db, [shared.id, only_a.id, shared.id, only_b.id])
+
+    async def test_stale_row_delete_is_split_to_bound_bind_params(self):
+        from src.fact_checking.chunk_embedding_service import ChunkEmbeddingService
+
+        service = ChunkEmbeddingService(MagicMock(), MagicMock())
+        messages = [uuid4() for _ in range(3)]
+        chunks = [MagicMock(id=uuid4()) for _ in range(6)]
+        mock_db = AsyncMock()
+
+        with (
+            patch("src.fact_checking.chunk_embedding_service.INSERT_BATCH_ROWS", 4),
+            patch.object(
+                service,
+                "get_or_create_chunks_batch",
+                AsyncMock(return_value=[(chunk, True) for chunk in chunks]),
+            ),
+            patch.object(service, "batch_update_is_common_flags", AsyncMock()),
+        ):
+            await service.chunk_and_embed_previously_seen_batch(
+                db=mock_db,
+                chunk_texts_by_message={
+                    message_id: [f"{i}a", f"{i}b"] for i, message_id in enumerate(messages)
+                },
+            )
+
+        deletes = [
+            call.args[0] for call in mock_db.execute.await_args_list if call.args[0].is_delete
+        ]
+        # Six kept pairs with at most four per statement: messages 1-2, then 3.
+        assert len(deletes) == 2
+        assert [sorted(len(v) for v in d.compile().params.values()) for d in deletes] == [
+            [2, 4],
+            [1, 2],
+        ]
+
+    async def test_single_message_delegates_to_batch(self):
+        from src.fact_checking.chunk_embedding_service import ChunkEmbeddingService
+
+        service = ChunkEmbeddingService(MagicMock(), MagicMock())
+        message_id = uuid4()
+        chunk = MagicMock(id=uuid4())
+
+        with patch.object(
+            service,
+            "chunk_and_embed_previously_seen_batch",
+            AsyncMock(return_value={message_id: [chunk]}),
+        ) as batch:
+            result = await service.chunk_and_embed_previously_seen(
+                db=AsyncMock(),
+                previously_seen_id=message_id,
+                text="hello",
+                chunk_texts=["hello"],
+            )
+
+        assert result == [chunk]
+        assert batch.call_args.kwargs["chunk_texts_by_message"] == {message_id: ["hello"]}
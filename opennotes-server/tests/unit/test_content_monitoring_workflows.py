@@ -2,6 +2,7 @@
 
 Tests cover:
 - start_ai_note_workflow calls content_monitoring_queue.enqueue() correctly
+- start_ai_note_batch_workflow enqueues one workflow per batch of items
 - call_persist_audit_log calls content_monitoring_queue.enqueue() correctly
 - Audit middleware calls call_persist_audit_log instead of NATS
 """
@@ -138,8 +139,7 @@ class TestCallPersistAuditLog:
 
 
 class TestAuditMiddlewareUsesDBOS:
-    @pytest.mark.asyncio
-    async def test_publish_audit_log_calls_dbos_instead_of_nats(self):
+    def test_publish_audit_log_submits_to_batched_sink(self):
         from src.middleware.audit import AuditMiddleware
 
         middleware = AuditMiddleware(app=MagicMock())
@@ -157,8 +157,8 @@ class TestAuditMiddlewareUsesDBOS:
 
         start_time = pendulum.now("UTC")
 
-        with patch("src.middleware.audit.call_persist_audit_log") as mock_call:
-            await middleware._publish_audit_log(
+        with patch("src.middleware.audit.audit_log_sink") as mock_sink:
+            middleware._publish_audit_log(
                 request=mock_request,
                 response=mock_response,
                 request_body=None,
@@ -166,11 +166,126 @@ class TestAuditMiddlewareUsesDBOS:
                 user_id=uuid4(),
             )
 
-            mock_call.assert_called_once()
-            call_args = mock_call.call_args.args
-            assert call_args[1] == "POST /api/v1/notes"
-            assert call_args[2] == "notes"
-            assert call_args[5] == "127.0.0.1"
+            mock_sink.submit.assert_called_once()
+            entry = mock_sink.submit.call_args.args[0]
+            assert entry["action"] == "POST /api/v1/notes"
+            assert entry["resource"] == "notes"
+            assert entry["ip_address"] == "127.0.0.1"
+            assert entry["created_at_iso"] == start_time.isoformat()
+
+
+class TestStartAINoteBatchWorkflow:
+    def test_enqueues_one_workflow_per_batch(self):
+        from src.dbos_workflows.content_monitoring_workflows import (
+            ai_note_batch_generation_workflow,
+            start_ai_note_batch_workflow,
+        )
+
+        items = [
+            {
+                "request_id": str(uuid4()),
+                "content": "claim one",
+                "scan_type": "similarity",
+                "fact_check_item_id": str(uuid4()),
+                "similarity_score": 0.9,
+            },
+            {
+                "request_id": str(uuid4()),
+                "content": "claim two",
+                "scan_type": "openai_moderation",
+                "moderation_metadata": {"flagged_categories": ["harassment"]},
+            },
+        ]
+        with patch(
+            "src.dbos_workflows.content_monitoring_workflows.content_monitoring_queue"
+        ) as mock_queue:
+            start_ai_note_batch_workflow(community_server_id="platform123", items=items)
+
+            mock_queue.enqueue.assert_called_once_with(
+                ai_note_batch_generation_workflow, "platform123", items
+            )
+
+    def test_build_scan_note_prompt_by_scan_type(self):
+        from src.dbos_workflows.content_monitoring_workflows import _build_scan_note_prompt
+
+        fact_check_item = MagicMock()
+        fact_check_item.title = "Fact title"
+        fact_check_item.rating = "False"
+        fact_check_item.summary = "Summary"
+        fact_check_item.content = "Details"
+        fact_check_item.source_url = None
+        fact_check_id = str(uuid4())
+
+        similarity_prompt = _build_scan_note_prompt(
+            {
+                "content": "claim",
+                "scan_type": "similarity",
+                "fact_check_item_id": fact_check_id,
+                "similarity_score": 0.9,
+            },
+            {fact_check_id: fact_check_item},
+        )
+        moderation_prompt = _build_scan_note_prompt(
+            {
+                "content": "rude message",
+                "scan_type": "openai_moderation",
+                "moderation_metadata": {"flagged_categories": ["harassment"]},
+            },
+            {},
+        )
+
+        assert "Fact title" in similarity_prompt
+        assert "rude message" in moderation_prompt
+        assert "harassment" in moderation_prompt
+
+    def test_build_scan_note_prompt_missing_fact_check_item(self):
+        from src.dbos_workflows.content_monitoring_workflows import _build_scan_note_prompt
+
+        with pytest.raises(ValueError, match="Fact-check item not found"):
+            _build_scan_note_prompt(
+                {
+                    "content": "claim",
+                    "scan_type": "similarity",
+                    "fact_check_item_id": str(uuid4()),
+                },
+                {},
+            )
+
+
+class TestCallPersistAuditLogBatch:
+    def test_enqueues_one_workflow_per_batch(self):
+        from src.dbos_workflows.content_monitoring_workflows import (
+            _audit_log_batch_workflow,
+            call_persist_audit_log_batch,
+        )
+
+        entries = [
+            {"user_id": None, "action": "POST /api/notes", "resource": "notes"},
+            {"user_id": None, "action": "DELETE /api/notes/1", "resource": "1"},
+        ]
+        with patch(
+            "src.dbos_workflows.content_monitoring_workflows.content_monitoring_queue"
+        ) as mock_queue:
+            call_persist_audit_log_batch(entries)
+
+            mock_queue.enqueue.assert_called_once_with(_audit_log_batch_workflow, entries)
+
+    def test_audit_log_row_parses_ids_and_timestamps(self):
+        from src.dbos_workflows.content_monitoring_workflows import _audit_log_row
+
+        user_id = uuid4()
+        row = _audit_log_row(
+            {
+                "user_id": str(user_id),
+                "action": "POST /api/notes",
+                "resource": "notes",
+                "created_at_iso": "2024-01-15T10:30:00+00:00",
+            }
+        )
+
+        assert row["user_id"] == user_id
+        assert row["created_at"].year == 2024
+        assert row["resource_id"] is None
 
 
 class TestHelperFunctionsStillAccessible:
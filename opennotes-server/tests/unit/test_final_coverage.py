@@ -96,6 +96,7 @@ async def test_users_crud_revoke_api_key():
 @pytest.mark.asyncio
 async def test_users_crud_verify_api_key():
     """Test API key verification."""
+    from src.auth.api_key_cache import api_key_cache
     from src.auth.password import get_password_hash
     from src.users import crud
     from src.users.models import APIKey, User
@@ -150,6 +151,9 @@ async def test_users_crud_verify_api_key():
     assert key == api_key
     assert verified_user == user
 
+    # Verified keys are cached; exercise the remaining cases on the cold path
+    api_key_cache.clear()
+
     # Test with wrong key
     mock_db.reset_mock()
     mock_result1 = MagicMock()
@@ -3,6 +3,7 @@
 This module tests the reusable JSON:API components in src/common/jsonapi.py:
 - Base response schemas (JSONAPIResource, JSONAPIListResponse, etc.)
 - Pagination link generation
+- Pagination cursor encoding
 - Error response formatting
 - Model-to-resource conversion
 """
@@ -10,6 +11,8 @@ This module tests the reusable JSON:API components in src/common/jsonapi.py:
 from datetime import UTC, datetime
 from uuid import uuid4
 
+import pytest
+
 
 class TestJSONAPIResourceConversion:
     """Tests for converting models to JSON:API resource objects."""
@@ -266,6 +269,100 @@ class TestPaginationLinks:
         assert "filter[status]=NEEDS_MORE_RATINGS" in links.next_
         assert "page[number]=2" in links.next_
 
+    def test_pagination_links_without_total_use_lookahead(self):
+        """Test that uncounted page-number links omit last and follow has_next."""
+        from src.common.jsonapi import create_pagination_links
+
+        links = create_pagination_links(
+            base_url="http://test/api/v2/notes",
+            page=2,
+            size=20,
+            total=None,
+            has_next=True,
+        )
+
+        assert links.last is None
+        assert links.prev is not None
+        assert "page[number]=1" in links.prev
+        assert links.next_ is not None
+        assert "page[number]=3" in links.next_
+
+        links = create_pagination_links(
+            base_url="http://test/api/v2/notes",
+            page=2,
+            size=20,
+            total=None,
+            has_next=False,
+        )
+
+        assert links.next_ is None
+
+    def test_cursor_pagination_links(self):
+        """Test cursor pagination links carry page[after] instead of page[number]."""
+        from src.common.jsonapi import create_pagination_links
+
+        links = create_pagination_links(
+            base_url="http://test/api/v2/notes",
+            page=None,
+            size=20,
+            total=None,
+            query_params={"filter[status]": "NEEDS_MORE_RATINGS"},
+            cursor="abc",
+            next_cursor="def",
+        )
+
+        assert links.self_ is not None
+        assert "page[after]=abc" in links.self_
+        assert "page[number]" not in links.self_
+        assert links.first is not None
+        assert "page[after]=&" in links.first
+        assert links.next_ is not None
+        assert "page[after]=def" in links.next_
+        assert "filter[status]=NEEDS_MORE_RATINGS" in links.next_
+        assert links.last is None
+        assert links.prev is None
+
+    def test_cursor_pagination_links_last_page(self):
+        """Test cursor pagination links have no next link on the last page."""
+        from src.common.jsonapi import create_pagination_links
+
+        links = create_pagination_links(
+            base_url="http://test/api/v2/notes",
+            page=None,
+            size=20,
+            total=5,
+            cursor="abc",
+            next_cursor=None,
+        )
+
+        assert links.next_ is None
+
+
+class TestPaginationCursor:
+    """Tests for opaque pagination cursor encoding."""
+
+    def test_cursor_round_trip(self):
+        """Test that encoded cursors decode to JSON-serializable values."""
+        from uuid import UUID
+
+        from src.common.jsonapi import decode_cursor, encode_cursor
+
+        created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        note_id = UUID("01234567-89ab-cdef-0123-456789abcdef")
+
+        cursor = encode_cursor([created_at, note_id, 7])
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == [created_at.isoformat(), str(note_id), 7]
+
+    @pytest.mark.parametrize("cursor", ["!!!", "bm90LWpzb24", "e30", "W10"])
+    def test_decode_cursor_rejects_malformed(self, cursor):
+        """Test that malformed, non-list, and empty cursors raise ValueError."""
+        from src.common.jsonapi import decode_cursor
+
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(cursor)
+
 
 class TestErrorResponseFormatting:
     """Tests for JSON:API error response formatting."""
@@ -1,10 +1,13 @@
 """Unit tests for PreviouslySeenService."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import pendulum
 import pytest
 
+from src.fact_checking.previously_seen_schemas import PreviouslySeenMessageBatchItem
 from src.fact_checking.previously_seen_service import PreviouslySeenService
 
 
@@ -210,3 +213,96 @@ class TestPreviouslySeenServiceStoreMethod:
             )
 
             assert result is None
+
+
+class TestPreviouslySeenServiceStoreBatch:
+    """Test PreviouslySeenService.store_messages_batch()."""
+
+    @staticmethod
+    def _chunk_embedding_service() -> MagicMock:
+        service = MagicMock()
+        service.chunking_service.chunk_text.side_effect = lambda text: text.split(". ")
+        service.chunk_and_embed_previously_seen_batch = AsyncMock(return_value={})
+        return service
+
+    @staticmethod
+    def _record(community_server_id, item: PreviouslySeenMessageBatchItem) -> SimpleNamespace:
+        return SimpleNamespace(
+            id=uuid4(),
+            community_server_id=community_server_id,
+            original_message_id=item.original_message_id,
+            published_note_id=item.published_note_id,
+            embedding=None,
+            embedding_provider=None,
+            embedding_model=None,
+            extra_metadata={**item.extra_metadata, "content": item.content},
+            created_at=pendulum.now("UTC"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_database(self):
+        mock_db = AsyncMock()
+
+        result = await PreviouslySeenService().store_messages_batch(
+            db=mock_db,
+            community_server_id=uuid4(),
+            messages=[],
+            chunk_embedding_service=self._chunk_embedding_service(),
+        )
+
+        assert result == []
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_is_written_in_one_transaction(self):
+        community_server_id = uuid4()
+        items = [
+            PreviouslySeenMessageBatchItem(
+                original_message_id=str(n),
+                published_note_id=uuid4(),
+                content=f"Claim {n}. Shared boilerplate",
+            )
+            for n in range(3)
+        ]
+        records = [self._record(community_server_id, item) for item in items]
+        insert_result = MagicMock()
+        insert_result.scalars.return_value.all.return_value = records
+        mock_db = AsyncMock()
+        mock_db.execute = AsyncMock(return_value=insert_result)
+        chunk_service = self._chunk_embedding_service()
+
+        result = await PreviouslySeenService().store_messages_batch(
+            db=mock_db,
+            community_server_id=community_server_id,
+            messages=items,
+            chunk_embedding_service=chunk_service,
+        )
+
+        assert [r.original_message_id for r in result] == ["0", "1", "2"]
+        assert result[0].extra_metadata["content"] == "Claim 0. Shared boilerplate"
+        mock_db.execute.assert_awaited_once()
+        chunk_service.chunk_and_embed_previously_seen_batch.assert_awaited_once()
+        by_message = chunk_service.chunk_and_embed_previously_seen_batch.call_args.kwargs[
+            "chunk_texts_by_message"
+        ]
+        assert by_message[records[1].id] == ["Claim 1", "Shared boilerplate"]
+        mock_db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_rolls_back_and_returns_empty_on_failure(self):
+        item = PreviouslySeenMessageBatchItem(
+            original_message_id="1", published_note_id=uuid4(), content="text"
+        )
+        mock_db = AsyncMock()
+        mock_db.execute.side_effect = Exception("Database error")
+
+        result = await PreviouslySeenService().store_messages_batch(
+            db=mock_db,
+            community_server_id=uuid4(),
+            messages=[item],
+            chunk_embedding_service=self._chunk_embedding_service(),
+        )
+
+        assert result == []
+        mock_db.rollback.assert_awaited_once()
+        mock_db.commit.assert_not_called()
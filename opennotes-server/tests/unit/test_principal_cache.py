@@ -0,0 +1,175 @@
+"""Unit tests for the authenticated principal cache."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pendulum
+import pytest
+from sqlalchemy import inspect
+
+from src.auth import principal_cache as principal_cache_module
+from src.auth.dependencies import _load_principal_user
+from src.auth.principal_cache import PrincipalCache
+from src.users.models import User
+from tests.redis_mock import create_stateful_redis_mock
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def redis():
+    mock_redis = create_stateful_redis_mock()
+    fake_client = SimpleNamespace(client=mock_redis, get=mock_redis.get, set=mock_redis.set)
+    with patch.object(principal_cache_module, "redis_client", fake_client):
+        yield mock_redis
+
+
+@pytest.fixture
+def cache(redis):
+    return PrincipalCache(ttl_seconds=30, max_size=100)
+
+
+def _make_user() -> User:
+    return User(
+        id=uuid4(),
+        username="alice",
+        email="alice@example.com",
+        hashed_password="hash",
+        full_name=None,
+        is_active=True,
+        principal_type="human",
+        platform_roles=["platform_admin"],
+        banned_at=None,
+        ban_reason=None,
+        discord_id=None,
+        tokens_valid_after=pendulum.datetime(2026, 1, 1),
+        created_at=pendulum.datetime(2025, 1, 1),
+        updated_at=pendulum.datetime(2025, 1, 1),
+    )
+
+
+def _mock_db() -> AsyncMock:
+    db = AsyncMock()
+    db.merge = AsyncMock(side_effect=lambda instance, load: instance)
+    return db
+
+
+class TestPrincipalCacheUsers:
+    @pytest.mark.asyncio
+    async def test_hit_returns_detached_copy_merged_without_load(self, cache):
+        user = _make_user()
+        cache.put_user(user)
+        db = _mock_db()
+
+        cached = await cache.get_user(db, user.id)
+
+        assert cached is not user
+        assert cached.username == "alice"
+        assert cached.tokens_valid_after == user.tokens_valid_after
+        assert inspect(cached).detached
+        db.merge.assert_awaited_once()
+        assert db.merge.await_args.kwargs == {"load": False}
+
+    @pytest.mark.asyncio
+    async def test_cached_columns_are_isolated_from_the_source_row(self, cache):
+        user = _make_user()
+        cache.put_user(user)
+        user.platform_roles.append("mutated")
+
+        cached = await cache.get_user(_mock_db(), user.id)
+
+        assert cached.platform_roles == ["platform_admin"]
+
+    @pytest.mark.asyncio
+    async def test_invalidation_marker_makes_entries_stale(self, cache, redis):
+        user = _make_user()
+        cache.put_user(user)
+        other_instance = PrincipalCache(ttl_seconds=30, max_size=100)
+
+        await other_instance.invalidate_user(user.id)
+
+        assert await cache.get_user(_mock_db(), user.id) is None
+        assert await redis.get(f"principal_invalidated:user:{user.id}") is not None
+
+    @pytest.mark.asyncio
+    async def test_entries_recached_during_grace_window_are_stale(self, cache):
+        user = _make_user()
+        await cache.invalidate_user(user.id)
+        cache.put_user(user)
+
+        assert await cache.get_user(_mock_db(), user.id) is None
+
+    @pytest.mark.asyncio
+    async def test_marker_read_failure_is_treated_as_stale(self, cache, redis):
+        user = _make_user()
+        cache.put_user(user)
+        redis.get = AsyncMock(side_effect=ConnectionError("Redis down"))
+
+        assert await cache.get_user(_mock_db(), user.id) is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_redis_connection(self):
+        cache = PrincipalCache(ttl_seconds=30, max_size=100)
+        disconnected = SimpleNamespace(client=None)
+        with patch.object(principal_cache_module, "redis_client", disconnected):
+            user = _make_user()
+            cache.put_user(user)
+            cache.put_profile_id(user.id, uuid4())
+
+            assert await cache.get_user(_mock_db(), user.id) is None
+            assert await cache.get_profile_id(user.id) is None
+
+
+class TestPrincipalCacheCommunities:
+    @pytest.mark.asyncio
+    async def test_community_ids_round_trip_and_invalidate(self, cache):
+        profile_id = uuid4()
+        community_ids = [uuid4(), uuid4()]
+        cache.put_community_ids(profile_id, community_ids)
+
+        assert await cache.get_community_ids(profile_id) == community_ids
+
+        await cache.invalidate_profile(profile_id)
+
+        assert await cache.get_community_ids(profile_id) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user_drops_profile_id(self, cache):
+        user_id, profile_id = uuid4(), uuid4()
+        cache.put_profile_id(user_id, profile_id)
+
+        assert await cache.get_profile_id(user_id) == profile_id
+
+        await cache.invalidate_user(user_id)
+
+        assert await cache.get_profile_id(user_id) is None
+
+    @pytest.mark.asyncio
+    async def test_profile_id_honours_invalidation_from_other_instance(self, cache):
+        user_id = uuid4()
+        cache.put_profile_id(user_id, uuid4())
+        other_instance = PrincipalCache(ttl_seconds=30, max_size=100)
+
+        await other_instance.invalidate_user(user_id)
+
+        assert await cache.get_profile_id(user_id) is None
+
+
+class TestLoadPrincipalUser:
+    @pytest.mark.asyncio
+    async def test_second_load_skips_database(self, redis):
+        cache = PrincipalCache(ttl_seconds=30, max_size=100)
+        user = _make_user()
+        get_user = AsyncMock(return_value=user)
+
+        with (
+            patch("src.auth.dependencies.principal_cache", cache),
+            patch("src.auth.dependencies.get_user_by_id", get_user),
+        ):
+            first = await _load_principal_user(MagicMock(), user.id)
+            second = await _load_principal_user(_mock_db(), user.id)
+
+        assert first is user
+        assert second.id == user.id
+        get_user.assert_awaited_once()
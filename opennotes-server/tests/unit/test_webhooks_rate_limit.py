@@ -385,3 +385,54 @@ class TestRateLimiter:
         assert allowed is False
         assert remaining == 0
         connected_limiter.redis_client.zrem.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_check_rate_limit_batch_grants_all_within_limit(self, connected_limiter):
+        mock_pipeline = AsyncMock()
+        mock_pipeline.execute = AsyncMock(return_value=[None, None, 15, None])
+        mock_pipeline.__aenter__ = AsyncMock(return_value=mock_pipeline)
+        mock_pipeline.__aexit__ = AsyncMock(return_value=None)
+
+        connected_limiter.redis_client.pipeline = MagicMock(return_value=mock_pipeline)
+
+        with patch("src.webhooks.rate_limit.settings") as mock_settings:
+            mock_settings.WEBHOOK_RATE_LIMIT_PER_COMMUNITY_SERVER = 100
+            mock_settings.WEBHOOK_RATE_LIMIT_WINDOW = 60
+
+            granted, remaining = await connected_limiter.check_rate_limit_batch("guild_123", 5)
+
+        assert granted == 5
+        assert remaining == 85
+        assert len(mock_pipeline.zadd.call_args.args[1]) == 5
+        connected_limiter.redis_client.pipeline.assert_called_once()
+        connected_limiter.redis_client.zrem.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_check_rate_limit_batch_releases_excess_slots(self, connected_limiter):
+        mock_pipeline = AsyncMock()
+        mock_pipeline.execute = AsyncMock(return_value=[None, None, 103, None])
+        mock_pipeline.__aenter__ = AsyncMock(return_value=mock_pipeline)
+        mock_pipeline.__aexit__ = AsyncMock(return_value=None)
+
+        connected_limiter.redis_client.pipeline = MagicMock(return_value=mock_pipeline)
+
+        with patch("src.webhooks.rate_limit.settings") as mock_settings:
+            mock_settings.WEBHOOK_RATE_LIMIT_PER_COMMUNITY_SERVER = 100
+            mock_settings.WEBHOOK_RATE_LIMIT_WINDOW = 60
+
+            granted, remaining = await connected_limiter.check_rate_limit_batch("guild_123", 5)
+
+        assert granted == 2
+        assert remaining == 0
+        members = list(mock_pipeline.zadd.call_args.args[1])
+        connected_limiter.redis_client.zrem.assert_called_once()
+        assert list(connected_limiter.redis_client.zrem.call_args.args[1:]) == members[2:]
+
+    @pytest.mark.asyncio
+    async def test_check_rate_limit_batch_zero_count(self, connected_limiter):
+        connected_limiter.redis_client.pipeline = MagicMock()
+
+        granted, remaining = await connected_limiter.check_rate_limit_batch("guild_123", 0)
+
+        assert (granted, remaining) == (0, 0)
+        connected_limiter.redis_client.pipeline.assert_not_called()
@@ -8,18 +8,22 @@ changing the public ``compute_sentiment_stats`` signature.
 from __future__ import annotations
 
 import asyncio
+import json
+from typing import Any
 
 from src.analyses.opinions._schemas import (
     SentimentScore,
     SentimentStatsReport,
     _SentimentBatchLLM,
 )
+from src.cache import utterance_analysis_cache
 from src.config import Settings, get_settings
 from src.services.gemini_agent import build_agent, run_vertex_agent_with_retry
 from src.services.vertex_limiter import vertex_slot
 from src.utterances.schema import Utterance
 
 _BATCH_SIZE = 10
+_CACHE_ANALYSIS = "sentiment"
 
 _SYSTEM_PROMPT = (
     "You are a sentiment classifier. For each utterance, return a sentiment "
@@ -68,26 +72,68 @@ async def compute_sentiment_stats(
     utterances: list[Utterance],
     *,
     settings: Settings | None = None,
+    pool: Any | None = None,
 ) -> SentimentStatsReport:
     """Compute per-utterance sentiment scores and aggregate distribution stats.
 
     Batches utterances into groups of ~10 for cost efficiency. Returns a pure
-    Pydantic report with no Vibecheck-specific coupling.
+    Pydantic report with no Vibecheck-specific coupling. When ``pool`` is
+    given, scores are memoized per normalized utterance text and only
+    uncached texts (each distinct text once) are sent to the model.
     """
     if not utterances:
         return _aggregate([])
 
     settings = settings or get_settings()
+
+    indexed: list[tuple[str, Utterance]] = [
+        (_utterance_id(utt, idx), utt) for idx, utt in enumerate(utterances)
+    ]
+    text_hashes = [
+        utterance_analysis_cache.utterance_text_hash(utt.text or "") for _, utt in indexed
+    ]
+    version = utterance_analysis_cache.analysis_version(
+        _SYSTEM_PROMPT,
+        settings.VERTEXAI_FAST_MODEL,
+        json.dumps(_SentimentBatchLLM.model_json_schema(), sort_keys=True),
+    )
+    cached = await utterance_analysis_cache.lookup(pool, _CACHE_ANALYSIS, version, text_hashes)
+
+    misses: dict[str, tuple[str, Utterance]] = {}
+    for item, text_hash in zip(indexed, text_hashes, strict=True):
+        if text_hash not in cached:
+            misses.setdefault(text_hash, item)
+    fresh = await _score_uncached(list(misses.items()), settings) if misses else {}
+    await utterance_analysis_cache.store(
+        pool,
+        _CACHE_ANALYSIS,
+        version,
+        fresh,
+        ttl_hours=settings.UTTERANCE_ANALYSIS_CACHE_TTL_HOURS,
+    )
+
+    by_hash = {**cached, **fresh}
+    all_scores = [
+        SentimentScore(utterance_id=uid, **by_hash[text_hash])
+        for (uid, _), text_hash in zip(indexed, text_hashes, strict=True)
+        if text_hash in by_hash
+    ]
+    return _aggregate(all_scores)
+
+
+async def _score_uncached(
+    items: list[tuple[str, tuple[str, Utterance]]],
+    settings: Settings,
+) -> dict[str, dict[str, Any]]:
+    """Score ``(text_hash, (utterance_id, utterance))`` items; returns payloads by hash."""
     agent = build_agent(
         settings,
         output_type=_SentimentBatchLLM,
         system_prompt=_SYSTEM_PROMPT,
         name="vibecheck.sentiment",
     )
-
-    indexed: list[tuple[str, Utterance]] = [
-        (_utterance_id(utt, idx), utt) for idx, utt in enumerate(utterances)
-    ]
+    hash_by_uid = {uid: text_hash for text_hash, (uid, _) in items}
+    indexed = [item for _, item in items]
 
     async def _run_batch(batch: list[tuple[str, Utterance]]) -> list[SentimentScore]:
         prompt = _format_batch(batch)
@@ -128,6 +174,8 @@ async def compute_sentiment_stats(
                 task.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
         raise
-    all_scores = [score for scores in batch_scores for score in scores]
-
-    return _aggregate(all_scores)
+    return {
+        hash_by_uid[score.utterance_id]: score.model_dump(mode="json", exclude={"utterance_id"})
+        for scores in batch_scores
+        for score in scores
+    }
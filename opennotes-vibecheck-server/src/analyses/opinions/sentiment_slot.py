@@ -17,7 +17,7 @@ async def run_sentiment(
 ) -> dict[str, Any]:
     del task_attempt, payload
     utterances = await load_job_utterances(pool, job_id)
-    report = await compute_sentiment_stats(utterances, settings=settings)
+    report = await compute_sentiment_stats(utterances, settings=settings, pool=pool)
     return {"sentiment_stats": report.model_dump(mode="json")}
 
 
@@ -8,13 +8,27 @@ Firecrawl utterances are always text.
 
 from __future__ import annotations
 
+import json
+from typing import Any
+
 from src.analyses.safety._schemas import HarmfulContentMatch
+from src.cache import utterance_analysis_cache
+from src.config import Settings, get_settings
 from src.monitoring import get_logger
-from src.services.openai_moderation import OpenAIModerationService
+from src.services.openai_moderation import (
+    MODERATION_MODEL,
+    ModerationResult,
+    OpenAIModerationService,
+)
 from src.utterances.schema import Utterance
 
 logger = get_logger(__name__)
 
+_CACHE_ANALYSIS = "openai_moderation"
+_CACHE_VERSION = utterance_analysis_cache.analysis_version(
+    MODERATION_MODEL, json.dumps(ModerationResult.model_json_schema(), sort_keys=True)
+)
+
 
 class OpenAIModerationTransientError(Exception):
     """Raised when the OpenAI moderation API call fails.
@@ -37,12 +51,17 @@ async def check_content_moderation(
 async def check_content_moderation_bulk(
     utterances: list[Utterance],
     moderation_service: OpenAIModerationService | None,
+    *,
+    pool: Any | None = None,
+    settings: Settings | None = None,
 ) -> list[HarmfulContentMatch | None]:
     """Run OpenAI content moderation on all utterances in ONE request.
 
     OpenAI's moderation API accepts an array input and returns one result per
     input in order. Index-aligned output; `None` in slot i means unflagged (or
-    that utterance lacked text / id).
+    that utterance lacked text / id). When ``pool`` is given, results are
+    memoized per normalized text and the request only carries distinct
+    uncached texts.
 
     Raises `OpenAIModerationTransientError` when the moderation API call fails
     so the slot orchestrator can decide how to combine with the parallel GCP
@@ -62,18 +81,45 @@ async def check_content_moderation_bulk(
     if not scanable:
         return out
 
-    texts = [u.text for _, u in scanable]
-    try:
-        results = await moderation_service.moderate_texts(texts)
-    except Exception as e:
-        logger.warning(
-            "Error in bulk content moderation",
-            extra={"error": str(e), "batch_size": len(texts)},
-        )
-        raise OpenAIModerationTransientError(str(e)) from e
-
-    for (orig_idx, utterance), result in zip(scanable, results, strict=False):
-        if result.flagged:
+    text_hashes = [
+        utterance_analysis_cache.utterance_text_hash(u.text or "") for _, u in scanable
+    ]
+    cached = await utterance_analysis_cache.lookup(
+        pool, _CACHE_ANALYSIS, _CACHE_VERSION, text_hashes
+    )
+    by_hash: dict[str, ModerationResult] = {
+        text_hash: ModerationResult.model_validate(payload)
+        for text_hash, payload in cached.items()
+    }
+
+    missing: dict[str, str] = {}
+    for (_, u), text_hash in zip(scanable, text_hashes, strict=True):
+        if text_hash not in by_hash:
+            missing.setdefault(text_hash, u.text or "")
+    if missing:
+        texts = list(missing.values())
+        try:
+            fresh = await moderation_service.moderate_texts(texts)
+        except Exception as e:
+            logger.warning(
+                "Error in bulk content moderation",
+                extra={"error": str(e), "batch_size": len(texts)},
+            )
+            raise OpenAIModerationTransientError(str(e)) from e
+        fresh_by_hash = dict(zip(missing, fresh, strict=False))
+        by_hash.update(fresh_by_hash)
+        if pool is not None:
+            await utterance_analysis_cache.store(
+                pool,
+                _CACHE_ANALYSIS,
+                _CACHE_VERSION,
+                {text_hash: r.model_dump(mode="json") for text_hash, r in fresh_by_hash.items()},
+                ttl_hours=(settings or get_settings()).UTTERANCE_ANALYSIS_CACHE_TTL_HOURS,
+            )
+
+    results = [by_hash.get(text_hash) for text_hash in text_hashes]
+    for (orig_idx, utterance), result in zip(scanable, results, strict=True):
+        if result is not None and result.flagged:
             out[orig_idx] = HarmfulContentMatch(
                 source="openai",
                 utterance_id=utterance.utterance_id or "",
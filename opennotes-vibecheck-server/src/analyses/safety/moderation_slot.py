@@ -28,6 +28,15 @@ class ModerationSlotError(Exception):
     """Raised when BOTH providers fail — slot worker retries via Cloud Tasks."""
 
 
+def build_openai_moderation_service(
+    settings: Settings | None,
+) -> OpenAIModerationService | None:
+    """OpenAI moderation client, or None when no API key is configured."""
+    if settings is not None and getattr(settings, "OPENAI_API_KEY", ""):
+        return OpenAIModerationService(client=AsyncOpenAI(api_key=settings.OPENAI_API_KEY))
+    return None
+
+
 async def run_safety_moderation(
     pool: Any,
     job_id: UUID,
@@ -43,14 +52,12 @@ async def run_safety_moderation(
         for utterance in utterances
     }
 
-    moderation_service: OpenAIModerationService | None = None
-    if settings is not None and getattr(settings, "OPENAI_API_KEY", ""):
-        moderation_service = OpenAIModerationService(
-            client=AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-        )
+    moderation_service = build_openai_moderation_service(settings)
 
     async with httpx.AsyncClient() as hx:
-        openai_task = check_content_moderation_bulk(utterances, moderation_service)
+        openai_task = check_content_moderation_bulk(
+            utterances, moderation_service, pool=pool, settings=settings
+        )
         gcp_task = moderate_texts_gcp(utterances, httpx_client=hx)
         openai_res, gcp_res = await asyncio.gather(
             openai_task, gcp_task, return_exceptions=True
@@ -85,4 +92,8 @@ async def run_safety_moderation(
     return {"harmful_content_matches": matches}
 
 
-__all__ = ["ModerationSlotError", "run_safety_moderation"]
+__all__ = [
+    "ModerationSlotError",
+    "build_openai_moderation_service",
+    "run_safety_moderation",
+]
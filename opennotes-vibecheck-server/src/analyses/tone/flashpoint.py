@@ -17,13 +17,15 @@ utterances[:i] is the prior context for utterances[i].
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import json
+from typing import TYPE_CHECKING, Any
 
 from src.analyses.tone._flashpoint_schemas import (
     FlashpointMatch,
     RiskLevel,
     _BulkFlashpointLLM,
 )
+from src.cache import utterance_analysis_cache
 from src.config import Settings
 from src.monitoring import get_logger
 from src.services.gemini_agent import build_agent, run_vertex_agent_with_retry
@@ -51,6 +53,9 @@ _BULK_SYSTEM_PROMPT = (
 )
 
 
+_CACHE_ANALYSIS = "flashpoint"
+
+
 def _format_utterance(u: Utterance) -> str:
     who = u.author or u.utterance_id or "unknown"
     return f"{who}: {u.text}"
@@ -61,6 +66,7 @@ async def detect_flashpoints_bulk(
     settings: Settings,
     *,
     score_threshold: int = 50,
+    pool: Any | None = None,
 ) -> list[FlashpointMatch | None]:
     """Score every utterance for flashpoint risk in ONE LLM call.
 
@@ -69,6 +75,10 @@ async def detect_flashpoints_bulk(
     ``score_threshold``, else ``None``. Errors from the LLM short-circuit
     to all-None (logged) so the orchestrator can still ship a partial
     SidebarPayload.
+
+    Scores depend on the prior context, so when ``pool`` is given the raw
+    model output is memoized per whole formatted conversation rather than
+    per utterance.
     """
     out: list[FlashpointMatch | None] = [None for _ in utterances]
     if len(utterances) <= 1:
@@ -84,19 +94,39 @@ async def detect_flashpoints_bulk(
     if not numbered:
         return out
 
-    agent = build_agent(
-        settings,
-        output_type=_BulkFlashpointLLM,
-        system_prompt=_BULK_SYSTEM_PROMPT,
-        name="vibecheck.flashpoint",
+    prompt = "Conversation:\n" + "\n".join(numbered)
+    conversation_hash = utterance_analysis_cache.utterance_text_hash(prompt)
+    version = utterance_analysis_cache.analysis_version(
+        _BULK_SYSTEM_PROMPT,
+        settings.VERTEXAI_FAST_MODEL,
+        json.dumps(_BulkFlashpointLLM.model_json_schema(), sort_keys=True),
     )
-    try:
-        async with vertex_slot(settings):
-            result = await run_vertex_agent_with_retry(agent, "Conversation:\n" + "\n".join(numbered))
-    except Exception as exc:
-        logger.warning("bulk flashpoint detection failed: %s", exc)
-        return out
-    parsed: _BulkFlashpointLLM = result.output
+    cached = await utterance_analysis_cache.lookup(
+        pool, _CACHE_ANALYSIS, version, [conversation_hash]
+    )
+    if conversation_hash in cached:
+        parsed = _BulkFlashpointLLM.model_validate(cached[conversation_hash])
+    else:
+        agent = build_agent(
+            settings,
+            output_type=_BulkFlashpointLLM,
+            system_prompt=_BULK_SYSTEM_PROMPT,
+            name="vibecheck.flashpoint",
+        )
+        try:
+            async with vertex_slot(settings):
+                result = await run_vertex_agent_with_retry(agent, prompt)
+        except Exception as exc:
+            logger.warning("bulk flashpoint detection failed: %s", exc)
+            return out
+        parsed = result.output
+        await utterance_analysis_cache.store(
+            pool,
+            _CACHE_ANALYSIS,
+            version,
+            {conversation_hash: parsed.model_dump(mode="json")},
+            ttl_hours=settings.UTTERANCE_ANALYSIS_CACHE_TTL_HOURS,
+        )
 
     for entry in parsed.results:
         idx = entry.utterance_index
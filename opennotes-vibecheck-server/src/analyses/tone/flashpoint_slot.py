@@ -17,7 +17,7 @@ async def run_flashpoint(
 ) -> dict[str, Any]:
     del task_attempt, payload
     utterances = await load_job_utterances(pool, job_id)
-    matches = await detect_flashpoints_bulk(utterances, settings)
+    matches = await detect_flashpoints_bulk(utterances, settings, pool=pool)
     return {
         "flashpoint_matches": [
             match.model_dump(mode="json") for match in matches if match is not None
@@ -14,10 +14,13 @@ minimal `insufficient_conversation=True` report is returned.
 
 from __future__ import annotations
 
+import json
 from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from src.analyses.stream_types import UtteranceStreamType
+from src.cache import utterance_analysis_cache
 from src.config import Settings
 from src.services.gemini_agent import build_agent, run_vertex_agent_with_retry
 from src.services.vertex_limiter import vertex_slot
@@ -28,6 +31,7 @@ from ._scd_schemas import SCDReport
 __all__ = ["SCDReport", "analyze_scd"]
 
 _PROMPT_PATH = Path(__file__).parent / "prompts" / "scd_prompt.txt"
+_CACHE_ANALYSIS = "scd"
 
 _INSUFFICIENT_SUMMARY = (
     "Insufficient conversation for dynamics analysis: fewer than two "
@@ -100,12 +104,16 @@ async def analyze_scd(
     settings: Settings,
     *,
     utterance_stream_type: UtteranceStreamType = UtteranceStreamType.UNKNOWN,
+    pool: Any | None = None,
 ) -> SCDReport:
     """Analyze tone/dynamics of a conversation using the SCD prompt.
 
     Args:
         utterances: Ordered list of utterances from `extract_utterances`.
         settings: Application settings (provides Vertex AI project/location/model).
+        pool: When given, the model's report is memoized per formatted
+            conversation and stream type, so an unchanged thread is not
+            re-analyzed.
 
     Returns:
         SCDReport with `narrative` + `speaker_arcs` populated alongside the
@@ -117,19 +125,38 @@ async def analyze_scd(
         return _insufficient_report(utterance_stream_type)
 
     prompt = _load_scd_prompt()
-    agent = build_agent(
-        settings,
-        output_type=SCDReport,
-        system_prompt=prompt,
-        name="vibecheck.scd",
-    )
     formatted = _format_utterances(utterances)
     user_prompt = (
         f"Upstream-claimed utterance_stream_type: {utterance_stream_type.value}\n"
         "Treat this as advisory. Classify the observed stream yourself in the output.\n\n"
         f"{formatted}"
     )
-    async with vertex_slot(settings):
-        result = await run_vertex_agent_with_retry(agent, user_prompt)
-    report = result.output
+    conversation_hash = utterance_analysis_cache.utterance_text_hash(user_prompt)
+    version = utterance_analysis_cache.analysis_version(
+        prompt,
+        settings.VERTEXAI_FAST_MODEL,
+        json.dumps(SCDReport.model_json_schema(), sort_keys=True),
+    )
+    cached = await utterance_analysis_cache.lookup(
+        pool, _CACHE_ANALYSIS, version, [conversation_hash]
+    )
+    if conversation_hash in cached:
+        report = SCDReport.model_validate(cached[conversation_hash])
+    else:
+        agent = build_agent(
+            settings,
+            output_type=SCDReport,
+            system_prompt=prompt,
+            name="vibecheck.scd",
+        )
+        async with vertex_slot(settings):
+            result = await run_vertex_agent_with_retry(agent, user_prompt)
+        report = result.output
+        await utterance_analysis_cache.store(
+            pool,
+            _CACHE_ANALYSIS,
+            version,
+            {conversation_hash: report.model_dump(mode="json")},
+            ttl_hours=settings.UTTERANCE_ANALYSIS_CACHE_TTL_HOURS,
+        )
     return report.model_copy(update={"upstream_stream_type": utterance_stream_type})
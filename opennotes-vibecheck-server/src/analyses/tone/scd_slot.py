@@ -25,6 +25,7 @@ async def run_scd(
         utterances,
         settings,
         utterance_stream_type=utterance_stream_type,
+        pool=pool,
     )
     return {"scd": report.model_dump(mode="json")}
 
@@ -1036,6 +1036,7 @@ BEGIN
     -- so the high-cardinality URL keys do not grow unbounded.
     DELETE FROM public.vibecheck_image_analysis_cache WHERE expires_at < pg_catalog.now();
     DELETE FROM public.vibecheck_video_analysis_cache WHERE expires_at < pg_catalog.now();
+    DELETE FROM public.vibecheck_utterance_analysis_cache WHERE expires_at < pg_catalog.now();
 
     RETURN purged;
 END;
@@ -1091,6 +1092,29 @@ ALTER TABLE public.vibecheck_video_analysis_cache ENABLE ROW LEVEL SECURITY;
 ALTER TABLE public.vibecheck_video_analysis_cache FORCE ROW LEVEL SECURITY;
 REVOKE ALL ON public.vibecheck_video_analysis_cache FROM anon, authenticated;
 
+-- =========================================================================
+-- vibecheck_utterance_analysis_cache (per-utterance model output memoization)
+-- =========================================================================
+-- Keyed by analysis name, a digest of the prompt/model version, and the
+-- sha256 of the normalized utterance text, so the same comment analyzed for
+-- a resubmitted URL, a near-identical page, or a section retry is served
+-- without another Vertex/OpenAI call.
+
+CREATE TABLE IF NOT EXISTS public.vibecheck_utterance_analysis_cache (
+    analysis TEXT NOT NULL,
+    version TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    result_payload JSONB NOT NULL,
+    checked_at TIMESTAMPTZ NOT NULL DEFAULT pg_catalog.now(),
+    expires_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (analysis, version, text_hash)
+);
+CREATE INDEX IF NOT EXISTS vibecheck_utterance_analysis_cache_expires_at_idx
+    ON public.vibecheck_utterance_analysis_cache (expires_at);
+ALTER TABLE public.vibecheck_utterance_analysis_cache ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.vibecheck_utterance_analysis_cache FORCE ROW LEVEL SECURITY;
+REVOKE ALL ON public.vibecheck_utterance_analysis_cache FROM anon, authenticated;
+
 -- =========================================================================
 -- Extend vibecheck_jobs_error_code_check for current PDF pipeline errors
 -- (TASK-1474.03, TASK-1498.01)
@@ -0,0 +1,143 @@
+"""Content-addressed cache of per-utterance analysis results.
+
+Popular pages are analyzed over and over: resubmitted URLs, near-identical
+pages that share a comment thread, section retries. The model output for a
+given utterance only depends on the analysis, its prompt/model version and
+the utterance text, so results are keyed by
+
+    (analysis, version, sha256(normalized text))
+
+and handlers only send cache misses to Vertex / OpenAI. ``version`` is a
+digest of everything that changes the model's answer (prompt, model name,
+output schema), so editing a prompt or bumping a model naturally misses
+instead of serving stale output.
+
+Conversation-level analyses (flashpoint, SCD) use the same table with the
+digest of the whole formatted conversation as the "text".
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import asyncpg
+
+from src.monitoring_metrics import UTTERANCE_ANALYSIS_CACHE_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_utterance_text(text: str) -> str:
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def utterance_text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_utterance_text(text).encode("utf-8")).hexdigest()
+
+
+def analysis_version(*parts: str) -> str:
+    """Digest of the inputs that determine an analysis's output for a text."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()[:16]
+
+
+async def fetch_cached(
+    pool: asyncpg.Pool, analysis: str, version: str, text_hashes: Iterable[str]
+) -> dict[str, dict[str, Any]]:
+    hashes = list(dict.fromkeys(text_hashes))
+    if not hashes:
+        return {}
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT text_hash, result_payload
+            FROM vibecheck_utterance_analysis_cache
+            WHERE analysis = $1 AND version = $2
+              AND text_hash = ANY($3::text[]) AND expires_at > now()
+            """,
+            analysis,
+            version,
+            hashes,
+        )
+    out: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        payload = row["result_payload"]
+        if isinstance(payload, str):
+            payload = json.loads(payload)
+        out[row["text_hash"]] = payload
+    UTTERANCE_ANALYSIS_CACHE_LOOKUPS.labels(analysis=analysis, outcome="hit").inc(len(out))
+    UTTERANCE_ANALYSIS_CACHE_LOOKUPS.labels(analysis=analysis, outcome="miss").inc(
+        len(hashes) - len(out)
+    )
+    return out
+
+
+async def upsert_cached(
+    pool: asyncpg.Pool,
+    analysis: str,
+    version: str,
+    results: dict[str, dict[str, Any]],
+    *,
+    ttl_hours: int,
+) -> None:
+    if not results:
+        return
+    expires_at = datetime.now(UTC) + timedelta(hours=ttl_hours)
+    rows = [
+        (analysis, version, text_hash, json.dumps(payload), expires_at)
+        for text_hash, payload in results.items()
+    ]
+    async with pool.acquire() as conn:
+        await conn.executemany(
+            """
+            INSERT INTO vibecheck_utterance_analysis_cache
+                (analysis, version, text_hash, result_payload, checked_at, expires_at)
+            VALUES ($1, $2, $3, $4::jsonb, now(), $5)
+            ON CONFLICT (analysis, version, text_hash) DO UPDATE SET
+                result_payload = EXCLUDED.result_payload,
+                checked_at = now(),
+                expires_at = EXCLUDED.expires_at
+            """,
+            rows,
+        )
+
+
+async def lookup(
+    pool: asyncpg.Pool | None, analysis: str, version: str, text_hashes: Iterable[str]
+) -> dict[str, dict[str, Any]]:
+    """Best-effort ``fetch_cached``: no pool or a cache error is an all-miss."""
+    if pool is None:
+        return {}
+    try:
+        return await fetch_cached(pool, analysis, version, text_hashes)
+    except Exception:
+        logger.exception("utterance analysis cache fetch failed; bypassing cache: %s", analysis)
+        return {}
+
+
+async def store(
+    pool: asyncpg.Pool | None,
+    analysis: str,
+    version: str,
+    results: dict[str, dict[str, Any]],
+    *,
+    ttl_hours: int,
+) -> None:
+    """Best-effort ``upsert_cached``: failures are logged, never raised."""
+    if pool is None:
+        return
+    try:
+        await upsert_cached(pool, analysis, version, results, ttl_hours=ttl_hours)
+    except Exception:
+        logger.exception("utterance analysis cache upsert failed; results not persisted: %s", analysis)
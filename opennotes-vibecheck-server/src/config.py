@@ -35,6 +35,14 @@ class Settings(BaseSettings):
     VERTEX_SATURATION_RETRY_BASE_MS: int = 500
     VERTEX_SATURATION_RETRY_MAX_MS: int = 4000
     VERTEX_SATURATION_RETRY_JITTER_MS: int = 250
+    # Adaptive (AIMD) shared limit for the Redis limiter. VERTEX_MAX_CONCURRENCY
+    # is the ceiling; a Vertex 429/RESOURCE_EXHAUSTED multiplies the shared
+    # limit by VERTEX_ADAPTIVE_DECREASE_FACTOR (at most once per cooldown) and
+    # each clean call adds 1/limit back. The local fallback keeps a static cap.
+    VERTEX_ADAPTIVE_CONCURRENCY_ENABLED: bool = True
+    VERTEX_ADAPTIVE_MIN_CONCURRENCY: int = 1
+    VERTEX_ADAPTIVE_DECREASE_FACTOR: float = 0.5
+    VERTEX_ADAPTIVE_DECREASE_COOLDOWN_MS: int = 5_000
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -96,6 +104,10 @@ class Settings(BaseSettings):
     # TASK-1483.24: Frame findings for a given video URL are stable; mirror
     # the image cache TTL. Lower if videos at a stable URL get re-edited.
     VISION_VIDEO_CACHE_TTL_HOURS: int = 168
+    # Per-utterance sentiment / moderation and per-conversation flashpoint /
+    # SCD outputs are memoized by (analysis, prompt+model version, text hash).
+    # A prompt or model change already misses, so the TTL only bounds storage.
+    UTTERANCE_ANALYSIS_CACHE_TTL_HOURS: int = 168
     VIBECHECK_SAFETY_RECOMMENDATION_GUARDRAIL_ENABLED: bool = True
     VIBECHECK_SAFETY_IMAGE_VISION_REVIEW_ENABLED: bool = False
     EVIDENCE_MAX_EXTERNAL_CLAIMS: int = 10
@@ -201,6 +213,10 @@ class Settings(BaseSettings):
     VIBECHECK_BATCH_SECTION_TARGET_BYTES: int = 80_000
     VIBECHECK_BATCH_OVERLAP_BYTES: int = 2_000
     VIBECHECK_BATCH_PARALLEL: int = 3
+    # While batched extraction is still running, score each finished
+    # section's utterances for sentiment/moderation into the utterance
+    # analysis cache so those slots mostly hit the cache once they start.
+    VIBECHECK_SPECULATIVE_ANALYSIS_ENABLED: bool = True
 
     @field_validator("LOGFIRE_EXTRACTOR_CONTENT_SAMPLE_RATE")
     @classmethod
@@ -231,6 +247,8 @@ class Settings(BaseSettings):
         "VERTEX_LEASE_RETRY_MAX_MS",
         "VIBECHECK_LIMITER_REDIS_MAX_CONNECTIONS",
         "VIBECHECK_MAX_INSTANCES",
+        "VERTEX_ADAPTIVE_MIN_CONCURRENCY",
+        "VERTEX_ADAPTIVE_DECREASE_COOLDOWN_MS",
     )
     @classmethod
     def _positive_vertex_limiter_numbers(cls, value: int) -> int:
@@ -238,6 +256,13 @@ class Settings(BaseSettings):
             raise ValueError("Vertex limiter numeric settings must be > 0")
         return value
 
+    @field_validator("VERTEX_ADAPTIVE_DECREASE_FACTOR")
+    @classmethod
+    def _vertex_adaptive_decrease_factor_in_range(cls, value: float) -> float:
+        if not 0 < value < 1:
+            raise ValueError("VERTEX_ADAPTIVE_DECREASE_FACTOR must be between 0 and 1")
+        return value
+
     @field_validator(
         "VERTEX_SATURATION_RETRY_ATTEMPTS",
         "VERTEX_SATURATION_RETRY_JITTER_MS",
@@ -160,7 +160,16 @@ from src.jobs.finalize import maybe_finalize_job
 from src.jobs.pdf_extract import PDFExtractionError, pdf_extract_step
 from src.jobs.scrape_quality import ScrapeQuality, classify_scrape
 from src.jobs.section_defaults import empty_section_data as _empty_section_data
-from src.jobs.slots import mark_slot_done, mark_slot_failed, write_slot
+from src.jobs.slots import (
+    coalesce_slot_writes,
+    mark_slot_done,
+    mark_slot_failed,
+    write_slot,
+)
+from src.jobs.speculative_analysis import (
+    speculative_analysis,
+    wait_for_speculative_analysis,
+)
 from src.jobs.utterance_writes import (
     UtterancePersistenceSuperseded,
     persist_utterances,
@@ -175,6 +184,7 @@ from src.monitoring_metrics import (
     classify_error,
 )
 from src.platforms import PlatformSignal
+from src.services.vertex_limiter import bind_vertex_priority, clear_vertex_priority
 from src.utils.url_security import (
     InvalidURL,
     revalidate_redirect_target,
@@ -1926,6 +1936,7 @@ async def _run_section(
         data: dict[str, Any] = {}
     elif handler is not None:
         try:
+            await wait_for_speculative_analysis(slug)
             data = await handler(pool, job_id, task_attempt, payload, settings)
         except Exception as exc:
             logger.exception(
@@ -2043,7 +2054,9 @@ async def _persist_empty_claim_enrichment_slots(
     task_attempt: UUID,
     slugs: tuple[SectionSlug, ...],
 ) -> None:
-    for slug in slugs:
+    # Issued concurrently so, inside `_run_all_sections`'s coalescing block,
+    # the empty defaults land in a single UPDATE.
+    async def _persist(slug: SectionSlug) -> None:
         slot = SectionSlot(
             state=SectionState.DONE,
             attempt_id=uuid4(),
@@ -2059,6 +2072,8 @@ async def _persist_empty_claim_enrichment_slots(
                 exc,
             )
 
+    await asyncio.gather(*(_persist(slug) for slug in slugs))
+
 
 async def _run_all_sections(
     pool: Any,
@@ -2079,7 +2094,26 @@ async def _run_all_sections(
     `return_exceptions=True` discarded these silently and led to jobs
     that 200'd back to Cloud Tasks while leaving slots unwritten
     (TASK-1473.41).
+
+    Terminal slot writes from the fan-out are coalesced per flush interval
+    (`coalesce_slot_writes`) so sections finishing together share one
+    UPDATE of the job row instead of queueing on its row lock.
     """
+    async with coalesce_slot_writes(pool, job_id, task_attempt):
+        await _fan_out_sections(
+            pool, job_id, task_attempt, payload, settings, test_fail_slug=test_fail_slug
+        )
+
+
+async def _fan_out_sections(
+    pool: Any,
+    job_id: UUID,
+    task_attempt: UUID,
+    payload: Any,
+    settings: Settings,
+    *,
+    test_fail_slug: str | None,
+) -> None:
     dedup_dependent_slugs: tuple[SectionSlug, ...] = (
         SectionSlug.FACTS_CLAIMS_EVIDENCE,
         SectionSlug.FACTS_CLAIMS_PREMISES,
@@ -2914,7 +2948,7 @@ async def _run_headline_summary_step(
 # ---------------------------------------------------------------------------
 
 
-async def _run_pipeline(  # noqa: PLR0912
+async def _run_pipeline(
     pool: Any,
     job_id: UUID,
     task_attempt: UUID,
@@ -2929,7 +2963,32 @@ async def _run_pipeline(  # noqa: PLR0912
     Isolated from the top-level `run_job` so unit tests can substitute an
     `AsyncMock` on this function to exercise the handler's error-handling
     without booting Firecrawl/Gemini/OpenAI.
+
+    Runs under `speculative_analysis` so batched extraction starts scoring
+    each extracted section's utterances before the fan-out begins.
     """
+    async with speculative_analysis(pool, settings):
+        await _run_pipeline_stages(
+            pool,
+            job_id,
+            task_attempt,
+            url,
+            settings,
+            source_type=source_type,
+            test_fail_slug=test_fail_slug,
+        )
+
+
+async def _run_pipeline_stages(  # noqa: PLR0912
+    pool: Any,
+    job_id: UUID,
+    task_attempt: UUID,
+    url: str,
+    settings: Settings,
+    *,
+    source_type: str,
+    test_fail_slug: str | None,
+) -> None:
     scrape_cache = _build_scrape_cache(settings)
     # Tier 2 / extract default-retry client; Tier 1 fail-fast probe client.
     # Both are seams tests can monkeypatch independently; the default-retry
@@ -3530,6 +3589,8 @@ async def run_section_retry(  # noqa: PLR0911, PLR0912
          slot (best-effort) and return 503 so Cloud Tasks retries.
     """
     retry_tokens = bind_contextvars(job_id=job_id, slug=slug)
+    # Section retries queue for Vertex behind interactive jobs.
+    priority_token = bind_vertex_priority("retry")
     try:
         loaded = await _load_job_attempt_and_slot(pool, job_id, slug)
         if loaded is None:
@@ -3738,6 +3799,7 @@ async def run_section_retry(  # noqa: PLR0911, PLR0912
         finally:
             clear_contextvars(attempt_tokens)
     finally:
+        clear_vertex_priority(priority_token)
         clear_contextvars(retry_tokens)
 
 
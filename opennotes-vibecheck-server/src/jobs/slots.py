@@ -9,13 +9,23 @@ manager returning an asyncpg connection-compatible object (i.e. an
 `asyncpg.Pool`). Helpers return the number of rows affected (0 or 1) so the
 caller can detect stale attempts and drop the redelivery.
 
-`slot.data` is serialized via `SectionSlot.model_dump(mode='json')` which
+`slot.data` is serialized via `SectionSlot.model_dump_json()` which
 converts UUIDs and datetimes to strings that Postgres accepts inside
 `JSONB`.
+
+Inside `coalesce_slot_writes(...)`, concurrent `write_slot` calls for the
+same job attempt are buffered for `SLOT_WRITE_FLUSH_INTERVAL_S` and merged
+into one `UPDATE`, so a fan-out of ~15 sections takes the job row lock and
+rewrites the `sections` document a handful of times instead of once per
+section.
 """
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
@@ -32,6 +42,21 @@ WHERE job_id = $1
   AND attempt_id = $2
 """
 
+# write_slots: same CAS as _WRITE_SQL, merging several slots at once. $3 is a
+# JSON object keyed by slug.
+_WRITE_MANY_SQL = """
+UPDATE vibecheck_jobs
+SET sections = sections || $3::jsonb,
+    updated_at = now()
+WHERE job_id = $1
+  AND attempt_id = $2
+"""
+
+# How long the first write in a coalescing window waits for siblings. Short
+# relative to section runtimes (seconds) but long enough to catch the bursts
+# where several handlers finish on the same event-loop tick.
+SLOT_WRITE_FLUSH_INTERVAL_S = 0.02
+
 # claim_slot guards (spec §"Slot write contract", codex W3 P1-4):
 #   1. job.attempt_id matches the caller's task_attempt (CAS against a
 #      retry-rotated attempt).
@@ -126,9 +151,15 @@ WHERE job_id = $1
 
 
 def _dump_slot(slot: SectionSlot) -> str:
-    """Serialize a SectionSlot for JSONB. model_dump(mode='json') converts
-    UUIDs and datetimes to strings so they round-trip cleanly."""
-    return json.dumps(slot.model_dump(mode="json"))
+    """Serialize a SectionSlot for JSONB. model_dump_json() converts UUIDs
+    and datetimes to strings so they round-trip cleanly, and serializes in
+    pydantic-core without building an intermediate dict."""
+    return slot.model_dump_json()
+
+
+def _dump_slot_map(dumped: Mapping[str, str]) -> str:
+    """Join already-serialized slots into one `{slug: slot, ...}` object."""
+    return "{" + ",".join(f"{json.dumps(slug)}:{body}" for slug, body in dumped.items()) + "}"
 
 
 def _rowcount(result: Any) -> int:
@@ -153,7 +184,13 @@ async def write_slot(
     The WHERE clause guards on `attempt_id = task_attempt` so redeliveries
     from a superseded job attempt are rejected. Returns the number of rows
     affected (0 = stale attempt / unknown job, 1 = written).
+
+    Inside a matching `coalesce_slot_writes` block the write is merged with
+    its concurrent siblings; the guard and return value are the same.
     """
+    batch = _active_slot_batch.get()
+    if batch is not None and batch.covers(db, job_id, task_attempt):
+        return await batch.submit(slug, slot)
     async with db.acquire() as conn:
         result = await conn.execute(
             _WRITE_SQL,
@@ -165,6 +202,136 @@ async def write_slot(
     return _rowcount(result)
 
 
+async def write_slots(
+    db: Any,
+    job_id: UUID,
+    task_attempt: UUID,
+    slots: Mapping[SectionSlug, SectionSlot],
+) -> int:
+    """Merge several slots into `sections` in one CAS-guarded UPDATE.
+
+    Same guard as `write_slot`: all slots land together or, on a stale
+    attempt, none do. Returns the number of rows affected (0 or 1).
+    """
+    if not slots:
+        return 0
+    return await _write_dumped_slots(
+        db,
+        job_id,
+        task_attempt,
+        {slug.value: _dump_slot(slot) for slug, slot in slots.items()},
+    )
+
+
+async def _write_dumped_slots(
+    db: Any,
+    job_id: UUID,
+    task_attempt: UUID,
+    dumped: Mapping[str, str],
+) -> int:
+    async with db.acquire() as conn:
+        result = await conn.execute(
+            _WRITE_MANY_SQL,
+            job_id,
+            task_attempt,
+            _dump_slot_map(dumped),
+        )
+    return _rowcount(result)
+
+
+class _SlotWriteBatch:
+    """Buffers `write_slot` calls for one job attempt and flushes them as a
+    single `write_slots` UPDATE after `flush_interval_s`.
+
+    Every caller in a flush waits on the shared statement and receives its
+    rowcount (or its exception), so the per-call contract of `write_slot`
+    is unchanged. Two writes to the same slug in one window keep the later
+    payload, matching what sequential writes would leave behind.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        job_id: UUID,
+        task_attempt: UUID,
+        flush_interval_s: float,
+    ) -> None:
+        self.db = db
+        self.job_id = job_id
+        self.task_attempt = task_attempt
+        self._flush_interval_s = flush_interval_s
+        self._pending: dict[str, str] = {}
+        self._waiters: list[asyncio.Future[int]] = []
+        self._scheduled: asyncio.Task[None] | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    def covers(self, db: Any, job_id: UUID, task_attempt: UUID) -> bool:
+        return db is self.db and job_id == self.job_id and task_attempt == self.task_attempt
+
+    async def submit(self, slug: SectionSlug, slot: SectionSlot) -> int:
+        waiter: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        self._pending[slug.value] = _dump_slot(slot)
+        self._waiters.append(waiter)
+        if self._scheduled is None:
+            self._scheduled = asyncio.create_task(self._flush_after_interval())
+            self._flushes.add(self._scheduled)
+            self._scheduled.add_done_callback(self._flushes.discard)
+        return await waiter
+
+    async def drain(self) -> None:
+        # asyncio.wait (not gather) so cancelling the caller never cancels a
+        # flush other sections are still waiting on.
+        while self._flushes:
+            await asyncio.wait(set(self._flushes))
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self._flush_interval_s)
+        pending, waiters = self._pending, self._waiters
+        self._pending, self._waiters = {}, []
+        self._scheduled = None
+        try:
+            rowcount = await _write_dumped_slots(
+                self.db, self.job_id, self.task_attempt, pending
+            )
+        except Exception as exc:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(exc)
+            return
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(rowcount)
+
+
+_active_slot_batch: ContextVar[_SlotWriteBatch | None] = ContextVar(
+    "vibecheck_active_slot_batch", default=None
+)
+
+
+@asynccontextmanager
+async def coalesce_slot_writes(
+    db: Any,
+    job_id: UUID,
+    task_attempt: UUID,
+    *,
+    flush_interval_s: float = SLOT_WRITE_FLUSH_INTERVAL_S,
+) -> AsyncIterator[None]:
+    """Coalesce `write_slot` calls for this job attempt made inside the block.
+
+    The batch travels in a ContextVar, so tasks created inside the block
+    (the section fan-out) inherit it. Writes for any other job, attempt or
+    pool fall through to a direct UPDATE. Pending writes are flushed before
+    the block exits.
+    """
+    batch = _SlotWriteBatch(db, job_id, task_attempt, flush_interval_s)
+    token = _active_slot_batch.set(batch)
+    try:
+        yield
+    finally:
+        _active_slot_batch.reset(token)
+        await batch.drain()
+
+
 async def claim_slot(
     db: Any,
     job_id: UUID,
@@ -315,9 +482,12 @@ async def mark_slot_failed(
 
 
 __all__ = [
+    "SLOT_WRITE_FLUSH_INTERVAL_S",
     "claim_slot",
+    "coalesce_slot_writes",
     "mark_slot_done",
     "mark_slot_failed",
     "retry_claim_slot",
     "write_slot",
+    "write_slots",
 ]
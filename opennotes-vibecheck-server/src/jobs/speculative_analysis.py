@@ -0,0 +1,143 @@
+"""Start per-utterance analyses while batched extraction is still running.
+
+On a batched page, `extract_utterances_dispatched` extracts sections in
+parallel, then assembles them. The section fan-out can only start after
+that, because slot payloads reference the final, assembled utterance ids.
+For long comment threads, that leaves the per-utterance analyses idle for
+most of the extraction.
+
+Sentiment and OpenAI moderation results are memoized per utterance text in
+`src.cache.utterance_analysis_cache`, not per utterance id. So each
+extracted section's utterances can be scored as soon as the section comes
+back, with the results going only into that cache. When the real slots run
+on the assembled payload, `wait_for_speculative_analysis` lets them pick up
+whatever is still in flight, and their lookups then hit the cache for every
+utterance already scored. Nothing speculative is ever written to a slot.
+
+Conversation-level analyses (flashpoint, SCD) and claim extraction depend
+on the whole thread, so they still wait for the assembled payload.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import cached_property
+from typing import Any
+
+from src.analyses.opinions.sentiment import compute_sentiment_stats
+from src.analyses.safety.moderation import check_content_moderation_bulk
+from src.analyses.safety.moderation_slot import build_openai_moderation_service
+from src.analyses.schemas import SectionSlug
+from src.config import Settings
+from src.monitoring import get_logger
+from src.services.openai_moderation import OpenAIModerationService
+from src.utterances.batched.assembler import SectionResult
+from src.utterances.batched.section_runner import listen_for_sections
+
+logger = get_logger(__name__)
+
+
+class SpeculativeAnalyses:
+    """Cache-warming tasks for one pipeline run, grouped by section slug."""
+
+    def __init__(self, pool: Any, settings: Settings) -> None:
+        self._pool = pool
+        self._settings = settings
+        self._tasks: dict[SectionSlug, set[asyncio.Task[None]]] = {}
+
+    def on_section(self, result: SectionResult) -> None:
+        # Section-local utterance ids can collide inside a section, and the
+        # cache is keyed by text, so drop them and let each analysis number
+        # the utterances positionally.
+        utterances = [
+            utterance.model_copy(update={"utterance_id": None})
+            for utterance in result.payload.utterances
+            if (utterance.text or "").strip()
+        ]
+        if not utterances:
+            return
+        self._spawn(
+            SectionSlug.OPINIONS_SENTIMENTS_SENTIMENT,
+            compute_sentiment_stats(utterances, settings=self._settings, pool=self._pool),
+        )
+        if self._moderation_service is not None:
+            self._spawn(
+                SectionSlug.SAFETY_MODERATION,
+                check_content_moderation_bulk(
+                    utterances,
+                    self._moderation_service,
+                    pool=self._pool,
+                    settings=self._settings,
+                ),
+            )
+
+    @cached_property
+    def _moderation_service(self) -> OpenAIModerationService | None:
+        return build_openai_moderation_service(self._settings)
+
+    async def wait_for(self, slug: SectionSlug) -> None:
+        tasks = self._tasks.get(slug)
+        if tasks:
+            await asyncio.wait(set(tasks))
+
+    async def cancel(self) -> None:
+        pending = [task for tasks in self._tasks.values() for task in tasks]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def _spawn(self, slug: SectionSlug, work: Awaitable[Any]) -> None:
+        task = asyncio.create_task(self._warm(slug, work))
+        tasks = self._tasks.setdefault(slug, set())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def _warm(self, slug: SectionSlug, work: Awaitable[Any]) -> None:
+        try:
+            await work
+        except Exception as exc:
+            # The slot recomputes anything missing from the cache.
+            logger.warning("speculative %s analysis failed: %s", slug.value, exc)
+
+
+_active_speculation: ContextVar[SpeculativeAnalyses | None] = ContextVar(
+    "vibecheck_active_speculation", default=None
+)
+
+
+@asynccontextmanager
+async def speculative_analysis(pool: Any, settings: Settings) -> AsyncIterator[None]:
+    """Warm the per-utterance caches from sections extracted inside the block.
+
+    A no-op without a pool (there is no cache to warm) or when
+    VIBECHECK_SPECULATIVE_ANALYSIS_ENABLED is off. Work still pending when
+    the block exits is cancelled.
+    """
+    if pool is None or not settings.VIBECHECK_SPECULATIVE_ANALYSIS_ENABLED:
+        yield
+        return
+    speculation = SpeculativeAnalyses(pool, settings)
+    token = _active_speculation.set(speculation)
+    try:
+        with listen_for_sections(speculation.on_section):
+            yield
+    finally:
+        _active_speculation.reset(token)
+        await speculation.cancel()
+
+
+async def wait_for_speculative_analysis(slug: SectionSlug) -> None:
+    """Let in-flight speculative work for `slug` finish before the slot runs,
+    so the slot reads its results from the cache instead of redoing it."""
+    speculation = _active_speculation.get()
+    if speculation is not None:
+        await speculation.wait_for(slug)
+
+
+__all__ = [
+    "SpeculativeAnalyses",
+    "speculative_analysis",
+    "wait_for_speculative_analysis",
+]
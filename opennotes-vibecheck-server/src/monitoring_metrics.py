@@ -43,6 +43,7 @@ __all__ = [
     "SECTION_FAILURES",
     "SECTION_MEDIA_DROPPED",
     "SINGLE_FLIGHT_LOCK_WAITS",
+    "UTTERANCE_ANALYSIS_CACHE_LOOKUPS",
     "ErrorType",
     "ExternalAPI",
     "ExternalAPIErrorCategory",
@@ -149,6 +150,14 @@ SECTION_MEDIA_DROPPED = Counter(
     labelnames=("media_type",),
 )
 
+# `analysis` is one of the fixed cache namespaces in
+# src.cache.utterance_analysis_cache callers; `outcome` is hit | miss.
+UTTERANCE_ANALYSIS_CACHE_LOOKUPS = Counter(
+    "vibecheck_utterance_analysis_cache_lookups_total",
+    "Per-utterance analysis cache lookups by analysis and outcome.",
+    labelnames=("analysis", "outcome"),
+)
+
 
 _TERMINAL_ERROR_CODE_BUCKETS: dict[str, ErrorType] = {
     "extraction_failed": "extraction",
@@ -27,6 +27,7 @@ from pydantic_ai.profiles.google import google_model_profile
 from pydantic_ai.providers.google import GoogleProvider
 
 from src.config import Settings
+from src.services.vertex_limiter import report_vertex_overload
 
 T = TypeVar("T", bound=BaseModel)
 GeminiTier = Literal["fast", "synthesis", "extractor"]
@@ -206,6 +207,7 @@ async def run_vertex_agent_with_retry(
         except ModelHTTPError as exc:
             if exc.status_code != 429:
                 raise
+            report_vertex_overload()
             attempts_used += 1
             if attempts_used >= MAX_VERTEX_429_ATTEMPTS:
                 logfire.warning(
@@ -1,8 +1,17 @@
-"""Shared limiter for Vertex/Gemini calls."""
+"""Shared limiter for Vertex/Gemini calls.
+
+With a Redis backend, callers that find every lease taken join a shared
+waiter queue ordered by priority class and arrival time, and are woken when a
+lease is released instead of polling blindly. The shared limit adapts to
+Vertex pushback (AIMD): VERTEX_MAX_CONCURRENCY is the ceiling, every
+429/RESOURCE_EXHAUSTED shrinks the limit multiplicatively and every clean call
+grows it back by 1/limit.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import inspect
 import random
 import secrets
@@ -11,8 +20,9 @@ import threading
 import time
 from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from typing import Any, NoReturn, Protocol, cast
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Literal, NoReturn, Protocol, cast
 
 import logfire
 from redis import asyncio as redis_asyncio
@@ -26,12 +36,23 @@ VERTEX_LIMITER_WAIT_MS = logfire.metric_histogram(
     unit="ms",
 )
 
+VertexPriority = Literal["interactive", "retry"]
+
+# Lower ranks are served first; arrival time orders waiters within a rank.
+_PRIORITY_RANKS: dict[str, int] = {"interactive": 0, "retry": 1}
+
 _ACQUIRE_SCRIPT = """
 local slots_key = KEYS[1]
 local lease_key = KEYS[2]
+local waiters_key = KEYS[3]
+local waiter_deadlines_key = KEYS[4]
+local limit_key = KEYS[5]
 local token = ARGV[1]
 local limit = tonumber(ARGV[2])
 local lease_ttl_ms = tonumber(ARGV[3])
+local priority_rank = tonumber(ARGV[4])
+local waiter_ttl_ms = tonumber(ARGV[5])
+local adaptive = ARGV[6] == "1"
 
 local now_parts = redis.call("TIME")
 local now_ms = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
@@ -40,13 +61,37 @@ local expires_at = now_ms + lease_ttl_ms
 redis.call("ZREMRANGEBYSCORE", slots_key, "-inf", now_ms)
 local active = redis.call("ZCARD", slots_key)
 
-if active < limit then
+if adaptive then
+  local adaptive_limit = tonumber(redis.call("HGET", limit_key, "limit"))
+  if adaptive_limit then
+    limit = math.max(1, math.min(limit, math.floor(adaptive_limit)))
+  end
+end
+
+-- Waiters that stopped polling (crashed, cancelled without leaving) drop out
+-- of the queue so they cannot block the callers behind them.
+local stale = redis.call("ZRANGEBYSCORE", waiter_deadlines_key, "-inf", now_ms)
+for _, stale_token in ipairs(stale) do
+  redis.call("ZREM", waiters_key, stale_token)
+end
+redis.call("ZREMRANGEBYSCORE", waiter_deadlines_key, "-inf", now_ms)
+
+redis.call("ZADD", waiters_key, "NX", priority_rank * 10000000000000 + now_ms, token)
+redis.call("ZADD", waiter_deadlines_key, now_ms + waiter_ttl_ms, token)
+local ahead = redis.call("ZRANK", waiters_key, token)
+
+if active < limit and ahead < limit - active then
+  redis.call("ZREM", waiters_key, token)
+  redis.call("ZREM", waiter_deadlines_key, token)
   redis.call("SET", lease_key, token, "PX", lease_ttl_ms)
   redis.call("ZADD", slots_key, expires_at, token)
   redis.call("PEXPIRE", slots_key, lease_ttl_ms)
   return {1, active + 1, limit, lease_ttl_ms, 0, "acquired"}
 end
 
+redis.call("PEXPIRE", waiters_key, lease_ttl_ms)
+redis.call("PEXPIRE", waiter_deadlines_key, lease_ttl_ms)
+
 local retry_after_ms = 50
 local next_slot = redis.call("ZRANGE", slots_key, 0, 0, "WITHSCORES")
 if next_slot[2] ~= nil then
@@ -59,21 +104,56 @@ return {0, active, limit, lease_ttl_ms, retry_after_ms, "saturated"}
 _RELEASE_SCRIPT = """
 local slots_key = KEYS[1]
 local lease_key = KEYS[2]
+local limit_key = KEYS[3]
 local token = ARGV[1]
+local outcome = ARGV[2]
+local max_limit = tonumber(ARGV[3])
+local min_limit = tonumber(ARGV[4])
+local decrease_factor = tonumber(ARGV[5])
+local cooldown_ms = tonumber(ARGV[6])
+local limit_ttl_ms = tonumber(ARGV[7])
+local channel = ARGV[8]
 
 local now_parts = redis.call("TIME")
 local now_ms = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
 redis.call("ZREMRANGEBYSCORE", slots_key, "-inf", now_ms)
 
+if outcome ~= "neutral" then
+  local current = math.min(tonumber(redis.call("HGET", limit_key, "limit")) or max_limit, max_limit)
+  if outcome == "overload" then
+    local decreased_at = tonumber(redis.call("HGET", limit_key, "decreased_at")) or 0
+    if now_ms - decreased_at >= cooldown_ms then
+      current = math.max(min_limit, current * decrease_factor)
+      redis.call("HSET", limit_key, "limit", tostring(current), "decreased_at", now_ms)
+    end
+  elseif current < max_limit then
+    current = math.min(max_limit, current + 1 / current)
+    redis.call("HSET", limit_key, "limit", tostring(current))
+  end
+  redis.call("PEXPIRE", limit_key, limit_ttl_ms)
+end
+
 if redis.call("GET", lease_key) ~= token then
   return {0, token, redis.call("ZCARD", slots_key), "not_owner_or_expired"}
 end
 
 redis.call("DEL", lease_key)
 local removed = redis.call("ZREM", slots_key, token)
+if removed == 1 then
+  redis.call("PUBLISH", channel, token)
+end
 return {removed, token, redis.call("ZCARD", slots_key), "released"}
 """
 
+_LEAVE_SCRIPT = """
+local waiters_key = KEYS[1]
+local waiter_deadlines_key = KEYS[2]
+local token = ARGV[1]
+
+redis.call("ZREM", waiter_deadlines_key, token)
+return {redis.call("ZREM", waiters_key, token), "left"}
+"""
+
 
 class VertexLimiterError(RuntimeError):
     """Base class for Vertex limiter failures."""
@@ -104,6 +184,20 @@ class _LimiterState:
     pending: int = 0
 
 
+@dataclass
+class _SlotOutcome:
+    overloaded: bool = False
+    failed: bool = False
+
+
+@dataclass(frozen=True)
+class _AdaptivePolicy:
+    max_limit: int
+    min_limit: int
+    decrease_factor: float
+    cooldown_ms: int
+
+
 @dataclass(frozen=True)
 class _LimiterLease:
     token: str
@@ -112,6 +206,8 @@ class _LimiterLease:
     active: int
     pending: int
     local_state: _LimiterState | None = None
+    adaptive: _AdaptivePolicy | None = None
+    outcome: _SlotOutcome = field(default_factory=_SlotOutcome, compare=False)
 
 
 class _LimiterBackend(Protocol):
@@ -138,6 +234,70 @@ _backend: tuple[tuple[Any, ...], _LimiterBackend] | None = None
 _backend_lock = threading.Lock()
 _FALLBACK_FAILURE_THRESHOLD = 2
 _FALLBACK_COOLDOWN_SECONDS = 10.0
+# Waiters refresh their queue entry on every poll; an entry not refreshed for
+# this many maximum retry intervals is treated as abandoned.
+_WAITER_TTL_POLLS = 4
+_MIN_WAITER_TTL_MS = 1_000
+# A learned limit with no traffic for an hour resets to VERTEX_MAX_CONCURRENCY.
+_ADAPTIVE_LIMIT_TTL_MS = 3_600_000
+
+_vertex_priority: ContextVar[VertexPriority] = ContextVar(
+    "vibecheck_vertex_priority", default="interactive"
+)
+_slot_outcome: ContextVar[_SlotOutcome | None] = ContextVar(
+    "vibecheck_vertex_slot_outcome", default=None
+)
+
+
+def bind_vertex_priority(priority: VertexPriority) -> Token[VertexPriority]:
+    """Queue Vertex calls made from the current context under `priority`.
+
+    Returns a reset token the caller MUST hand to `clear_vertex_priority` in
+    a `finally` block. Tasks spawned afterwards inherit the priority.
+    """
+    if priority not in _PRIORITY_RANKS:
+        raise ValueError(f"Unknown Vertex limiter priority: {priority}")
+    return _vertex_priority.set(priority)
+
+
+def clear_vertex_priority(token: Token[VertexPriority]) -> None:
+    _vertex_priority.reset(token)
+
+
+def report_vertex_overload() -> None:
+    """Mark the enclosing `vertex_slot` as having hit Vertex 429/RESOURCE_EXHAUSTED.
+
+    Callers that retry 429s inside the slot report them here so the shared
+    limit still backs off even when the call eventually succeeds.
+    """
+    outcome = _slot_outcome.get()
+    if outcome is not None:
+        outcome.overloaded = True
+
+
+def _is_vertex_overload(exc: BaseException) -> bool:
+    return getattr(exc, "status_code", None) == 429 or "RESOURCE_EXHAUSTED" in str(exc)
+
+
+def _adaptive_policy(settings: Settings) -> _AdaptivePolicy | None:
+    if not settings.VERTEX_ADAPTIVE_CONCURRENCY_ENABLED:
+        return None
+    return _AdaptivePolicy(
+        max_limit=settings.VERTEX_MAX_CONCURRENCY,
+        min_limit=min(settings.VERTEX_ADAPTIVE_MIN_CONCURRENCY, settings.VERTEX_MAX_CONCURRENCY),
+        decrease_factor=settings.VERTEX_ADAPTIVE_DECREASE_FACTOR,
+        cooldown_ms=settings.VERTEX_ADAPTIVE_DECREASE_COOLDOWN_MS,
+    )
+
+
+def _release_outcome(lease: _LimiterLease) -> str:
+    if lease.adaptive is None:
+        return "neutral"
+    if lease.outcome.overloaded:
+        return "overload"
+    if lease.outcome.failed:
+        return "neutral"
+    return "ok"
 
 
 def _limiter_state_for(limit: int, loop: asyncio.AbstractEventLoop) -> _LimiterState:
@@ -220,10 +380,20 @@ class _RedisLeaseBackend:
         self._redis = redis_client
         self._slots_key = f"{key_prefix}:slots"
         self._lease_key_prefix = f"{key_prefix}:lease"
+        self._waiters_key = f"{key_prefix}:waiters"
+        self._waiter_deadlines_key = f"{key_prefix}:waiter_deadlines"
+        self._limit_key = f"{key_prefix}:limit"
+        self._release_channel = f"{key_prefix}:released"
         self._sleep = sleep
         self._script_lock = asyncio.Lock()
         self._acquire_sha: str | None = None
         self._release_sha: str | None = None
+        self._leave_sha: str | None = None
+        # Replaced on every release so a waiter that captured the event before
+        # its acquire attempt cannot miss a release that lands in between.
+        self._release_notice = asyncio.Event()
+        self._release_listener: asyncio.Task[None] | None = None
+        self._release_listener_retry_at = 0.0
         # `_owner_loop` is only safe under a single event-loop usage contract. We capture
         # the first caller loop on first acquire and enforce same-loop use to avoid
         # unsafely shared cross-loop operations. This does not close races where two
@@ -238,6 +408,8 @@ class _RedisLeaseBackend:
         acquire_timeout_ms: int,
         retry_min_ms: int,
         retry_max_ms: int,
+        priority: VertexPriority = "interactive",
+        adaptive: bool = False,
     ) -> _LimiterLease:
         if limit <= 0:
             raise ValueError("VERTEX_MAX_CONCURRENCY must be > 0")
@@ -252,88 +424,145 @@ class _RedisLeaseBackend:
 
         token = secrets.token_urlsafe(24)
         deadline = time.monotonic() + (acquire_timeout_ms / 1000)
-        while True:
-            response = await self._acquire_once(
-                token=token,
-                limit=limit,
-                lease_ttl_ms=lease_ttl_ms,
-                retry_min_ms=retry_min_ms,
-            )
-            acquired, _active, max_concurrency, _ttl, retry_after_ms, reason = response
-            if acquired:
-                return _LimiterLease(
-                    token=token,
-                    backend=self.backend_name,
-                    max_concurrency=max_concurrency,
-                    active=_active,
-                    pending=0,
-                )
-
-            remaining_s = deadline - time.monotonic()
-            if remaining_s <= 0:
-                raise VertexLimiterSaturationError(
-                    "Vertex limiter saturated before a shared Redis lease was acquired"
-                )
-
-            sleep_ms = max(retry_min_ms, min(retry_after_ms, retry_max_ms))
-            sleep_s = min(sleep_ms / 1000, remaining_s)
-            if reason != "saturated":
-                raise VertexLimiterError(f"Unexpected Vertex limiter acquire result: {reason}")
-            await self._sleep(sleep_s)
+        acquire_args = (
+            self._slots_key,
+            f"{self._lease_key_prefix}:{token}",
+            self._waiters_key,
+            self._waiter_deadlines_key,
+            self._limit_key,
+            token,
+            limit,
+            lease_ttl_ms,
+            _PRIORITY_RANKS[priority],
+            max(retry_max_ms * _WAITER_TTL_POLLS, _MIN_WAITER_TTL_MS),
+            "1" if adaptive else "0",
+        )
+        queued = False
+        try:
+            while True:
+                release_notice = self._release_notice
+                response = await self._acquire_once(acquire_args, retry_min_ms=retry_min_ms)
+                acquired, _active, max_concurrency, _ttl, retry_after_ms, reason = response
+                if acquired:
+                    queued = False
+                    return _LimiterLease(
+                        token=token,
+                        backend=self.backend_name,
+                        max_concurrency=max_concurrency,
+                        active=_active,
+                        pending=0,
+                    )
+                queued = True
+
+                remaining_s = deadline - time.monotonic()
+                if remaining_s <= 0:
+                    raise VertexLimiterSaturationError(
+                        "Vertex limiter saturated before a shared Redis lease was acquired"
+                    )
+
+                sleep_ms = max(retry_min_ms, min(retry_after_ms, retry_max_ms))
+                sleep_s = min(sleep_ms / 1000, remaining_s)
+                if reason != "saturated":
+                    raise VertexLimiterError(f"Unexpected Vertex limiter acquire result: {reason}")
+                await self._wait_for_release(release_notice, sleep_s)
+        finally:
+            if queued:
+                await self._leave_queue(token)
 
     async def release(self, lease: _LimiterLease) -> None:
-        await self._release_once(lease.token)
+        await self._release_once(lease)
 
     async def probe(self) -> None:
         # Load scripts as a lightweight connectivity/protocol probe.
         await self._load_scripts_with_retry(0)
 
     async def aclose(self) -> None:
+        listener = self._release_listener
+        if listener is not None and not listener.done():
+            listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await listener
         await self._redis.aclose()
 
-    async def _load_scripts(self) -> tuple[str, str]:
-        if self._acquire_sha is not None and self._release_sha is not None:
-            return self._acquire_sha, self._release_sha
+    async def _load_scripts(self) -> tuple[str, str, str]:
+        if (
+            self._acquire_sha is not None
+            and self._release_sha is not None
+            and self._leave_sha is not None
+        ):
+            return self._acquire_sha, self._release_sha, self._leave_sha
 
         async with self._script_lock:
             if self._acquire_sha is None:
                 self._acquire_sha = await self._redis.script_load(_ACQUIRE_SCRIPT)
             if self._release_sha is None:
                 self._release_sha = await self._redis.script_load(_RELEASE_SCRIPT)
-            return self._acquire_sha, self._release_sha
+            if self._leave_sha is None:
+                self._leave_sha = await self._redis.script_load(_LEAVE_SCRIPT)
+            return self._acquire_sha, self._release_sha, self._leave_sha
+
+    def _notify_released(self) -> None:
+        notice = self._release_notice
+        self._release_notice = asyncio.Event()
+        notice.set()
+
+    async def _wait_for_release(self, notice: asyncio.Event, timeout_s: float) -> None:
+        self._ensure_release_listener()
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(notice.wait(), timeout_s)
+
+    def _ensure_release_listener(self) -> None:
+        # Releases in this process wake local waiters directly; the pub/sub
+        # listener carries releases from other instances. Without it waiters
+        # still poll on the script's retry_after hint.
+        pubsub_factory = getattr(self._redis, "pubsub", None)
+        if pubsub_factory is None:
+            return
+        if self._release_listener is not None and not self._release_listener.done():
+            return
+        now = time.monotonic()
+        if now < self._release_listener_retry_at:
+            return
+        self._release_listener_retry_at = now + _FALLBACK_COOLDOWN_SECONDS
+        self._release_listener = asyncio.get_running_loop().create_task(
+            self._listen_for_releases(pubsub_factory())
+        )
+
+    async def _listen_for_releases(self, pubsub: Any) -> None:
+        try:
+            await pubsub.subscribe(self._release_channel)
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    self._notify_released()
+        except Exception as exc:
+            _log_backend_unavailable(exc, final_attempt=False, will_raise=False)
+        finally:
+            with contextlib.suppress(Exception):
+                await pubsub.aclose()
+
+    async def _leave_queue(self, token: str) -> None:
+        # Best effort: an entry left behind stops being refreshed and is pruned
+        # by the next acquire after its waiter deadline.
+        with contextlib.suppress(Exception):
+            _acquire_sha, _release_sha, leave_sha = await self._load_scripts()
+            await self._redis.evalsha(
+                leave_sha, 2, self._waiters_key, self._waiter_deadlines_key, token
+            )
 
     async def _acquire_once(
         self,
+        acquire_args: tuple[Any, ...],
         *,
-        token: str,
-        limit: int,
-        lease_ttl_ms: int,
         retry_min_ms: int,
     ) -> tuple[bool, int, int, int, int, str]:
-        acquire_sha, _release_sha = await self._load_scripts_with_retry(retry_min_ms)
+        acquire_sha, _release_sha, _leave_sha = await self._load_scripts_with_retry(retry_min_ms)
         try:
-            result = await self._redis.evalsha(
-                acquire_sha,
-                2,
-                self._slots_key,
-                f"{self._lease_key_prefix}:{token}",
-                token,
-                limit,
-                lease_ttl_ms,
-            )
+            result = await self._redis.evalsha(acquire_sha, 5, *acquire_args)
         except Exception as exc:
             _log_backend_unavailable(exc, final_attempt=False, will_raise=False)
             await self._sleep(retry_min_ms / 1000)
             try:
-                result = await self._redis.evalsha(
-                    acquire_sha,
-                    2,
-                    self._slots_key,
-                    f"{self._lease_key_prefix}:{token}",
-                    token,
-                    limit,
-                    lease_ttl_ms,
-                )
+                result = await self._redis.evalsha(acquire_sha, 5, *acquire_args)
             except Exception as retry_exc:
                 _log_backend_unavailable(
                     retry_exc,
@@ -346,15 +575,25 @@ class _RedisLeaseBackend:
 
         return _parse_acquire_result(result)
 
-    async def _release_once(self, token: str) -> None:
-        _acquire_sha, release_sha = await self._load_scripts_with_retry(0)
+    async def _release_once(self, lease: _LimiterLease) -> None:
+        token = lease.token
+        policy = lease.adaptive
+        _acquire_sha, release_sha, _leave_sha = await self._load_scripts_with_retry(0)
         try:
             redis_result = await self._redis.evalsha(
                 release_sha,
-                2,
+                3,
                 self._slots_key,
                 f"{self._lease_key_prefix}:{token}",
+                self._limit_key,
                 token,
+                _release_outcome(lease),
+                policy.max_limit if policy else lease.max_concurrency,
+                policy.min_limit if policy else 1,
+                policy.decrease_factor if policy else 1,
+                policy.cooldown_ms if policy else 0,
+                _ADAPTIVE_LIMIT_TTL_MS,
+                self._release_channel,
             )
         except Exception as exc:
             _log_backend_unavailable(
@@ -365,6 +604,8 @@ class _RedisLeaseBackend:
             raise VertexLimiterBackendUnavailableError("Vertex limiter Redis release failed") from exc
 
         release_result = _parse_release_result(redis_result)
+        if release_result.removed:
+            self._notify_released()
         if release_result.status == "not_owner_or_expired":
             logfire.warning(
                 "Vibecheck limiter Redis lease expired before release",
@@ -380,7 +621,7 @@ class _RedisLeaseBackend:
                 lease_status=release_result.status,
             )
 
-    async def _load_scripts_with_retry(self, retry_min_ms: int) -> tuple[str, str]:
+    async def _load_scripts_with_retry(self, retry_min_ms: int) -> tuple[str, str, str]:
         try:
             return await self._load_scripts()
         except Exception as exc:
@@ -545,6 +786,8 @@ class _RedisLimiterBackend:
                 acquire_timeout_ms=settings.VERTEX_LEASE_ACQUIRE_TIMEOUT_MS,
                 retry_min_ms=settings.VERTEX_LEASE_RETRY_MIN_MS,
                 retry_max_ms=settings.VERTEX_LEASE_RETRY_MAX_MS,
+                priority=_vertex_priority.get(),
+                adaptive=settings.VERTEX_ADAPTIVE_CONCURRENCY_ENABLED,
             )
             with self._state_lock:
                 self._active_leases += 1
@@ -556,6 +799,7 @@ class _RedisLimiterBackend:
                     max_concurrency=lease.max_concurrency,
                     active=active,
                     pending=pending,
+                    adaptive=_adaptive_policy(settings),
                 )
         finally:
             with self._state_lock:
@@ -916,10 +1160,20 @@ def _log_backend_unavailable(
 
 
 @asynccontextmanager
-async def vertex_slot(settings: Settings | None = None) -> AsyncIterator[None]:
-    """Wait for a configured Vertex/Gemini execution slot."""
+async def vertex_slot(
+    settings: Settings | None = None,
+    *,
+    priority: VertexPriority | None = None,
+) -> AsyncIterator[None]:
+    """Wait for a configured Vertex/Gemini execution slot.
+
+    `priority` defaults to the one bound with `bind_vertex_priority`
+    (``"interactive"`` when unset).
+    """
     resolved_settings = settings or get_settings()
     backend = _backend_for(resolved_settings, asyncio.get_running_loop())
+    resolved_priority = priority or _vertex_priority.get()
+    priority_token = bind_vertex_priority(resolved_priority)
     started = time.perf_counter()
     lease: _LimiterLease | None = None
     body_raised = False
@@ -930,19 +1184,33 @@ async def vertex_slot(settings: Settings | None = None) -> AsyncIterator[None]:
             wait_ms = (time.perf_counter() - started) * 1000
             VERTEX_LIMITER_WAIT_MS.record(
                 wait_ms,
-                {"vertex_limiter.backend": lease.backend},
+                {
+                    "vertex_limiter.backend": lease.backend,
+                    "vertex_limiter.priority": resolved_priority,
+                },
             )
             span.set_attribute("vertex_limiter.wait_ms", wait_ms)
             span.set_attribute("vertex_limiter.max_concurrency", lease.max_concurrency)
             span.set_attribute("vertex_limiter.backend", lease.backend)
             span.set_attribute("vertex_limiter.active", lease.active)
             span.set_attribute("vertex_limiter.pending", lease.pending)
+            span.set_attribute("vertex_limiter.priority", resolved_priority)
 
-        yield
-    except BaseException:
+        outcome_token = _slot_outcome.set(lease.outcome)
+        try:
+            yield
+        finally:
+            _slot_outcome.reset(outcome_token)
+    except BaseException as exc:
         body_raised = True
+        if lease is not None:
+            if _is_vertex_overload(exc):
+                lease.outcome.overloaded = True
+            else:
+                lease.outcome.failed = True
         raise
     finally:
+        clear_vertex_priority(priority_token)
         if lease is not None:
             try:
                 await backend.release(lease)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import random
 import re
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import UTC, datetime
 from html import unescape
 from typing import cast
@@ -35,6 +39,41 @@ from src.utterances.extractor import (
 )
 from src.utterances.schema import BatchedUtteranceRedirectionResponse, UtterancesPayload
 
+logger = logging.getLogger(__name__)
+
+SectionListener = Callable[[SectionResult], None]
+
+_section_listener: ContextVar[SectionListener | None] = ContextVar(
+    "vibecheck_section_listener", default=None
+)
+
+
+@contextmanager
+def listen_for_sections(listener: SectionListener) -> Iterator[None]:
+    """Call `listener` with each SectionResult as soon as it is extracted.
+
+    Lets a caller start work on early sections of a batched page while later
+    sections are still with Gemini, without threading a callback through
+    `extract_utterances_dispatched`. Utterance ids are section-local at this
+    point; only `assemble_sections` assigns the final ones. A failing
+    listener is logged and never affects extraction.
+    """
+    token = _section_listener.set(listener)
+    try:
+        yield
+    finally:
+        _section_listener.reset(token)
+
+
+def _notify_section_listener(result: SectionResult) -> None:
+    listener = _section_listener.get()
+    if listener is None:
+        return
+    try:
+        listener(result)
+    except Exception:
+        logger.exception("section listener failed for section %s", result.section.index)
+
 
 def _section_has_extractable_content(section: HtmlSection) -> bool:
     raw = section.html_slice.encode("utf-8")
@@ -165,13 +204,15 @@ async def run_all_sections(
 
     async def _run_one(section: HtmlSection) -> SectionResult:
         async with semaphore:
-            return await run_section(
+            result = await run_section(
                 section,
                 parent,
                 settings=settings,
                 scrape=scrape,
                 scrape_cache=scrape_cache,
             )
+        _notify_section_listener(result)
+        return result
 
     return list(await asyncio.gather(*(_run_one(s) for s in sections)))
 
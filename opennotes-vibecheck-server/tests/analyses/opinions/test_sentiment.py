@@ -274,3 +274,74 @@ async def test_compute_sentiment_stats_assigns_fallback_ids(monkeypatch):
     report = await compute_sentiment_stats(utterances)
 
     assert [s.utterance_id for s in report.per_utterance] == ["utt-0", "utt-1"]
+
+
+class _DictCache:
+    """In-memory stand-in for utterance_analysis_cache.lookup/store."""
+
+    def __init__(self) -> None:
+        self.entries: dict[tuple[str, str, str], dict[str, Any]] = {}
+
+    async def lookup(self, pool, analysis, version, text_hashes):
+        return {
+            h: self.entries[(analysis, version, h)]
+            for h in text_hashes
+            if (analysis, version, h) in self.entries
+        }
+
+    async def store(self, pool, analysis, version, results, *, ttl_hours):
+        for h, payload in results.items():
+            self.entries[(analysis, version, h)] = payload
+
+
+async def test_compute_sentiment_stats_only_scores_cache_misses(monkeypatch):
+    cache = _DictCache()
+    monkeypatch.setattr(sentiment_module.utterance_analysis_cache, "lookup", cache.lookup)
+    monkeypatch.setattr(sentiment_module.utterance_analysis_cache, "store", cache.store)
+    first = _FakeAgent(
+        [
+            _SentimentBatchLLM(
+                scores=[
+                    _SentimentScoreLLM(utterance_id="u1", label="positive", valence=0.9),
+                    _SentimentScoreLLM(utterance_id="u2", label="negative", valence=-0.9),
+                ]
+            )
+        ]
+    )
+    monkeypatch.setattr(sentiment_module, "build_agent", lambda *args, **kwargs: first)
+    await compute_sentiment_stats(
+        [
+            Utterance(utterance_id="u1", kind="post", text="Great job!"),
+            Utterance(utterance_id="u2", kind="comment", text="This is bad."),
+        ],
+        pool=object(),
+    )
+
+    second = _FakeAgent(
+        [
+            _SentimentBatchLLM(
+                scores=[_SentimentScoreLLM(utterance_id="b3", label="neutral", valence=0.0)]
+            )
+        ]
+    )
+    monkeypatch.setattr(sentiment_module, "build_agent", lambda *args, **kwargs: second)
+    report = await compute_sentiment_stats(
+        [
+            Utterance(utterance_id="b1", kind="post", text="  Great   job! "),
+            Utterance(utterance_id="b2", kind="comment", text="This is bad."),
+            Utterance(utterance_id="b3", kind="comment", text="It shipped Tuesday."),
+            Utterance(utterance_id="b4", kind="reply", text="This is bad."),
+        ],
+        pool=object(),
+    )
+
+    assert len(second.calls) == 1
+    assert "b3" in second.calls[0]
+    assert "b1" not in second.calls[0]
+    assert "b2" not in second.calls[0]
+    assert [(s.utterance_id, s.label) for s in report.per_utterance] == [
+        ("b1", "positive"),
+        ("b2", "negative"),
+        ("b3", "neutral"),
+        ("b4", "negative"),
+    ]
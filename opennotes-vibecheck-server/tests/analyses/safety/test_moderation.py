@@ -1,6 +1,7 @@
 """Unit tests for the harmful-content moderation capability."""
 
 import logging
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
@@ -11,6 +12,7 @@ from src.analyses.safety.moderation import (
     check_content_moderation,
     check_content_moderation_bulk,
 )
+from src.config import Settings
 from src.services.openai_moderation import ModerationResult
 from src.utterances.schema import Utterance
 
@@ -208,6 +210,42 @@ class TestBulkModeration:
         mock_service.moderate_texts.assert_called_once()
         mock_service.moderate_multimodal.assert_not_called()
 
+    async def test_duplicate_and_cached_texts_are_not_resent(self, monkeypatch):
+        from src.analyses.safety import moderation as moderation_module
+
+        cached_hash = moderation_module.utterance_analysis_cache.utterance_text_hash("seen before")
+        stored: dict[str, dict[str, Any]] = {}
+
+        async def fake_lookup(pool, analysis, version, text_hashes):
+            return {cached_hash: make_moderation_result(flagged=True).model_dump(mode="json")}
+
+        async def fake_store(pool, analysis, version, results, *, ttl_hours):
+            stored.update(results)
+
+        monkeypatch.setattr(moderation_module.utterance_analysis_cache, "lookup", fake_lookup)
+        monkeypatch.setattr(moderation_module.utterance_analysis_cache, "store", fake_store)
+        mock_service = AsyncMock()
+        mock_service.moderate_texts = AsyncMock(
+            return_value=[make_moderation_result(flagged=False)]
+        )
+
+        results = await check_content_moderation_bulk(
+            [
+                make_utterance(utterance_id="utt_1", text="seen before"),
+                make_utterance(utterance_id="utt_2", text="new text"),
+                make_utterance(utterance_id="utt_3", text="new  text"),
+            ],
+            mock_service,
+            pool=object(),
+            settings=Settings(),
+        )
+
+        mock_service.moderate_texts.assert_awaited_once_with(["new text"])
+        assert results[0] is not None
+        assert results[0].utterance_id == "utt_1"
+        assert results[1:] == [None, None]
+        assert len(stored) == 1
+
     async def test_exception_raises_transient_error_with_context_logged(self, caplog):
         mock_service = AsyncMock()
         mock_service.moderate_texts = AsyncMock(side_effect=Exception("API error"))
@@ -217,7 +217,7 @@ class TestEmptyUtterances:
 
         call_count = 0
 
-        async def spy_openai(utterances, moderation_service=None):
+        async def spy_openai(utterances, moderation_service=None, **_kwargs):
             nonlocal call_count
             call_count += 1
             return []
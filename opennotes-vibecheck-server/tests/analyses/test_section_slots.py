@@ -75,7 +75,8 @@ async def test_run_flashpoint_loads_persisted_utterances_and_returns_matches(
 ) -> None:
     from src.analyses.tone import flashpoint_slot
 
-    async def fake_detect(utterances, settings):
+    async def fake_detect(utterances, settings, *, pool=None):
+        del pool
         assert [u.utterance_id for u in utterances] == ["u-1", "u-2"]
         return [
             None,
@@ -113,8 +114,8 @@ async def test_run_scd_loads_persisted_utterances_and_returns_report(
 ) -> None:
     from src.analyses.tone import scd_slot
 
-    async def fake_analyze(utterances, settings, *, utterance_stream_type=None):
-        del utterance_stream_type
+    async def fake_analyze(utterances, settings, *, utterance_stream_type=None, pool=None):
+        del utterance_stream_type, pool
         assert [u.author for u in utterances] == ["alice", "bob"]
         return SCDReport(
             narrative="Bob escalates after Alice reports a concrete issue.",
@@ -186,7 +187,8 @@ async def test_run_sentiment_loads_persisted_utterances_and_returns_stats(
 ) -> None:
     from src.analyses.opinions import sentiment_slot
 
-    async def fake_sentiment(utterances, *, settings=None):
+    async def fake_sentiment(utterances, *, settings=None, pool=None):
+        del pool
         assert [u.text for u in utterances] == [
             "The checkout flow is broken for everyone.",
             "That release was careless and made the product worse.",
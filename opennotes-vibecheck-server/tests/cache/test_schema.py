@@ -592,6 +592,38 @@ class TestVideoAnalysisCacheTable:
         assert forbidden == []
 
 
+class TestUtteranceAnalysisCacheTable:
+    def test_create_table_if_not_exists(self, schema_sql: str) -> None:
+        assert (
+            "CREATE TABLE IF NOT EXISTS public.vibecheck_utterance_analysis_cache" in schema_sql
+        )
+
+    def test_primary_key_scopes_by_analysis_and_version(self, schema_sql: str) -> None:
+        assert "PRIMARY KEY (analysis, version, text_hash)" in schema_sql
+
+    def test_rls_enabled_and_forced(self, schema_sql: str) -> None:
+        assert (
+            "ALTER TABLE public.vibecheck_utterance_analysis_cache ENABLE ROW LEVEL SECURITY"
+            in schema_sql
+        )
+        assert (
+            "ALTER TABLE public.vibecheck_utterance_analysis_cache FORCE ROW LEVEL SECURITY"
+            in schema_sql
+        )
+
+    def test_revokes_anon_and_authenticated(self, schema_sql: str) -> None:
+        assert (
+            "REVOKE ALL ON public.vibecheck_utterance_analysis_cache FROM anon, authenticated"
+            in schema_sql
+        )
+
+    def test_expires_at_index_exists(self, schema_sql: str) -> None:
+        assert (
+            "CREATE INDEX IF NOT EXISTS vibecheck_utterance_analysis_cache_expires_at_idx"
+            in schema_sql
+        )
+
+
 class TestUnsafeUrlErrorCode:
     def test_error_code_check_includes_unsafe_url(self, schema_sql: str) -> None:
         assert "'unsafe_url'" in schema_sql
@@ -641,6 +673,15 @@ class TestPurgeFunctionExtended:
             in schema_sql
         )
 
+    def test_purge_function_deletes_expired_utterance_analysis_cache(
+        self, schema_sql: str
+    ) -> None:
+        assert (
+            "DELETE FROM public.vibecheck_utterance_analysis_cache "
+            "WHERE expires_at < pg_catalog.now()"
+            in schema_sql
+        )
+
 
 class TestSchemaQualification:
     def test_all_public_ddl_targets_are_schema_qualified(self, schema_sql: str) -> None:
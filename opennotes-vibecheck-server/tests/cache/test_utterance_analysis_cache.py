@@ -0,0 +1,127 @@
+"""Tests for src/cache/utterance_analysis_cache.py.
+
+Key derivation and the best-effort wrappers are pure; fetch/upsert use a
+testcontainers Postgres like tests/cache/test_image_analysis_cache.py.
+"""
+from __future__ import annotations
+
+import socket
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import MagicMock
+
+import asyncpg
+import pytest
+from testcontainers.postgres import PostgresContainer
+
+from src.cache import utterance_analysis_cache
+
+_REAL_GETADDRINFO = socket.getaddrinfo
+
+_MINIMAL_DDL = """
+CREATE TABLE IF NOT EXISTS vibecheck_utterance_analysis_cache (
+    analysis TEXT NOT NULL,
+    version TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    result_payload JSONB NOT NULL,
+    checked_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    expires_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (analysis, version, text_hash)
+);
+"""
+
+
+class TestKeyDerivation:
+    def test_whitespace_and_unicode_forms_share_a_hash(self) -> None:
+        assert utterance_analysis_cache.utterance_text_hash(
+            "  This   is\n\tgreat "
+        ) == utterance_analysis_cache.utterance_text_hash("This is great")
+        assert utterance_analysis_cache.utterance_text_hash(
+            "ﬁne"
+        ) == utterance_analysis_cache.utterance_text_hash("fine")
+
+    def test_different_text_has_different_hash(self) -> None:
+        assert utterance_analysis_cache.utterance_text_hash(
+            "This is great"
+        ) != utterance_analysis_cache.utterance_text_hash("This is terrible")
+
+    def test_version_changes_with_any_part(self) -> None:
+        base = utterance_analysis_cache.analysis_version("prompt", "model-a")
+        assert base == utterance_analysis_cache.analysis_version("prompt", "model-a")
+        assert base != utterance_analysis_cache.analysis_version("prompt", "model-b")
+        assert base != utterance_analysis_cache.analysis_version("prompt2", "model-a")
+        assert utterance_analysis_cache.analysis_version(
+            "ab", "c"
+        ) != utterance_analysis_cache.analysis_version("a", "bc")
+
+
+class TestBestEffortWrappers:
+    async def test_lookup_without_pool_is_all_miss(self) -> None:
+        assert await utterance_analysis_cache.lookup(None, "sentiment", "v1", ["h"]) == {}
+
+    async def test_lookup_swallows_pool_errors(self) -> None:
+        pool = MagicMock()
+        pool.acquire.side_effect = RuntimeError("pool closed")
+        assert await utterance_analysis_cache.lookup(pool, "sentiment", "v1", ["h"]) == {}
+
+    async def test_store_swallows_pool_errors(self) -> None:
+        pool = MagicMock()
+        pool.acquire.side_effect = RuntimeError("pool closed")
+        await utterance_analysis_cache.store(
+            pool, "sentiment", "v1", {"h": {"label": "neutral"}}, ttl_hours=1
+        )
+
+
+@pytest.fixture(autouse=True)
+def _restore_real_dns(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(socket, "getaddrinfo", _REAL_GETADDRINFO)
+
+
+@pytest.fixture(scope="module")
+def _postgres_container() -> Iterator[PostgresContainer]:
+    with PostgresContainer("postgres:16-alpine") as pg:
+        yield pg
+
+
+@pytest.fixture
+async def db_pool(_postgres_container: PostgresContainer) -> AsyncIterator[asyncpg.Pool]:
+    raw = _postgres_container.get_connection_url()
+    dsn = raw.replace("postgresql+psycopg2://", "postgresql://")
+    pool = await asyncpg.create_pool(dsn, min_size=1, max_size=4)
+    assert pool is not None
+    async with pool.acquire() as conn:
+        await conn.execute("DROP TABLE IF EXISTS vibecheck_utterance_analysis_cache CASCADE;")
+        await conn.execute(_MINIMAL_DDL)
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
+class TestRoundTrip:
+    async def test_upsert_then_fetch_returns_only_hits(self, db_pool: asyncpg.Pool) -> None:
+        await utterance_analysis_cache.upsert_cached(
+            db_pool, "sentiment", "v1", {"h1": {"label": "positive"}}, ttl_hours=24
+        )
+        out = await utterance_analysis_cache.fetch_cached(db_pool, "sentiment", "v1", ["h1", "h2"])
+        assert out == {"h1": {"label": "positive"}}
+
+    async def test_version_and_analysis_scope_entries(self, db_pool: asyncpg.Pool) -> None:
+        await utterance_analysis_cache.upsert_cached(
+            db_pool, "sentiment", "v1", {"h1": {"label": "positive"}}, ttl_hours=24
+        )
+        assert await utterance_analysis_cache.fetch_cached(db_pool, "sentiment", "v2", ["h1"]) == {}
+        assert await utterance_analysis_cache.fetch_cached(db_pool, "scd", "v1", ["h1"]) == {}
+
+    async def test_expired_entries_are_misses(self, db_pool: asyncpg.Pool) -> None:
+        await utterance_analysis_cache.upsert_cached(
+            db_pool, "sentiment", "v1", {"h1": {"label": "positive"}}, ttl_hours=-1
+        )
+        assert await utterance_analysis_cache.fetch_cached(db_pool, "sentiment", "v1", ["h1"]) == {}
+
+    async def test_upsert_overwrites_existing_entry(self, db_pool: asyncpg.Pool) -> None:
+        for label in ("positive", "negative"):
+            await utterance_analysis_cache.upsert_cached(
+                db_pool, "sentiment", "v1", {"h1": {"label": label}}, ttl_hours=24
+            )
+        out = await utterance_analysis_cache.fetch_cached(db_pool, "sentiment", "v1", ["h1"])
+        assert out == {"h1": {"label": "negative"}}
@@ -126,7 +126,9 @@ async def test_post_then_internal_run_then_poll_to_done(
     from src.analyses.opinions import sentiment_slot, subjective_slot
     from src.analyses.tone import flashpoint_slot, scd_slot
 
-    async def _stub_flashpoints(utterances: list[Any], settings: Any) -> list[Any]:
+    async def _stub_flashpoints(
+        utterances: list[Any], settings: Any, **_kwargs: Any
+    ) -> list[Any]:
         return [
             None,
             FlashpointMatch(
@@ -184,7 +186,7 @@ async def test_post_then_internal_run_then_poll_to_done(
         )
 
     async def _stub_sentiment(
-        utterances: list[Any], *, settings: Any = None
+        utterances: list[Any], *, settings: Any = None, **_kwargs: Any
     ) -> SentimentStatsReport:
         return SentimentStatsReport(
             per_utterance=[
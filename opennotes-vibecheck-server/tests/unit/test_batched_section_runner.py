@@ -6,6 +6,8 @@ Covers:
 - AC2: run_all_sections bounds concurrency to VIBECHECK_BATCH_PARALLEL.
 - AC3: ZeroUtterancesError for content-bearing sections aborts the batch.
 - AC4: TransientExtractionError propagates and aborts run_all_sections.
+- listen_for_sections sees each section as it completes; a failing
+  listener never affects extraction.
 """
 
 from __future__ import annotations
@@ -26,7 +28,11 @@ from src.config import Settings
 from src.firecrawl_client import ScrapeMetadata
 from src.utterances.batched.assembler import SectionResult
 from src.utterances.batched.partition import HtmlSection
-from src.utterances.batched.section_runner import run_all_sections, run_section
+from src.utterances.batched.section_runner import (
+    listen_for_sections,
+    run_all_sections,
+    run_section,
+)
 from src.utterances.errors import TransientExtractionError, ZeroUtterancesError
 from src.utterances.schema import BatchedUtteranceRedirectionResponse, Utterance, UtterancesPayload
 
@@ -488,3 +494,76 @@ async def test_transient_error_bubbles_from_section(
             scrape=mock_scrape,
             scrape_cache=mock_scrape_cache,
         )
+
+
+@pytest.mark.asyncio
+async def test_section_listener_sees_each_section_as_it_completes(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+    mock_scrape: MagicMock,
+    mock_scrape_cache: MagicMock,
+) -> None:
+    release_last = asyncio.Event()
+    seen: list[int] = []
+
+    async def _ordered_run(agent: Any, prompt: str, *, deps: Any = None) -> _FakeRunResult:
+        if "section 2" in prompt:
+            await release_last.wait()
+        return _FakeRunResult(output=_make_payload())
+
+    def _listener(result: SectionResult) -> None:
+        seen.append(result.section.index)
+        if len(seen) == 2:
+            release_last.set()
+
+    _patch_vertex_slot(monkeypatch)
+    _patch_build_agent(monkeypatch)
+    monkeypatch.setattr(
+        "src.utterances.batched.section_runner.run_vertex_agent_with_retry",
+        _ordered_run,
+    )
+
+    with listen_for_sections(_listener):
+        results = await run_all_sections(
+            [_make_section(i) for i in range(3)],
+            _make_parent(),
+            settings=settings,
+            scrape=mock_scrape,
+            scrape_cache=mock_scrape_cache,
+        )
+
+    assert sorted(seen[:2]) == [0, 1]
+    assert seen[2] == 2
+    assert [r.section.index for r in results] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_failing_section_listener_does_not_abort_extraction(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+    mock_scrape: MagicMock,
+    mock_scrape_cache: MagicMock,
+) -> None:
+    async def _fake_run(agent: Any, prompt: str, *, deps: Any = None) -> _FakeRunResult:
+        return _FakeRunResult(output=_make_payload())
+
+    def _listener(result: SectionResult) -> None:
+        raise RuntimeError("listener bug")
+
+    _patch_vertex_slot(monkeypatch)
+    _patch_build_agent(monkeypatch)
+    monkeypatch.setattr(
+        "src.utterances.batched.section_runner.run_vertex_agent_with_retry",
+        _fake_run,
+    )
+
+    with listen_for_sections(_listener):
+        results = await run_all_sections(
+            [_make_section(i) for i in range(2)],
+            _make_parent(),
+            settings=settings,
+            scrape=mock_scrape,
+            scrape_cache=mock_scrape_cache,
+        )
+
+    assert len(results) == 2
@@ -0,0 +1,167 @@
+"""Unit tests for coalesced slot writes in src/jobs/slots.py.
+
+A recording fake pool stands in for Postgres: the CAS semantics themselves
+are covered against a real database in tests/unit/test_slot_writes.py, here
+we only check how many statements are issued and what they carry.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from src.analyses.schemas import SectionSlot, SectionSlug, SectionState
+from src.jobs.slots import coalesce_slot_writes, write_slot, write_slots
+
+
+class _BoomError(RuntimeError):
+    pass
+
+
+class _RecordingPool:
+    def __init__(self, result: str = "UPDATE 1", exc: Exception | None = None) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+        self._result = result
+        self._exc = exc
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+    async def execute(self, sql: str, *args: Any) -> str:
+        self.calls.append((sql, args))
+        if self._exc is not None:
+            raise self._exc
+        return self._result
+
+
+def _done_slot(marker: str) -> SectionSlot:
+    return SectionSlot(state=SectionState.DONE, attempt_id=uuid4(), data={"marker": marker})
+
+
+async def test_write_slots_merges_every_slot_in_one_statement() -> None:
+    pool = _RecordingPool()
+    job_id, attempt = uuid4(), uuid4()
+
+    rows = await write_slots(
+        pool,
+        job_id,
+        attempt,
+        {
+            SectionSlug.SAFETY_MODERATION: _done_slot("a"),
+            SectionSlug.TONE_DYNAMICS_FLASHPOINT: _done_slot("b"),
+        },
+    )
+
+    assert rows == 1
+    assert len(pool.calls) == 1
+    sql, args = pool.calls[0]
+    assert "sections || $3::jsonb" in sql
+    assert args[:2] == (job_id, attempt)
+    merged = json.loads(args[2])
+    assert merged[SectionSlug.SAFETY_MODERATION.value]["data"] == {"marker": "a"}
+    assert merged[SectionSlug.TONE_DYNAMICS_FLASHPOINT.value]["data"] == {"marker": "b"}
+
+
+async def test_write_slots_with_nothing_to_write_skips_the_database() -> None:
+    pool = _RecordingPool()
+
+    assert await write_slots(pool, uuid4(), uuid4(), {}) == 0
+    assert pool.calls == []
+
+
+async def test_concurrent_writes_inside_block_share_one_update() -> None:
+    pool = _RecordingPool()
+    job_id, attempt = uuid4(), uuid4()
+    slugs = [
+        SectionSlug.SAFETY_MODERATION,
+        SectionSlug.TONE_DYNAMICS_FLASHPOINT,
+        SectionSlug.TONE_DYNAMICS_SCD,
+    ]
+
+    async with coalesce_slot_writes(pool, job_id, attempt, flush_interval_s=0.01):
+        results = await asyncio.gather(
+            *(write_slot(pool, job_id, attempt, slug, _done_slot(slug.value)) for slug in slugs)
+        )
+
+    assert results == [1, 1, 1]
+    assert len(pool.calls) == 1
+    assert set(json.loads(pool.calls[0][1][2])) == {slug.value for slug in slugs}
+
+
+async def test_stale_attempt_reports_zero_rows_to_every_writer() -> None:
+    pool = _RecordingPool(result="UPDATE 0")
+    job_id, attempt = uuid4(), uuid4()
+
+    async with coalesce_slot_writes(pool, job_id, attempt, flush_interval_s=0.01):
+        results = await asyncio.gather(
+            write_slot(pool, job_id, attempt, SectionSlug.SAFETY_MODERATION, _done_slot("a")),
+            write_slot(pool, job_id, attempt, SectionSlug.TONE_DYNAMICS_SCD, _done_slot("b")),
+        )
+
+    assert results == [0, 0]
+
+
+async def test_flush_error_is_raised_to_every_writer() -> None:
+    pool = _RecordingPool(exc=_BoomError("pool exhausted"))
+    job_id, attempt = uuid4(), uuid4()
+
+    async with coalesce_slot_writes(pool, job_id, attempt, flush_interval_s=0.01):
+        results = await asyncio.gather(
+            write_slot(pool, job_id, attempt, SectionSlug.SAFETY_MODERATION, _done_slot("a")),
+            write_slot(pool, job_id, attempt, SectionSlug.TONE_DYNAMICS_SCD, _done_slot("b")),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(result, _BoomError) for result in results)
+    assert len(pool.calls) == 1
+
+
+async def test_later_write_to_same_slug_wins_within_a_flush() -> None:
+    pool = _RecordingPool()
+    job_id, attempt = uuid4(), uuid4()
+    slug = SectionSlug.SAFETY_MODERATION
+
+    async with coalesce_slot_writes(pool, job_id, attempt, flush_interval_s=0.01):
+        await asyncio.gather(
+            write_slot(pool, job_id, attempt, slug, _done_slot("first")),
+            write_slot(pool, job_id, attempt, slug, _done_slot("second")),
+        )
+
+    assert len(pool.calls) == 1
+    assert json.loads(pool.calls[0][1][2])[slug.value]["data"] == {"marker": "second"}
+
+
+@pytest.mark.parametrize("other", ["job", "attempt"])
+async def test_writes_for_other_job_attempts_bypass_the_batch(other: str) -> None:
+    pool = _RecordingPool()
+    job_id, attempt = uuid4(), uuid4()
+    target_job = uuid4() if other == "job" else job_id
+    target_attempt = uuid4() if other == "attempt" else attempt
+
+    async with coalesce_slot_writes(pool, job_id, attempt, flush_interval_s=60):
+        rows = await write_slot(
+            pool, target_job, target_attempt, SectionSlug.SAFETY_MODERATION, _done_slot("a")
+        )
+
+    assert rows == 1
+    assert len(pool.calls) == 1
+    assert "jsonb_build_object" in pool.calls[0][0]
+
+
+async def test_block_exit_waits_for_pending_flush() -> None:
+    pool = _RecordingPool()
+    job_id, attempt = uuid4(), uuid4()
+
+    async with coalesce_slot_writes(pool, job_id, attempt, flush_interval_s=0.05):
+        task = asyncio.create_task(
+            write_slot(pool, job_id, attempt, SectionSlug.SAFETY_MODERATION, _done_slot("a"))
+        )
+        await asyncio.sleep(0)
+
+    assert len(pool.calls) == 1
+    assert await task == 1
@@ -0,0 +1,185 @@
+"""Unit tests for src/jobs/speculative_analysis.py.
+
+The analyses themselves are replaced with fakes; these tests cover when
+speculative work starts, that slots can wait for it, and that failures and
+shutdown never leak out of the pipeline.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.analyses.schemas import PageKind, SectionSlug, UtteranceStreamType
+from src.config import Settings
+from src.jobs import speculative_analysis
+from src.utterances.batched.assembler import SectionResult
+from src.utterances.batched.partition import HtmlSection
+from src.utterances.batched.section_runner import _notify_section_listener
+from src.utterances.schema import Utterance, UtterancesPayload
+
+
+def _section_result(*texts: str) -> SectionResult:
+    return SectionResult(
+        section=HtmlSection(
+            index=0,
+            html_slice="<p>x</p>",
+            global_start=0,
+            global_end=8,
+            overlap_with_prev_bytes=0,
+            parent_context_text=None,
+        ),
+        payload=UtterancesPayload(
+            source_url="https://example.com/",
+            scraped_at=datetime.now(UTC),
+            utterances=[
+                Utterance(kind="comment", text=text, utterance_id="local-1") for text in texts
+            ],
+            page_kind=PageKind.FORUM_THREAD,
+            utterance_stream_type=UtteranceStreamType.COMMENT_SECTION,
+        ),
+    )
+
+
+@pytest.fixture
+def sentiment_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[Utterance]]:
+    calls: list[list[Utterance]] = []
+
+    async def _fake_sentiment(utterances: list[Utterance], **_kwargs: Any) -> None:
+        calls.append(utterances)
+
+    monkeypatch.setattr(speculative_analysis, "compute_sentiment_stats", _fake_sentiment)
+    return calls
+
+
+@pytest.fixture
+def moderation_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[Utterance]]:
+    calls: list[list[Utterance]] = []
+
+    async def _fake_moderation(utterances: list[Utterance], service: Any, **_kwargs: Any) -> None:
+        calls.append(utterances)
+
+    monkeypatch.setattr(speculative_analysis, "check_content_moderation_bulk", _fake_moderation)
+    monkeypatch.setattr(
+        speculative_analysis, "build_openai_moderation_service", lambda _settings: MagicMock()
+    )
+    return calls
+
+
+async def test_extracted_section_warms_sentiment_and_moderation(
+    sentiment_calls: list[list[Utterance]],
+    moderation_calls: list[list[Utterance]],
+) -> None:
+    async with speculative_analysis.speculative_analysis(MagicMock(), Settings()):
+        _notify_section_listener(_section_result("first", "   ", "second"))
+        await speculative_analysis.wait_for_speculative_analysis(
+            SectionSlug.OPINIONS_SENTIMENTS_SENTIMENT
+        )
+        await speculative_analysis.wait_for_speculative_analysis(SectionSlug.SAFETY_MODERATION)
+
+    assert [[u.text for u in call] for call in sentiment_calls] == [["first", "second"]]
+    assert [[u.text for u in call] for call in moderation_calls] == [["first", "second"]]
+    assert all(u.utterance_id is None for u in sentiment_calls[0])
+
+
+async def test_moderation_is_skipped_without_openai_key(
+    sentiment_calls: list[list[Utterance]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    moderation = MagicMock()
+    monkeypatch.setattr(speculative_analysis, "check_content_moderation_bulk", moderation)
+
+    async with speculative_analysis.speculative_analysis(MagicMock(), Settings(OPENAI_API_KEY="")):
+        _notify_section_listener(_section_result("first"))
+        await speculative_analysis.wait_for_speculative_analysis(
+            SectionSlug.OPINIONS_SENTIMENTS_SENTIMENT
+        )
+
+    assert len(sentiment_calls) == 1
+    moderation.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("pool", "enabled"),
+    [(None, True), (MagicMock(), False)],
+)
+async def test_disabled_or_poolless_runs_nothing(
+    sentiment_calls: list[list[Utterance]],
+    pool: Any,
+    enabled: bool,
+) -> None:
+    settings = Settings(VIBECHECK_SPECULATIVE_ANALYSIS_ENABLED=enabled)
+
+    async with speculative_analysis.speculative_analysis(pool, settings):
+        _notify_section_listener(_section_result("first"))
+        await asyncio.sleep(0)
+
+    assert sentiment_calls == []
+
+
+async def test_slot_waits_for_in_flight_speculation(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = asyncio.Event()
+    finished: list[str] = []
+
+    async def _slow_sentiment(utterances: list[Utterance], **_kwargs: Any) -> None:
+        await release.wait()
+        finished.append("sentiment")
+
+    monkeypatch.setattr(speculative_analysis, "compute_sentiment_stats", _slow_sentiment)
+
+    async with speculative_analysis.speculative_analysis(
+        MagicMock(), Settings(OPENAI_API_KEY="")
+    ):
+        _notify_section_listener(_section_result("first"))
+        waiter = asyncio.create_task(
+            speculative_analysis.wait_for_speculative_analysis(
+                SectionSlug.OPINIONS_SENTIMENTS_SENTIMENT
+            )
+        )
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        release.set()
+        await waiter
+
+    assert finished == ["sentiment"]
+
+
+async def test_failed_speculation_is_swallowed(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _failing_sentiment(utterances: list[Utterance], **_kwargs: Any) -> None:
+        raise RuntimeError("vertex down")
+
+    monkeypatch.setattr(speculative_analysis, "compute_sentiment_stats", _failing_sentiment)
+
+    async with speculative_analysis.speculative_analysis(
+        MagicMock(), Settings(OPENAI_API_KEY="")
+    ):
+        _notify_section_listener(_section_result("first"))
+        await speculative_analysis.wait_for_speculative_analysis(
+            SectionSlug.OPINIONS_SENTIMENTS_SENTIMENT
+        )
+
+
+async def test_block_exit_cancels_pending_speculation(monkeypatch: pytest.MonkeyPatch) -> None:
+    started = asyncio.Event()
+    cancelled: list[bool] = []
+
+    async def _hanging_sentiment(utterances: list[Utterance], **_kwargs: Any) -> None:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    monkeypatch.setattr(speculative_analysis, "compute_sentiment_stats", _hanging_sentiment)
+
+    async with speculative_analysis.speculative_analysis(
+        MagicMock(), Settings(OPENAI_API_KEY="")
+    ):
+        _notify_section_listener(_section_result("first"))
+        await started.wait()
+
+    assert cancelled == [True]
@@ -15,12 +15,27 @@ from src.services import vertex_limiter
 from src.services.vertex_limiter import vertex_slot
 
 
+def _script_name(script: str) -> str:
+    if "not_owner_or_expired" in script:
+        return "release"
+    if '"left"' in script:
+        return "leave"
+    return "acquire"
+
+
 class _SharedFakeRedis:
+    """Python model of the acquire/release/leave Lua scripts."""
+
     def __init__(self) -> None:
         self.tokens: dict[str, int] = {}
         self.now_ms = 0
         self.cleanup_calls: list[str] = []
         self.loaded_scripts: list[str] = []
+        self.waiters: dict[str, tuple[int, int]] = {}
+        self.adaptive_limit: float | None = None
+        self.decreased_at_ms: int | None = None
+        self.release_outcomes: list[str] = []
+        self._arrivals = 0
 
     def advance(self, delta_ms: int) -> None:
         self.now_ms += delta_ms
@@ -33,22 +48,46 @@ class _SharedFakeRedis:
 
     async def script_load(self, script: str) -> str:
         self.loaded_scripts.append(script)
-        return "release" if "not_owner_or_expired" in script else "acquire"
+        return _script_name(script)
 
     async def evalsha(self, sha: str, numkeys: int, *args: Any) -> list[Any]:
-        assert numkeys == 2
+        argv = args[numkeys:]
         if sha == "acquire":
-            token = str(args[2])
-            limit = int(args[3])
-            lease_ttl_ms = int(args[4])
+            assert numkeys == 5
+            token = str(argv[0])
+            limit = int(argv[1])
+            lease_ttl_ms = int(argv[2])
             self._cleanup_expired(source="acquire")
-            if len(self.tokens) >= limit:
+            if argv[5] == "1" and self.adaptive_limit is not None:
+                limit = max(1, min(limit, int(self.adaptive_limit)))
+            if token not in self.waiters:
+                self._arrivals += 1
+                self.waiters[token] = (int(argv[3]), self._arrivals)
+            ahead = sorted(self.waiters, key=self.waiters.__getitem__).index(token)
+            if len(self.tokens) >= limit or ahead >= limit - len(self.tokens):
                 return [0, len(self.tokens), limit, lease_ttl_ms, 1, "saturated"]
+            del self.waiters[token]
             self.tokens[token] = self.now_ms + lease_ttl_ms
             return [1, len(self.tokens), limit, lease_ttl_ms, 0, "acquired"]
 
-        token = str(args[2])
+        if sha == "leave":
+            assert numkeys == 2
+            return [int(self.waiters.pop(str(argv[0]), None) is not None), "left"]
+
+        assert numkeys == 3
+        token, outcome = str(argv[0]), str(argv[1])
+        max_limit, min_limit = int(argv[2]), int(argv[3])
+        decrease_factor, cooldown_ms = float(argv[4]), int(argv[5])
+        self.release_outcomes.append(outcome)
         self._cleanup_expired(source="release")
+        if outcome != "neutral":
+            current = min(self.adaptive_limit or max_limit, max_limit)
+            if outcome == "overload":
+                if self.decreased_at_ms is None or self.now_ms - self.decreased_at_ms >= cooldown_ms:
+                    self.adaptive_limit = max(min_limit, current * decrease_factor)
+                    self.decreased_at_ms = self.now_ms
+            elif current < max_limit:
+                self.adaptive_limit = min(max_limit, current + 1 / current)
         if token not in self.tokens:
             return [0, token, len(self.tokens), "not_owner_or_expired"]
         del self.tokens[token]
@@ -74,7 +113,7 @@ class _FailingRedis:
 
     async def evalsha(self, sha: str, numkeys: int, *keys_and_args: Any) -> list[Any]:
         assert sha
-        assert numkeys == 2
+        assert numkeys == 5
         assert keys_and_args
         raise TimeoutError("redis unavailable")
 
@@ -128,13 +167,13 @@ class _AcquiredThenFailingReleaseRedis:
         self.release_calls: int = 0
 
     async def script_load(self, script: str) -> str:
-        return "release" if "not_owner_or_expired" in script else "acquire"
+        return _script_name(script)
 
     async def evalsha(self, sha: str, numkeys: int, *keys_and_args: Any) -> list[Any]:
-        assert numkeys == 2
         if sha == "acquire":
+            assert numkeys == 5
             self.acquire_calls += 1
-            token = str(keys_and_args[2])
+            token = str(keys_and_args[numkeys])
             self.acquired_tokens.add(token)
             return [1, len(self.acquired_tokens), 1, 60_000, 0, "acquired"]
         assert sha == "release"
@@ -152,8 +191,8 @@ class _BadReleaseResultRedis:
 
     async def evalsha(self, sha: str, numkeys: int, *keys_and_args: Any) -> list[Any]:
         assert sha == "release"
-        assert numkeys == 2
-        assert len(keys_and_args) == 3
+        assert numkeys == 3
+        assert len(keys_and_args) == 11
         return [1, "token", 0, 1]
 
     async def aclose(self) -> None:
@@ -167,8 +206,8 @@ class _BadAcquireResultRedis:
 
     async def evalsha(self, sha: str, numkeys: int, *keys_and_args: Any) -> list[Any]:
         assert sha == "acquire"
-        assert numkeys == 2
-        assert len(keys_and_args) == 5
+        assert numkeys == 5
+        assert len(keys_and_args) == 11
         return [2, 1, 1, 1, 1, "acquired"]
 
     async def aclose(self) -> None:
@@ -337,7 +376,10 @@ async def test_vertex_slot_records_wait_ms_local_backend(monkeypatch: pytest.Mon
     recorded_wait_ms, recorded_attrs = recorded_histogram.records[0]
     assert isinstance(recorded_wait_ms, float)
     assert recorded_wait_ms >= 0.0
-    assert recorded_attrs == {"vertex_limiter.backend": "local"}
+    assert recorded_attrs == {
+        "vertex_limiter.backend": "local",
+        "vertex_limiter.priority": "interactive",
+    }
 
 
 async def test_vertex_slot_records_wait_ms_redis_backend(
@@ -369,7 +411,10 @@ async def test_vertex_slot_records_wait_ms_redis_backend(
     recorded_wait_ms, recorded_attrs = recording_histogram.records[0]
     assert isinstance(recorded_wait_ms, float)
     assert recorded_wait_ms >= 0.0
-    assert recorded_attrs == {"vertex_limiter.backend": "redis"}
+    assert recorded_attrs == {
+        "vertex_limiter.backend": "redis",
+        "vertex_limiter.priority": "interactive",
+    }
 
 
 async def test_vertex_slot_uses_redis_backend_when_limiter_url_is_configured(
@@ -586,10 +631,18 @@ async def test_redis_backend_cleans_expired_leases_on_acquire_and_release() -> N
 
     release_response = await redis.evalsha(
         "release",
-        2,
+        3,
         "vibecheck:rl:vertex:slots",
         f"{backend._lease_key_prefix}:{first_lease.token}",
+        "vibecheck:rl:vertex:limit",
         first_lease.token,
+        "neutral",
+        1,
+        1,
+        1,
+        0,
+        3_600_000,
+        "vibecheck:rl:vertex:released",
     )
     assert release_response == [0, first_lease.token, 1, "not_owner_or_expired"]
     assert redis.cleanup_calls == ["acquire", "acquire", "release"]
@@ -1228,3 +1281,153 @@ async def test_vertex_limiter_mixed_inflight_releases_route_by_backend() -> None
     await backend.release(local_lease)
 
     assert redis.tokens == {}
+
+
+def _redis_limiter_settings(**overrides: Any) -> Settings:
+    return Settings(
+        VIBECHECK_LIMITER_REDIS_URL="rediss://:secret@10.0.0.1:6379",
+        VIBECHECK_LIMITER_REDIS_CA_CERT_PATH="/etc/ssl/vibecheck-limiter-redis/ca.crt",
+        VERTEX_LEASE_ACQUIRE_TIMEOUT_MS=10,
+        VERTEX_LEASE_RETRY_MIN_MS=1,
+        VERTEX_LEASE_RETRY_MAX_MS=1,
+        **overrides,
+    )
+
+
+async def test_redis_backend_serves_interactive_waiters_before_retries() -> None:
+    redis = _SharedFakeRedis()
+    backend = vertex_limiter._RedisLeaseBackend(redis)
+    acquire_kwargs: dict[str, Any] = {
+        "limit": 1,
+        "lease_ttl_ms": 60_000,
+        "acquire_timeout_ms": 5_000,
+        "retry_min_ms": 1_000,
+        "retry_max_ms": 1_000,
+    }
+    holder = await backend.acquire(**acquire_kwargs)
+    served: list[str] = []
+
+    async def _waiter(priority: vertex_limiter.VertexPriority) -> None:
+        lease = await backend.acquire(**acquire_kwargs, priority=priority)
+        served.append(priority)
+        await backend.release(lease)
+
+    retry_task = asyncio.create_task(_waiter("retry"))
+    await asyncio.sleep(0)
+    interactive_task = asyncio.create_task(_waiter("interactive"))
+    await asyncio.sleep(0)
+    assert sorted(rank for rank, _arrival in redis.waiters.values()) == [0, 1]
+
+    await backend.release(holder)
+    # Released leases wake waiters immediately rather than after retry_max_ms.
+    await asyncio.wait_for(asyncio.gather(retry_task, interactive_task), timeout=0.5)
+
+    assert served == ["interactive", "retry"]
+    assert redis.waiters == {}
+
+
+async def test_redis_backend_leaves_waiter_queue_when_acquire_times_out() -> None:
+    redis = _SharedFakeRedis()
+    backend = vertex_limiter._RedisLeaseBackend(redis)
+    holder = await backend.acquire(
+        limit=1, lease_ttl_ms=60_000, acquire_timeout_ms=10, retry_min_ms=1, retry_max_ms=1
+    )
+
+    with pytest.raises(vertex_limiter.VertexLimiterSaturationError):
+        await backend.acquire(
+            limit=1, lease_ttl_ms=60_000, acquire_timeout_ms=1, retry_min_ms=1, retry_max_ms=1
+        )
+
+    assert redis.waiters == {}
+    await backend.release(holder)
+
+
+async def test_vertex_slot_overload_halves_shared_limit_and_clean_calls_recover(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis = _SharedFakeRedis()
+    monkeypatch.setattr(vertex_limiter, "_new_redis_client", lambda _settings: redis)
+    settings = _redis_limiter_settings(VERTEX_MAX_CONCURRENCY=4)
+
+    async with vertex_slot(settings):
+        vertex_limiter.report_vertex_overload()
+    assert redis.adaptive_limit == 2
+
+    # A second 429 inside the cooldown window does not shrink the limit again.
+    class _Vertex429Error(Exception):
+        status_code = 429
+
+    with pytest.raises(_Vertex429Error):
+        async with vertex_slot(settings):
+            raise _Vertex429Error("RESOURCE_EXHAUSTED")
+    assert redis.adaptive_limit == 2
+
+    async with vertex_slot(settings):
+        assert len(redis.tokens) == 1
+    assert redis.adaptive_limit == 2.5
+    assert redis.release_outcomes == ["overload", "overload", "ok"]
+
+
+async def test_vertex_slot_non_overload_failures_leave_limit_unchanged(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis = _SharedFakeRedis()
+    monkeypatch.setattr(vertex_limiter, "_new_redis_client", lambda _settings: redis)
+
+    with pytest.raises(ValueError, match="bad output"):
+        async with vertex_slot(_redis_limiter_settings()):
+            raise ValueError("bad output")
+
+    assert redis.release_outcomes == ["neutral"]
+    assert redis.adaptive_limit is None
+
+
+async def test_vertex_slot_adaptive_concurrency_can_be_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis = _SharedFakeRedis()
+    redis.adaptive_limit = 1
+    monkeypatch.setattr(vertex_limiter, "_new_redis_client", lambda _settings: redis)
+    settings = _redis_limiter_settings(
+        VERTEX_MAX_CONCURRENCY=2, VERTEX_ADAPTIVE_CONCURRENCY_ENABLED=False
+    )
+
+    async with vertex_slot(settings), vertex_slot(settings):
+        vertex_limiter.report_vertex_overload()
+        assert len(redis.tokens) == 2
+
+    assert redis.release_outcomes == ["neutral", "neutral"]
+
+
+async def test_vertex_slot_records_bound_priority(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _RecordingHistogram:
+        def __init__(self) -> None:
+            self.attributes: list[dict[str, str]] = []
+
+        def record(self, value: float, attributes: dict[str, str] | None = None) -> None:
+            self.attributes.append(attributes or {})
+
+    recording_histogram = _RecordingHistogram()
+    redis = _SharedFakeRedis()
+    monkeypatch.setattr(vertex_limiter, "_new_redis_client", lambda _settings: redis)
+    monkeypatch.setattr(vertex_limiter, "VERTEX_LIMITER_WAIT_MS", recording_histogram)
+    settings = _redis_limiter_settings()
+
+    token = vertex_limiter.bind_vertex_priority("retry")
+    try:
+        async with vertex_slot(settings):
+            pass
+    finally:
+        vertex_limiter.clear_vertex_priority(token)
+    async with vertex_slot(settings):
+        pass
+
+    assert [a["vertex_limiter.priority"] for a in recording_histogram.attributes] == [
+        "retry",
+        "interactive",
+    ]
+
+
+def test_settings_rejects_out_of_range_adaptive_decrease_factor() -> None:
+    with pytest.raises(ValidationError, match="VERTEX_ADAPTIVE_DECREASE_FACTOR"):
+        Settings(VERTEX_ADAPTIVE_DECREASE_FACTOR=1.0)
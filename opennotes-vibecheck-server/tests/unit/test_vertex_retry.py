@@ -32,6 +32,18 @@ async def test_retries_on_429_then_succeeds() -> None:
     assert agent.run.call_args == call("test prompt")
 
 
+async def test_retried_429_is_reported_to_the_vertex_limiter() -> None:
+    agent = _mock_agent(_exc(429), object())
+
+    with (
+        patch("asyncio.sleep", new_callable=AsyncMock),
+        patch("src.services.gemini_agent.report_vertex_overload") as mock_report,
+    ):
+        await run_vertex_agent_with_retry(agent, "test prompt")
+
+    mock_report.assert_called_once_with()
+
+
 async def test_exhausts_all_attempts_and_reraises_429() -> None:
     agent = _mock_agent(_exc(429), _exc(429), _exc(429))
 